@@ -0,0 +1,252 @@
+"""
+Answer-Leakage Detector Across Questions Within a List
+
+REQUIREMENTS:
+- Rubric criterion "Answer Leakage Prevention": no question's statement or
+  solution may give away another question's answer
+- Per list, build a shingle index (SHINGLE_WORDS-word windows) of every
+  question's secrets:
+    answer        - the correct answer / correct alternative
+    solution_key  - the solution's final result (last bold span, else the
+                    right-hand side of the last math span, else the last
+                    sentence); used for discursive questions without an answer
+- Probe every other question's statement against the index in one pass
+  over its tokens (near-linear, instead of comparing all pairs)
+- Report leaking pairs with the overlapping spans
+- Streams whole corpora one list at a time
+
+Shingles made only of stopwords, and shingles found in at least
+COMMON_FRACTION of the list's statements (shared topic vocabulary), are not
+secrets. A pair leaks when at least LEAK_COVERAGE of the secret's shingles
+show up in the other statement. A secret shorter than a shingle ("liver",
+"2 mols") is a leak only with context: within CONTEXT_WINDOW words of it,
+the other statement must repeat at least MIN_CONTEXT_WORDS content words of
+the source question's statement. Otherwise every list about quadrilaterals
+would "leak" the word "square".
+
+USAGE:
+    python3 answer_leakage.py list_of_questions_to_test_v3.json
+    python3 answer_leakage.py corpus.json --results leakage.jsonl
+"""
+
+import json
+import re
+import sys
+import time
+from collections import Counter
+
+from catalog_search import STOPWORDS, fold
+from corpus_stream import iter_question_lists
+
+# -------------------------------------------------------------------------
+# CONFIGURATION
+# -------------------------------------------------------------------------
+
+SHINGLE_WORDS = 4
+LEAK_COVERAGE = 0.6
+COMMON_FRACTION = 0.5
+MIN_SHORT_SECRET_CHARS = 5   # secrets shorter than a shingle must be this distinctive
+CONTEXT_WINDOW = 12
+MIN_CONTEXT_WORDS = 2
+MIN_CONTENT_WORD_CHARS = 4
+
+ALL_STOPWORDS = STOPWORDS["en"] | STOPWORDS["pt"]
+
+MATH_TAG = re.compile(r"\{\{/?MATH(?:BLOCK)?\}\}")
+LATEX_COMMAND = re.compile(r"\\[a-zA-Z]+")
+TOKEN = re.compile(r"[a-z0-9]+(?:[.,][0-9]+)*")
+BOLD_SPAN = re.compile(r"\*\*(.+?)\*\*", re.DOTALL)
+MATH_SPAN = re.compile(r"\{\{MATH(?:BLOCK)?\}\}(.*?)\{\{/MATH(?:BLOCK)?\}\}", re.DOTALL)
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+# -------------------------------------------------------------------------
+# TOKENS AND SECRETS
+# -------------------------------------------------------------------------
+
+def tokenize(text):
+    """Fold accents and case, drop math tags and LaTeX command names."""
+    text = LATEX_COMMAND.sub(" ", MATH_TAG.sub(" ", text or ""))
+    return TOKEN.findall(fold(text))
+
+
+def solution_key(solution):
+    """The phrase stating a solution's final result."""
+    bold = BOLD_SPAN.findall(solution or "")
+    if bold:
+        return bold[-1]
+    math = MATH_SPAN.findall(solution or "")
+    if math:
+        return math[-1].rsplit("=", 1)[-1]
+    sentences = [s for s in SENTENCE_END.split((solution or "").strip()) if s]
+    return sentences[-1] if sentences else ""
+
+
+def question_secrets(question):
+    """(kind, tokens) of what this question must not have leaked elsewhere."""
+    answer = question.get("answer") or question.get("correct_answer")
+    if isinstance(answer, str) and answer.strip():
+        return [("answer", tokenize(answer))]
+    return [("solution_key", tokenize(solution_key(question.get("question_solution"))))]
+
+
+def shingles(tokens):
+    """Word shingles; a secret shorter than a shingle is one (distinctive) shingle."""
+    if len(tokens) < SHINGLE_WORDS:
+        if len("".join(tokens)) < MIN_SHORT_SECRET_CHARS:
+            return []
+        return [tuple(tokens)]
+    return [tuple(tokens[i:i + SHINGLE_WORDS]) for i in range(len(tokens) - SHINGLE_WORDS + 1)]
+
+
+def _windows(tokens, size):
+    return {tuple(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+
+
+# -------------------------------------------------------------------------
+# DETECTION
+# -------------------------------------------------------------------------
+
+def find_leaks(question_list):
+    """Return the leaking pairs of one list."""
+    questions = question_list.get("questions") or []
+    statements = [tokenize(q.get("question_statement")) for q in questions]
+
+    # Shingles shared by many statements are the list's topic, not a secret
+    statement_frequency = Counter()
+    sizes = {SHINGLE_WORDS}
+    secrets = []
+    for question in questions:
+        secrets.append(question_secrets(question))
+        sizes.update(len(tokens) for _, tokens in secrets[-1] if 0 < len(tokens) < SHINGLE_WORDS)
+    for tokens in statements:
+        for size in sizes:
+            statement_frequency.update(_windows(tokens, size))
+    common = max(2, COMMON_FRACTION * len(questions))
+    word_frequency = Counter(word for tokens in statements for word in set(tokens))
+    content_words = [{t for t in tokens if len(t) >= MIN_CONTENT_WORD_CHARS
+                      and t not in ALL_STOPWORDS and word_frequency[t] < common}
+                     for tokens in statements]
+
+    # shingle -> [(question, secret number)]
+    index = {}
+    secret_sizes = {}
+    for owner, owned in enumerate(secrets):
+        own_statement = statements[owner]
+        for number, (_, tokens) in enumerate(owned):
+            kept = []
+            for shingle in set(shingles(tokens)):
+                if all(token in ALL_STOPWORDS for token in shingle):
+                    continue
+                if statement_frequency[shingle] >= common:
+                    continue
+                # Restating the question's own wording is not a secret either
+                if shingle in _windows(own_statement, len(shingle)):
+                    continue
+                kept.append(shingle)
+            secret_sizes[owner, number] = len(kept)
+            for shingle in kept:
+                index.setdefault(shingle, []).append((owner, number))
+
+    leaks = []
+    for prober, tokens in enumerate(statements):
+        hits = {}   # (owner, number) -> {shingle: [(start, size)]}
+        for size in sizes:
+            for start in range(len(tokens) - size + 1):
+                shingle = tuple(tokens[start:start + size])
+                for key in index.get(shingle, ()):
+                    if key[0] != prober:
+                        hits.setdefault(key, {}).setdefault(shingle, []).append((start, size))
+        for (owner, number), matched in hits.items():
+            coverage = len(matched) / secret_sizes[owner, number]
+            if coverage < LEAK_COVERAGE:
+                continue
+            kind, secret_tokens = secrets[owner][number]
+            context = []
+            if len(secret_tokens) < SHINGLE_WORDS:
+                context = _shared_context(tokens, matched, content_words[owner])
+                if len(context) < MIN_CONTEXT_WORDS:
+                    continue
+            leaks.append({
+                "source": owner,
+                "secret": kind,
+                "leaked_in": prober,
+                "coverage": round(coverage, 3),
+                "spans": _spans(tokens, matched),
+                "context": context,
+            })
+    return leaks
+
+
+def _shared_context(tokens, matched, source_words):
+    """Source-statement content words found near any occurrence of a short secret."""
+    shared = set()
+    for windows in matched.values():
+        for start, size in windows:
+            nearby = tokens[max(0, start - CONTEXT_WINDOW):start + size + CONTEXT_WINDOW]
+            shared.update(word for word in nearby if word in source_words)
+    return sorted(shared)
+
+
+def _spans(tokens, matched):
+    """Merge matched token windows into the overlapping spans' text."""
+    ranges = sorted((start, start + size) for windows in matched.values() for start, size in windows)
+    merged = []
+    for start, end in ranges:
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return [" ".join(tokens[start:end]) for start, end in merged]
+
+
+# -------------------------------------------------------------------------
+# MAIN EXECUTION
+# -------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    results_path = None
+    if "--results" in args:
+        pos = args.index("--results")
+        results_path = args[pos + 1]
+        del args[pos:pos + 2]
+    if len(args) != 1:
+        print(__doc__)
+        sys.exit(2)
+
+    start = time.perf_counter()
+    totals = Counter()
+    out = open(results_path, "w", encoding="utf-8") if results_path else None
+    try:
+        for question_list in iter_question_lists(args[0]):
+            leaks = find_leaks(question_list)
+            totals["lists"] += 1
+            if out:
+                out.write(json.dumps({"list_id": question_list.get("list_id"), "leaks": leaks},
+                                     ensure_ascii=False) + "\n")
+            if not leaks:
+                continue
+            totals["lists_with_leaks"] += 1
+            for leak in leaks:
+                totals["leaks"] += 1
+                totals[f"secret_{leak['secret']}"] += 1
+                if totals["leaks"] <= 25:
+                    print(f"list {question_list.get('list_id')}: {leak['secret']} of question "
+                          f"{leak['source']} leaks in the statement of question {leak['leaked_in']} "
+                          f"({leak['coverage']:.0%}): {leak['spans']}"
+                          + (f" near {leak['context']}" if leak["context"] else ""))
+    finally:
+        if out:
+            out.close()
+    elapsed = time.perf_counter() - start
+
+    print(f"\n# =========================================================================")
+    print(f"# ANSWER LEAKAGE")
+    print(f"# =========================================================================")
+    print(f"# Lists: {totals['lists']} ({totals['lists_with_leaks']} with leaks)")
+    print(f"# Leaking pairs: {totals['leaks']}")
+    for kind in sorted(k for k in totals if k.startswith("secret_")):
+        print(f"#   {kind[len('secret_'):]}: {totals[kind]}")
+    print(f"# {totals['lists'] / elapsed:,.0f} lists per second")
+    if results_path:
+        print(f"# Results written to {results_path}")
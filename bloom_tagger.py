@@ -0,0 +1,355 @@
+"""
+Aho-Corasick Cognitive-Level Tagger (Bloom's Taxonomy Coverage)
+
+REQUIREMENTS:
+- English and Portuguese Bloom-verb and question-stem lexicons, compiled
+  into one Aho-Corasick automaton over accent-folded, lower-cased text
+- One pass over each question_statement; matches must sit on word
+  boundaries (a trailing "*" in the lexicon allows any word ending); bare
+  question words ("which", "qual") count as Remember only when nothing else
+  matched
+- A cognitive-level distribution per question and per list, plus list-level
+  diversity (normalized entropy, distinct levels, higher-order share) and a
+  suggested "Cognitive Level Diversity" score
+- Automaton built once and pickled (bloom_automaton.pkl), rebuilt only when
+  the lexicon changes
+
+Suggested rubric score (Cognitive Level Diversity, 0-2):
+    0 - a single dominant level and no higher-order (Analyze/Evaluate/Create) question
+    2 - three or more dominant levels, including a higher-order one
+    1 - otherwise
+
+USAGE:
+    python3 bloom_tagger.py list_of_questions_to_test_v3.json
+    python3 bloom_tagger.py list_of_questions_to_test_v3.json -o tagged.json
+"""
+
+import hashlib
+import json
+import math
+import os
+import pickle
+import sys
+import time
+from collections import Counter
+
+from catalog_search import fold
+from corpus_stream import iter_question_lists, write_corpus
+
+# -------------------------------------------------------------------------
+# CONFIGURATION
+# -------------------------------------------------------------------------
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+AUTOMATON_PATH = os.path.join(SCRIPT_DIR, "bloom_automaton.pkl")
+
+LEVELS = ("remember", "understand", "apply", "analyze", "evaluate", "create")
+HIGHER_ORDER = frozenset({"analyze", "evaluate", "create"})
+
+# Accent-folded, lower-case phrases; "*" = any word ending
+BLOOM_LEXICON = {
+    "en": {
+        "remember": """define* list name identify* recall* recogni* label* memori* "what is"
+            "what are" "what was" "what were" "which of the following" "who was" "who were"
+            "when did" "when was" "where is" "where did" "what material" "what type"
+            "what term" "which term" "which word" "select the" "choose the" """,
+        "understand": """explain* describe* summari* interpret* classif* paraphras* illustrat*
+            discuss* "why" "in your own words" "main idea" "primary role" "purpose of"
+            "what does" "what happens" "best describes" "means that" "how does" "how do"
+            "what kind" "what change" "give an example" "example of" "characteri*" """,
+        "apply": """calculat* comput* solv* determin* appl* demonstrat* convert* estimat* predict*
+            find use using "how many" "how much" "how long" "what is the probability"
+            "what is the value" "what is the area" "what is the volume" "show that" "based on" """,
+        "analyze": """analy* compar* contrast* differentiat* distinguish* examin* categori* infer*
+            deduc* investigat* "relationship between" "what evidence" "why does" "why did"
+            "effect of" "effect on" "impact of" "cause of" "role of" "factors" "most likely"
+            "what will be" "indicates" "implies" """,
+        "evaluate": """evaluat* justif* assess* critiqu* judg* argu* defend* recommend* prioriti*
+            validat* "to what extent" "do you agree" "which is more" "most effective"
+            "best explains" "strengths and weaknesses" """,
+        "create": """design* creat* propose proposing develop* formulat* construct* compos*
+            invent* devis* generat* "come up with" "write a" "plan a" "suggest a" """,
+    },
+    "pt": {
+        "remember": """defin* list* nomei* cite identifiqu* identifica* reconhec* indiqu*
+            mencion* "qual e" "quais sao" "o que e" "quem foi" "quem eram" "quando" "qual o nome"
+            "qual das alternativas" "assinale" "marque" """,
+        "understand": """expliqu* explica* descrev* descreva resum* interpret* classifiqu*
+            ilustr* parafrase* "por que" "por qual motivo" "qual o papel" "qual a funcao"
+            "qual o principal" "qual a principal" "significado" "o que acontece" "como a"
+            "como o" "como essa" "como esse" "de que maneira" "de que forma" "o que representou"
+            "o que caracteriza" "exemplo" "exemplos" "que tipo" """,
+        "apply": """calcul* determin* resolv* resolva aplique aplicando utiliz* convert* estim*
+            encontr* demonstr* "quantos" "quantas" "qual a probabilidade" "qual o valor"
+            "qual a area" "qual o volume" "de quantas maneiras" "com base" "qual a vergencia"
+            "qual o modulo" """,
+        "analyze": """analis* compar* contrast* diferenci* distingu* examin* categoriz* infir*
+            deduz* investig* relacion* "relacao entre" "o que essa afirmacao revela"
+            "impacto" "consequencias" "fatores" "mais provavel" "provavelmente" "implica"
+            "indica" "contribuiu" "contribui" """,
+        "evaluate": """avali* justifiqu* justific* critiqu* julg* argument* defend* recomend*
+            "em que medida" "voce concorda" "qual a melhor" "mais eficaz" "pontos fortes" """,
+        "create": """proponha propor elabor* crie criar planej* formul* construa desenvolv*
+            invent* produza redija escreva "sugira uma" """,
+    },
+}
+
+# Bare question words: "Which organ produces bile?" is recall, but only
+# when nothing more specific matched
+FALLBACK_LEVEL = "remember"
+FALLBACK_STEMS = {
+    "en": "which what who whom when where",
+    "pt": "qual quais que quem quando onde",
+}
+
+# -------------------------------------------------------------------------
+# LEXICON
+# -------------------------------------------------------------------------
+
+def lexicon_patterns(lexicon=BLOOM_LEXICON):
+    """Sorted unique (phrase, level, prefix) from the lexicon strings."""
+    patterns = set()
+    for stems in FALLBACK_STEMS.values():
+        patterns.update((stem, "", False) for stem in stems.split())
+    for levels in lexicon.values():
+        for level, entries in levels.items():
+            rest = entries
+            while rest.strip():
+                rest = rest.strip()
+                if rest.startswith('"'):
+                    phrase, rest = rest[1:].split('"', 1)
+                else:
+                    phrase, _, rest = rest.partition(" ")
+                prefix = phrase.endswith("*")
+                patterns.add((phrase.rstrip("*"), level, prefix))
+    return sorted(patterns)
+
+
+def lexicon_hash(lexicon=BLOOM_LEXICON):
+    encoded = json.dumps([lexicon, FALLBACK_STEMS], sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+# -------------------------------------------------------------------------
+# AHO-CORASICK AUTOMATON
+# -------------------------------------------------------------------------
+
+class BloomAutomaton:
+    """
+    Aho-Corasick automaton over the lexicon phrases. goto[state] maps a
+    character to the next state, fail[state] is the longest proper suffix
+    state, and outputs[state] lists the pattern ids ending there (failure
+    outputs merged in at build time).
+    """
+
+    def __init__(self, patterns, digest):
+        self.patterns = patterns     # id -> (phrase, level or "" for fallbacks, prefix)
+        self.digest = digest
+        self.goto = [{}]
+        self.fail = [0]
+        self.outputs = [[]]
+        for pattern_id, (phrase, _, _) in enumerate(patterns):
+            state = 0
+            for char in phrase:
+                next_state = self.goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][char] = next_state
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.outputs.append([])
+                state = next_state
+            self.outputs[state].append(pattern_id)
+
+        # Breadth-first failure links
+        queue = list(self.goto[0].values())
+        for state in queue:
+            for char, child in self.goto[state].items():
+                queue.append(child)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[child] = target if target != child else 0
+                self.outputs[child] = self.outputs[child] + self.outputs[self.fail[child]]
+
+    def matches(self, text):
+        """Yield (start, end, pattern_id) of word-bounded matches in folded text."""
+        goto = self.goto
+        fail = self.fail
+        outputs = self.outputs
+        patterns = self.patterns
+        state = 0
+        for i, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern_id in outputs[state]:
+                phrase, _, prefix = patterns[pattern_id]
+                start = i - len(phrase) + 1
+                if start and text[start - 1].isalnum():
+                    continue
+                if not prefix and i + 1 < len(text) and text[i + 1].isalnum():
+                    continue
+                yield start, i + 1, pattern_id
+
+    def save(self, path=AUTOMATON_PATH):
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+
+def load_automaton(path=AUTOMATON_PATH):
+    """The pickled automaton if it matches the current lexicon, else a fresh (saved) one."""
+    digest = lexicon_hash()
+    try:
+        with open(path, "rb") as f:
+            automaton = pickle.load(f)
+        if automaton.digest == digest:
+            return automaton
+    except (FileNotFoundError, EOFError, pickle.UnpicklingError, AttributeError):
+        pass
+    automaton = BloomAutomaton(lexicon_patterns(), digest)
+    automaton.save(path)
+    return automaton
+
+
+# -------------------------------------------------------------------------
+# TAGGING
+# -------------------------------------------------------------------------
+
+def tag_statement(statement, automaton):
+    """
+    Level distribution of one statement ({} when nothing matched) and the
+    phrases found. Overlapping matches of one level ("calcul" and
+    "calculat") count once; question words only count when nothing else did.
+    """
+    counts = Counter()
+    found = []
+    covered = {}        # level -> end of its last counted match
+    fallback = None
+    for start, end, pattern_id in automaton.matches(fold(statement or "")):
+        phrase, level, _ = automaton.patterns[pattern_id]
+        if not level:
+            fallback = fallback or phrase
+            continue
+        if start < covered.get(level, -1):
+            covered[level] = max(covered[level], end)
+            continue
+        covered[level] = end
+        counts[level] += 1
+        found.append(phrase)
+    if not counts and fallback:
+        counts[FALLBACK_LEVEL] = 1
+        found.append(fallback)
+    total = sum(counts.values())
+    distribution = {level: round(counts[level] / total, 3) for level in LEVELS if counts[level]}
+    return distribution, found
+
+
+def dominant_level(distribution):
+    """Most frequent level; ties go to the higher-order one."""
+    if not distribution:
+        return None
+    return max(distribution, key=lambda level: (distribution[level], LEVELS.index(level)))
+
+
+def tag_questions(statements, automaton):
+    """Batch form of tag_statement for a whole list (or any batch of statements)."""
+    return [tag_statement(statement, automaton) for statement in statements]
+
+
+def list_diversity(distributions):
+    """List-level distribution, diversity measures and suggested 0-2 score."""
+    classified = [d for d in distributions if d]
+    totals = {level: sum(d.get(level, 0.0) for d in classified) for level in LEVELS}
+    count = len(classified)
+    distribution = {level: round(totals[level] / count, 3) for level in LEVELS if totals[level]} \
+        if count else {}
+    entropy = -sum(p * math.log(p) for p in (totals[l] / count for l in LEVELS) if p > 0) \
+        if count else 0.0
+    dominant = Counter(dominant_level(d) for d in classified)
+    higher_order = sum(dominant[level] for level in HIGHER_ORDER)
+    if len(dominant) <= 1 and not higher_order:
+        score = 0
+    elif len(dominant) >= 3 and higher_order:
+        score = 2
+    else:
+        score = 1
+    return {
+        "distribution": distribution,
+        "diversity": round(entropy / math.log(len(LEVELS)), 3),
+        "distinct_levels": len(dominant),
+        "dominant_levels": {level: dominant[level] for level in LEVELS if dominant[level]},
+        "higher_order_share": round(higher_order / count, 3) if count else 0.0,
+        "unclassified": len(distributions) - count,
+        "score": score,
+    }
+
+
+def tag_list(question_list, automaton):
+    """Return the list with "bloom" on each question and a list-level "bloom" summary."""
+    questions = question_list.get("questions") or []
+    tagged = tag_questions([q.get("question_statement") for q in questions], automaton)
+    annotated = []
+    for question, (distribution, found) in zip(questions, tagged):
+        annotated.append(dict(question, bloom={"level": dominant_level(distribution),
+                                               "distribution": distribution, "matches": found}))
+    summary = list_diversity([distribution for distribution, _ in tagged])
+    return dict(question_list, questions=annotated, bloom=summary)
+
+
+# -------------------------------------------------------------------------
+# MAIN EXECUTION
+# -------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    output_path = None
+    if "-o" in args:
+        pos = args.index("-o")
+        output_path = args[pos + 1]
+        del args[pos:pos + 2]
+    if len(args) != 1:
+        print(__doc__)
+        sys.exit(2)
+
+    start = time.perf_counter()
+    automaton = load_automaton()
+    loaded = time.perf_counter()
+    totals = Counter()
+    header = {}
+
+    def tagged_lists():
+        for question_list in iter_question_lists(args[0], header):
+            result = tag_list(question_list, automaton)
+            summary = result["bloom"]
+            totals["lists"] += 1
+            totals[f"score_{summary['score']}"] += 1
+            totals["questions"] += len(result["questions"])
+            totals["unclassified"] += summary["unclassified"]
+            for level, count in summary["dominant_levels"].items():
+                totals[level] += count
+            yield result
+
+    if output_path:
+        write_corpus(output_path, header, tagged_lists())
+    else:
+        for _ in tagged_lists():
+            pass
+    elapsed = time.perf_counter() - start
+
+    print(f"# =========================================================================")
+    print(f"# BLOOM'S TAXONOMY COVERAGE")
+    print(f"# =========================================================================")
+    print(f"# Automaton: {len(automaton.patterns)} phrases, {len(automaton.goto)} states "
+          f"(loaded in {(loaded - start) * 1000:.1f} ms)")
+    print(f"# Lists: {totals['lists']}, questions: {totals['questions']} "
+          f"({totals['unclassified']} unclassified)")
+    print(f"# Dominant levels: " + ", ".join(f"{level} {totals[level]}" for level in LEVELS))
+    print(f"# Suggested scores: 2 -> {totals['score_2']}, 1 -> {totals['score_1']}, "
+          f"0 -> {totals['score_0']}")
+    print(f"# {totals['questions'] / elapsed:,.0f} questions per second")
+    if output_path:
+        print(f"# Written to {output_path}")
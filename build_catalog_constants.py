@@ -0,0 +1,262 @@
+"""
+Generate a Frozen Catalog Constants Module from the CSV
+
+REQUIREMENTS:
+- Emit catalog_constants.py: tuples, frozensets and read-only mappings with
+  disciplines, topics, categories, per-cell availability and translations
+- Importing the generated module must not touch the CSV
+- Staleness check against the CSV size and SHA-256 recorded in the module
+  (never mtimes: git does not preserve them). load_catalog_constants()
+  regenerates a stale module before importing it (about 3 ms of hashing for
+  the 2 MB CSV); regenerate=False only warns
+
+USAGE:
+    python3 build_catalog_constants.py            # regenerate if stale
+    python3 build_catalog_constants.py --force    # always regenerate
+    python3 build_catalog_constants.py --check    # exit 1 if stale
+
+From code:
+    from build_catalog_constants import load_catalog_constants
+    catalog = load_catalog_constants()
+    catalog.CELLS[("Mathematics", 100, 500)]
+"""
+
+import ast
+import csv
+import hashlib
+import importlib
+import os
+import sys
+
+import generate_bilingual_requests as bilingual
+
+# -------------------------------------------------------------------------
+# CONFIGURATION
+# -------------------------------------------------------------------------
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CSV_PATH = os.path.join(SCRIPT_DIR, "Biblioteca de Alexandria - en.csv")
+DEFAULT_OUTPUT_PATH = os.path.join(SCRIPT_DIR, "catalog_constants.py")
+MODULE_NAME = "catalog_constants"
+
+# -------------------------------------------------------------------------
+# HELPER FUNCTIONS
+# -------------------------------------------------------------------------
+
+def csv_sha256(csv_path):
+    """SHA-256 of the raw CSV bytes."""
+    digest = hashlib.sha256()
+    with open(csv_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_catalog(csv_path):
+    """
+    Read everything the constants module needs in one pass over the CSV.
+    Returns (row_count, topics, categories, topic_categories) where the last
+    three are dicts of sets.
+    """
+    topics = {}
+    categories = {}
+    topic_categories = {}
+    row_count = 0
+
+    with open(csv_path, "r", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            row_count += 1
+            disc = row.get("discipline", "").strip()
+            topic = row.get("topic", "").strip()
+            category = row.get("category", "").strip()
+            if not disc:
+                continue
+            if topic:
+                topics.setdefault(disc, set()).add(topic)
+            if category:
+                categories.setdefault(disc, set()).add(category)
+            if topic and category:
+                topic_categories.setdefault((disc, topic), set()).add(category)
+
+    return row_count, topics, categories, topic_categories
+
+
+def _tuple_literal(values, indent):
+    if not values:
+        return "()"
+    pad = " " * indent
+    items = "".join(f"{pad}    {value!r},\n" for value in values)
+    return "(\n" + items + pad + ")"
+
+
+def _mapping_literal(name, mapping, comment):
+    lines = [f"# {comment}", f"{name} = MappingProxyType({{"]
+    for key in sorted(mapping):
+        lines.append(f"    {key!r}: {_tuple_literal(mapping[key], 4)},")
+    lines.append("})")
+    return "\n".join(lines)
+
+
+def render_module(csv_path):
+    """Return the source of catalog_constants.py for csv_path."""
+    row_count, topics, categories, topic_categories = read_catalog(csv_path)
+
+    # Per-cell availability exactly as the bilingual generator sees it
+    # (including the synthetic Portuguese categories)
+    cells = {}
+    for disc, grades in bilingual.load_categories_from_csv(csv_path).items():
+        for grade, difficulties in grades.items():
+            for difficulty, cell_categories in difficulties.items():
+                if cell_categories:
+                    cells[(disc, grade, difficulty)] = sorted(cell_categories)
+                    categories.setdefault(disc, set()).update(cell_categories)
+
+    disciplines = sorted(set(topics) | set(categories))
+    grades = sorted({grade for _, grade, _ in cells})
+
+    parts = [
+        '"""',
+        "Catalog Constants (GENERATED - DO NOT EDIT)",
+        "",
+        f"Generated by build_catalog_constants.py from {os.path.basename(csv_path)!r}.",
+        "Regenerate with: python3 build_catalog_constants.py",
+        '"""',
+        "",
+        "from types import MappingProxyType",
+        "",
+        f"CSV_FILENAME = {os.path.basename(csv_path)!r}",
+        f"CSV_SHA256 = {csv_sha256(csv_path)!r}",
+        f"CSV_SIZE = {os.path.getsize(csv_path)}",
+        f"CSV_ROWS = {row_count}",
+        "",
+        f"DISCIPLINES = {_tuple_literal(disciplines, 0)}",
+        "",
+        f"GRADES = {tuple(grades)!r}",
+        f"DIFFICULTY_LEVELS = {tuple(bilingual.DIFFICULTY_LEVELS)!r}",
+        "",
+        _mapping_literal("TOPICS", {d: sorted(v) for d, v in topics.items()},
+                         "discipline -> topics"),
+        "",
+        _mapping_literal("CATEGORIES", {d: sorted(v) for d, v in categories.items()},
+                         "discipline -> categories"),
+        "",
+        _mapping_literal("TOPIC_CATEGORIES",
+                         {k: sorted(v) for k, v in topic_categories.items()},
+                         "(discipline, topic) -> categories"),
+        "",
+        _mapping_literal("CELLS", cells,
+                         "(discipline, grade, difficulty) -> categories available in that cell"),
+        "",
+        "# Cells with at least one category",
+        "AVAILABLE_CELLS = frozenset(CELLS)",
+        "",
+        "# Every (discipline, category) pair",
+        "DISCIPLINE_CATEGORY_PAIRS = frozenset(",
+        "    (discipline, category)",
+        "    for discipline, names in CATEGORIES.items()",
+        "    for category in names",
+        ")",
+        "",
+        "# English -> Portuguese",
+        "DISCIPLINE_TRANSLATIONS = MappingProxyType({",
+        *[f"    {k!r}: {v!r}," for k, v in bilingual.DISCIPLINE_TRANSLATIONS.items()],
+        "})",
+        "",
+        "# English -> Portuguese (topic-level names)",
+        "CATEGORY_TRANSLATIONS = MappingProxyType({",
+        *[f"    {k!r}: {v!r}," for k, v in bilingual.CATEGORY_TRANSLATIONS.items()],
+        "})",
+        "",
+        "DISCIPLINE_TRANSLATIONS_REVERSE = MappingProxyType(",
+        "    {v: k for k, v in DISCIPLINE_TRANSLATIONS.items()}",
+        ")",
+        "",
+    ]
+    return "\n".join(parts)
+
+
+def build(csv_path=DEFAULT_CSV_PATH, output_path=DEFAULT_OUTPUT_PATH):
+    """Regenerate the constants module. Writes atomically."""
+    source = render_module(csv_path)
+    tmp_path = output_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(source)
+    os.replace(tmp_path, output_path)
+    return output_path
+
+
+def _recorded(module_path, name):
+    """Read a `NAME = literal` line from the generated file without importing it."""
+    try:
+        with open(module_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith(f"{name} = "):
+                    return ast.literal_eval(line.split("=", 1)[1].strip())
+    except FileNotFoundError:
+        pass
+    return None
+
+
+def is_stale(csv_path=DEFAULT_CSV_PATH, module_path=DEFAULT_OUTPUT_PATH):
+    """
+    True if the module is missing or was generated from a different CSV:
+    the recorded CSV_SIZE is compared first, so a resized CSV is caught
+    without hashing it, then CSV_SHA256.
+    """
+    if _recorded(module_path, "CSV_SIZE") != os.path.getsize(csv_path):
+        return True
+    return _recorded(module_path, "CSV_SHA256") != csv_sha256(csv_path)
+
+
+def load_catalog_constants(csv_path=DEFAULT_CSV_PATH, module_path=DEFAULT_OUTPUT_PATH,
+                           regenerate=True):
+    """
+    Import catalog_constants, regenerating it first when it is stale
+    (is_stale). With regenerate=False, or when the module cannot be written,
+    a stale module is imported as-is with a warning.
+
+    When the CSV is not available (e.g. a deployment shipping only the
+    generated module) the existing module is used as-is.
+    """
+    regenerated = False
+    if os.path.exists(csv_path) and is_stale(csv_path, module_path):
+        name = os.path.basename(module_path)
+        if regenerate:
+            try:
+                build(csv_path, module_path)
+                regenerated = True
+            except OSError as e:
+                print(f"Warning: {name} is stale and could not be regenerated: {e}",
+                      file=sys.stderr)
+        else:
+            print(f"Warning: {name} is stale; run python3 build_catalog_constants.py",
+                  file=sys.stderr)
+
+    module_dir = os.path.dirname(os.path.abspath(module_path))
+    if module_dir not in sys.path:
+        sys.path.insert(0, module_dir)
+    if regenerated:
+        importlib.invalidate_caches()
+        if MODULE_NAME in sys.modules:
+            return importlib.reload(sys.modules[MODULE_NAME])
+    return importlib.import_module(MODULE_NAME)
+
+
+# -------------------------------------------------------------------------
+# MAIN EXECUTION
+# -------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    csv_path = DEFAULT_CSV_PATH
+    output_path = DEFAULT_OUTPUT_PATH
+
+    if "--check" in sys.argv:
+        stale = is_stale(csv_path, output_path)
+        print(f"# {output_path}: {'STALE' if stale else 'up to date'}")
+        sys.exit(1 if stale else 0)
+
+    if "--force" in sys.argv or is_stale(csv_path, output_path):
+        build(csv_path, output_path)
+        print(f"# Generated {output_path}")
+    else:
+        print(f"# {output_path} is up to date")
@@ -0,0 +1,6250 @@
+"""
+Catalog Constants (GENERATED - DO NOT EDIT)
+
+Generated by build_catalog_constants.py from 'Biblioteca de Alexandria - en.csv'.
+Regenerate with: python3 build_catalog_constants.py
+"""
+
+from types import MappingProxyType
+
+CSV_FILENAME = 'Biblioteca de Alexandria - en.csv'
+CSV_SHA256 = '2e6aa5ff534a3e9e8f987bace3ce97fed04efe18edacc79bbe05b000ae51cd1d'
+CSV_SIZE = 2024715
+CSV_ROWS = 1748
+
+DISCIPLINES = (
+    'Arts',
+    'Biology',
+    'Chemistry',
+    'Economics',
+    'English',
+    'Environmental Sciences',
+    'Geography',
+    'History',
+    'Mathematics',
+    'Philosophy',
+    'Physical Education',
+    'Physics',
+    'Portuguese',
+    'Science',
+    'Sociology',
+    'Spanish',
+)
+
+GRADES = (10, 20, 30, 40, 50, 60, 70, 80, 90, 100, 110, 120)
+DIFFICULTY_LEVELS = (300, 500, 700)
+
+# discipline -> topics
+TOPICS = MappingProxyType({
+    'Arts': (
+        'Art Knowledge',
+        'Art and Movement',
+        'Artistic Production',
+        'Music',
+        'Performing Arts',
+        'Scenic Art',
+        'Visual Art',
+    ),
+    'Biology': (
+        'Biochemistry and Metabolism',
+        'Ecology and Environment',
+        'Genetics and Heredity',
+        'Genetics and Inheritance',
+        'Human Anatomy and Physiology',
+        'Introduction to Biology and Evolution',
+        'Structure and Function of Organisms',
+    ),
+    'Chemistry': (
+        'Atoms and Periodic Table',
+        'Chemical Equilibrium and Electrochemistry',
+        'Inorganic Compounds and Stoichiometry',
+        'Introduction to Chemistry',
+        'Organic Chemistry: Isomerism and Reactions',
+        'Organic Chemistry: Organic Compounds',
+        'Solutions and Colligative Properties',
+        'Thermochemistry, Kinetics and Nuclear',
+        'Thermochemistry, Kinetics, and Nuclear',
+    ),
+    'Economics': (
+        'Basic Economic Concepts',
+        'Current Economics',
+        'Current Economy',
+        'Economic Indicators and Policies',
+        'Finance and Investment',
+        'Market Structures and Competition',
+    ),
+    'English': (
+        'Grammar',
+        'Reading, Writing and Comprehension',
+        'Reading, Writing, and Comprehension',
+        'Verbs',
+        'Vocabulary',
+    ),
+    'Environmental Sciences': (
+        'Action of Nature',
+        'Biomes and Ecosystems',
+        'Human Action',
+    ),
+    'Geography': (
+        'Ecosystem and Biome',
+        'Geographic Space',
+        'Geographical Space',
+        'Geography Theory',
+        'Geopolitics',
+        'Human Development',
+        'Region',
+        'Territory',
+        'Theory of Geography',
+    ),
+    'History': (
+        'Ancient History',
+        'Contemporary History',
+        'Medieval History',
+        'Modern History',
+        'Theory of History',
+    ),
+    'Mathematics': (
+        'Algebra',
+        'Arithmetic and Numbers',
+        'Combinatorial Analysis and Probability',
+        'Geometry',
+        'Magnitudes and Measurements',
+        'Magnitudes and Measures',
+        'Statistics',
+        'Trigonometry',
+    ),
+    'Philosophy': (
+        'Concept',
+        'Culture',
+        'Ethics',
+        'Origin',
+        'Politics',
+    ),
+    'Physical Education': (
+        'Dance',
+        'Ethics in Sports',
+        'Health',
+        'Recreation',
+        'Research in Sports',
+        'Sport',
+        'Wrestling',
+    ),
+    'Physics': (
+        'Astronomy',
+        'Electromagnetism',
+        'Introduction to Physics',
+        'Kinematics',
+        'Modern Physics and Relativity',
+        'Modern physics and relativity',
+        'Statics and Dynamics',
+        'Thermology',
+        'Waves and Optics',
+    ),
+    'Science': (
+        'Earth and Universe',
+        'Life and Evolution',
+        'Matter and Energy',
+    ),
+    'Sociology': (
+        'Individual and Social Class',
+        'Social Structure',
+        'Sociology Theory',
+        'Theory of Sociology',
+    ),
+    'Spanish': (
+        'Grammar',
+        'Reading, Comprehension and Spelling',
+        'Verbs',
+        'Vocabulary',
+    ),
+})
+
+# discipline -> categories
+CATEGORIES = MappingProxyType({
+    'Arts': (
+        'Aesthetic and Cultural Matrices',
+        'Art Creation Processes',
+        'Art Perception',
+        'Art Space',
+        'Art and Society',
+        'Art and Technology',
+        'Art: Ancient Egypt',
+        'Art: Ancient Greece',
+        'Art: Ancient Mesopotamia',
+        'Art: Ancient Persia',
+        'Art: Ancient Rome',
+        'Art: Contemporary',
+        'Art: Introduction',
+        'Art: Mesoamerica',
+        'Art: Modern Baroque',
+        'Art: Oriental',
+        'Art: Prehistory',
+        'Art: Social Critique',
+        'Artistic Creation',
+        'Artistic Experiences',
+        'Artistic Languages',
+        'Artistic Representations in Dance',
+        'Arts Professionals',
+        'Audiovisual Recording',
+        'Body Sounds',
+        'Collective Work in Arts',
+        'Community Arts Creation',
+        'Contemporary Impressionism',
+        'Contemporary Romanticism and Realism',
+        'Dance Codes',
+        'Dance Experience',
+        'Dance Groups in School',
+        'Dance Movement',
+        'Dance Movements',
+        'Dance in Different Contexts',
+        'Dance: Introduction',
+        'Dances: World',
+        'Dramaturgy and Contemporary Theater',
+        'Drawing',
+        'Early Christian Art',
+        'Evolution of Dance',
+        'Function of Music',
+        'Games, Fun and Music',
+        'Islamic Art',
+        'Medieval Byzantine Art',
+        'Medieval Gothic Art',
+        'Modern Neoclassicism',
+        'Modern Renaissance',
+        'Modernism',
+        'Music Circulation',
+        'Music Recording',
+        'Music: Introduction',
+        'Musical Construction',
+        'Musical Expression',
+        'Playfulness in Art: Themes, Games, and Fun',
+        'Plural Senses of the Arts',
+        'Postmodernism',
+        'Relationships Between Artistic Languages',
+        'Scenic Elements',
+        'Sound Improvisation',
+        'Space in the Construction of Dance Movements',
+        'Stage Styles',
+        'Theater',
+        'Theater Function',
+        'Theater: Creation and Characters',
+        'Theater: Introduction',
+        'Theatrical Elements',
+        'Theatrical Production',
+        'Various Artistic Languages',
+        'Video and Photography',
+        'Visual Arts',
+        'Visual Arts Construction',
+        'Visual Arts and Other Arts',
+        'Visual Arts: Introduction',
+        'Visual Expression',
+    ),
+    'Biology': (
+        'Animals: Circulatory System',
+        'Animals: Digestive System',
+        'Animals: Respiratory System',
+        'Animals: Types of Excretion',
+        'Animals: Vertebrates and Invertebrates',
+        'Biochemistry: Carbohydrates and Lipids',
+        'Biochemistry: DNA and RNA',
+        'Biochemistry: Proteins',
+        'Biochemistry: Vitamins and Minerals',
+        'Cell Division',
+        'Chromosomes',
+        'Cytology',
+        'Ecology: Biocycles',
+        'Ecology: Biogeochemical Cycles',
+        'Ecology: Ecological Pyramids',
+        'Ecology: Ecological Relationships',
+        'Ecology: Ecological Succession',
+        'Ecology: Food and Web Chain',
+        'Ecology: Introduction',
+        'Environment: Biomes',
+        'Environment: Pollution',
+        'Evolution',
+        'Fungi Kingdom: Fungi',
+        'Genetics: Blood Groups',
+        'Genetics: Exercises',
+        'Genetics: Introduction',
+        'Genetics: Linkage',
+        "Genetics: Mendel's 1st Law",
+        "Genetics: Mendel's 2nd Law",
+        'Genetics: Pedigree',
+        'Human Body: Circulatory System',
+        'Human Body: Digestive System',
+        'Human Body: Endocrine System',
+        'Human Body: Excretory System',
+        'Human Body: Importance of Water',
+        'Human Body: Lymphatic System',
+        'Human Body: Muscular System',
+        'Human Body: Nervous System',
+        'Human Body: Reproductive System',
+        'Human Body: Respiratory System',
+        'Human Body: Senses',
+        'Human Body: Skeletal System',
+        'Human Body: Tissues',
+        'Lamarckism and Darwinism',
+        'Living Beings: Types of Reproduction',
+        'Metabolisms',
+        'Monera Kingdom: Bacteria',
+        'Photosynthesis',
+        'Plant Kingdom: Plants',
+        'Protista Kingdom: Protozoa and Algae',
+        'Virus',
+    ),
+    'Chemistry': (
+        'Atoms: Atomic Mass Unit',
+        'Atoms: Characteristics of Atoms and Ions',
+        'Atoms: Electron Distribution',
+        'Atoms: Energy Levels and Sublevels',
+        'Atoms: Evolution of Atomic Models',
+        'Atoms: Isotopes, Isotones, and Isobars',
+        'Basic Stoichiometry',
+        'Biochemistry',
+        'Chemical Bonds: Covalent',
+        'Chemical Bonds: Ionic',
+        'Chemical Bonds: Metallic',
+        'Chemical Equilibrium',
+        'Chemical Formulas',
+        'Chemical Kinetics: Activation Energy',
+        'Chemical Kinetics: Introduction and Average Rate',
+        'Chemical Kinetics: Main Speed Factors',
+        'Chemical Kinetics: Rate Law',
+        'Chemical Kinetics: Reaction Order',
+        'Colligative Properties: Boiling Point Elevation',
+        'Colligative Properties: Colligative Properties Problems',
+        'Colligative Properties: Cryoscopy',
+        'Colligative Properties: Osmotic Pressure',
+        'Colligative Properties: Tonoscopy',
+        'Colligative Properties: Vapor Pressure',
+        'Colloids',
+        'Components and Phases',
+        'Concentration Units: % Mass, Volume and Other Units',
+        'Concentration Units: Molality',
+        'Concentration Units: Molarity',
+        'Current Periodic Table',
+        'Determination of Molecular Formula',
+        'Dissociation and Ionization',
+        'Electrochemistry: Batteries',
+        'Electrochemistry: Electrolysis',
+        "Electrochemistry: Faraday's Laws",
+        'Electrochemistry: Introduction',
+        'Electrochemistry: Nernst Equation',
+        'Equilibrium: Partial Pressures',
+        'Equilibrium: Solubility Product',
+        'Equilibrium: pH and pOH',
+        'Eutectic and Azeotropic Mixtures',
+        'Gases: General Equation',
+        'Gases: Introduction',
+        'Gases: Relationship between Mol and Volume at STP',
+        'Geometric Isomerism',
+        'Homogeneous and Heterogeneous Mixtures',
+        'Hybridization',
+        'Initial Aspects of Matter',
+        'Inorganic Functions: Acids',
+        'Inorganic Functions: Bases',
+        'Inorganic Functions: Nomenclature of Acids',
+        'Inorganic Functions: Nomenclature of Bases',
+        'Inorganic Functions: Oxide Nomenclature',
+        'Inorganic Functions: Oxides',
+        'Inorganic Functions: Salt',
+        'Inorganic Functions: Salt Nomenclature',
+        'Intermolecular Bonds',
+        'Introduction to Organic Chemistry: Aromatic Compounds',
+        'Introduction to Organic Chemistry: Chain Classification',
+        'Introduction to Organic Chemistry: Classification of Carbons',
+        "Introduction to Organic Chemistry: Kekulé's Postulates",
+        'Introduction to Organic Chemistry: Minimum Formula Problems',
+        'Introduction to Organic Chemistry: Orbital Hybridization',
+        'Introduction to Organic Chemistry: Organic Series',
+        'Introduction to Organic Chemistry: Pi and Sigma Bonds',
+        'Introduction to Organic Chemistry: Types of Formulas',
+        'Ionic Equilibrium',
+        "Le Chatelier's Principle",
+        'Main Physical States of Matter',
+        'Main Reaction Types',
+        'Mixtures: Separation of Mixtures',
+        'Mol: Amount of Substance',
+        'Molar Fraction Concentration Units',
+        'Molar Mass: Relationship between Mole and Mass',
+        'Molecular Geometry',
+        'Nuclear Reaction: Activity',
+        'Nuclear Reaction: Half-Life',
+        'Nuclear Reaction: Introduction',
+        'Nuclear Reaction: Kinetic Constant',
+        'Optical Isomerism',
+        'Organic Functions: Acyl Halide',
+        'Organic Functions: Acyl Halide Nomenclature',
+        'Organic Functions: Alcohol',
+        'Organic Functions: Alcohol Nomenclature',
+        'Organic Functions: Aldehyde',
+        'Organic Functions: Aldehyde Nomenclature',
+        'Organic Functions: Amide',
+        'Organic Functions: Amide Nomenclature',
+        'Organic Functions: Amine',
+        'Organic Functions: Amine Nomenclature',
+        'Organic Functions: Aromatic Hydrocarbons',
+        'Organic Functions: Carboxylic Acid',
+        'Organic Functions: Carboxylic Acid Nomenclature',
+        'Organic Functions: Cyclic Hydrocarbons',
+        'Organic Functions: Ester',
+        'Organic Functions: Ester Nomenclature',
+        'Organic Functions: Ether',
+        'Organic Functions: Ether Nomenclature',
+        'Organic Functions: Hydrocarbon Nomenclature',
+        'Organic Functions: Hydrocarbons',
+        'Organic Functions: Ketone',
+        'Organic Functions: Ketone Nomenclature',
+        'Organic Functions: Nitrile and Isonitrile',
+        'Organic Functions: Nitro Compound',
+        'Organic Functions: Nomenclature of Aromatic Hydrocarbons',
+        'Organic Functions: Nomenclature of Cyclic Hydrocarbons',
+        'Organic Functions: Nomenclature of Nitrile and Isonitrile',
+        'Organic Functions: Nomenclature of Nitro Compounds',
+        'Organic Functions: Nomenclature of Phenol',
+        'Organic Functions: Organic Anhydride',
+        'Organic Functions: Organic Anhydride Nomenclature',
+        'Organic Functions: Organic Functions Problems',
+        'Organic Functions: Organic Halide',
+        'Organic Functions: Organic Halide Nomenclature',
+        'Organic Functions: Organic Salt',
+        'Organic Functions: Organic Salt Nomenclature',
+        'Organic Functions: Phenol',
+        'Organic Functions: Sulfonated Functions',
+        'Organic Reactions: Addition',
+        'Organic Reactions: Elimination',
+        'Organic Reactions: Organic Reaction Problems',
+        'Organic Reactions: Oxidation',
+        'Organic Reactions: Substitution',
+        'Oxidation Number',
+        'Periodic Table: History of the Table',
+        'Periodic Table: Metal',
+        'Periodic Table: Non-Metal',
+        'Periodic Table: Properties',
+        'Phase Diagram',
+        'Physical and Chemical Phenomena',
+        'Planar Isomerism',
+        'Polymers',
+        'Ponderal Laws: Dalton',
+        'Ponderal Laws: Lavoisier',
+        'Properties of Organic Compounds: Acidity and Basicity',
+        'Properties of Organic Compounds: Boiling and Melting Points',
+        'Properties of Organic Compounds: Solubility of Organic Compounds',
+        "Proust's Law of Definite Proportions",
+        'Reactions: Balancing',
+        'Reactions: Redox Equation',
+        'Redox Equation Balancing Reactions',
+        'Salt Hydrolysis Equilibrium',
+        'Simple and Compound Substances',
+        'Solutions: Dilution',
+        'Solutions: Introduction',
+        'Solutions: Mixtures of the Same Solute',
+        'Solutions: Non-Reactive Mixing',
+        'Solutions: Reaction Mixing',
+        'Solutions: Solubility',
+        'Solutions: Types of Solution',
+        'State Changes',
+        'Stoichiometry: Limiting and Excess',
+        'Stoichiometry: Purity and Yield',
+        'Stoichiometry: Stoichiometry Problems',
+        'Subject: General Properties',
+        'Subject: Physical, Chemical, and Organoleptic Properties',
+        'Substances and Mixtures',
+        'Thermochemistry: Enthalpy',
+        'Thermochemistry: Enthalpy by Bonding',
+        'Thermochemistry: Entropy',
+        'Thermochemistry: Gibbs Free Energy',
+        "Thermochemistry: Hess's Law",
+        'Thermochemistry: Internal Energy',
+    ),
+    'Economics': (
+        'Accounting and Financial Statements',
+        'Balance of Payments',
+        'Basic Economics: Concepts',
+        'Competition Model: Production and Cost',
+        'Consequences of Stabilization Policies',
+        'Consumer Theory',
+        'Contemporary Macroeconomics',
+        'Current Economy: Rest of the World',
+        'Current Economy: USA',
+        'Economic Indicators: Economic Cycle',
+        'Economic Indicators: Inflation',
+        'Economic Indicators: Unemployment',
+        'Factor Markets: Advanced',
+        'Factor Markets: Introduction',
+        'Financial Sector: Advanced',
+        'Financial Sector: Introduction',
+        'Fiscal Policy',
+        'Functions of Money',
+        'Imperfect Competition',
+        'Interest',
+        'International Capital Flows and Rates',
+        'International Trade and Finance',
+        'Macroeconomics Standards',
+        'Market Failure and the Role of Government',
+        'Mathematical Finance',
+        'Monetary Policy',
+        'Money, Banking and Central Banks',
+        'National Income',
+        'Opportunity Cost',
+        'Perfect Competition',
+        'Price Elasticity',
+        'Real Estate Sector',
+        'Stocks and Bonds',
+        'Supply and Demand',
+        'Taxes',
+        'Valuation',
+    ),
+    'English': (
+        'A, An, The',
+        'Adjectives and Adverbs',
+        'Adjectives: Introduction',
+        'Alphabet',
+        'Alphabet and Sounds',
+        'Antonyms and Synonyms',
+        'Aspects of Current Genres',
+        'Basic Text Interpretation',
+        'Basic Text Writing',
+        'Basic Vocabulary: Family and Places',
+        'Cognates and False Friends',
+        'Comparative and Superlative of Adjectives',
+        'Conjunctions',
+        'Connectors',
+        'Cultural Aspects',
+        'Elements of Advertising and Argumentation',
+        'English Text Interpretation',
+        'Expansion of the English Language',
+        'Household Objects and Parts',
+        'If Clauses',
+        'Imperative',
+        'Indication of Possession',
+        'Indicative of Questions and Answers',
+        'Indicative of Questions and Answers: Introduction',
+        'Interrogative Relative Pronouns',
+        'Introduction to Connectors',
+        'Introduction to If Clauses',
+        'Negative Sentences',
+        'Negative Sentences: Introduction',
+        'Numerals',
+        'Object Pronouns',
+        'Oral Activities',
+        'Paraphrasing',
+        'Past Continuous',
+        'Personal Pronouns',
+        'Personal Routines and Information',
+        'Plural',
+        'Polysemy',
+        'Possessive Pronouns',
+        'Prefixes and Suffixes',
+        'Prepositions',
+        'Prepositions of Time',
+        'Present Continuous',
+        'Pronouns and Adjectives: Demonstratives',
+        'Pronouns and Adjectives: Possessive and Genitive',
+        'Pronouns: Object and Subject',
+        'Question Tags',
+        'Reading and Text Comprehension',
+        'Reflexive Pronouns',
+        'Relative Pronouns',
+        'Relative Pronouns: Introduction',
+        'Some, Any, Many, Much',
+        'Some, Any, Many, Much, Few, a Few, and Quantities',
+        'Speaking Activities',
+        'Text Interpretation',
+        'Text Structuring and Production',
+        'Use and Variation of the English Language',
+        'Verbs: Can',
+        'Verbs: Future Perfect',
+        'Verbs: Future with Going to and Will',
+        'Verbs: Gerunds and Infinitives',
+        'Verbs: Introduction to Modal Verbs',
+        'Verbs: Introduction to Past Continuous',
+        'Verbs: Introduction to Present Continuous',
+        'Verbs: Introduction to Simple Present',
+        'Verbs: Introduction to the Imperative',
+        'Verbs: Introduction to the Verb to Be',
+        'Verbs: Main Future Forms',
+        'Verbs: Modal Verbs',
+        'Verbs: Passive Voice',
+        'Verbs: Past Perfect',
+        'Verbs: Phrasal Verbs',
+        'Verbs: Present Perfect Continuous',
+        'Verbs: Review of the Verb to Be',
+        'Verbs: Simple Future',
+        'Verbs: Simple Past',
+        'Verbs: Simple Past Regular and Irregular Verbs',
+        'Verbs: Simple Past and Present Perfect',
+        'Verbs: Simple Present',
+        'Verbs: Tense Exercises',
+        'Verbs: to Be',
+        'Vocabulary: Animals and Plants',
+        'Vocabulary: Animals, Plants and Human Body Parts',
+        'Vocabulary: Classroom Elements',
+        'Vocabulary: Colors',
+        'Vocabulary: Domestic Animals',
+        'Vocabulary: Family Core',
+        'Vocabulary: Family Members and Friends',
+        'Vocabulary: Food, Objects and Parts of the House',
+        'Vocabulary: Food: Food and Drink',
+        'Vocabulary: Fun and Leisure',
+        'Vocabulary: How to Request Clarifications',
+        'Vocabulary: Human Body Parts',
+        'Vocabulary: Interview Aspects',
+        'Vocabulary: Main Adjectives',
+        'Vocabulary: Main Professions',
+        'Vocabulary: Name and Greeting',
+        'Vocabulary: School and Community Places',
+        'Vocabulary: Scientific Technical Vocabulary',
+        'Word Pronunciation',
+        'Written Productions',
+    ),
+    'Environmental Sciences': (
+        'Acid Rain',
+        'Age Structure Diagrams',
+        'Aquaculture',
+        'Aquatic Biomes',
+        'Ecological Succession: Introduction',
+        'Ecological Tolerance',
+        'Ecosystem Services',
+        'El Niño and La Niña',
+        'Energy in an Ecosystem',
+        'Food Chains and Trophic Networks',
+        'Generalist and Specialist Species',
+        'Global Climate Change',
+        'Green Revolution',
+        'Indoor Air Pollution',
+        'Introduction to Air Pollution',
+        'Introduction to Biodiversity',
+        'Introduction to Ecosystems',
+        'Invasive Species',
+        'Island Biogeography',
+        'Meat Production Methods and Overfishing',
+        'Natural Disruptions to Ecosystems',
+        'Noise Pollution',
+        'Ocean Warming and Acidification',
+        'Ozone Depletion',
+        'Pest Control Methods',
+        'Photochemical Smog',
+        'Pollution and Human Health',
+        'Population Growth and Development: Introduction',
+        'Primary Productivity',
+        'Solid Waste Elimination and Waste Reduction Methods',
+        'Survival Curves',
+        'Terrestrial Biomes',
+        'Thermal Pollution',
+        'Trophic Levels',
+        'Types and Effects of Irrigation',
+    ),
+    'Geography': (
+        '4.0 Revolution',
+        'Africa: Economic Dependency',
+        'Africa: Environmental Issues',
+        'Africa: Globalized World',
+        'Africa: Globalized World: Review',
+        'Africa: Migration Flows',
+        'Africa: Natural',
+        'Africa: Neocolonialism and Independence',
+        'Africa: Population',
+        'Africa: Socioeconomic Characteristics',
+        'Africa: Tensions and Conflicts',
+        'African Dependency Issues',
+        'Amazon: Biomes, Economy and Environmental Impacts',
+        'Amazon: Biomes, Economy and Environmental Impacts: Review',
+        'America: Colonization and Independence',
+        'America: Conflicts and Tensions',
+        'America: Indigenous Peoples',
+        'America: Latin American Blocks',
+        'America: Natural Aspects',
+        'America: Population',
+        'America: Regionalization',
+        'America: U.S. and Its Influences in Latin America',
+        'Anglo-American: Industry, Agriculture and Development Model',
+        'Antarctica: Natural and Human Aspects',
+        'Asia and Europe: Territorial Conflicts',
+        'Asia: Asian Tigers',
+        'Asia: Economy and Population',
+        'Asia: Energy Matrices',
+        'Asia: Environmental Issues',
+        'Asia: Natural Aspects',
+        'Asia: Socialism',
+        'Asia: Socialism: Review',
+        'Atmospheric Circulation, Wind and Rain: Review',
+        'Atmospheric Circulation: Wind and Rain',
+        'Biodiversity: Characteristics',
+        'Bipolar World',
+        'Bipolarized World: Review',
+        'Capitalism',
+        'Capitalism: Review',
+        'Cartographic Representations',
+        'Cartographic Scales',
+        'Cartography: Map Reading and Making',
+        'Cartography: Scale, Projection and Geotechnology: Review',
+        'Cartography: Scale, Projection, and Geotechnology',
+        'Cartography: Time and Space',
+        'Cartography: Time and Space: Review',
+        'Changes and Continuities',
+        'Characteristics of the Continents: Africa',
+        'Characteristics of the Continents: Americas',
+        'Characteristics of the Continents: Asia',
+        'Characteristics of the Continents: Europe',
+        'Characteristics of the Continents: Oceania',
+        'China: Natural and Human Aspects',
+        'Cities and Different Urban Spaces',
+        'City and Countryside',
+        'Climate: Human Actions and Climate Change',
+        'Climate: World',
+        'Climatic Factors',
+        'Climatic Factors: Review',
+        'Cold War',
+        'Conscious Consumption and Circulation of Goods',
+        'Conservation and Environmental Degradation',
+        'Different Places',
+        'Different Types of Work',
+        'Drawings and Mind Maps',
+        'Earth: Formation of the Continents',
+        'Earth: Formation of the Continents: Review',
+        'Earth: Planet Formation',
+        'Earth: Tectonic Plates',
+        'Eastern Europe: Characteristics and Conflicts',
+        'Emergence of Cities',
+        'Energy Matrices',
+        'Energy Sources: Non-Renewable Energies',
+        'Energy Sources: Non-Renewable Energies: Review',
+        'Energy Sources: Renewable Energies',
+        'Energy Sources: Renewable Energies: Review',
+        'Europe: EURO and the Trade Blocks',
+        'Europe: Economy and Population',
+        'Europe: Energy Matrices',
+        'Europe: Environmental Issues',
+        'Europe: Euro and Other Trade Blocks: Review',
+        'Europe: Natural Aspects',
+        'Europe: Russia vs Ukraine',
+        'European Union',
+        'Everyday: Housing, Toys, Clothes, Furniture, and Daily Objects',
+        'Fundamentals of Geography',
+        'Fundamentals of Geography: Review',
+        'Geomorphology: Endogenous and Exogenous Agents',
+        'Geomorphology: Endogenous and Exogenous Agents: Review',
+        'Geomorphology: Relief Structure and Rock Types',
+        'Geomorphology: Relief Structure and Rock Types: Review',
+        'Global Geopolitical Concepts',
+        'Global Geopolitics',
+        'Globalization and Neoliberalism',
+        'Globalized World',
+        'Globalized World: Review',
+        'Hydrography: Aquifers',
+        'Impacts of Human Activities',
+        'Industrial Revolution: Characteristics',
+        'Industrial Revolution: Review',
+        'Industry Classification',
+        'Industry Classification: Review',
+        'Innovation and Energy',
+        'International Conferences on Environmental Impacts',
+        'Japan: Natural and Human Aspects',
+        'Landscape Transformations',
+        'Landscape: Transformation',
+        'Landscapes: Natural and Urban',
+        'Latin America: Economic Crisis and Social Problems',
+        'Latin America: Left-Wing Governments',
+        'Latin America: Left-Wing Governments: Review',
+        'Life and Natural Cycles',
+        'MERCOSUR: Characteristics and Members',
+        'MERCOSUR: Introduction',
+        'Manners and Transportation',
+        'Map Reading',
+        'Maps and Living Places',
+        'Maps and Photographs',
+        'Maps: Satellites and Photographs',
+        'Means of Transport and Communication',
+        'Midwest: Region Growth, Deforestation and its Biomes',
+        'Modes and Transportation: Review',
+        'NATO and Counter-Terrorism: Review',
+        'Nationalism and Geopolitics: Review',
+        'New World Order',
+        'New World Order: Review',
+        'Nuclear Energy',
+        'Nuclear Energy: Review',
+        'Oceania: Natural and Human Aspects',
+        'Production and Consumerism',
+        'Production and Consumption',
+        'References and Games',
+        'Relief: Characteristics',
+        'Relief: Main Types',
+        'Revolution 4.0: Review',
+        'Rocks: Characteristics',
+        'Rural and Urban Relationship',
+        'Schedule: Social Activities',
+        'Soil Formation: Degradation and Conservation Methods',
+        'Soil: Main Types',
+        'Soil: Review',
+        'Spatial References',
+        "Subject's Place in the World",
+        'Taylorism and Fordism',
+        'Taylorism and Fordism: Review',
+        'Time and Experience',
+        'Transportation and Communication Media',
+        'Types of Pollution',
+        'Urban Geography',
+        'Use of Natural Resources',
+        'Vegetation: Characteristics',
+        'Water Conservation',
+        'Water Resources: Water Reuse',
+        'Weather Elements',
+        'Weather Elements: Review',
+        'Weather and Climate',
+        'Work and Technology',
+        'Work: Rural and Urban',
+        'World: Agriculture and Hunger',
+        'World: Arab Spring',
+        'World: Biomes',
+        'World: Biomes: Review',
+        'World: Climate: Review',
+        'World: Cosmopolitan',
+        'World: Diversity and Transformation',
+        'World: Global Inequality',
+        'World: Globalization',
+        'World: Hydrography',
+        'World: Hydrography: Review',
+        'World: Main Climates',
+        'World: NATO and the Fight Against Terrorism',
+        'World: Nation-State Economics',
+        'World: Population Distribution',
+        'World: UN and Intergovernmental Organizations',
+    ),
+    'History': (
+        'Absolute Monarchies',
+        'Absolutism',
+        'Absolutism: Review',
+        'Africa: Kush, Axum and Ghana: Review',
+        'African Kingdoms: Kush, Axum, and Ghana',
+        'America in the 19th Century',
+        'America in the 19th Century: Review',
+        'America: Indigenous Peoples',
+        'America: Native Peoples: Review',
+        'American Independence Review',
+        'American War of Independence',
+        'Ancient Cities and Contemporary Cities',
+        'Ancient Egypt',
+        'Ancient Egypt: Introduction',
+        'Ancient Egypt: Review',
+        'Ancient Greece, Classical Period, Hellenism: Review',
+        'Ancient Greece, Pre-Hellenism: Review',
+        'Ancient Greece: Classical Period, Hellenism',
+        'Ancient Greece: Introduction',
+        'Ancient Greece: Pre-Hellenism',
+        'Ancient Rome, Monarchy and Republic: Review',
+        'Ancient Rome, Roman Empire: Review',
+        'Ancient Rome: Introduction',
+        'Ancient Rome: Monarchy and Republic',
+        'Ancient Rome: Roman Empire',
+        'Arabs: Expansion of Islam',
+        'Asia: Far East',
+        'Birth of Cities',
+        'Change in Life in the Countryside and the City',
+        'Chinese Communist Revolution',
+        'Chinese Communist Revolution: Review',
+        'City: Work, Culture, and Leisure',
+        'Cold War: Formation of Blocs',
+        'Cold War: Formation of the Blocs: Review',
+        'Cold War: Introduction',
+        'Cold War: Peaceful Coexistence, Conflicts and Social Movements',
+        'Cold War: Peaceful Coexistence, Conflicts and Social Movements: Review',
+        'Concept of Temporality',
+        'Conflicts in the Middle East',
+        'Conflicts in the Middle East: Review',
+        'Cuban Communist Revolution',
+        'Cuban Communist Revolution: Review',
+        'Decolonization of Africa and Asia',
+        'Decolonization of Africa and Asia: Review',
+        'Decolonization: Africa and Asia',
+        'Dictatorial Regimes in Latin America',
+        'Dictatorial Regimes in Latin America: Review',
+        'Dictatorships in Latin America',
+        'Emergence of the Human Species',
+        'English Revolution: From the Puritan Revolution to the Glorious Revolution',
+        'English Revolution: Review',
+        'English Revolution: from the Puritan Revolution to the Glorious Revolution',
+        'Enlightenment: Review',
+        'European Imperialism in Asia and Africa',
+        'European Maritime Expansion: Mercantilism',
+        'European Maritime Expansion: Review',
+        'Experience Recording',
+        'Fall of the Western Roman Empire, Late Antiquity: Review',
+        'Family Life',
+        'Family and Community',
+        'First Industrial Revolution',
+        'First Industrial Revolution: Review',
+        'Formation of Modern States',
+        'Formation of Modern States: Review',
+        'French Revolution: Constitutional Monarchy, National Convention, and Directory',
+        'French Revolution: Review',
+        'From Nomadism to Sedentism: Birth of the First Cities and Agriculture',
+        'Games and Toys in Different Eras',
+        'Globalized World',
+        'Great Navigations',
+        'Heritage: Material and Intangible',
+        'Historical Time',
+        'History and Memory',
+        'History of Indigenous Peoples',
+        'Human Actions: Time and Space',
+        'Illustration',
+        'Imperialism: Africa',
+        'Imperialism: Africa: Review',
+        'Imperialism: Asia',
+        'Imperialism: Asia: Review',
+        'Islam: Birth and Expansion',
+        'Islam: Birth and Expansion: Review',
+        'Italian and German Unification: Review',
+        'Language and Technology in the Study of History',
+        'Late Antiquity: Fall of the Western Roman Empire',
+        'Latin American Independences: Formation of the First Republics',
+        'Latin American Independences: Review',
+        'Media and Communication',
+        'Mesoamerica: Introduction',
+        'Mesopotamia',
+        'Mesopotamia: Introduction',
+        'Mesopotamia: Review',
+        'Middle Ages: Introduction',
+        'Middle Ages: Late Middle Ages, High Middle Ages, and Early Middle Ages',
+        'Middle Ages: Review',
+        'Milestones of Memory',
+        'Movement of People and Goods',
+        'Napoleonic Period',
+        'Napoleonic Period: Review',
+        'Nomadism and the First Communities',
+        'Notion of State',
+        'Objects and Memory',
+        'Official Documents',
+        'Perception of Social Environment Differences',
+        'Politics and Economy: Latin America in the Post-Military Dictatorship',
+        'Protestant Movement: Review',
+        'Protestant Movements',
+        'Protestantism',
+        'Religion of Ancient Peoples',
+        'Renaissance',
+        'Renaissance: Review',
+        'Routes: Land, River and Maritime',
+        'Russian Revolution',
+        'Russian Revolution: From the Fall of Tsarism to the Revolutionary Process: Review',
+        'Russian Revolution: From the Fall of the Tsar to the Revolutionary Process',
+        'Russian Revolution: Lenin and Stalin',
+        'Russian Revolution: Lenin and Stalin: Review',
+        'School and Community',
+        'Second Industrial Revolution and 19th Century Social Doctrines: Review',
+        'Second Industrial Revolution and the Social Doctrines of the 19th Century',
+        'Social and Cultural Transformations',
+        'Space: Public and Domestic',
+        'Spanish Colonization in America: Economy, Society, Administration, and Slavery',
+        'Spanish Colonization: Economy, Politics, Society, Colonial Pact, and Slavery',
+        'Spanish Colonization: Review',
+        'Study of History: Introduction',
+        'Terrorism',
+        'Thirteen Colonies',
+        'Thirteen Colonies: Review',
+        'Time Measurement',
+        'Time and History',
+        'Time and Orality',
+        'Totalitarian Regimes in Europe: Francoism and Salazarism',
+        'Totalitarian Regimes in Europe: Nazism, Fascism, Communism, Salazarism, and Francoism: Review',
+        'Totalitarian Regimes in Europe: Nazism, Fascism, and Communism',
+        'Totalitarian Regimes: Nazism, Fascism, Communism, Francoism, and Salazarism',
+        'USA and Latin America: International Relations',
+        'Unifications in Europe: Italy and Germany',
+        'What is History: Review',
+        'What is history?',
+        'Work and Nature',
+        'World War I',
+        'World War I: Background',
+        'World War I: Conclusion of the War',
+        'World War I: Review',
+        'World War II',
+        'World War II: Review',
+    ),
+    'Mathematics': (
+        '3D Geometric Solids',
+        'Absolute Value and Modulus',
+        'Absolute Value and Number Order',
+        'Addition and Subtraction of Decimal Numbers',
+        'Addition and Subtraction of Natural Numbers',
+        'Addition and Subtraction of Natural Numbers Less than 100',
+        'Addition and Subtraction of Naturals Less than 1,000',
+        'Addition and Subtraction: Missing Values',
+        'Algebraic Expressions',
+        'Algorithms and Problems',
+        'Algorithms and Problems: Medium',
+        'Analytic Geometry: Centroid',
+        'Analytic Geometry: Distance Between Points',
+        'Analytic Geometry: Equation of Conics',
+        'Analytic Geometry: Equation of a Line',
+        'Analytic Geometry: Equation of the Circle',
+        'Analytic Geometry: Midpoint',
+        'Angle Classification',
+        'Angle Congruence and Proportionality',
+        'Angle Measurement',
+        'Angle Problems',
+        'Angles: Classification',
+        'Angles: Clocks',
+        'Angles: Degrees and Radians',
+        'Angles: Vertically Opposite Angles',
+        'Angular Relationships in Parallel Lines',
+        'Area and Perimeter: Comparison',
+        'Area of Plane Figures: Unit Squares',
+        'Area of Shapes',
+        'Area: Circle',
+        'Area: Composite Figures',
+        'Area: Rectangle and Parallelogram',
+        'Area: Square',
+        'Area: Trapezoid',
+        'Area: Triangle',
+        'Arithmetic Progression: Sum',
+        'Arithmetic Progression: Terms',
+        'Bar or Pictorial Charts',
+        'Base Change',
+        'Base Change Problems',
+        'Basic Addition Facts',
+        'Basic Multiplication Facts',
+        'Basic Probability',
+        'Basic Second Degree Equation',
+        'Basic Subtraction Facts',
+        'Basic Trigonometric Lines: 30º, 45º, 60º',
+        'Binomial Probability',
+        'Bisector and Perpendicular Bisector',
+        'Cartesian Coordinates',
+        'Cartesian Plane: 1st Quadrant',
+        'Cartesian Plane: Points',
+        'Census and Sample Research',
+        'Circle Area',
+        'Circle: Angles in a Circle',
+        'Circle: Circumference Problems',
+        'Circle: Eccentric Angles',
+        'Circle: Inscribed and Central Angles',
+        'Circle: Power of a Point',
+        'Circles: Introduction',
+        'Circumscribed Polygons',
+        'Classification of Angles by Their Opening',
+        'Classification of Shapes',
+        'Clock Reading',
+        'Combinations',
+        'Combinatorial Analysis: Additive Principle',
+        'Combinatorial Analysis: Circular Permutation',
+        'Combinatorial Analysis: Combination',
+        'Combinatorial Analysis: Factorial',
+        'Combinatorial Analysis: Multiplicative Principle',
+        'Combinatorial Analysis: Number of Non-Negative Integer Solutions',
+        'Combinatorial Analysis: Number of Positive Integer Solutions',
+        "Combinatorial Analysis: Pascal's Triangle",
+        'Combinatorial Analysis: Permutation with Repetition',
+        'Combinatorial Analysis: Simple Permutation',
+        'Comparison of Natural Numbers Less Than 100',
+        'Comparison of Natural Numbers Less Than 20',
+        'Comparison of Object Areas',
+        'Comparison of Research Information',
+        'Comparisons between fractions',
+        'Complex Numbers: Basic Equality',
+        'Complex Numbers: Basic Operations',
+        'Complex Numbers: Conjugate',
+        'Complex Numbers: Exponentiation',
+        'Complex Numbers: Gauss Plane',
+        'Complex Numbers: Introduction',
+        'Complex Numbers: Magnitude',
+        'Complex Numbers: Multiplication and Division',
+        'Complex Numbers: Powers of i',
+        'Complex Numbers: Trigonometric Form',
+        'Composition and Decomposition of Natural Numbers Less than 10,000',
+        'Composition and Decomposition of Natural Numbers Less than 100',
+        'Composition and Decomposition of Natural Numbers Less than 1000',
+        'Composition and Decomposition of Natural Numbers into Powers of 10',
+        'Compound Rule of Three Problems',
+        'Conditional Probability',
+        'Congruent Figures',
+        'Contextualized Measurement Problems',
+        'Conversion: Area',
+        'Conversion: Length',
+        'Conversion: Mass and Volume',
+        'Counting Natural Numbers Less Than 1,000',
+        'Counting Natural Numbers Less Than 100',
+        'Counting Principle',
+        'Counting: Introduction',
+        'Data Interpretation',
+        'Data Reading and Interpretation',
+        'Data Representation',
+        'Dates and Time Periods',
+        'Decimal Numbers',
+        'Decimal System',
+        'Determinant: 1x1',
+        'Determinant: 2x2',
+        'Determinant: 3x3',
+        'Determinant: Inverse Matrix and Cofactors',
+        'Determinant: Laplace',
+        "Determinants: Binet's Theorem",
+        'Determinants: Properties',
+        'Direct Proportion Rule Problems',
+        'Distance Between Points in the Cartesian Plane',
+        'Divisibility Criteria',
+        'Divisibility Criteria: Review',
+        'Division of Naturals',
+        'Divisors and Multiples',
+        'Double, Half, Triple and Third Part',
+        'Dubious Figures',
+        'Elements of a Sequence',
+        'Equal Parts Distribution',
+        'Equality Between Two Members',
+        'Equality: Identical Sums and Subtractions',
+        'Equality: Missing Values',
+        'Equality: Same Operation on Both Sides',
+        'Equations with Two Variables',
+        'Equations: Irrational',
+        'Event Classification',
+        'Exact Square and Cubic Roots',
+        'Expansion and Reduction of Figures',
+        'Exponential Equation',
+        'Exponential Function: Graph',
+        'Exponential Function: Inputs and Outputs',
+        'Exponential Inequality',
+        'Exponentiation: Introduction',
+        'Exponentiation: Negative Exponents',
+        'Exponentiation: Properties',
+        'Exponentiation: Rational Numbers',
+        'Factorial',
+        'Factorization',
+        'Factorization: Difference of Squares',
+        'Factorization: Grouping and Evidencing',
+        'Factorization: Second Degree Expressions',
+        'Financial Mathematics: Compound Interest',
+        'Financial Mathematics: Interest and Time Value of Money',
+        'Financial Mathematics: Simple Interest',
+        'Financial Mathematics: Spreadsheets',
+        'First Degree Equation',
+        'First Degree Equation Problems',
+        'First Degree Equations',
+        'First Degree Function: Graph and Table',
+        'First Degree Function: Inputs and Outputs',
+        'First Degree Function: Introduction',
+        'First Degree Inequality',
+        'Flat Figures: Introduction',
+        'Flat Figures: Sides and Vertices',
+        'Flowcharts',
+        'Fractions and Decimal Numbers: Conversion',
+        'Fractions: Addition and Subtraction',
+        'Fractions: Common Denominators',
+        'Fractions: Comparison',
+        'Fractions: Composing Shapes',
+        'Fractions: Concept of Conversion between Fractions and Decimal Numbers',
+        'Fractions: Equivalent Fractions',
+        'Fractions: Multiplication and Division',
+        'Fractions: Parts of Natural Numbers',
+        'Fractions: Representation',
+        'Function: Bijective',
+        'Function: Codomain and Range',
+        'Function: Domain',
+        'Function: Even or Odd',
+        'Function: Graphs',
+        'Function: Injective and Surjective',
+        'Function: Inputs and Outputs',
+        'Function: Introduction',
+        'Function: Linear Functions',
+        'Function: Representations and Applications',
+        'Fundamental Principle of Counting',
+        'GCD',
+        'GCD Problems',
+        'Geometric Algorithms',
+        'Geometric Constructions',
+        'Geometric Progression: Sum',
+        'Geometric Progression: Terms',
+        'Graphics: Bars and Columns',
+        'Graphics: Bars, Tables, Lines, Images',
+        'Graphics: Graph Suitability',
+        'Graphics: Pie Charts',
+        'Graphics: bar, table, line, image',
+        'Graphics: graph evaluation',
+        'Greater or Lesser',
+        'Ground Floor and Aerial Views',
+        'Hexagon Area',
+        'Indirect Rule of 3 Problems',
+        'Inequalities: Introduction',
+        'Inscribed Angles',
+        'Inscribed Polygons',
+        'Internal Angles of Quadrilaterals',
+        'Introduction to Regular Polygons',
+        'Inverse Relationships of Operations',
+        'Irrational Numbers',
+        'Irrational Numbers: Number Line',
+        'LCM',
+        'LCM Problems',
+        'Linear Equations: Comparison',
+        'Linear Systems: Resolution',
+        'Linear Systems: System Discussion',
+        'Linear Systems: Written by Matrices',
+        'Lines, Line Segments, and Rays',
+        'Lines: Parallel and Transversal',
+        'Localization',
+        'Logarithm: Introduction',
+        'Logarithm: Properties',
+        'Logarithm: Values',
+        'Logarithmic Equation',
+        'Logarithmic Function: Graph',
+        'Logarithmic Function: Inputs and Outputs',
+        'Logarithmic Inequality',
+        'Mathematical Expressions',
+        'Matrix: Classifications',
+        'Matrix: Equality',
+        'Matrix: Inverse Calculation',
+        'Matrix: Operations',
+        'Metric Relationships in the Right Triangle',
+        'Metric vs. Imperial System',
+        'Modular Equation',
+        'Modular Function: Graph',
+        'Modular Function: Inputs and Outputs',
+        'Modular Inequality',
+        'Movement of Objects and People',
+        'Movements and Location: Grid Meshes',
+        'Multiplication and Division Problems',
+        'Multiplication and Division of Decimal Numbers',
+        'Multiplication by 2, 3, 4, 5, and 10',
+        'Multiplication by 2, 3, 4, and 5',
+        'Multiplication with Missing Values',
+        'Negative Numbers',
+        "Newton's Binomial: Independent Term of x",
+        "Newton's Binomial: Introduction",
+        "Newton's Binomial: Sum of the Coefficients (Binomials)",
+        'Non-Rational Square and Cubic Roots',
+        'Notable Cube Products',
+        'Notable Products',
+        'Notable Products of Squares',
+        'Number Line: Natural Numbers',
+        'Number of Solutions of the System',
+        'Numeric Sets',
+        'Numerical Expressions',
+        'Operations with Real Numbers',
+        'Operations: Addition and Subtraction',
+        'Operations: Decimals',
+        'Operations: Decimals and Fractions',
+        'Operations: Mixed Numbers',
+        'Operations: Multiplication and Division',
+        'Operations: Natural Numbers',
+        'Operations: Negative Numbers',
+        'Operations: Order of Operations',
+        'Operations: Problems with Rational Operations',
+        'Operations: Properties',
+        'Operations: Ratios',
+        'Opposite Numbers',
+        'Organization of Objects by Attributes',
+        'Orthogonal View',
+        'Parallel Lines Cut by a Transversal',
+        'Paths of People and Objects',
+        'Percentage: Conversion with Fractions and Decimals',
+        'Percentage: Discounts or Percentage Increases',
+        'Percentage: Notable Percentages',
+        'Percentage: Percentage Problems',
+        'Percentage: Relation to Proportionality',
+        'Percentage: Successive Percentages',
+        'Perfect Squares',
+        'Perimeter',
+        'Perimeter and Area Relationship',
+        'Perimeter: Circle',
+        'Permutations',
+        'Planning: Spatial Figures',
+        'Point, Line, and Plane',
+        'Polygon Angles',
+        'Polygon Transformations',
+        'Polygons: Classification',
+        'Polygons: Diagonal',
+        'Polygons: Introduction',
+        'Polygons: Sum of Angles',
+        'Polynomials: Factorization',
+        "Polynomials: Girard's Relations",
+        'Polynomials: Numerical Values',
+        'Polynomials: Operations',
+        'Polynomials: Properties',
+        'Polynomials: Remainder',
+        'Polynomials: Roots',
+        'Possible Outcomes',
+        'Prime and Composite Numbers',
+        'Prime and Composite Numbers: Review',
+        'Prisms and Pyramids: Layouts and Characteristics',
+        'Probability Predictions',
+        'Probability of Complementary Events',
+        'Probability: Dependent Events',
+        'Probability: Independent Events',
+        'Probability: Introduction',
+        'Probability: Properties',
+        'Probability: Sample Space',
+        'Probability: Successive Events',
+        'Probable and Improbable',
+        'Problems and Flowcharts',
+        'Problems with Measurements',
+        'Problems with Scientific Notation',
+        'Properties of Exponentiation: Rational Exponents',
+        'Properties of Shapes',
+        'Proportion',
+        'Proportionality Relationships',
+        'Proportions in the Cartesian Plane',
+        'Pythagorean Theorem',
+        'Quadratic Equation: Bhaskara',
+        'Quadrilateral Classification',
+        'Quadrilateral: Parallelogram',
+        'Quadrilateral: Rectangle',
+        'Quadrilateral: Rhombus',
+        'Quadrilaterals: Introduction',
+        'Quadrilaterals: Trapezoid',
+        'Radication',
+        'Radication: Properties',
+        'Random Events',
+        'Ratio',
+        'Rational Exponents: Powering',
+        'Rational Number Sorting',
+        'Rational Numbers: Introduction',
+        'Rationalization of Denominators',
+        'Reading and Comparing Natural Numbers Less Than 10,000',
+        'Reading and Comparing Natural Numbers Less Than 100,000',
+        'Reasons and Proportions',
+        'Rectangle Area',
+        'Reflections in the Cartesian Plane',
+        'Reflections of Plane Figures',
+        'Reflections: Advanced',
+        'Regular Polygon: Construction',
+        'Regular Polygons: Angles and Diagonals',
+        'Regular Polygons: Introduction',
+        'Relationships and equations of magnitudes',
+        'Remainders of Division',
+        'Repeating Decimals',
+        'Representation and Reading of Research',
+        'Research: Sampling',
+        'Right Triangle: Metric Relationships',
+        'Right and Non-Right Angles',
+        'Roman Numerals',
+        'Rotations in the Cartesian Plane',
+        'Rotations of Plane Figures',
+        'Rotations: Advanced',
+        'Rounding',
+        'Rule of 3: Direct',
+        'Rule of 3: Indirect',
+        'Sample Spaces',
+        'Scientific Notation',
+        'Scientific Notation: Review',
+        'Second Degree Equation: Coefficients',
+        'Second Degree Equations',
+        'Second Degree Function: Graph and Table',
+        'Second Degree Function: Inputs and Outputs',
+        'Second Degree Function: Introduction',
+        'Second Degree Function: Maximums and Minimums',
+        'Second Degree Inequality',
+        'Sequence Terms',
+        'Sequence of Events of the Day',
+        'Sequences and Patterns',
+        'Sequences: Addition and Subtraction',
+        'Sequences: Classifications',
+        'Sequences: Increasing and Decreasing',
+        'Sequences: Missing Elements',
+        'Sequences: Multiples of a Natural Number',
+        'Sequences: Terms',
+        'Sets',
+        'Sets: Introduction',
+        'Side, Radius and Apothem of Inscribed and Circumscribed Polygons',
+        'Similar Matrix',
+        'Size Comparison by Terms',
+        'Spatial Figures',
+        'Spatial Geometric Figures: Characteristics and Layouts',
+        "Spatial Geometry: Cavalieri's Principle",
+        'Spatial Geometry: Deformations in Projections',
+        'Spatial Geometry: Dihedrals and Trihedrals',
+        'Spatial Geometry: Frontal Views',
+        'Spatial Geometry: Fundamentals',
+        'Spatial Geometry: Metric Relations of Cones',
+        'Spatial Geometry: Metric Relations of Prisms',
+        'Spatial Geometry: Metric Relations of Pyramids',
+        'Spatial Geometry: Metric Relations of Spheres',
+        'Spatial Geometry: Metric Relations of the Cylinder',
+        'Spatial Geometry: Polyhedra',
+        'Spatial Geometry: Prism Volume',
+        'Spatial Geometry: Revolution Figures',
+        'Spatial Geometry: Surface Area of the Cone',
+        'Spatial Geometry: Surface Area of the Cylinder',
+        'Spatial Geometry: Surface Area of the Prism',
+        'Spatial Geometry: Surface Area of the Pyramid',
+        'Spatial Geometry: Surface Area of the Sphere',
+        'Spatial Geometry: Volume of Cones',
+        'Spatial Geometry: Volume of Spheres',
+        'Spatial Geometry: Volume of the Cylinder',
+        'Spatial Geometry: Volume of the Pyramid',
+        'Square Area',
+        'Statistics: Arithmetic Mean',
+        'Statistics: Arithmetic and Geometric Means',
+        'Statistics: Averages',
+        'Statistics: Frequencies',
+        'Statistics: Interpretation of Graphs and Tables',
+        'Statistics: Median',
+        'Statistics: Mode',
+        'Statistics: Mode and Median',
+        'Statistics: Sample Surveys',
+        'Statistics: Types of Graphs and Tables',
+        'Sum of the Interior Angles of a Triangle',
+        'Symmetry in Relation to Axes',
+        'Symmetry in the Cartesian Plane: Introduction',
+        'System of Equations',
+        "Thales' Theorem",
+        'Theoretical Probability',
+        'Time Conversion',
+        'Time Intervals',
+        'Translations in the Cartesian Plane',
+        'Translations of Plane Figures',
+        'Translations: Advanced',
+        'Trapezoid Area',
+        'Triangle Area',
+        'Triangle Components',
+        'Triangle Existence Condition',
+        'Triangle Similarity',
+        'Triangles and Their Classifications',
+        'Triangles: Angular Classification',
+        'Triangles: Cevians and Notable Points',
+        'Triangles: Classification by Sides',
+        'Triangles: Congruence',
+        'Triangles: Law of Cosines',
+        'Triangles: Law of Sines',
+        "Triangles: Menelaus' Theorem",
+        'Triangles: Pythagoras',
+        'Triangles: Similarity',
+        'Triangles: Sum of Angles',
+        'Trigonometric Equation',
+        'Trigonometric Function: Graphs',
+        'Trigonometric Function: Inputs and Outputs',
+        'Trigonometric Function: Periodicity',
+        'Trigonometric Inequality',
+        'Trigonometric Lines of 75º, 15º, 22.5º',
+        'Trigonometric Ratios',
+        'Trigonometry in the Right Triangle',
+        'Trigonometry: Basic Trigonometric Lines (30º,45º,60º): Review',
+        'Trigonometry: Double/Triple Angle',
+        'Trigonometry: Fundamental Relationship',
+        'Trigonometry: Product-to-Sum Transformation',
+        'Trigonometry: Sine, Cosine, and Tangent: Review',
+        'Trigonometry: Sum and Difference of Angles',
+        'Unequal Partition',
+        'Unequal Partition Problems',
+        'Unit Fractions',
+        'Unit Systems',
+        'Units of Measure: Time',
+        'Units of Measurement: Capacity and Mass',
+        'Units of Measurement: Length and Time',
+        'Value Equivalence: Discount and Exchange',
+        'Value Equivalence: buying and selling',
+        'Variables',
+        'Variables and Unknowns',
+        'Volume and Area: Cylinder',
+        'Volume: Contextualized Rectangular Prism',
+        'Volume: Rectangular Blocks',
+        'Volume: Rectangular Prism',
+        'Volume: Relationships with Cubes',
+        'Writing Natural Numbers',
+    ),
+    'Philosophy': (
+        'Art and Culture',
+        'Concept of Modernity',
+        'Construction of Morality',
+        'Cultural Diversity',
+        'Democracy and Citizenship',
+        'Ethics and Democratic Values',
+        'Ethics and Will',
+        'Ethics in the Globalized World',
+        'Freedom and Subjectivity',
+        'Human Rights and Totalitarian Regimes',
+        'Identity',
+        'Kant, Hegel and Freud',
+        'Marx and Nietzsche',
+        'Modern and Contemporary Philosophy',
+        'Morality of Modern Man',
+        'Origin of Philosophy',
+        'Philosophical Schools: Ancient, Medieval, Modern, and Contemporary',
+        'Politics and Power',
+        'Reflection on Ethics',
+        'Science and Bioethics',
+        'Science and its Contexts: Ethics, Freedom, Culture, and Religion',
+        'Scientific Thinking vs. Common Sense',
+        'Subjectivity in Contemporary Society',
+        'Subjectivity of Contemporary Culture',
+        'Understanding and Reflection on Philosophy',
+    ),
+    'Physical Education': (
+        'American Football',
+        'Ballroom Dancing',
+        'Basic Elements of Gymnastics: Balances, Jumps, and Turns',
+        'Body Awareness Gymnastics',
+        'Body Self-Awareness',
+        'Chess',
+        'Combat Sports',
+        'Combat Sports: Introduction',
+        'Constitutive Elements of Dances',
+        'Dance as Historical Heritage',
+        'Dances: Community and Regional Context',
+        'Dances: Injustice and Prejudice',
+        'Darts',
+        'Doping in Sports',
+        'Doping, Corruption and Medication',
+        'Electronic Games',
+        'Ethics and Sports',
+        'Field Sports',
+        'Field and Pole Sports',
+        'Fights and Practice',
+        'Fitness Gymnastics',
+        'Football',
+        'Football: Introduction',
+        'Futsal',
+        "Games and Fun: Blind Man's Bluff",
+        'Games and Fun: Capture the Flag',
+        'Games and Fun: Circle and Rope',
+        'Games and Fun: Dodgeball',
+        'Games and Fun: Hide and Seek and Tag',
+        'Games and Fun: Hopscotch',
+        'Games and Fun: Hot Potato and Pass the Ring',
+        'Games and Fun: Marbles and Spinning Top',
+        'Games and Fun: Popular Worldwide',
+        'General Gymnastics Elements: Rotations, Acrobatics, with and without Equipment',
+        'Gymnastics',
+        'Handball',
+        'Handball: Introduction',
+        'Health and Sports',
+        'High Performance Sports and the Body',
+        'History of Sports',
+        'Hockey',
+        'Invasion Sports',
+        'Invasion Sports: Introduction',
+        'Jiu-Jitsu',
+        'Judo',
+        'Judo: Introduction',
+        'Measure Sports',
+        'Measure Sports: Introduction',
+        'Movement and Dance',
+        'Nature Adventures',
+        'Net Sports',
+        'Net Sports: Introduction',
+        'Net and Wall Sports',
+        'Olympic Sports and Olympics',
+        'Physical Exercise Demands',
+        'Physical Exercise and Physical Activity',
+        'Physical Exercise and the Body',
+        'Pole Sports',
+        'Precision Sports',
+        'Skate',
+        'Steroids and Anabolics',
+        'Swimming',
+        'Technical-Combinatory Sports',
+        'Track and Field',
+        'Track and Field: Introduction',
+        'Traditional Games and Toys',
+        'Transformations in Sports',
+        'Urban Adventure',
+        'Urban Dances',
+        'Volleyball',
+        'Volleyball: Introduction',
+        'World Fights',
+    ),
+    'Physics': (
+        'Astronomy: Black Holes',
+        'Astronomy: Celestial Objects',
+        'Astronomy: Galaxies',
+        'Astronomy: Stellar Evolution',
+        'Astronomy: Types of Stars',
+        "Bernoulli's Principle",
+        "Calorimetry: Fourier's Law",
+        'Calorimetry: Heat Exchange Problems',
+        'Calorimetry: Heat Flow',
+        'Calorimetry: Introduction',
+        'Calorimetry: Latent Heat',
+        'Calorimetry: Sensible Heat',
+        'Calorimetry: Thermal Power',
+        'Calorimetry: Thermometer Scale Changes',
+        "Convex and Concave Mirrors: Gauss's Equation",
+        'Convex and Concave Mirrors: Image Formation',
+        'Dimensional Analysis',
+        'Dynamics: Centripetal Force',
+        'Dynamics: Elastic Force',
+        'Dynamics: Forces in Curvilinear Motion',
+        'Dynamics: Main Forces',
+        "Dynamics: Mechanics Problems: Newton's Laws",
+        "Dynamics: Newton's 1st Law",
+        "Dynamics: Newton's 2nd Law",
+        "Dynamics: Newton's 3rd Law",
+        'Dynamics: Representation of Forces',
+        'Dynamics: Traction Force',
+        'Dynamics: friction force',
+        'Electricity: Capacitance',
+        'Electricity: Capacitors in Parallel',
+        'Electricity: Capacitors in Series',
+        'Electricity: Charge Conservation',
+        'Electricity: Conductors and Insulators',
+        "Electricity: Coulomb's Law",
+        'Electricity: Electric Charge',
+        'Electricity: Electric Current',
+        'Electricity: Electric Field',
+        "Electricity: Electric Field and Gauss's Law",
+        'Electricity: Electric Potential',
+        'Electricity: Electric Potential Energy',
+        'Electricity: Electric Power',
+        'Electricity: Electrical Circuits',
+        'Electricity: Generators and Receivers',
+        'Electricity: Lines of Force',
+        "Electricity: Ohm's First Law",
+        'Electricity: Parallel Plate Capacitor',
+        'Electricity: Parallel Resistors',
+        'Electricity: Potential Difference',
+        'Electricity: Problems of Electric Forces and Fields',
+        "Electricity: Resistivity and Ohm's 2nd Law",
+        'Electricity: Resistor Association',
+        'Electricity: Series Resistors',
+        'Electricity: Spherical Capacitor',
+        'Electricity: Types of Electrification',
+        'Electricity: Voltmeters and Ammeters',
+        'Electricity: Work of Electric Force in Uniform Fields',
+        'Electricity: Work of the Electric Force',
+        'Expansion: Liquids in Containers',
+        'Flat Mirror: Image Formation',
+        'Flat Mirror: Movement and Image Formation',
+        'Flat Mirror: Rotation',
+        'Geometric Optics: Apparent Position',
+        'Geometric Optics: Camera Obscura',
+        'Geometric Optics: Critical Angle Problems',
+        'Geometric Optics: Human Eye',
+        'Geometric Optics: Introduction',
+        'Geometric Optics: Optical Instruments',
+        'Geometric Optics: Parallel Plates',
+        'Geometric Optics: Penumbra and Shadow',
+        'Geometric Optics: Prisms',
+        'Geometric Optics: Reflection',
+        'Geometric Optics: Refractive Index',
+        "Geometric Optics: Snell's Law",
+        'Gravitation: Bodies in Orbit',
+        'Gravitation: Escape Velocity',
+        'Gravitation: Gravitation Problems',
+        'Gravitation: Gravitational Acceleration',
+        'Gravitation: Gravitational Force',
+        "Gravitation: Kepler's Laws",
+        "Hydrodynamics: Bernoulli's Principle",
+        'Hydrodynamics: Flow Rate',
+        'Hydrostatics: Buoyancy',
+        'Hydrostatics: Hydrostatic Problems',
+        "Hydrostatics: Pascal's Theorem",
+        'Hydrostatics: Pressure',
+        'Hydrostatics: Specific Mass',
+        "Hydrostatics: Stevin's Theorem",
+        'Hydrostatics: Work and Energy Problems',
+        'International System',
+        'Kinematics: Acceleration of Uniformly Varied Circular Motion',
+        'Kinematics: Angular Displacement',
+        'Kinematics: Average Angular Velocity',
+        'Kinematics: Average Scalar Acceleration',
+        'Kinematics: Average Scalar Speed',
+        'Kinematics: Average Speed of Uniformly Accelerated Motion',
+        'Kinematics: Average Vector Acceleration',
+        'Kinematics: Average Vector Velocity',
+        'Kinematics: Centripetal Acceleration',
+        'Kinematics: Instantaneous Acceleration',
+        'Kinematics: Instantaneous Speed',
+        'Kinematics: Motion Transmission',
+        'Kinematics: Oblique Motion',
+        'Kinematics: Oblique Motion Equation',
+        'Kinematics: Path of a Body',
+        'Kinematics: Period in Circular Movements',
+        'Kinematics: Position Change',
+        'Kinematics: Reference Frame and Position',
+        'Kinematics: Relationship between Speeds in Circular Motions',
+        'Kinematics: Relative Velocity',
+        'Kinematics: Uniform Circular Motion',
+        'Kinematics: Uniform Circular Motion Acceleration',
+        'Kinematics: Uniform Motion',
+        'Kinematics: Uniform Motion Graphs',
+        'Kinematics: Uniformly Accelerated Motion',
+        'Kinematics: Uniformly Accelerated Motion Graphs',
+        'Kinematics: Uniformly Varied Circular Motion',
+        'Kinematics: Vertical Motion',
+        "Lens: Lens Maker's Equation",
+        'Lenses: Gaussian Equation',
+        'Lenses: Types',
+        'Lenses: Vergence',
+        'Linear Expansion',
+        'Magnetic Field: Coil',
+        'Magnetic Field: Loop',
+        'Magnetic Field: Solenoid',
+        'Magnetic Field: Wire',
+        "Magnetism: Faraday's Law",
+        'Magnetism: Field Lines',
+        'Magnetism: Force on Current-Carrying Wire',
+        'Magnetism: Magnetic Field',
+        'Magnetism: Magnetic Flux',
+        'Magnetism: Magnetic Force on Charges',
+        'Magnetism: Magnets',
+        'Main Forms of Energy Generation',
+        'Modern Physics: Bohr Model',
+        'Modern Physics: Heisenberg Uncertainty Principle',
+        'Modern Physics: Hydrogen Atom',
+        'Modern Physics: Photoelectric Effect',
+        'Modern Physics: Photons',
+        'Momentum and Impulse: Coefficient of Restitution',
+        'Momentum and Impulse: Collision and Momentum Problems',
+        'Momentum and Impulse: Collisions in One Dimension',
+        'Momentum and Impulse: Conservation of Momentum',
+        'Momentum and Impulse: Impulse Theorem',
+        'Momentum and Impulse: Impulse of a Force',
+        'Momentum and Impulse: Momentum',
+        'Momentum and Impulse: Two-Dimensional Collisions',
+        'Order of Magnitude',
+        'Renewable and Non-Renewable Energies',
+        'Simple Harmonic Motion: Definition',
+        'Simple Harmonic Motion: Equation of Motion',
+        'Simple Harmonic Motion: Mass-Spring System',
+        'Simple Harmonic Motion: Mechanical Energy',
+        'Simple Harmonic Motion: Relationship between SHM and UCM',
+        'Simple Harmonic Motion: Simple Pendulum',
+        'Solar System: Characteristics',
+        'Sound Waves: Pitch and Timbre',
+        'Statics: Levers',
+        'Statics: Rigid Body',
+        'Statics: Torque or Moment',
+        'Surface Expansion',
+        'System Prefixes',
+        'Theory of Relativity: Introduction',
+        'Theory of Relativity: Relativistic Energy',
+        'Theory of Relativity: Space Contraction',
+        'Theory of Relativity: Time Dilation',
+        'Thermodynamics: 1st Law of Thermodynamics',
+        'Thermodynamics: 2nd Law of Thermodynamics',
+        'Thermodynamics: Average Speed of Gas Molecules',
+        'Thermodynamics: Carnot Cycle',
+        'Thermodynamics: Entropy',
+        'Thermodynamics: Gas Pressure',
+        'Thermodynamics: Gaseous Transformations',
+        'Thermodynamics: General Gas Equation',
+        'Thermodynamics: Internal Energy of a Gas',
+        'Thermodynamics: Thermal Machines',
+        'Thermodynamics: Thermal Transformations',
+        'Thermodynamics: Thermodynamic Cycle',
+        'Thermodynamics: Work of a Gas',
+        'Vectors: Addition',
+        'Vectors: Decomposition',
+        'Vectors: Difference',
+        'Vectors: Introduction',
+        'Volumetric Expansion',
+        'Waves: Beats',
+        'Waves: Doppler Effect',
+        'Waves: Electromagnetic and Mechanical',
+        'Waves: Elements of a Wave',
+        'Waves: Equation',
+        "Waves: Newton's Rings",
+        'Waves: Polarization',
+        'Waves: Radiations and Their Risks',
+        'Waves: Reflection',
+        'Waves: Refraction',
+        'Waves: Sound Intensity',
+        'Waves: Speed on Strings',
+        'Waves: Superposition',
+        'Waves: Vibration in Sound Tubes',
+        'Waves: Vibration in Strings',
+        'Waves: Wave Speed',
+        "Waves: Young's Experiment",
+        'Work: Constant Force',
+        'Work: Elastic Force',
+        'Work: Elastic Potential Energy',
+        'Work: Graphics',
+        'Work: Gravitational Potential Energy',
+        'Work: Kinetic Energy',
+        'Work: Kinetic Energy and Work',
+        'Work: Mechanical Energy',
+        'Work: Non-Conservative Systems',
+        'Work: Power',
+        'Work: Power and Speed',
+        'Work: Resultant Force',
+        'Work: Weight',
+    ),
+    'Portuguese': (
+        'Alfabetização',
+        'Artigo de Opinião',
+        'Classe de Palavras',
+        'Classes Gramaticais',
+        'Crase',
+        'Interpretação Textual',
+        'Interpretação de Texto',
+        'Parnasianismo',
+        'Pontuação',
+        'Preposição',
+        'Substantivo',
+        'Substantivos',
+    ),
+    'Science': (
+        'Air Composition',
+        'Animals: Group Organization',
+        'Animals: Life Cycle',
+        'Animals: Way of Life',
+        'Astronomical Unit',
+        'Atom: Atomic Evolution',
+        'Atom: Introduction',
+        'Basic Electrical Circuits',
+        'Basic Genetics',
+        'Basic Stoichiometry',
+        'Cardinal Points',
+        'Characteristics of Plants and Animals',
+        'Chemical Bonds: Ionic and Covalent',
+        'Chemical Transformations',
+        'Circulatory System',
+        'Colligative Properties: Boiling Point Elevation',
+        'Conscious Consumption',
+        'Conscious Consumption and Environmental Issues',
+        'Continental Drift',
+        'Cyclic Movements of the Moon and Earth',
+        'Daily Activities Time Scales',
+        'Daily Periods',
+        'Digestive System',
+        'Disasters and Natural Changes',
+        'Disease Prevention',
+        'Domestic Accident Prevention',
+        'Earth Features',
+        'Earth Study',
+        'Effect of Solar Radiation',
+        'Electrical Power',
+        'Electromagnetic Waves: Introduction',
+        'Energy Generation',
+        'Energy Transformation',
+        'Environmental Balance',
+        'Everyday Materials Transformations',
+        'Evolution: Introduction',
+        'Food Chains: Introduction',
+        'Food Production by Microorganisms',
+        'Food and Eating Disorders',
+        'Fungi and Bacteria: Decomposition',
+        'Galaxies and Milky Way',
+        'Greenhouse Effect and Human Action',
+        'Heat Propagation',
+        'Heat and Temperature',
+        'History of Technology',
+        'Human Body Parts: Introduction',
+        'Human Body: Cell Organization',
+        'Human Body: Circulatory System',
+        'Human Body: Digestive System',
+        'Human Body: Gametes and Transmission of Traits',
+        'Human Body: Human Reproduction',
+        'Human Body: Movement',
+        'Human Body: Nervous System',
+        'Human Body: Puberty',
+        'Human Body: Respiratory System',
+        'Human Body: System Organization',
+        'Human Body: Urinary System',
+        'Human Body: Vision',
+        'Human Physical Characteristics',
+        'Hygiene Habits',
+        'Impacts of Science',
+        'Land Use',
+        'Layers of the Earth',
+        'Main Inorganic Compounds',
+        'Main Phases of the Moon',
+        'Maintenance of Auditory and Visual Health',
+        'Materials of Main Everyday Objects',
+        'Materials: Characteristics and Composition',
+        'Matter Cycle and Energy Flow',
+        'Mixtures Separation',
+        'Mixtures: Introduction',
+        'Moon',
+        'Natural Phenomena',
+        'Nature Conservation',
+        'New Materials and Technologies',
+        'Number of Moles: Introduction',
+        'Observation Devices',
+        'Ozone Layer',
+        'Passage of Light through Objects',
+        'Periodic Table: Introduction',
+        'Phases of Mixing',
+        'Phases of the Moon',
+        'Physical Properties of Materials',
+        'Plants: Main Parts',
+        'Plants: Water and Light',
+        'Ponderal Laws: Introduction',
+        'Positions of the Sun and Shadow',
+        'Primary Colors',
+        'Reactions: Introduction',
+        'Renewable and Non-Renewable Energies',
+        'Reproduction: Plants and Animals',
+        'Respiratory System',
+        'Reversible and Irreversible Transformations',
+        'Simple and Thermal Machines',
+        'Solar System: Evolution',
+        'Solar System: Introduction',
+        'Sound Production',
+        'Stars and Constellations',
+        'Stars: Evolution',
+        'State Changes',
+        'Subject: Introduction',
+        'Types of Fuels',
+        'Types of Mixtures',
+        'Types of Rocks',
+        'Types of Soil',
+        'Types of Substances and Mixtures',
+        'Water Cycle',
+        'Water Usage',
+        'Water and Community',
+        'Waves: Introduction',
+        'Weather Forecasting',
+    ),
+    'Sociology': (
+        'Changes in the World of Work',
+        'Classics of Sociology',
+        'Concept of Ideology',
+        'Globalized World and Migration Flows',
+        'Human Coexistence: Social Interaction and Isolation',
+        'Mass Culture',
+        'Modernity: Ethnocentrism and Racism',
+        'Rights and Duties',
+        'Social Inequality',
+        'Society, Ideology and Culture',
+        'State Building',
+        'Technology and Work',
+        'Violence and its Manifestations',
+    ),
+    'Spanish': (
+        'Accentuation',
+        'Adjectives',
+        'Adverbs',
+        'Articles, Contractions and Neutral Article',
+        'Conjunctions',
+        'False Cognates',
+        'Formal and Informal Treatment',
+        'Homographs and Homophones',
+        'Indefinite Pronouns and Determiners',
+        'Interrogative Pronouns',
+        'Muy vs. Mucho',
+        'Numbers in Spanish',
+        'Object Pronoun',
+        'Past Perfect and Simple Past',
+        'Personal Pronoun',
+        'Possessive and Demonstrative Pronouns',
+        'Prepositions and Prepositional Phrases',
+        'Reflexive Pronouns and Relative Pronouns',
+        'Scientific Technical Vocabulary',
+        'Spelling',
+        'Text Interpretation',
+        'Textual Genres',
+        'The Alphabet, Sounds and Syllabic Separation',
+        'Use of the Whys',
+        'Verbs: Future Simple and Future Perfect',
+        'Verbs: Imperative',
+        'Verbs: Imperfect Preterite and Past Perfect',
+        'Verbs: Imperfect Preterite and Perfect Subjunctive',
+        'Verbs: Like',
+        'Verbs: Participle',
+        'Verbs: Past Conditional',
+        'Verbs: Past Participle',
+        'Verbs: Past Perfect',
+        'Verbs: Periphrastic Future',
+        'Verbs: Present Subjunctive',
+        'Verbs: Present Tense',
+        'Verbs: Ser, Estar, Tener',
+        'Verbs: Simple Conditional',
+        'Verbs: Tense Problems',
+        'Vocabulary: Animals, Plants, and Human Body Parts',
+        'Vocabulary: Days of the Week, Dates and Time',
+        'Vocabulary: Parts of the House, Objects and Materials',
+        'Vocabulary: Places and Family',
+        'Vocabulary: Travel and Transportation',
+        'Word Formation',
+    ),
+})
+
+# (discipline, topic) -> categories
+TOPIC_CATEGORIES = MappingProxyType({
+    ('Arts', 'Art Knowledge'): (
+        'Art: Ancient Egypt',
+        'Art: Ancient Greece',
+        'Art: Ancient Mesopotamia',
+        'Art: Ancient Persia',
+        'Art: Ancient Rome',
+        'Art: Contemporary',
+        'Art: Introduction',
+        'Art: Mesoamerica',
+        'Art: Modern Baroque',
+        'Art: Oriental',
+        'Art: Prehistory',
+        'Artistic Languages',
+        'Contemporary Impressionism',
+        'Contemporary Romanticism and Realism',
+        'Early Christian Art',
+        'Islamic Art',
+        'Medieval Byzantine Art',
+        'Medieval Gothic Art',
+        'Modern Neoclassicism',
+        'Modern Renaissance',
+        'Modernism',
+        'Postmodernism',
+    ),
+    ('Arts', 'Art and Movement'): (
+        'Artistic Representations in Dance',
+        'Dance Experience',
+        'Dance Movement',
+        'Dance: Introduction',
+        'Dances: World',
+        'Evolution of Dance',
+        'Playfulness in Art: Themes, Games, and Fun',
+    ),
+    ('Arts', 'Artistic Production'): (
+        'Aesthetic and Cultural Matrices',
+        'Art Creation Processes',
+        'Art Space',
+        'Art and Society',
+        'Art and Technology',
+        'Art: Social Critique',
+        'Artistic Creation',
+        'Artistic Experiences',
+        'Arts Professionals',
+        'Collective Work in Arts',
+        'Community Arts Creation',
+        'Dance Codes',
+        'Dance Groups in School',
+        'Dance Movements',
+        'Dance in Different Contexts',
+        'Plural Senses of the Arts',
+        'Relationships Between Artistic Languages',
+        'Space in the Construction of Dance Movements',
+        'Various Artistic Languages',
+        'Visual Arts and Other Arts',
+    ),
+    ('Arts', 'Music'): (
+        'Function of Music',
+        'Music Circulation',
+        'Music Recording',
+        'Music: Introduction',
+        'Musical Construction',
+    ),
+    ('Arts', 'Performing Arts'): (
+        'Dramaturgy and Contemporary Theater',
+        'Stage Styles',
+        'Theater',
+        'Theater Function',
+        'Theater: Creation and Characters',
+        'Theater: Introduction',
+        'Theatrical Elements',
+        'Theatrical Production',
+    ),
+    ('Arts', 'Scenic Art'): (
+        'Scenic Elements',
+    ),
+    ('Arts', 'Visual Art'): (
+        'Art Perception',
+        'Audiovisual Recording',
+        'Body Sounds',
+        'Drawing',
+        'Games, Fun and Music',
+        'Musical Expression',
+        'Sound Improvisation',
+        'Video and Photography',
+        'Visual Arts',
+        'Visual Arts Construction',
+        'Visual Arts: Introduction',
+        'Visual Expression',
+    ),
+    ('Biology', 'Biochemistry and Metabolism'): (
+        'Biochemistry: Carbohydrates and Lipids',
+        'Biochemistry: DNA and RNA',
+        'Biochemistry: Proteins',
+        'Biochemistry: Vitamins and Minerals',
+        'Cell Division',
+        'Cytology',
+        'Metabolisms',
+        'Photosynthesis',
+    ),
+    ('Biology', 'Ecology and Environment'): (
+        'Ecology: Biocycles',
+        'Ecology: Biogeochemical Cycles',
+        'Ecology: Ecological Pyramids',
+        'Ecology: Ecological Relationships',
+        'Ecology: Ecological Succession',
+        'Ecology: Food and Web Chain',
+        'Ecology: Introduction',
+        'Environment: Biomes',
+        'Environment: Pollution',
+    ),
+    ('Biology', 'Genetics and Heredity'): (
+        'Genetics: Introduction',
+    ),
+    ('Biology', 'Genetics and Inheritance'): (
+        'Chromosomes',
+        'Genetics: Blood Groups',
+        'Genetics: Exercises',
+        'Genetics: Linkage',
+        "Genetics: Mendel's 1st Law",
+        "Genetics: Mendel's 2nd Law",
+        'Genetics: Pedigree',
+    ),
+    ('Biology', 'Human Anatomy and Physiology'): (
+        'Human Body: Circulatory System',
+        'Human Body: Digestive System',
+        'Human Body: Endocrine System',
+        'Human Body: Excretory System',
+        'Human Body: Importance of Water',
+        'Human Body: Lymphatic System',
+        'Human Body: Muscular System',
+        'Human Body: Nervous System',
+        'Human Body: Reproductive System',
+        'Human Body: Respiratory System',
+        'Human Body: Senses',
+        'Human Body: Skeletal System',
+        'Human Body: Tissues',
+    ),
+    ('Biology', 'Introduction to Biology and Evolution'): (
+        'Evolution',
+        'Lamarckism and Darwinism',
+    ),
+    ('Biology', 'Structure and Function of Organisms'): (
+        'Animals: Circulatory System',
+        'Animals: Digestive System',
+        'Animals: Respiratory System',
+        'Animals: Types of Excretion',
+        'Animals: Vertebrates and Invertebrates',
+        'Fungi Kingdom: Fungi',
+        'Living Beings: Types of Reproduction',
+        'Monera Kingdom: Bacteria',
+        'Plant Kingdom: Plants',
+        'Protista Kingdom: Protozoa and Algae',
+        'Virus',
+    ),
+    ('Chemistry', 'Atoms and Periodic Table'): (
+        'Atoms: Atomic Mass Unit',
+        'Atoms: Characteristics of Atoms and Ions',
+        'Atoms: Electron Distribution',
+        'Atoms: Energy Levels and Sublevels',
+        'Atoms: Evolution of Atomic Models',
+        'Atoms: Isotopes, Isotones, and Isobars',
+        'Current Periodic Table',
+        'Periodic Table: History of the Table',
+        'Periodic Table: Metal',
+        'Periodic Table: Non-Metal',
+        'Periodic Table: Properties',
+    ),
+    ('Chemistry', 'Chemical Equilibrium and Electrochemistry'): (
+        'Chemical Equilibrium',
+        'Electrochemistry: Batteries',
+        'Electrochemistry: Electrolysis',
+        "Electrochemistry: Faraday's Laws",
+        'Electrochemistry: Introduction',
+        'Electrochemistry: Nernst Equation',
+        'Equilibrium: Partial Pressures',
+        'Equilibrium: Solubility Product',
+        'Equilibrium: pH and pOH',
+        'Ionic Equilibrium',
+        "Le Chatelier's Principle",
+        'Salt Hydrolysis Equilibrium',
+    ),
+    ('Chemistry', 'Inorganic Compounds and Stoichiometry'): (
+        'Basic Stoichiometry',
+        'Chemical Bonds: Covalent',
+        'Chemical Bonds: Ionic',
+        'Chemical Bonds: Metallic',
+        'Chemical Formulas',
+        'Determination of Molecular Formula',
+        'Dissociation and Ionization',
+        'Gases: Introduction',
+        'Gases: Relationship between Mol and Volume at STP',
+        'Hybridization',
+        'Inorganic Functions: Acids',
+        'Inorganic Functions: Bases',
+        'Inorganic Functions: Nomenclature of Acids',
+        'Inorganic Functions: Nomenclature of Bases',
+        'Inorganic Functions: Oxide Nomenclature',
+        'Inorganic Functions: Oxides',
+        'Inorganic Functions: Salt',
+        'Inorganic Functions: Salt Nomenclature',
+        'Intermolecular Bonds',
+        'Main Reaction Types',
+        'Mixtures: Separation of Mixtures',
+        'Mol: Amount of Substance',
+        'Molar Mass: Relationship between Mole and Mass',
+        'Molecular Geometry',
+        'Oxidation Number',
+        'Ponderal Laws: Dalton',
+        'Ponderal Laws: Lavoisier',
+        "Proust's Law of Definite Proportions",
+        'Reactions: Balancing',
+        'Reactions: Redox Equation',
+        'Redox Equation Balancing Reactions',
+        'Stoichiometry: Limiting and Excess',
+        'Stoichiometry: Purity and Yield',
+        'Stoichiometry: Stoichiometry Problems',
+    ),
+    ('Chemistry', 'Introduction to Chemistry'): (
+        'Colloids',
+        'Components and Phases',
+        'Eutectic and Azeotropic Mixtures',
+        'Gases: General Equation',
+        'Homogeneous and Heterogeneous Mixtures',
+        'Initial Aspects of Matter',
+        'Main Physical States of Matter',
+        'Phase Diagram',
+        'Physical and Chemical Phenomena',
+        'Simple and Compound Substances',
+        'State Changes',
+        'Subject: General Properties',
+        'Subject: Physical, Chemical, and Organoleptic Properties',
+        'Substances and Mixtures',
+    ),
+    ('Chemistry', 'Organic Chemistry: Isomerism and Reactions'): (
+        'Geometric Isomerism',
+        'Optical Isomerism',
+        'Organic Reactions: Addition',
+        'Organic Reactions: Elimination',
+        'Organic Reactions: Organic Reaction Problems',
+        'Organic Reactions: Oxidation',
+        'Organic Reactions: Substitution',
+        'Planar Isomerism',
+    ),
+    ('Chemistry', 'Organic Chemistry: Organic Compounds'): (
+        'Biochemistry',
+        'Introduction to Organic Chemistry: Aromatic Compounds',
+        'Introduction to Organic Chemistry: Chain Classification',
+        'Introduction to Organic Chemistry: Classification of Carbons',
+        "Introduction to Organic Chemistry: Kekulé's Postulates",
+        'Introduction to Organic Chemistry: Minimum Formula Problems',
+        'Introduction to Organic Chemistry: Orbital Hybridization',
+        'Introduction to Organic Chemistry: Organic Series',
+        'Introduction to Organic Chemistry: Pi and Sigma Bonds',
+        'Introduction to Organic Chemistry: Types of Formulas',
+        'Organic Functions: Acyl Halide',
+        'Organic Functions: Acyl Halide Nomenclature',
+        'Organic Functions: Alcohol',
+        'Organic Functions: Alcohol Nomenclature',
+        'Organic Functions: Aldehyde',
+        'Organic Functions: Aldehyde Nomenclature',
+        'Organic Functions: Amide',
+        'Organic Functions: Amide Nomenclature',
+        'Organic Functions: Amine',
+        'Organic Functions: Amine Nomenclature',
+        'Organic Functions: Aromatic Hydrocarbons',
+        'Organic Functions: Carboxylic Acid',
+        'Organic Functions: Carboxylic Acid Nomenclature',
+        'Organic Functions: Cyclic Hydrocarbons',
+        'Organic Functions: Ester',
+        'Organic Functions: Ester Nomenclature',
+        'Organic Functions: Ether',
+        'Organic Functions: Ether Nomenclature',
+        'Organic Functions: Hydrocarbon Nomenclature',
+        'Organic Functions: Hydrocarbons',
+        'Organic Functions: Ketone',
+        'Organic Functions: Ketone Nomenclature',
+        'Organic Functions: Nitrile and Isonitrile',
+        'Organic Functions: Nitro Compound',
+        'Organic Functions: Nomenclature of Aromatic Hydrocarbons',
+        'Organic Functions: Nomenclature of Cyclic Hydrocarbons',
+        'Organic Functions: Nomenclature of Nitrile and Isonitrile',
+        'Organic Functions: Nomenclature of Nitro Compounds',
+        'Organic Functions: Nomenclature of Phenol',
+        'Organic Functions: Organic Anhydride',
+        'Organic Functions: Organic Anhydride Nomenclature',
+        'Organic Functions: Organic Functions Problems',
+        'Organic Functions: Organic Halide',
+        'Organic Functions: Organic Halide Nomenclature',
+        'Organic Functions: Organic Salt',
+        'Organic Functions: Organic Salt Nomenclature',
+        'Organic Functions: Phenol',
+        'Organic Functions: Sulfonated Functions',
+        'Polymers',
+        'Properties of Organic Compounds: Acidity and Basicity',
+        'Properties of Organic Compounds: Boiling and Melting Points',
+        'Properties of Organic Compounds: Solubility of Organic Compounds',
+    ),
+    ('Chemistry', 'Solutions and Colligative Properties'): (
+        'Colligative Properties: Boiling Point Elevation',
+        'Colligative Properties: Colligative Properties Problems',
+        'Colligative Properties: Cryoscopy',
+        'Colligative Properties: Osmotic Pressure',
+        'Colligative Properties: Vapor Pressure',
+        'Concentration Units: % Mass, Volume and Other Units',
+        'Concentration Units: Molality',
+        'Concentration Units: Molarity',
+        'Molar Fraction Concentration Units',
+        'Solutions: Dilution',
+        'Solutions: Introduction',
+        'Solutions: Mixtures of the Same Solute',
+        'Solutions: Non-Reactive Mixing',
+        'Solutions: Reaction Mixing',
+        'Solutions: Solubility',
+        'Solutions: Types of Solution',
+    ),
+    ('Chemistry', 'Thermochemistry, Kinetics and Nuclear'): (
+        'Nuclear Reaction: Kinetic Constant',
+        'Thermochemistry: Enthalpy',
+        'Thermochemistry: Enthalpy by Bonding',
+        'Thermochemistry: Internal Energy',
+    ),
+    ('Chemistry', 'Thermochemistry, Kinetics, and Nuclear'): (
+        'Chemical Kinetics: Activation Energy',
+        'Chemical Kinetics: Introduction and Average Rate',
+        'Chemical Kinetics: Main Speed Factors',
+        'Chemical Kinetics: Rate Law',
+        'Chemical Kinetics: Reaction Order',
+        'Colligative Properties: Tonoscopy',
+        'Nuclear Reaction: Activity',
+        'Nuclear Reaction: Half-Life',
+        'Nuclear Reaction: Introduction',
+        'Thermochemistry: Entropy',
+        'Thermochemistry: Gibbs Free Energy',
+        "Thermochemistry: Hess's Law",
+    ),
+    ('Economics', 'Basic Economic Concepts'): (
+        'Basic Economics: Concepts',
+        'Consumer Theory',
+        'Functions of Money',
+        'National Income',
+        'Opportunity Cost',
+        'Supply and Demand',
+    ),
+    ('Economics', 'Current Economics'): (
+        'Contemporary Macroeconomics',
+    ),
+    ('Economics', 'Current Economy'): (
+        'Current Economy: Rest of the World',
+        'Current Economy: USA',
+    ),
+    ('Economics', 'Economic Indicators and Policies'): (
+        'Consequences of Stabilization Policies',
+        'Economic Indicators: Economic Cycle',
+        'Economic Indicators: Inflation',
+        'Economic Indicators: Unemployment',
+        'Fiscal Policy',
+        'Monetary Policy',
+    ),
+    ('Economics', 'Finance and Investment'): (
+        'Accounting and Financial Statements',
+        'Balance of Payments',
+        'Financial Sector: Advanced',
+        'Financial Sector: Introduction',
+        'Interest',
+        'International Capital Flows and Rates',
+        'International Trade and Finance',
+        'Macroeconomics Standards',
+        'Mathematical Finance',
+        'Money, Banking and Central Banks',
+        'Real Estate Sector',
+        'Stocks and Bonds',
+        'Taxes',
+        'Valuation',
+    ),
+    ('Economics', 'Market Structures and Competition'): (
+        'Competition Model: Production and Cost',
+        'Factor Markets: Advanced',
+        'Factor Markets: Introduction',
+        'Imperfect Competition',
+        'Market Failure and the Role of Government',
+        'Perfect Competition',
+        'Price Elasticity',
+    ),
+    ('English', 'Grammar'): (
+        'A, An, The',
+        'Adjectives and Adverbs',
+        'Adjectives: Introduction',
+        'Cognates and False Friends',
+        'Comparative and Superlative of Adjectives',
+        'Conjunctions',
+        'Connectors',
+        'Household Objects and Parts',
+        'If Clauses',
+        'Imperative',
+        'Indication of Possession',
+        'Indicative of Questions and Answers',
+        'Indicative of Questions and Answers: Introduction',
+        'Interrogative Relative Pronouns',
+        'Introduction to Connectors',
+        'Introduction to If Clauses',
+        'Negative Sentences',
+        'Negative Sentences: Introduction',
+        'Numerals',
+        'Object Pronouns',
+        'Paraphrasing',
+        'Past Continuous',
+        'Personal Pronouns',
+        'Personal Routines and Information',
+        'Plural',
+        'Possessive Pronouns',
+        'Prefixes and Suffixes',
+        'Prepositions',
+        'Prepositions of Time',
+        'Present Continuous',
+        'Pronouns and Adjectives: Demonstratives',
+        'Pronouns and Adjectives: Possessive and Genitive',
+        'Pronouns: Object and Subject',
+        'Reflexive Pronouns',
+        'Relative Pronouns',
+        'Relative Pronouns: Introduction',
+        'Some, Any, Many, Much',
+        'Some, Any, Many, Much, Few, a Few, and Quantities',
+        'Verbs: Modal Verbs',
+    ),
+    ('English', 'Reading, Writing and Comprehension'): (
+        'Alphabet',
+        'Alphabet and Sounds',
+        'Aspects of Current Genres',
+        'Basic Text Interpretation',
+        'Basic Text Writing',
+        'Cultural Aspects',
+        'English Text Interpretation',
+        'Expansion of the English Language',
+        'Oral Activities',
+        'Question Tags',
+        'Reading and Text Comprehension',
+        'Speaking Activities',
+        'Text Interpretation',
+        'Text Structuring and Production',
+        'Written Productions',
+    ),
+    ('English', 'Reading, Writing, and Comprehension'): (
+        'Elements of Advertising and Argumentation',
+        'Use and Variation of the English Language',
+        'Word Pronunciation',
+    ),
+    ('English', 'Verbs'): (
+        'Verbs: Can',
+        'Verbs: Future Perfect',
+        'Verbs: Future with Going to and Will',
+        'Verbs: Gerunds and Infinitives',
+        'Verbs: Introduction to Modal Verbs',
+        'Verbs: Introduction to Past Continuous',
+        'Verbs: Introduction to Present Continuous',
+        'Verbs: Introduction to Simple Present',
+        'Verbs: Introduction to the Imperative',
+        'Verbs: Introduction to the Verb to Be',
+        'Verbs: Main Future Forms',
+        'Verbs: Passive Voice',
+        'Verbs: Past Perfect',
+        'Verbs: Phrasal Verbs',
+        'Verbs: Present Perfect Continuous',
+        'Verbs: Review of the Verb to Be',
+        'Verbs: Simple Future',
+        'Verbs: Simple Past',
+        'Verbs: Simple Past Regular and Irregular Verbs',
+        'Verbs: Simple Past and Present Perfect',
+        'Verbs: Simple Present',
+        'Verbs: Tense Exercises',
+        'Verbs: to Be',
+    ),
+    ('English', 'Vocabulary'): (
+        'Antonyms and Synonyms',
+        'Basic Vocabulary: Family and Places',
+        'Polysemy',
+        'Vocabulary: Animals and Plants',
+        'Vocabulary: Animals, Plants and Human Body Parts',
+        'Vocabulary: Classroom Elements',
+        'Vocabulary: Colors',
+        'Vocabulary: Domestic Animals',
+        'Vocabulary: Family Core',
+        'Vocabulary: Family Members and Friends',
+        'Vocabulary: Food, Objects and Parts of the House',
+        'Vocabulary: Food: Food and Drink',
+        'Vocabulary: Fun and Leisure',
+        'Vocabulary: How to Request Clarifications',
+        'Vocabulary: Human Body Parts',
+        'Vocabulary: Interview Aspects',
+        'Vocabulary: Main Adjectives',
+        'Vocabulary: Main Professions',
+        'Vocabulary: Name and Greeting',
+        'Vocabulary: School and Community Places',
+        'Vocabulary: Scientific Technical Vocabulary',
+    ),
+    ('Environmental Sciences', 'Action of Nature'): (
+        'El Niño and La Niña',
+        'Food Chains and Trophic Networks',
+        'Trophic Levels',
+    ),
+    ('Environmental Sciences', 'Biomes and Ecosystems'): (
+        'Aquatic Biomes',
+        'Ecological Succession: Introduction',
+        'Ecological Tolerance',
+        'Ecosystem Services',
+        'Energy in an Ecosystem',
+        'Generalist and Specialist Species',
+        'Introduction to Biodiversity',
+        'Introduction to Ecosystems',
+        'Island Biogeography',
+        'Natural Disruptions to Ecosystems',
+        'Terrestrial Biomes',
+    ),
+    ('Environmental Sciences', 'Human Action'): (
+        'Acid Rain',
+        'Age Structure Diagrams',
+        'Aquaculture',
+        'Global Climate Change',
+        'Green Revolution',
+        'Indoor Air Pollution',
+        'Introduction to Air Pollution',
+        'Invasive Species',
+        'Meat Production Methods and Overfishing',
+        'Noise Pollution',
+        'Ocean Warming and Acidification',
+        'Ozone Depletion',
+        'Pest Control Methods',
+        'Photochemical Smog',
+        'Pollution and Human Health',
+        'Population Growth and Development: Introduction',
+        'Primary Productivity',
+        'Solid Waste Elimination and Waste Reduction Methods',
+        'Survival Curves',
+        'Thermal Pollution',
+        'Types and Effects of Irrigation',
+    ),
+    ('Geography', 'Ecosystem and Biome'): (
+        'Biodiversity: Characteristics',
+        'Conservation and Environmental Degradation',
+        'Landscapes: Natural and Urban',
+        'Types of Pollution',
+        'World: Biomes',
+        'World: Biomes: Review',
+    ),
+    ('Geography', 'Geographic Space'): (
+        'Atmospheric Circulation, Wind and Rain: Review',
+        'Atmospheric Circulation: Wind and Rain',
+        'Cartographic Scales',
+        'Cartography: Time and Space',
+        'Climate: Human Actions and Climate Change',
+        'Climate: World',
+        'Climatic Factors',
+        'Climatic Factors: Review',
+        'Earth: Formation of the Continents',
+        'Earth: Formation of the Continents: Review',
+        'Earth: Planet Formation',
+        'Earth: Tectonic Plates',
+        'Geomorphology: Endogenous and Exogenous Agents',
+        'Geomorphology: Endogenous and Exogenous Agents: Review',
+        'Geomorphology: Relief Structure and Rock Types',
+        'Geomorphology: Relief Structure and Rock Types: Review',
+        'Hydrography: Aquifers',
+        'Landscape: Transformation',
+        'Relief: Characteristics',
+        'Relief: Main Types',
+        'Rocks: Characteristics',
+        'Soil Formation: Degradation and Conservation Methods',
+        'Soil: Main Types',
+        'Soil: Review',
+        'Vegetation: Characteristics',
+        'Water Conservation',
+        'Water Resources: Water Reuse',
+        'Weather Elements',
+        'Weather Elements: Review',
+        'Weather and Climate',
+        'World: Climate: Review',
+        'World: Hydrography',
+        'World: Main Climates',
+    ),
+    ('Geography', 'Geographical Space'): (
+        'World: Hydrography: Review',
+    ),
+    ('Geography', 'Geography Theory'): (
+        'Cartographic Representations',
+        'Cartography: Map Reading and Making',
+        'Cartography: Scale, Projection and Geotechnology: Review',
+        'Cartography: Time and Space: Review',
+        'Drawings and Mind Maps',
+        'Fundamentals of Geography: Review',
+        'Map Reading',
+        'Maps and Living Places',
+        'Maps and Photographs',
+        'Schedule: Social Activities',
+        'Spatial References',
+        'Time and Experience',
+    ),
+    ('Geography', 'Geopolitics'): (
+        'Africa: Tensions and Conflicts',
+        'America: Conflicts and Tensions',
+        'America: U.S. and Its Influences in Latin America',
+        'Asia and Europe: Territorial Conflicts',
+        'Bipolar World',
+        'Bipolarized World: Review',
+        'Cold War',
+        'Eastern Europe: Characteristics and Conflicts',
+        'Europe: Russia vs Ukraine',
+        'European Union',
+        'Global Geopolitical Concepts',
+        'Global Geopolitics',
+        'International Conferences on Environmental Impacts',
+        'NATO and Counter-Terrorism: Review',
+        'Nationalism and Geopolitics: Review',
+        'World: Arab Spring',
+        'World: NATO and the Fight Against Terrorism',
+        'World: UN and Intergovernmental Organizations',
+    ),
+    ('Geography', 'Human Development'): (
+        '4.0 Revolution',
+        'America: Latin American Blocks',
+        'Anglo-American: Industry, Agriculture and Development Model',
+        'Asia: Asian Tigers',
+        'Asia: Socialism',
+        'Capitalism',
+        'Capitalism: Review',
+        'Changes and Continuities',
+        'Cities and Different Urban Spaces',
+        'City and Countryside',
+        'Conscious Consumption and Circulation of Goods',
+        'Different Places',
+        'Different Types of Work',
+        'Emergence of Cities',
+        'Energy Matrices',
+        'Energy Sources: Non-Renewable Energies',
+        'Energy Sources: Non-Renewable Energies: Review',
+        'Energy Sources: Renewable Energies',
+        'Energy Sources: Renewable Energies: Review',
+        'Europe: EURO and the Trade Blocks',
+        'Everyday: Housing, Toys, Clothes, Furniture, and Daily Objects',
+        'Globalization and Neoliberalism',
+        'Globalized World',
+        'Globalized World: Review',
+        'Impacts of Human Activities',
+        'Industrial Revolution: Characteristics',
+        'Industrial Revolution: Review',
+        'Industry Classification',
+        'Industry Classification: Review',
+        'Innovation and Energy',
+        'Landscape Transformations',
+        'Life and Natural Cycles',
+        'MERCOSUR: Characteristics and Members',
+        'MERCOSUR: Introduction',
+        'Manners and Transportation',
+        'Maps: Satellites and Photographs',
+        'Means of Transport and Communication',
+        'Modes and Transportation: Review',
+        'New World Order',
+        'New World Order: Review',
+        'Nuclear Energy',
+        'Nuclear Energy: Review',
+        'Production and Consumerism',
+        'Production and Consumption',
+        'References and Games',
+        'Revolution 4.0: Review',
+        'Rural and Urban Relationship',
+        "Subject's Place in the World",
+        'Taylorism and Fordism',
+        'Taylorism and Fordism: Review',
+        'Transportation and Communication Media',
+        'Urban Geography',
+        'Use of Natural Resources',
+        'Work and Technology',
+        'Work: Rural and Urban',
+        'World: Agriculture and Hunger',
+        'World: Cosmopolitan',
+        'World: Diversity and Transformation',
+        'World: Global Inequality',
+        'World: Globalization',
+        'World: Nation-State Economics',
+        'World: Population Distribution',
+    ),
+    ('Geography', 'Region'): (
+        'Amazon: Biomes, Economy and Environmental Impacts',
+        'Amazon: Biomes, Economy and Environmental Impacts: Review',
+        'Midwest: Region Growth, Deforestation and its Biomes',
+    ),
+    ('Geography', 'Territory'): (
+        'Africa: Economic Dependency',
+        'Africa: Environmental Issues',
+        'Africa: Globalized World',
+        'Africa: Globalized World: Review',
+        'Africa: Migration Flows',
+        'Africa: Natural',
+        'Africa: Neocolonialism and Independence',
+        'Africa: Population',
+        'Africa: Socioeconomic Characteristics',
+        'African Dependency Issues',
+        'America: Colonization and Independence',
+        'America: Indigenous Peoples',
+        'America: Natural Aspects',
+        'America: Population',
+        'America: Regionalization',
+        'Antarctica: Natural and Human Aspects',
+        'Asia: Economy and Population',
+        'Asia: Energy Matrices',
+        'Asia: Environmental Issues',
+        'Asia: Natural Aspects',
+        'Asia: Socialism: Review',
+        'Characteristics of the Continents: Africa',
+        'Characteristics of the Continents: Americas',
+        'Characteristics of the Continents: Asia',
+        'Characteristics of the Continents: Europe',
+        'Characteristics of the Continents: Oceania',
+        'China: Natural and Human Aspects',
+        'Europe: Economy and Population',
+        'Europe: Energy Matrices',
+        'Europe: Environmental Issues',
+        'Europe: Euro and Other Trade Blocks: Review',
+        'Europe: Natural Aspects',
+        'Japan: Natural and Human Aspects',
+        'Latin America: Economic Crisis and Social Problems',
+        'Latin America: Left-Wing Governments',
+        'Latin America: Left-Wing Governments: Review',
+        'Oceania: Natural and Human Aspects',
+    ),
+    ('Geography', 'Theory of Geography'): (
+        'Cartography: Scale, Projection, and Geotechnology',
+        'Fundamentals of Geography',
+    ),
+    ('History', 'Ancient History'): (
+        'Africa: Kush, Axum and Ghana: Review',
+        'African Kingdoms: Kush, Axum, and Ghana',
+        'America: Indigenous Peoples',
+        'America: Native Peoples: Review',
+        'Ancient Cities and Contemporary Cities',
+        'Ancient Egypt',
+        'Ancient Egypt: Introduction',
+        'Ancient Egypt: Review',
+        'Ancient Greece, Classical Period, Hellenism: Review',
+        'Ancient Greece, Pre-Hellenism: Review',
+        'Ancient Greece: Classical Period, Hellenism',
+        'Ancient Greece: Introduction',
+        'Ancient Greece: Pre-Hellenism',
+        'Ancient Rome, Monarchy and Republic: Review',
+        'Ancient Rome, Roman Empire: Review',
+        'Ancient Rome: Introduction',
+        'Ancient Rome: Monarchy and Republic',
+        'Ancient Rome: Roman Empire',
+        'Asia: Far East',
+        'Birth of Cities',
+        'Fall of the Western Roman Empire, Late Antiquity: Review',
+        'From Nomadism to Sedentism: Birth of the First Cities and Agriculture',
+        'History of Indigenous Peoples',
+        'Late Antiquity: Fall of the Western Roman Empire',
+        'Mesoamerica: Introduction',
+        'Mesopotamia',
+        'Mesopotamia: Introduction',
+        'Mesopotamia: Review',
+        'Nomadism and the First Communities',
+        'Religion of Ancient Peoples',
+    ),
+    ('History', 'Contemporary History'): (
+        'Change in Life in the Countryside and the City',
+        'Chinese Communist Revolution',
+        'Chinese Communist Revolution: Review',
+        'City: Work, Culture, and Leisure',
+        'Cold War: Formation of Blocs',
+        'Cold War: Formation of the Blocs: Review',
+        'Cold War: Introduction',
+        'Cold War: Peaceful Coexistence, Conflicts and Social Movements',
+        'Cold War: Peaceful Coexistence, Conflicts and Social Movements: Review',
+        'Conflicts in the Middle East',
+        'Conflicts in the Middle East: Review',
+        'Cuban Communist Revolution',
+        'Cuban Communist Revolution: Review',
+        'Decolonization of Africa and Asia',
+        'Decolonization of Africa and Asia: Review',
+        'Decolonization: Africa and Asia',
+        'Dictatorial Regimes in Latin America',
+        'Dictatorial Regimes in Latin America: Review',
+        'Dictatorships in Latin America',
+        'Family Life',
+        'Family and Community',
+        'Games and Toys in Different Eras',
+        'Globalized World',
+        'Media and Communication',
+        'Movement of People and Goods',
+        'Perception of Social Environment Differences',
+        'Politics and Economy: Latin America in the Post-Military Dictatorship',
+        'Routes: Land, River and Maritime',
+        'Russian Revolution',
+        'Russian Revolution: From the Fall of Tsarism to the Revolutionary Process: Review',
+        'Russian Revolution: From the Fall of the Tsar to the Revolutionary Process',
+        'Russian Revolution: Lenin and Stalin',
+        'Russian Revolution: Lenin and Stalin: Review',
+        'School and Community',
+        'Social and Cultural Transformations',
+        'Space: Public and Domestic',
+        'Terrorism',
+        'Totalitarian Regimes in Europe: Francoism and Salazarism',
+        'Totalitarian Regimes in Europe: Nazism, Fascism, Communism, Salazarism, and Francoism: Review',
+        'Totalitarian Regimes in Europe: Nazism, Fascism, and Communism',
+        'Totalitarian Regimes: Nazism, Fascism, Communism, Francoism, and Salazarism',
+        'Work and Nature',
+        'World War I',
+        'World War I: Background',
+        'World War I: Conclusion of the War',
+        'World War I: Review',
+        'World War II',
+        'World War II: Review',
+    ),
+    ('History', 'Medieval History'): (
+        'Arabs: Expansion of Islam',
+        'Islam: Birth and Expansion',
+        'Islam: Birth and Expansion: Review',
+        'Middle Ages: Introduction',
+        'Middle Ages: Late Middle Ages, High Middle Ages, and Early Middle Ages',
+        'Middle Ages: Review',
+    ),
+    ('History', 'Modern History'): (
+        'Absolute Monarchies',
+        'Absolutism',
+        'Absolutism: Review',
+        'America in the 19th Century',
+        'America in the 19th Century: Review',
+        'American Independence Review',
+        'American War of Independence',
+        'English Revolution: From the Puritan Revolution to the Glorious Revolution',
+        'English Revolution: Review',
+        'English Revolution: from the Puritan Revolution to the Glorious Revolution',
+        'Enlightenment: Review',
+        'European Imperialism in Asia and Africa',
+        'European Maritime Expansion: Mercantilism',
+        'European Maritime Expansion: Review',
+        'First Industrial Revolution',
+        'First Industrial Revolution: Review',
+        'Formation of Modern States',
+        'Formation of Modern States: Review',
+        'French Revolution: Constitutional Monarchy, National Convention, and Directory',
+        'French Revolution: Review',
+        'Great Navigations',
+        'Illustration',
+        'Imperialism: Africa',
+        'Imperialism: Africa: Review',
+        'Imperialism: Asia',
+        'Imperialism: Asia: Review',
+        'Italian and German Unification: Review',
+        'Latin American Independences: Formation of the First Republics',
+        'Latin American Independences: Review',
+        'Napoleonic Period',
+        'Napoleonic Period: Review',
+        'Protestant Movement: Review',
+        'Protestant Movements',
+        'Protestantism',
+        'Renaissance',
+        'Renaissance: Review',
+        'Second Industrial Revolution and 19th Century Social Doctrines: Review',
+        'Second Industrial Revolution and the Social Doctrines of the 19th Century',
+        'Spanish Colonization in America: Economy, Society, Administration, and Slavery',
+        'Spanish Colonization: Economy, Politics, Society, Colonial Pact, and Slavery',
+        'Spanish Colonization: Review',
+        'Thirteen Colonies',
+        'Thirteen Colonies: Review',
+        'USA and Latin America: International Relations',
+        'Unifications in Europe: Italy and Germany',
+    ),
+    ('History', 'Theory of History'): (
+        'Concept of Temporality',
+        'Emergence of the Human Species',
+        'Experience Recording',
+        'Heritage: Material and Intangible',
+        'Historical Time',
+        'History and Memory',
+        'Human Actions: Time and Space',
+        'Language and Technology in the Study of History',
+        'Milestones of Memory',
+        'Notion of State',
+        'Objects and Memory',
+        'Official Documents',
+        'Study of History: Introduction',
+        'Time Measurement',
+        'Time and History',
+        'Time and Orality',
+        'What is History: Review',
+        'What is history?',
+    ),
+    ('Mathematics', 'Algebra'): (
+        'Addition and Subtraction: Missing Values',
+        'Algebraic Expressions',
+        'Basic Second Degree Equation',
+        'Circumscribed Polygons',
+        'Complex Numbers: Basic Equality',
+        'Complex Numbers: Basic Operations',
+        'Complex Numbers: Conjugate',
+        'Complex Numbers: Exponentiation',
+        'Complex Numbers: Gauss Plane',
+        'Complex Numbers: Introduction',
+        'Complex Numbers: Magnitude',
+        'Complex Numbers: Multiplication and Division',
+        'Complex Numbers: Powers of i',
+        'Compound Rule of Three Problems',
+        'Determinant: 1x1',
+        'Determinant: 2x2',
+        'Determinant: 3x3',
+        'Determinant: Inverse Matrix and Cofactors',
+        'Determinant: Laplace',
+        "Determinants: Binet's Theorem",
+        'Determinants: Properties',
+        'Direct Proportion Rule Problems',
+        'Equal Parts Distribution',
+        'Equality Between Two Members',
+        'Equality: Identical Sums and Subtractions',
+        'Equality: Missing Values',
+        'Equality: Same Operation on Both Sides',
+        'Equations with Two Variables',
+        'Equations: Irrational',
+        'Exponential Equation',
+        'Exponential Function: Graph',
+        'Exponential Function: Inputs and Outputs',
+        'Exponential Inequality',
+        'Factorization',
+        'Factorization: Difference of Squares',
+        'Factorization: Grouping and Evidencing',
+        'Factorization: Second Degree Expressions',
+        'First Degree Equation',
+        'First Degree Equation Problems',
+        'First Degree Equations',
+        'First Degree Function: Graph and Table',
+        'First Degree Function: Inputs and Outputs',
+        'First Degree Function: Introduction',
+        'First Degree Inequality',
+        'Function: Bijective',
+        'Function: Codomain and Range',
+        'Function: Domain',
+        'Function: Even or Odd',
+        'Function: Graphs',
+        'Function: Injective and Surjective',
+        'Function: Inputs and Outputs',
+        'Function: Introduction',
+        'Function: Linear Functions',
+        'Function: Representations and Applications',
+        'Indirect Rule of 3 Problems',
+        'Inequalities: Introduction',
+        'Inscribed Polygons',
+        'Linear Equations: Comparison',
+        'Linear Systems: Resolution',
+        'Linear Systems: System Discussion',
+        'Linear Systems: Written by Matrices',
+        'Logarithm: Introduction',
+        'Logarithm: Properties',
+        'Logarithm: Values',
+        'Logarithmic Equation',
+        'Logarithmic Function: Graph',
+        'Logarithmic Function: Inputs and Outputs',
+        'Logarithmic Inequality',
+        'Matrix: Classifications',
+        'Matrix: Equality',
+        'Matrix: Inverse Calculation',
+        'Matrix: Operations',
+        'Modular Equation',
+        'Modular Function: Graph',
+        'Modular Function: Inputs and Outputs',
+        'Modular Inequality',
+        'Notable Cube Products',
+        'Notable Products',
+        'Notable Products of Squares',
+        'Number of Solutions of the System',
+        'Numeric Sets',
+        'Organization of Objects by Attributes',
+        'Polynomials: Factorization',
+        "Polynomials: Girard's Relations",
+        'Polynomials: Numerical Values',
+        'Polynomials: Operations',
+        'Polynomials: Properties',
+        'Polynomials: Remainder',
+        'Polynomials: Roots',
+        'Proportion',
+        'Proportionality Relationships',
+        'Proportions in the Cartesian Plane',
+        'Quadratic Equation: Bhaskara',
+        'Quadrilateral: Rhombus',
+        'Ratio',
+        'Rationalization of Denominators',
+        'Reasons and Proportions',
+        'Relationships and equations of magnitudes',
+        'Rule of 3: Direct',
+        'Rule of 3: Indirect',
+        'Second Degree Equation: Coefficients',
+        'Second Degree Equations',
+        'Second Degree Function: Graph and Table',
+        'Second Degree Function: Inputs and Outputs',
+        'Second Degree Function: Introduction',
+        'Second Degree Function: Maximums and Minimums',
+        'Second Degree Inequality',
+        'Sequence of Events of the Day',
+        'Sequences and Patterns',
+        'Sequences: Addition and Subtraction',
+        'Sequences: Increasing and Decreasing',
+        'Sequences: Missing Elements',
+        'Sequences: Multiples of a Natural Number',
+        'Sets',
+        'Sets: Introduction',
+        'Similar Matrix',
+        'System of Equations',
+        'Unequal Partition',
+        'Unequal Partition Problems',
+        'Variables',
+        'Variables and Unknowns',
+    ),
+    ('Mathematics', 'Arithmetic and Numbers'): (
+        'Absolute Value and Modulus',
+        'Absolute Value and Number Order',
+        'Addition and Subtraction of Decimal Numbers',
+        'Addition and Subtraction of Natural Numbers',
+        'Addition and Subtraction of Natural Numbers Less than 100',
+        'Addition and Subtraction of Naturals Less than 1,000',
+        'Algorithms and Problems',
+        'Algorithms and Problems: Medium',
+        'Arithmetic Progression: Sum',
+        'Arithmetic Progression: Terms',
+        'Base Change',
+        'Base Change Problems',
+        'Basic Addition Facts',
+        'Basic Multiplication Facts',
+        'Basic Subtraction Facts',
+        'Comparison of Natural Numbers Less Than 100',
+        'Comparison of Natural Numbers Less Than 20',
+        'Comparisons between fractions',
+        'Composition and Decomposition of Natural Numbers Less than 10,000',
+        'Composition and Decomposition of Natural Numbers Less than 100',
+        'Composition and Decomposition of Natural Numbers Less than 1000',
+        'Composition and Decomposition of Natural Numbers into Powers of 10',
+        'Counting Natural Numbers Less Than 1,000',
+        'Counting Natural Numbers Less Than 100',
+        'Data Reading and Interpretation',
+        'Decimal Numbers',
+        'Decimal System',
+        'Divisibility Criteria',
+        'Divisibility Criteria: Review',
+        'Division of Naturals',
+        'Divisors and Multiples',
+        'Double, Half, Triple and Third Part',
+        'Elements of a Sequence',
+        'Exact Square and Cubic Roots',
+        'Exponentiation: Introduction',
+        'Exponentiation: Negative Exponents',
+        'Exponentiation: Properties',
+        'Exponentiation: Rational Numbers',
+        'Financial Mathematics: Compound Interest',
+        'Financial Mathematics: Interest and Time Value of Money',
+        'Financial Mathematics: Simple Interest',
+        'Financial Mathematics: Spreadsheets',
+        'Fractions and Decimal Numbers: Conversion',
+        'Fractions: Addition and Subtraction',
+        'Fractions: Common Denominators',
+        'Fractions: Comparison',
+        'Fractions: Composing Shapes',
+        'Fractions: Concept of Conversion between Fractions and Decimal Numbers',
+        'Fractions: Equivalent Fractions',
+        'Fractions: Multiplication and Division',
+        'Fractions: Parts of Natural Numbers',
+        'Fractions: Representation',
+        'GCD',
+        'GCD Problems',
+        'Geometric Progression: Sum',
+        'Geometric Progression: Terms',
+        'Greater or Lesser',
+        'Inverse Relationships of Operations',
+        'Irrational Numbers',
+        'Irrational Numbers: Number Line',
+        'LCM',
+        'LCM Problems',
+        'Mathematical Expressions',
+        'Multiplication and Division Problems',
+        'Multiplication and Division of Decimal Numbers',
+        'Multiplication by 2, 3, 4, 5, and 10',
+        'Multiplication by 2, 3, 4, and 5',
+        'Multiplication with Missing Values',
+        'Negative Numbers',
+        'Non-Rational Square and Cubic Roots',
+        'Number Line: Natural Numbers',
+        'Numerical Expressions',
+        'Operations with Real Numbers',
+        'Operations: Addition and Subtraction',
+        'Operations: Decimals',
+        'Operations: Decimals and Fractions',
+        'Operations: Mixed Numbers',
+        'Operations: Multiplication and Division',
+        'Operations: Natural Numbers',
+        'Operations: Negative Numbers',
+        'Operations: Order of Operations',
+        'Operations: Problems with Rational Operations',
+        'Operations: Properties',
+        'Operations: Ratios',
+        'Opposite Numbers',
+        'Percentage: Conversion with Fractions and Decimals',
+        'Percentage: Discounts or Percentage Increases',
+        'Percentage: Notable Percentages',
+        'Percentage: Percentage Problems',
+        'Percentage: Relation to Proportionality',
+        'Percentage: Successive Percentages',
+        'Prime and Composite Numbers',
+        'Prime and Composite Numbers: Review',
+        'Problems and Flowcharts',
+        'Problems with Scientific Notation',
+        'Properties of Exponentiation: Rational Exponents',
+        'Radication',
+        'Radication: Properties',
+        'Rational Exponents: Powering',
+        'Rational Number Sorting',
+        'Rational Numbers: Introduction',
+        'Reading and Comparing Natural Numbers Less Than 10,000',
+        'Reading and Comparing Natural Numbers Less Than 100,000',
+        'Remainders of Division',
+        'Repeating Decimals',
+        'Roman Numerals',
+        'Rounding',
+        'Scientific Notation',
+        'Scientific Notation: Review',
+        'Sequence Terms',
+        'Sequences: Classifications',
+        'Sequences: Terms',
+        'Unit Fractions',
+        'Writing Natural Numbers',
+    ),
+    ('Mathematics', 'Combinatorial Analysis and Probability'): (
+        'Basic Probability',
+        'Binomial Probability',
+        'Combinations',
+        'Combinatorial Analysis: Additive Principle',
+        'Combinatorial Analysis: Circular Permutation',
+        'Combinatorial Analysis: Combination',
+        'Combinatorial Analysis: Factorial',
+        'Combinatorial Analysis: Multiplicative Principle',
+        'Combinatorial Analysis: Number of Non-Negative Integer Solutions',
+        'Combinatorial Analysis: Number of Positive Integer Solutions',
+        "Combinatorial Analysis: Pascal's Triangle",
+        'Combinatorial Analysis: Permutation with Repetition',
+        'Combinatorial Analysis: Simple Permutation',
+        'Conditional Probability',
+        'Counting Principle',
+        'Counting: Introduction',
+        'Event Classification',
+        'Factorial',
+        'Fundamental Principle of Counting',
+        'Graphics: bar, table, line, image',
+        'Graphics: graph evaluation',
+        "Newton's Binomial: Independent Term of x",
+        "Newton's Binomial: Introduction",
+        "Newton's Binomial: Sum of the Coefficients (Binomials)",
+        'Permutations',
+        'Possible Outcomes',
+        'Probability Predictions',
+        'Probability of Complementary Events',
+        'Probability: Dependent Events',
+        'Probability: Independent Events',
+        'Probability: Introduction',
+        'Probability: Properties',
+        'Probability: Sample Space',
+        'Probability: Successive Events',
+        'Probable and Improbable',
+        'Random Events',
+        'Sample Spaces',
+        'Theoretical Probability',
+    ),
+    ('Mathematics', 'Geometry'): (
+        '3D Geometric Solids',
+        'Analytic Geometry: Centroid',
+        'Analytic Geometry: Distance Between Points',
+        'Analytic Geometry: Equation of Conics',
+        'Analytic Geometry: Equation of a Line',
+        'Analytic Geometry: Equation of the Circle',
+        'Analytic Geometry: Midpoint',
+        'Angle Classification',
+        'Angle Congruence and Proportionality',
+        'Angle Problems',
+        'Angles: Classification',
+        'Angles: Clocks',
+        'Angles: Vertically Opposite Angles',
+        'Angular Relationships in Parallel Lines',
+        'Area of Plane Figures: Unit Squares',
+        'Area of Shapes',
+        'Area: Circle',
+        'Area: Composite Figures',
+        'Area: Rectangle and Parallelogram',
+        'Area: Square',
+        'Area: Trapezoid',
+        'Area: Triangle',
+        'Bisector and Perpendicular Bisector',
+        'Cartesian Coordinates',
+        'Cartesian Plane: 1st Quadrant',
+        'Cartesian Plane: Points',
+        'Circle Area',
+        'Circle: Angles in a Circle',
+        'Circle: Circumference Problems',
+        'Circle: Eccentric Angles',
+        'Circle: Inscribed and Central Angles',
+        'Circle: Power of a Point',
+        'Circles: Introduction',
+        'Classification of Angles by Their Opening',
+        'Classification of Shapes',
+        'Clock Reading',
+        'Congruent Figures',
+        'Conversion: Area',
+        'Distance Between Points in the Cartesian Plane',
+        'Expansion and Reduction of Figures',
+        'Flat Figures: Introduction',
+        'Flat Figures: Sides and Vertices',
+        'Geometric Algorithms',
+        'Geometric Constructions',
+        'Hexagon Area',
+        'Inscribed Angles',
+        'Internal Angles of Quadrilaterals',
+        'Introduction to Regular Polygons',
+        'Lines, Line Segments, and Rays',
+        'Lines: Parallel and Transversal',
+        'Localization',
+        'Metric Relationships in the Right Triangle',
+        'Movement of Objects and People',
+        'Movements and Location: Grid Meshes',
+        'Orthogonal View',
+        'Parallel Lines Cut by a Transversal',
+        'Paths of People and Objects',
+        'Perfect Squares',
+        'Perimeter',
+        'Perimeter and Area Relationship',
+        'Perimeter: Circle',
+        'Planning: Spatial Figures',
+        'Point, Line, and Plane',
+        'Polygon Angles',
+        'Polygon Transformations',
+        'Polygons: Classification',
+        'Polygons: Diagonal',
+        'Polygons: Introduction',
+        'Polygons: Sum of Angles',
+        'Prisms and Pyramids: Layouts and Characteristics',
+        'Properties of Shapes',
+        'Pythagorean Theorem',
+        'Quadrilateral Classification',
+        'Quadrilateral: Parallelogram',
+        'Quadrilateral: Rectangle',
+        'Quadrilaterals: Introduction',
+        'Quadrilaterals: Trapezoid',
+        'Rectangle Area',
+        'Reflections in the Cartesian Plane',
+        'Reflections of Plane Figures',
+        'Reflections: Advanced',
+        'Regular Polygon: Construction',
+        'Regular Polygons: Angles and Diagonals',
+        'Regular Polygons: Introduction',
+        'Right Triangle: Metric Relationships',
+        'Right and Non-Right Angles',
+        'Rotations in the Cartesian Plane',
+        'Rotations of Plane Figures',
+        'Rotations: Advanced',
+        'Side, Radius and Apothem of Inscribed and Circumscribed Polygons',
+        'Spatial Figures',
+        'Spatial Geometric Figures: Characteristics and Layouts',
+        "Spatial Geometry: Cavalieri's Principle",
+        'Spatial Geometry: Deformations in Projections',
+        'Spatial Geometry: Dihedrals and Trihedrals',
+        'Spatial Geometry: Frontal Views',
+        'Spatial Geometry: Fundamentals',
+        'Spatial Geometry: Metric Relations of Cones',
+        'Spatial Geometry: Metric Relations of Prisms',
+        'Spatial Geometry: Metric Relations of Pyramids',
+        'Spatial Geometry: Metric Relations of Spheres',
+        'Spatial Geometry: Metric Relations of the Cylinder',
+        'Spatial Geometry: Polyhedra',
+        'Spatial Geometry: Prism Volume',
+        'Spatial Geometry: Revolution Figures',
+        'Spatial Geometry: Surface Area of the Cone',
+        'Spatial Geometry: Surface Area of the Cylinder',
+        'Spatial Geometry: Surface Area of the Prism',
+        'Spatial Geometry: Surface Area of the Pyramid',
+        'Spatial Geometry: Surface Area of the Sphere',
+        'Spatial Geometry: Volume of Cones',
+        'Spatial Geometry: Volume of Spheres',
+        'Spatial Geometry: Volume of the Cylinder',
+        'Spatial Geometry: Volume of the Pyramid',
+        'Square Area',
+        'Sum of the Interior Angles of a Triangle',
+        'Symmetry in Relation to Axes',
+        'Symmetry in the Cartesian Plane: Introduction',
+        "Thales' Theorem",
+        'Translations in the Cartesian Plane',
+        'Translations of Plane Figures',
+        'Translations: Advanced',
+        'Trapezoid Area',
+        'Triangle Area',
+        'Triangle Components',
+        'Triangle Existence Condition',
+        'Triangle Similarity',
+        'Triangles and Their Classifications',
+        'Triangles: Angular Classification',
+        'Triangles: Cevians and Notable Points',
+        'Triangles: Classification by Sides',
+        'Triangles: Congruence',
+        'Triangles: Law of Cosines',
+        'Triangles: Law of Sines',
+        "Triangles: Menelaus' Theorem",
+        'Triangles: Pythagoras',
+        'Triangles: Similarity',
+        'Triangles: Sum of Angles',
+        'Volume and Area: Cylinder',
+        'Volume: Contextualized Rectangular Prism',
+        'Volume: Rectangular Blocks',
+        'Volume: Rectangular Prism',
+    ),
+    ('Mathematics', 'Magnitudes and Measurements'): (
+        'Angle Measurement',
+        'Angles: Degrees and Radians',
+        'Area and Perimeter: Comparison',
+        'Comparison of Object Areas',
+        'Contextualized Measurement Problems',
+        'Conversion: Length',
+        'Conversion: Mass and Volume',
+        'Dates and Time Periods',
+        'Flowcharts',
+        'Ground Floor and Aerial Views',
+        'Metric vs. Imperial System',
+        'Problems with Measurements',
+        'Size Comparison by Terms',
+        'Time Conversion',
+        'Time Intervals',
+        'Unit Systems',
+        'Units of Measure: Time',
+        'Value Equivalence: buying and selling',
+        'Volume: Relationships with Cubes',
+    ),
+    ('Mathematics', 'Magnitudes and Measures'): (
+        'Units of Measurement: Capacity and Mass',
+        'Units of Measurement: Length and Time',
+        'Value Equivalence: Discount and Exchange',
+    ),
+    ('Mathematics', 'Statistics'): (
+        'Bar or Pictorial Charts',
+        'Census and Sample Research',
+        'Comparison of Research Information',
+        'Data Interpretation',
+        'Data Representation',
+        'Dubious Figures',
+        'Graphics: Bars and Columns',
+        'Graphics: Bars, Tables, Lines, Images',
+        'Graphics: Graph Suitability',
+        'Graphics: Pie Charts',
+        'Representation and Reading of Research',
+        'Research: Sampling',
+        'Statistics: Arithmetic Mean',
+        'Statistics: Arithmetic and Geometric Means',
+        'Statistics: Averages',
+        'Statistics: Frequencies',
+        'Statistics: Interpretation of Graphs and Tables',
+        'Statistics: Median',
+        'Statistics: Mode',
+        'Statistics: Mode and Median',
+        'Statistics: Sample Surveys',
+        'Statistics: Types of Graphs and Tables',
+    ),
+    ('Mathematics', 'Trigonometry'): (
+        'Basic Trigonometric Lines: 30º, 45º, 60º',
+        'Complex Numbers: Trigonometric Form',
+        'Trigonometric Equation',
+        'Trigonometric Function: Graphs',
+        'Trigonometric Function: Inputs and Outputs',
+        'Trigonometric Function: Periodicity',
+        'Trigonometric Inequality',
+        'Trigonometric Lines of 75º, 15º, 22.5º',
+        'Trigonometric Ratios',
+        'Trigonometry in the Right Triangle',
+        'Trigonometry: Basic Trigonometric Lines (30º,45º,60º): Review',
+        'Trigonometry: Double/Triple Angle',
+        'Trigonometry: Fundamental Relationship',
+        'Trigonometry: Product-to-Sum Transformation',
+        'Trigonometry: Sine, Cosine, and Tangent: Review',
+        'Trigonometry: Sum and Difference of Angles',
+    ),
+    ('Philosophy', 'Concept'): (
+        'Concept of Modernity',
+        'Construction of Morality',
+        'Freedom and Subjectivity',
+        'Identity',
+        'Scientific Thinking vs. Common Sense',
+        'Subjectivity in Contemporary Society',
+        'Understanding and Reflection on Philosophy',
+    ),
+    ('Philosophy', 'Culture'): (
+        'Art and Culture',
+        'Cultural Diversity',
+        'Subjectivity of Contemporary Culture',
+    ),
+    ('Philosophy', 'Ethics'): (
+        'Ethics and Democratic Values',
+        'Ethics and Will',
+        'Ethics in the Globalized World',
+        'Human Rights and Totalitarian Regimes',
+        'Morality of Modern Man',
+        'Reflection on Ethics',
+        'Science and Bioethics',
+        'Science and its Contexts: Ethics, Freedom, Culture, and Religion',
+    ),
+    ('Philosophy', 'Origin'): (
+        'Kant, Hegel and Freud',
+        'Marx and Nietzsche',
+        'Modern and Contemporary Philosophy',
+        'Origin of Philosophy',
+        'Philosophical Schools: Ancient, Medieval, Modern, and Contemporary',
+    ),
+    ('Philosophy', 'Politics'): (
+        'Democracy and Citizenship',
+        'Politics and Power',
+    ),
+    ('Physical Education', 'Dance'): (
+        'Ballroom Dancing',
+        'Constitutive Elements of Dances',
+        'Dance as Historical Heritage',
+        'Dances: Community and Regional Context',
+        'Dances: Injustice and Prejudice',
+        'Movement and Dance',
+        'Urban Dances',
+    ),
+    ('Physical Education', 'Ethics in Sports'): (
+        'Doping in Sports',
+        'Doping, Corruption and Medication',
+        'Ethics and Sports',
+        'Steroids and Anabolics',
+    ),
+    ('Physical Education', 'Health'): (
+        'Body Awareness Gymnastics',
+        'Body Self-Awareness',
+        'Fitness Gymnastics',
+        'Health and Sports',
+        'Physical Exercise Demands',
+        'Physical Exercise and Physical Activity',
+        'Physical Exercise and the Body',
+    ),
+    ('Physical Education', 'Recreation'): (
+        "Games and Fun: Blind Man's Bluff",
+        'Games and Fun: Capture the Flag',
+        'Games and Fun: Circle and Rope',
+        'Games and Fun: Dodgeball',
+        'Games and Fun: Hide and Seek and Tag',
+        'Games and Fun: Hopscotch',
+        'Games and Fun: Hot Potato and Pass the Ring',
+        'Games and Fun: Marbles and Spinning Top',
+        'Games and Fun: Popular Worldwide',
+        'Traditional Games and Toys',
+    ),
+    ('Physical Education', 'Research in Sports'): (
+        'History of Sports',
+        'Olympic Sports and Olympics',
+    ),
+    ('Physical Education', 'Sport'): (
+        'American Football',
+        'Basic Elements of Gymnastics: Balances, Jumps, and Turns',
+        'Chess',
+        'Combat Sports',
+        'Combat Sports: Introduction',
+        'Darts',
+        'Electronic Games',
+        'Field Sports',
+        'Field and Pole Sports',
+        'Football',
+        'Football: Introduction',
+        'Futsal',
+        'General Gymnastics Elements: Rotations, Acrobatics, with and without Equipment',
+        'Gymnastics',
+        'Handball',
+        'Handball: Introduction',
+        'High Performance Sports and the Body',
+        'Hockey',
+        'Invasion Sports',
+        'Invasion Sports: Introduction',
+        'Judo',
+        'Judo: Introduction',
+        'Measure Sports',
+        'Measure Sports: Introduction',
+        'Nature Adventures',
+        'Net Sports',
+        'Net Sports: Introduction',
+        'Net and Wall Sports',
+        'Pole Sports',
+        'Precision Sports',
+        'Skate',
+        'Swimming',
+        'Technical-Combinatory Sports',
+        'Track and Field',
+        'Track and Field: Introduction',
+        'Transformations in Sports',
+        'Urban Adventure',
+        'Volleyball',
+        'Volleyball: Introduction',
+    ),
+    ('Physical Education', 'Wrestling'): (
+        'Fights and Practice',
+        'Jiu-Jitsu',
+        'World Fights',
+    ),
+    ('Physics', 'Astronomy'): (
+        'Astronomy: Black Holes',
+        'Astronomy: Celestial Objects',
+        'Astronomy: Galaxies',
+        'Astronomy: Stellar Evolution',
+        'Astronomy: Types of Stars',
+        'Solar System: Characteristics',
+    ),
+    ('Physics', 'Electromagnetism'): (
+        'Electricity: Capacitance',
+        'Electricity: Capacitors in Parallel',
+        'Electricity: Capacitors in Series',
+        'Electricity: Charge Conservation',
+        'Electricity: Conductors and Insulators',
+        "Electricity: Coulomb's Law",
+        'Electricity: Electric Charge',
+        'Electricity: Electric Current',
+        'Electricity: Electric Field',
+        "Electricity: Electric Field and Gauss's Law",
+        'Electricity: Electric Potential',
+        'Electricity: Electric Potential Energy',
+        'Electricity: Electric Power',
+        'Electricity: Electrical Circuits',
+        'Electricity: Generators and Receivers',
+        'Electricity: Lines of Force',
+        "Electricity: Ohm's First Law",
+        'Electricity: Parallel Plate Capacitor',
+        'Electricity: Parallel Resistors',
+        'Electricity: Potential Difference',
+        'Electricity: Problems of Electric Forces and Fields',
+        "Electricity: Resistivity and Ohm's 2nd Law",
+        'Electricity: Resistor Association',
+        'Electricity: Series Resistors',
+        'Electricity: Spherical Capacitor',
+        'Electricity: Types of Electrification',
+        'Electricity: Voltmeters and Ammeters',
+        'Electricity: Work of Electric Force in Uniform Fields',
+        'Electricity: Work of the Electric Force',
+        'Magnetic Field: Coil',
+        'Magnetic Field: Loop',
+        'Magnetic Field: Solenoid',
+        'Magnetic Field: Wire',
+        "Magnetism: Faraday's Law",
+        'Magnetism: Field Lines',
+        'Magnetism: Force on Current-Carrying Wire',
+        'Magnetism: Magnetic Field',
+        'Magnetism: Magnetic Flux',
+        'Magnetism: Magnetic Force on Charges',
+        'Magnetism: Magnets',
+    ),
+    ('Physics', 'Introduction to Physics'): (
+        'Dimensional Analysis',
+        'International System',
+        'Order of Magnitude',
+        'System Prefixes',
+        'Vectors: Addition',
+        'Vectors: Decomposition',
+        'Vectors: Difference',
+        'Vectors: Introduction',
+    ),
+    ('Physics', 'Kinematics'): (
+        'Kinematics: Acceleration of Uniformly Varied Circular Motion',
+        'Kinematics: Angular Displacement',
+        'Kinematics: Average Angular Velocity',
+        'Kinematics: Average Scalar Acceleration',
+        'Kinematics: Average Scalar Speed',
+        'Kinematics: Average Speed of Uniformly Accelerated Motion',
+        'Kinematics: Average Vector Acceleration',
+        'Kinematics: Average Vector Velocity',
+        'Kinematics: Centripetal Acceleration',
+        'Kinematics: Instantaneous Acceleration',
+        'Kinematics: Instantaneous Speed',
+        'Kinematics: Motion Transmission',
+        'Kinematics: Oblique Motion',
+        'Kinematics: Oblique Motion Equation',
+        'Kinematics: Path of a Body',
+        'Kinematics: Period in Circular Movements',
+        'Kinematics: Position Change',
+        'Kinematics: Reference Frame and Position',
+        'Kinematics: Relationship between Speeds in Circular Motions',
+        'Kinematics: Relative Velocity',
+        'Kinematics: Uniform Circular Motion',
+        'Kinematics: Uniform Circular Motion Acceleration',
+        'Kinematics: Uniform Motion',
+        'Kinematics: Uniform Motion Graphs',
+        'Kinematics: Uniformly Accelerated Motion',
+        'Kinematics: Uniformly Accelerated Motion Graphs',
+        'Kinematics: Uniformly Varied Circular Motion',
+        'Kinematics: Vertical Motion',
+    ),
+    ('Physics', 'Modern Physics and Relativity'): (
+        'Theory of Relativity: Relativistic Energy',
+    ),
+    ('Physics', 'Modern physics and relativity'): (
+        'Modern Physics: Bohr Model',
+        'Modern Physics: Heisenberg Uncertainty Principle',
+        'Modern Physics: Hydrogen Atom',
+        'Modern Physics: Photoelectric Effect',
+        'Modern Physics: Photons',
+        'Theory of Relativity: Introduction',
+        'Theory of Relativity: Space Contraction',
+        'Theory of Relativity: Time Dilation',
+    ),
+    ('Physics', 'Statics and Dynamics'): (
+        "Bernoulli's Principle",
+        'Dynamics: Centripetal Force',
+        'Dynamics: Elastic Force',
+        'Dynamics: Forces in Curvilinear Motion',
+        'Dynamics: Main Forces',
+        "Dynamics: Mechanics Problems: Newton's Laws",
+        "Dynamics: Newton's 1st Law",
+        "Dynamics: Newton's 2nd Law",
+        "Dynamics: Newton's 3rd Law",
+        'Dynamics: Representation of Forces',
+        'Dynamics: Traction Force',
+        'Dynamics: friction force',
+        'Gravitation: Bodies in Orbit',
+        'Gravitation: Escape Velocity',
+        'Gravitation: Gravitation Problems',
+        'Gravitation: Gravitational Acceleration',
+        'Gravitation: Gravitational Force',
+        "Gravitation: Kepler's Laws",
+        "Hydrodynamics: Bernoulli's Principle",
+        'Hydrodynamics: Flow Rate',
+        'Hydrostatics: Buoyancy',
+        'Hydrostatics: Hydrostatic Problems',
+        "Hydrostatics: Pascal's Theorem",
+        'Hydrostatics: Pressure',
+        'Hydrostatics: Specific Mass',
+        "Hydrostatics: Stevin's Theorem",
+        'Hydrostatics: Work and Energy Problems',
+        'Momentum and Impulse: Coefficient of Restitution',
+        'Momentum and Impulse: Collision and Momentum Problems',
+        'Momentum and Impulse: Collisions in One Dimension',
+        'Momentum and Impulse: Conservation of Momentum',
+        'Momentum and Impulse: Impulse Theorem',
+        'Momentum and Impulse: Impulse of a Force',
+        'Momentum and Impulse: Momentum',
+        'Momentum and Impulse: Two-Dimensional Collisions',
+        'Statics: Levers',
+        'Statics: Rigid Body',
+        'Statics: Torque or Moment',
+        'Work: Constant Force',
+        'Work: Elastic Force',
+        'Work: Elastic Potential Energy',
+        'Work: Graphics',
+        'Work: Gravitational Potential Energy',
+        'Work: Kinetic Energy',
+        'Work: Kinetic Energy and Work',
+        'Work: Mechanical Energy',
+        'Work: Non-Conservative Systems',
+        'Work: Power',
+        'Work: Power and Speed',
+        'Work: Resultant Force',
+        'Work: Weight',
+    ),
+    ('Physics', 'Thermology'): (
+        "Calorimetry: Fourier's Law",
+        'Calorimetry: Heat Exchange Problems',
+        'Calorimetry: Heat Flow',
+        'Calorimetry: Introduction',
+        'Calorimetry: Latent Heat',
+        'Calorimetry: Sensible Heat',
+        'Calorimetry: Thermal Power',
+        'Calorimetry: Thermometer Scale Changes',
+        'Expansion: Liquids in Containers',
+        'Linear Expansion',
+        'Main Forms of Energy Generation',
+        'Renewable and Non-Renewable Energies',
+        'Surface Expansion',
+        'Thermodynamics: 1st Law of Thermodynamics',
+        'Thermodynamics: 2nd Law of Thermodynamics',
+        'Thermodynamics: Average Speed of Gas Molecules',
+        'Thermodynamics: Carnot Cycle',
+        'Thermodynamics: Entropy',
+        'Thermodynamics: Gas Pressure',
+        'Thermodynamics: Gaseous Transformations',
+        'Thermodynamics: General Gas Equation',
+        'Thermodynamics: Internal Energy of a Gas',
+        'Thermodynamics: Thermal Machines',
+        'Thermodynamics: Thermal Transformations',
+        'Thermodynamics: Thermodynamic Cycle',
+        'Thermodynamics: Work of a Gas',
+        'Volumetric Expansion',
+    ),
+    ('Physics', 'Waves and Optics'): (
+        "Convex and Concave Mirrors: Gauss's Equation",
+        'Convex and Concave Mirrors: Image Formation',
+        'Flat Mirror: Image Formation',
+        'Flat Mirror: Movement and Image Formation',
+        'Flat Mirror: Rotation',
+        'Geometric Optics: Apparent Position',
+        'Geometric Optics: Camera Obscura',
+        'Geometric Optics: Critical Angle Problems',
+        'Geometric Optics: Human Eye',
+        'Geometric Optics: Introduction',
+        'Geometric Optics: Optical Instruments',
+        'Geometric Optics: Parallel Plates',
+        'Geometric Optics: Penumbra and Shadow',
+        'Geometric Optics: Prisms',
+        'Geometric Optics: Reflection',
+        'Geometric Optics: Refractive Index',
+        "Geometric Optics: Snell's Law",
+        "Lens: Lens Maker's Equation",
+        'Lenses: Gaussian Equation',
+        'Lenses: Types',
+        'Lenses: Vergence',
+        'Simple Harmonic Motion: Definition',
+        'Simple Harmonic Motion: Equation of Motion',
+        'Simple Harmonic Motion: Mass-Spring System',
+        'Simple Harmonic Motion: Mechanical Energy',
+        'Simple Harmonic Motion: Relationship between SHM and UCM',
+        'Simple Harmonic Motion: Simple Pendulum',
+        'Sound Waves: Pitch and Timbre',
+        'Waves: Beats',
+        'Waves: Doppler Effect',
+        'Waves: Electromagnetic and Mechanical',
+        'Waves: Elements of a Wave',
+        'Waves: Equation',
+        "Waves: Newton's Rings",
+        'Waves: Polarization',
+        'Waves: Radiations and Their Risks',
+        'Waves: Reflection',
+        'Waves: Refraction',
+        'Waves: Sound Intensity',
+        'Waves: Speed on Strings',
+        'Waves: Superposition',
+        'Waves: Vibration in Sound Tubes',
+        'Waves: Vibration in Strings',
+        'Waves: Wave Speed',
+        "Waves: Young's Experiment",
+    ),
+    ('Science', 'Earth and Universe'): (
+        'Air Composition',
+        'Astronomical Unit',
+        'Cardinal Points',
+        'Colligative Properties: Boiling Point Elevation',
+        'Continental Drift',
+        'Cyclic Movements of the Moon and Earth',
+        'Daily Activities Time Scales',
+        'Daily Periods',
+        'Earth Features',
+        'Earth Study',
+        'Effect of Solar Radiation',
+        'Environmental Balance',
+        'Galaxies and Milky Way',
+        'Greenhouse Effect and Human Action',
+        'Land Use',
+        'Layers of the Earth',
+        'Main Phases of the Moon',
+        'Moon',
+        'Natural Phenomena',
+        'Observation Devices',
+        'Ozone Layer',
+        'Phases of the Moon',
+        'Positions of the Sun and Shadow',
+        'Solar System: Evolution',
+        'Solar System: Introduction',
+        'Stars and Constellations',
+        'Stars: Evolution',
+        'Types of Rocks',
+        'Types of Soil',
+        'Weather Forecasting',
+    ),
+    ('Science', 'Life and Evolution'): (
+        'Animals: Group Organization',
+        'Animals: Life Cycle',
+        'Animals: Way of Life',
+        'Basic Genetics',
+        'Characteristics of Plants and Animals',
+        'Circulatory System',
+        'Conscious Consumption and Environmental Issues',
+        'Digestive System',
+        'Disasters and Natural Changes',
+        'Disease Prevention',
+        'Evolution: Introduction',
+        'Food Chains: Introduction',
+        'Food Production by Microorganisms',
+        'Food and Eating Disorders',
+        'Fungi and Bacteria: Decomposition',
+        'History of Technology',
+        'Human Body Parts: Introduction',
+        'Human Body: Cell Organization',
+        'Human Body: Circulatory System',
+        'Human Body: Digestive System',
+        'Human Body: Gametes and Transmission of Traits',
+        'Human Body: Human Reproduction',
+        'Human Body: Movement',
+        'Human Body: Nervous System',
+        'Human Body: Puberty',
+        'Human Body: Respiratory System',
+        'Human Body: System Organization',
+        'Human Body: Urinary System',
+        'Human Body: Vision',
+        'Human Physical Characteristics',
+        'Hygiene Habits',
+        'Matter Cycle and Energy Flow',
+        'Plants: Main Parts',
+        'Plants: Water and Light',
+        'Reproduction: Plants and Animals',
+        'Respiratory System',
+        'Water and Community',
+    ),
+    ('Science', 'Matter and Energy'): (
+        'Atom: Atomic Evolution',
+        'Atom: Introduction',
+        'Basic Electrical Circuits',
+        'Basic Stoichiometry',
+        'Chemical Bonds: Ionic and Covalent',
+        'Chemical Transformations',
+        'Conscious Consumption',
+        'Domestic Accident Prevention',
+        'Electrical Power',
+        'Electromagnetic Waves: Introduction',
+        'Energy Generation',
+        'Energy Transformation',
+        'Everyday Materials Transformations',
+        'Heat Propagation',
+        'Heat and Temperature',
+        'Impacts of Science',
+        'Main Inorganic Compounds',
+        'Maintenance of Auditory and Visual Health',
+        'Materials of Main Everyday Objects',
+        'Materials: Characteristics and Composition',
+        'Mixtures Separation',
+        'Mixtures: Introduction',
+        'Nature Conservation',
+        'New Materials and Technologies',
+        'Number of Moles: Introduction',
+        'Passage of Light through Objects',
+        'Periodic Table: Introduction',
+        'Phases of Mixing',
+        'Physical Properties of Materials',
+        'Ponderal Laws: Introduction',
+        'Primary Colors',
+        'Reactions: Introduction',
+        'Renewable and Non-Renewable Energies',
+        'Reversible and Irreversible Transformations',
+        'Simple and Thermal Machines',
+        'Sound Production',
+        'State Changes',
+        'Subject: Introduction',
+        'Types of Fuels',
+        'Types of Mixtures',
+        'Types of Substances and Mixtures',
+        'Water Cycle',
+        'Water Usage',
+        'Waves: Introduction',
+    ),
+    ('Sociology', 'Individual and Social Class'): (
+        'Human Coexistence: Social Interaction and Isolation',
+        'Social Inequality',
+    ),
+    ('Sociology', 'Social Structure'): (
+        'Changes in the World of Work',
+        'Globalized World and Migration Flows',
+        'Mass Culture',
+        'Modernity: Ethnocentrism and Racism',
+        'Society, Ideology and Culture',
+        'State Building',
+        'Technology and Work',
+        'Violence and its Manifestations',
+    ),
+    ('Sociology', 'Sociology Theory'): (
+        'Classics of Sociology',
+        'Rights and Duties',
+    ),
+    ('Sociology', 'Theory of Sociology'): (
+        'Concept of Ideology',
+    ),
+    ('Spanish', 'Grammar'): (
+        'Adjectives',
+        'Adverbs',
+        'Articles, Contractions and Neutral Article',
+        'Conjunctions',
+        'Formal and Informal Treatment',
+        'Indefinite Pronouns and Determiners',
+        'Interrogative Pronouns',
+        'Muy vs. Mucho',
+        'Numbers in Spanish',
+        'Object Pronoun',
+        'Past Perfect and Simple Past',
+        'Personal Pronoun',
+        'Possessive and Demonstrative Pronouns',
+        'Prepositions and Prepositional Phrases',
+        'Reflexive Pronouns and Relative Pronouns',
+        'Textual Genres',
+        'Use of the Whys',
+        'Word Formation',
+    ),
+    ('Spanish', 'Reading, Comprehension and Spelling'): (
+        'Accentuation',
+        'Spelling',
+        'Text Interpretation',
+        'The Alphabet, Sounds and Syllabic Separation',
+    ),
+    ('Spanish', 'Verbs'): (
+        'Verbs: Future Simple and Future Perfect',
+        'Verbs: Imperative',
+        'Verbs: Imperfect Preterite and Past Perfect',
+        'Verbs: Imperfect Preterite and Perfect Subjunctive',
+        'Verbs: Like',
+        'Verbs: Participle',
+        'Verbs: Past Conditional',
+        'Verbs: Past Participle',
+        'Verbs: Past Perfect',
+        'Verbs: Periphrastic Future',
+        'Verbs: Present Subjunctive',
+        'Verbs: Present Tense',
+        'Verbs: Ser, Estar, Tener',
+        'Verbs: Simple Conditional',
+        'Verbs: Tense Problems',
+    ),
+    ('Spanish', 'Vocabulary'): (
+        'False Cognates',
+        'Homographs and Homophones',
+        'Scientific Technical Vocabulary',
+        'Vocabulary: Animals, Plants, and Human Body Parts',
+        'Vocabulary: Days of the Week, Dates and Time',
+        'Vocabulary: Parts of the House, Objects and Materials',
+        'Vocabulary: Places and Family',
+        'Vocabulary: Travel and Transportation',
+    ),
+})
+
+# (discipline, grade, difficulty) -> categories available in that cell
+CELLS = MappingProxyType({
+    ('Arts', 10, 300): (
+        'Aesthetic and Cultural Matrices',
+        'Artistic Experiences',
+        'Community Arts Creation',
+        'Visual Arts',
+        'Visual Arts Construction',
+    ),
+    ('Arts', 20, 300): (
+        'Art Space',
+        'Dance Movements',
+        'Dance in Different Contexts',
+        'Plural Senses of the Arts',
+        'Space in the Construction of Dance Movements',
+    ),
+    ('Arts', 30, 300): (
+        'Body Sounds',
+        'Dance Codes',
+        'Dance Groups in School',
+        'Games, Fun and Music',
+        'Musical Expression',
+    ),
+    ('Arts', 40, 300): (
+        'Audiovisual Recording',
+        'Collective Work in Arts',
+        'Sound Improvisation',
+        'Theater',
+        'Theatrical Elements',
+    ),
+    ('Arts', 50, 300): (
+        'Art and Technology',
+        'Artistic Creation',
+        'Dance: Introduction',
+        'Music: Introduction',
+        'Playfulness in Art: Themes, Games, and Fun',
+        'Theater: Creation and Characters',
+        'Theater: Introduction',
+        'Various Artistic Languages',
+        'Visual Arts: Introduction',
+    ),
+    ('Arts', 60, 300): (
+        'Art Creation Processes',
+        'Art Perception',
+        'Arts Professionals',
+        'Drawing',
+        'Video and Photography',
+        'Visual Arts and Other Arts',
+        'Visual Expression',
+    ),
+    ('Arts', 70, 300): (
+        'Artistic Representations in Dance',
+        'Dance Experience',
+        'Dance Movement',
+        'Dances: World',
+        'Evolution of Dance',
+    ),
+    ('Arts', 80, 300): (
+        'Function of Music',
+        'Music Circulation',
+        'Music Recording',
+        'Musical Construction',
+    ),
+    ('Arts', 90, 300): (
+        'Art and Society',
+        'Art and Technology',
+        'Dramaturgy and Contemporary Theater',
+        'Relationships Between Artistic Languages',
+        'Scenic Elements',
+        'Stage Styles',
+        'Theater Function',
+        'Theatrical Production',
+    ),
+    ('Arts', 100, 300): (
+        'Art: Ancient Egypt',
+        'Art: Ancient Greece',
+        'Art: Ancient Mesopotamia',
+        'Art: Ancient Persia',
+        'Art: Ancient Rome',
+        'Art: Introduction',
+        'Art: Prehistory',
+        'Artistic Languages',
+        'Medieval Byzantine Art',
+    ),
+    ('Arts', 110, 300): (
+        'Art: Mesoamerica',
+        'Art: Modern Baroque',
+        'Early Christian Art',
+        'Islamic Art',
+        'Medieval Gothic Art',
+        'Modern Neoclassicism',
+        'Modern Renaissance',
+    ),
+    ('Arts', 120, 300): (
+        'Art: Contemporary',
+        'Art: Oriental',
+        'Art: Social Critique',
+        'Contemporary Impressionism',
+        'Contemporary Romanticism and Realism',
+        'Modernism',
+        'Postmodernism',
+    ),
+    ('Biology', 100, 300): (
+        'Animals: Circulatory System',
+        'Animals: Digestive System',
+        'Animals: Respiratory System',
+        'Animals: Types of Excretion',
+        'Animals: Vertebrates and Invertebrates',
+        'Ecology: Biocycles',
+        'Ecology: Biogeochemical Cycles',
+        'Ecology: Ecological Pyramids',
+        'Ecology: Ecological Relationships',
+        'Ecology: Ecological Succession',
+        'Ecology: Food and Web Chain',
+        'Ecology: Introduction',
+        'Environment: Biomes',
+        'Environment: Pollution',
+        'Fungi Kingdom: Fungi',
+        'Living Beings: Types of Reproduction',
+        'Monera Kingdom: Bacteria',
+        'Plant Kingdom: Plants',
+        'Protista Kingdom: Protozoa and Algae',
+        'Virus',
+    ),
+    ('Biology', 110, 300): (
+        'Biochemistry: Carbohydrates and Lipids',
+        'Biochemistry: DNA and RNA',
+        'Biochemistry: Proteins',
+        'Biochemistry: Vitamins and Minerals',
+        'Cell Division',
+        'Cytology',
+        'Human Body: Circulatory System',
+        'Human Body: Digestive System',
+        'Human Body: Endocrine System',
+        'Human Body: Excretory System',
+        'Human Body: Importance of Water',
+        'Human Body: Lymphatic System',
+        'Human Body: Muscular System',
+        'Human Body: Nervous System',
+        'Human Body: Reproductive System',
+        'Human Body: Respiratory System',
+        'Human Body: Senses',
+        'Human Body: Skeletal System',
+        'Human Body: Tissues',
+        'Metabolisms',
+        'Photosynthesis',
+    ),
+    ('Biology', 120, 300): (
+        'Chromosomes',
+        'Evolution',
+        'Genetics: Blood Groups',
+        'Genetics: Exercises',
+        'Genetics: Introduction',
+        'Genetics: Linkage',
+        "Genetics: Mendel's 1st Law",
+        "Genetics: Mendel's 2nd Law",
+        'Genetics: Pedigree',
+        'Lamarckism and Darwinism',
+    ),
+    ('Chemistry', 100, 300): (
+        'Atoms: Atomic Mass Unit',
+        'Atoms: Characteristics of Atoms and Ions',
+        'Atoms: Electron Distribution',
+        'Atoms: Energy Levels and Sublevels',
+        'Atoms: Evolution of Atomic Models',
+        'Atoms: Isotopes, Isotones, and Isobars',
+        'Chemical Bonds: Covalent',
+        'Chemical Bonds: Ionic',
+        'Chemical Bonds: Metallic',
+        'Chemical Formulas',
+        'Components and Phases',
+        'Current Periodic Table',
+        'Determination of Molecular Formula',
+        'Dissociation and Ionization',
+        'Eutectic and Azeotropic Mixtures',
+        'Gases: Introduction',
+        'Gases: Relationship between Mol and Volume at STP',
+        'Homogeneous and Heterogeneous Mixtures',
+        'Hybridization',
+        'Initial Aspects of Matter',
+        'Inorganic Functions: Acids',
+        'Inorganic Functions: Bases',
+        'Inorganic Functions: Nomenclature of Acids',
+        'Inorganic Functions: Nomenclature of Bases',
+        'Inorganic Functions: Oxide Nomenclature',
+        'Inorganic Functions: Oxides',
+        'Inorganic Functions: Salt',
+        'Inorganic Functions: Salt Nomenclature',
+        'Intermolecular Bonds',
+        'Main Physical States of Matter',
+        'Main Reaction Types',
+        'Mixtures: Separation of Mixtures',
+        'Mol: Amount of Substance',
+        'Molar Mass: Relationship between Mole and Mass',
+        'Molecular Geometry',
+        'Oxidation Number',
+        'Periodic Table: History of the Table',
+        'Periodic Table: Metal',
+        'Periodic Table: Non-Metal',
+        'Periodic Table: Properties',
+        'Phase Diagram',
+        'Physical and Chemical Phenomena',
+        'Ponderal Laws: Dalton',
+        'Ponderal Laws: Lavoisier',
+        "Proust's Law of Definite Proportions",
+        'Reactions: Balancing',
+        'Reactions: Redox Equation',
+        'Redox Equation Balancing Reactions',
+        'Simple and Compound Substances',
+        'State Changes',
+        'Subject: General Properties',
+        'Subject: Physical, Chemical, and Organoleptic Properties',
+        'Substances and Mixtures',
+    ),
+    ('Chemistry', 100, 500): (
+        'Basic Stoichiometry',
+        'Gases: General Equation',
+        'Stoichiometry: Limiting and Excess',
+        'Stoichiometry: Purity and Yield',
+        'Stoichiometry: Stoichiometry Problems',
+    ),
+    ('Chemistry', 110, 500): (
+        'Chemical Equilibrium',
+        'Chemical Kinetics: Activation Energy',
+        'Chemical Kinetics: Introduction and Average Rate',
+        'Chemical Kinetics: Main Speed Factors',
+        'Chemical Kinetics: Rate Law',
+        'Chemical Kinetics: Reaction Order',
+        'Colligative Properties: Boiling Point Elevation',
+        'Colligative Properties: Colligative Properties Problems',
+        'Colligative Properties: Cryoscopy',
+        'Colligative Properties: Osmotic Pressure',
+        'Colligative Properties: Tonoscopy',
+        'Colligative Properties: Vapor Pressure',
+        'Colloids',
+        'Concentration Units: % Mass, Volume and Other Units',
+        'Concentration Units: Molality',
+        'Concentration Units: Molarity',
+        'Electrochemistry: Batteries',
+        'Electrochemistry: Electrolysis',
+        "Electrochemistry: Faraday's Laws",
+        'Electrochemistry: Introduction',
+        'Electrochemistry: Nernst Equation',
+        'Equilibrium: Partial Pressures',
+        'Equilibrium: Solubility Product',
+        'Equilibrium: pH and pOH',
+        'Ionic Equilibrium',
+        "Le Chatelier's Principle",
+        'Molar Fraction Concentration Units',
+        'Nuclear Reaction: Activity',
+        'Nuclear Reaction: Half-Life',
+        'Nuclear Reaction: Introduction',
+        'Nuclear Reaction: Kinetic Constant',
+        'Salt Hydrolysis Equilibrium',
+        'Solutions: Dilution',
+        'Solutions: Introduction',
+        'Solutions: Mixtures of the Same Solute',
+        'Solutions: Non-Reactive Mixing',
+        'Solutions: Reaction Mixing',
+        'Solutions: Solubility',
+        'Solutions: Types of Solution',
+        'Thermochemistry: Enthalpy',
+        'Thermochemistry: Enthalpy by Bonding',
+        'Thermochemistry: Entropy',
+        'Thermochemistry: Gibbs Free Energy',
+        "Thermochemistry: Hess's Law",
+        'Thermochemistry: Internal Energy',
+    ),
+    ('Chemistry', 120, 500): (
+        'Introduction to Organic Chemistry: Aromatic Compounds',
+        'Introduction to Organic Chemistry: Chain Classification',
+        'Introduction to Organic Chemistry: Classification of Carbons',
+        "Introduction to Organic Chemistry: Kekulé's Postulates",
+        'Introduction to Organic Chemistry: Minimum Formula Problems',
+        'Introduction to Organic Chemistry: Orbital Hybridization',
+        'Introduction to Organic Chemistry: Organic Series',
+        'Introduction to Organic Chemistry: Pi and Sigma Bonds',
+        'Introduction to Organic Chemistry: Types of Formulas',
+        'Organic Functions: Alcohol',
+        'Organic Functions: Alcohol Nomenclature',
+        'Organic Functions: Aldehyde',
+        'Organic Functions: Aldehyde Nomenclature',
+        'Organic Functions: Aromatic Hydrocarbons',
+        'Organic Functions: Carboxylic Acid',
+        'Organic Functions: Carboxylic Acid Nomenclature',
+        'Organic Functions: Cyclic Hydrocarbons',
+        'Organic Functions: Ester',
+        'Organic Functions: Ester Nomenclature',
+        'Organic Functions: Ether',
+        'Organic Functions: Ether Nomenclature',
+        'Organic Functions: Hydrocarbon Nomenclature',
+        'Organic Functions: Hydrocarbons',
+        'Organic Functions: Ketone',
+        'Organic Functions: Ketone Nomenclature',
+        'Organic Functions: Nomenclature of Aromatic Hydrocarbons',
+        'Organic Functions: Nomenclature of Cyclic Hydrocarbons',
+        'Organic Functions: Nomenclature of Phenol',
+        'Organic Functions: Organic Anhydride',
+        'Organic Functions: Organic Anhydride Nomenclature',
+        'Organic Functions: Organic Halide',
+        'Organic Functions: Organic Halide Nomenclature',
+        'Organic Functions: Organic Salt',
+        'Organic Functions: Organic Salt Nomenclature',
+        'Organic Functions: Phenol',
+    ),
+    ('Chemistry', 120, 700): (
+        'Biochemistry',
+        'Geometric Isomerism',
+        'Optical Isomerism',
+        'Organic Functions: Acyl Halide',
+        'Organic Functions: Acyl Halide Nomenclature',
+        'Organic Functions: Amide',
+        'Organic Functions: Amide Nomenclature',
+        'Organic Functions: Amine',
+        'Organic Functions: Amine Nomenclature',
+        'Organic Functions: Nitrile and Isonitrile',
+        'Organic Functions: Nitro Compound',
+        'Organic Functions: Nomenclature of Nitrile and Isonitrile',
+        'Organic Functions: Nomenclature of Nitro Compounds',
+        'Organic Functions: Organic Functions Problems',
+        'Organic Functions: Sulfonated Functions',
+        'Organic Reactions: Addition',
+        'Organic Reactions: Elimination',
+        'Organic Reactions: Organic Reaction Problems',
+        'Organic Reactions: Oxidation',
+        'Organic Reactions: Substitution',
+        'Planar Isomerism',
+        'Polymers',
+        'Properties of Organic Compounds: Acidity and Basicity',
+        'Properties of Organic Compounds: Boiling and Melting Points',
+        'Properties of Organic Compounds: Solubility of Organic Compounds',
+    ),
+    ('Economics', 100, 300): (
+        'Basic Economics: Concepts',
+        'Consequences of Stabilization Policies',
+        'Economic Indicators: Economic Cycle',
+        'Economic Indicators: Inflation',
+        'Economic Indicators: Unemployment',
+        'Financial Sector: Introduction',
+        'Fiscal Policy',
+        'Interest',
+        'National Income',
+        'Opportunity Cost',
+        'Supply and Demand',
+        'Taxes',
+    ),
+    ('Economics', 110, 300): (
+        'Balance of Payments',
+        'Competition Model: Production and Cost',
+        'Factor Markets: Introduction',
+        'Functions of Money',
+        'Imperfect Competition',
+        'International Capital Flows and Rates',
+        'International Trade and Finance',
+        'Macroeconomics Standards',
+        'Mathematical Finance',
+        'Monetary Policy',
+        'Perfect Competition',
+        'Price Elasticity',
+    ),
+    ('Economics', 120, 300): (
+        'Accounting and Financial Statements',
+        'Consumer Theory',
+        'Contemporary Macroeconomics',
+        'Current Economy: Rest of the World',
+        'Current Economy: USA',
+        'Factor Markets: Advanced',
+        'Financial Sector: Advanced',
+        'Market Failure and the Role of Government',
+        'Money, Banking and Central Banks',
+        'Real Estate Sector',
+        'Stocks and Bonds',
+        'Valuation',
+    ),
+    ('English', 30, 300): (
+        'Alphabet',
+        'Personal Pronouns',
+        'Verbs: Introduction to the Verb to Be',
+    ),
+    ('English', 40, 300): (
+        'Indicative of Questions and Answers: Introduction',
+        'Object Pronouns',
+        'Verbs: Introduction to Simple Present',
+        'Vocabulary: Colors',
+        'Vocabulary: Family Core',
+        'Vocabulary: Main Professions',
+    ),
+    ('English', 50, 300): (
+        'Adjectives: Introduction',
+        'Basic Text Interpretation',
+        'Basic Text Writing',
+        'Negative Sentences: Introduction',
+        'Possessive Pronouns',
+        'Vocabulary: Domestic Animals',
+    ),
+    ('English', 60, 300): (
+        'Cognates and False Friends',
+        'Indication of Possession',
+        'Personal Routines and Information',
+        'Speaking Activities',
+        'Text Interpretation',
+        'Text Structuring and Production',
+        'Verbs: Introduction to Present Continuous',
+        'Verbs: Introduction to the Imperative',
+        'Verbs: Simple Present',
+        'Verbs: to Be',
+        'Vocabulary: Classroom Elements',
+        'Vocabulary: Family Members and Friends',
+        'Vocabulary: How to Request Clarifications',
+        'Vocabulary: School and Community Places',
+        'Word Pronunciation',
+    ),
+    ('English', 70, 300): (
+        'Introduction to Connectors',
+        'Polysemy',
+        'Prepositions of Time',
+        'Pronouns: Object and Subject',
+        'Use and Variation of the English Language',
+        'Verbs: Can',
+        'Verbs: Introduction to Past Continuous',
+        'Verbs: Simple Past Regular and Irregular Verbs',
+        'Vocabulary: Interview Aspects',
+        'Vocabulary: Main Adjectives',
+    ),
+    ('English', 80, 300): (
+        'Comparative and Superlative of Adjectives',
+        'Cultural Aspects',
+        'Household Objects and Parts',
+        'Paraphrasing',
+        'Prefixes and Suffixes',
+        'Relative Pronouns',
+        'Relative Pronouns: Introduction',
+        'Some, Any, Many, Much',
+        'Verbs: Main Future Forms',
+        'Verbs: Simple Future',
+        'Vocabulary: Fun and Leisure',
+    ),
+    ('English', 90, 300): (
+        'Aspects of Current Genres',
+        'Connectors',
+        'Elements of Advertising and Argumentation',
+        'Expansion of the English Language',
+        'Introduction to If Clauses',
+        'Reading and Text Comprehension',
+        'Verbs: Introduction to Modal Verbs',
+        'Vocabulary: Animals and Plants',
+        'Vocabulary: Food: Food and Drink',
+        'Vocabulary: Human Body Parts',
+    ),
+    ('English', 100, 300): (
+        'A, An, The',
+        'Alphabet and Sounds',
+        'Antonyms and Synonyms',
+        'Basic Vocabulary: Family and Places',
+        'Imperative',
+        'Indicative of Questions and Answers',
+        'Negative Sentences',
+        'Numerals',
+        'Personal Pronouns',
+        'Plural',
+        'Present Continuous',
+        'Pronouns and Adjectives: Possessive and Genitive',
+        'Verbs: Review of the Verb to Be',
+        'Verbs: Simple Present',
+        'Vocabulary: Name and Greeting',
+    ),
+    ('English', 110, 500): (
+        'Adjectives and Adverbs',
+        'Conjunctions',
+        'Past Continuous',
+        'Prefixes and Suffixes',
+        'Prepositions',
+        'Pronouns and Adjectives: Demonstratives',
+        'Some, Any, Many, Much, Few, a Few, and Quantities',
+        'Verbs: Past Perfect',
+        'Verbs: Present Perfect Continuous',
+        'Verbs: Simple Past',
+        'Verbs: Simple Past and Present Perfect',
+        'Vocabulary: Food, Objects and Parts of the House',
+        'Vocabulary: Scientific Technical Vocabulary',
+    ),
+    ('English', 120, 500): (
+        'English Text Interpretation',
+        'If Clauses',
+        'Interrogative Relative Pronouns',
+        'Oral Activities',
+        'Question Tags',
+        'Reflexive Pronouns',
+        'Verbs: Future Perfect',
+        'Verbs: Future with Going to and Will',
+        'Verbs: Gerunds and Infinitives',
+        'Verbs: Modal Verbs',
+        'Verbs: Passive Voice',
+        'Verbs: Phrasal Verbs',
+        'Verbs: Tense Exercises',
+        'Vocabulary: Animals, Plants and Human Body Parts',
+        'Written Productions',
+    ),
+    ('Environmental Sciences', 100, 300): (
+        'Aquatic Biomes',
+        'Ecological Tolerance',
+        'Ecosystem Services',
+        'Energy in an Ecosystem',
+        'Food Chains and Trophic Networks',
+        'Introduction to Biodiversity',
+        'Introduction to Ecosystems',
+        'Island Biogeography',
+        'Primary Productivity',
+        'Terrestrial Biomes',
+        'Trophic Levels',
+    ),
+    ('Environmental Sciences', 110, 300): (
+        'Age Structure Diagrams',
+        'Aquaculture',
+        'Ecological Succession: Introduction',
+        'El Niño and La Niña',
+        'Generalist and Specialist Species',
+        'Green Revolution',
+        'Meat Production Methods and Overfishing',
+        'Natural Disruptions to Ecosystems',
+        'Pest Control Methods',
+        'Population Growth and Development: Introduction',
+        'Survival Curves',
+        'Types and Effects of Irrigation',
+    ),
+    ('Environmental Sciences', 120, 300): (
+        'Acid Rain',
+        'Global Climate Change',
+        'Indoor Air Pollution',
+        'Introduction to Air Pollution',
+        'Invasive Species',
+        'Noise Pollution',
+        'Ocean Warming and Acidification',
+        'Ozone Depletion',
+        'Photochemical Smog',
+        'Pollution and Human Health',
+        'Solid Waste Elimination and Waste Reduction Methods',
+        'Thermal Pollution',
+    ),
+    ('Geography', 10, 300): (
+        'Different Places',
+        'Different Types of Work',
+        'Everyday: Housing, Toys, Clothes, Furniture, and Daily Objects',
+        'Life and Natural Cycles',
+        'Maps and Living Places',
+        'References and Games',
+        "Subject's Place in the World",
+        'Time and Experience',
+    ),
+    ('Geography', 20, 300): (
+        'Changes and Continuities',
+        'Drawings and Mind Maps',
+        'Maps and Photographs',
+        'Means of Transport and Communication',
+        'Schedule: Social Activities',
+        'Spatial References',
+        'Use of Natural Resources',
+    ),
+    ('Geography', 30, 300): (
+        'Cartographic Representations',
+        'City and Countryside',
+        'Impacts of Human Activities',
+        'Landscape Transformations',
+        'Production and Consumerism',
+    ),
+    ('Geography', 40, 300): (
+        'Conservation and Environmental Degradation',
+        'Landscapes: Natural and Urban',
+        'Production and Consumption',
+        'Rural and Urban Relationship',
+        'Work: Rural and Urban',
+    ),
+    ('Geography', 50, 300): (
+        'Cities and Different Urban Spaces',
+        'Energy Matrices',
+        'Innovation and Energy',
+        'Maps: Satellites and Photographs',
+        'Transportation and Communication Media',
+        'Types of Pollution',
+        'Work and Technology',
+    ),
+    ('Geography', 60, 300): (
+        'Biodiversity: Characteristics',
+        'Cartographic Scales',
+        'Cartography: Map Reading and Making',
+        'Climate: Human Actions and Climate Change',
+        'Climate: World',
+        'Earth: Planet Formation',
+        'Earth: Tectonic Plates',
+        'Emergence of Cities',
+        'Hydrography: Aquifers',
+        'Landscape: Transformation',
+        'Map Reading',
+        'Relief: Characteristics',
+        'Rocks: Characteristics',
+        'Soil Formation: Degradation and Conservation Methods',
+        'Vegetation: Characteristics',
+        'Water Conservation',
+        'Water Resources: Water Reuse',
+        'Weather and Climate',
+    ),
+    ('Geography', 70, 300): (
+        'Conscious Consumption and Circulation of Goods',
+    ),
+    ('Geography', 80, 300): (
+        'America: Colonization and Independence',
+        'America: Conflicts and Tensions',
+        'America: Indigenous Peoples',
+        'America: Latin American Blocks',
+        'America: Natural Aspects',
+        'America: Population',
+        'America: Regionalization',
+        'America: U.S. and Its Influences in Latin America',
+        'World: Diversity and Transformation',
+        'World: Nation-State Economics',
+        'World: Population Distribution',
+    ),
+    ('Geography', 80, 500): (
+        'Africa: Economic Dependency',
+        'Africa: Environmental Issues',
+        'Africa: Migration Flows',
+        'Africa: Natural',
+        'Africa: Neocolonialism and Independence',
+        'Africa: Population',
+        'Africa: Socioeconomic Characteristics',
+        'Africa: Tensions and Conflicts',
+        'African Dependency Issues',
+        'Antarctica: Natural and Human Aspects',
+        'MERCOSUR: Introduction',
+    ),
+    ('Geography', 90, 500): (
+        'Asia and Europe: Territorial Conflicts',
+        'Asia: Asian Tigers',
+        'Asia: Economy and Population',
+        'Asia: Energy Matrices',
+        'Asia: Environmental Issues',
+        'Asia: Natural Aspects',
+        'China: Natural and Human Aspects',
+        'Cold War',
+        'Europe: Economy and Population',
+        'Europe: Energy Matrices',
+        'Europe: Environmental Issues',
+        'Europe: Natural Aspects',
+        'Europe: Russia vs Ukraine',
+        'European Union',
+        'Global Geopolitical Concepts',
+        'Japan: Natural and Human Aspects',
+        'Oceania: Natural and Human Aspects',
+        'World: Agriculture and Hunger',
+        'World: Arab Spring',
+        'World: Cosmopolitan',
+        'World: Global Inequality',
+        'World: Globalization',
+        'World: UN and Intergovernmental Organizations',
+    ),
+    ('Geography', 100, 500): (
+        '4.0 Revolution',
+        'Atmospheric Circulation: Wind and Rain',
+        'Bipolar World',
+        'Capitalism',
+        'Cartography: Scale, Projection, and Geotechnology',
+        'Cartography: Time and Space',
+        'Climatic Factors',
+        'Earth: Formation of the Continents',
+        'Energy Sources: Non-Renewable Energies',
+        'Energy Sources: Renewable Energies',
+        'Fundamentals of Geography',
+        'Geomorphology: Endogenous and Exogenous Agents',
+        'Geomorphology: Relief Structure and Rock Types',
+        'Globalized World',
+        'Industrial Revolution: Characteristics',
+        'Industry Classification',
+        'Manners and Transportation',
+        'New World Order',
+        'Relief: Main Types',
+        'Soil: Main Types',
+        'Taylorism and Fordism',
+        'Weather Elements',
+        'World: Biomes',
+        'World: Hydrography',
+        'World: Main Climates',
+    ),
+    ('Geography', 110, 700): (
+        'Africa: Globalized World',
+        'Amazon: Biomes, Economy and Environmental Impacts',
+        'Asia: Socialism',
+        'Europe: EURO and the Trade Blocks',
+        'Latin America: Left-Wing Governments',
+        'MERCOSUR: Characteristics and Members',
+        'Midwest: Region Growth, Deforestation and its Biomes',
+        'Nuclear Energy',
+        'World: NATO and the Fight Against Terrorism',
+    ),
+    ('Geography', 120, 700): (
+        'Africa: Globalized World: Review',
+        'Amazon: Biomes, Economy and Environmental Impacts: Review',
+        'Anglo-American: Industry, Agriculture and Development Model',
+        'Asia: Socialism: Review',
+        'Atmospheric Circulation, Wind and Rain: Review',
+        'Bipolarized World: Review',
+        'Capitalism: Review',
+        'Cartography: Scale, Projection and Geotechnology: Review',
+        'Cartography: Time and Space: Review',
+        'Characteristics of the Continents: Africa',
+        'Characteristics of the Continents: Americas',
+        'Characteristics of the Continents: Asia',
+        'Characteristics of the Continents: Europe',
+        'Characteristics of the Continents: Oceania',
+        'Climatic Factors: Review',
+        'Earth: Formation of the Continents: Review',
+        'Eastern Europe: Characteristics and Conflicts',
+        'Energy Sources: Non-Renewable Energies: Review',
+        'Energy Sources: Renewable Energies: Review',
+        'Europe: Euro and Other Trade Blocks: Review',
+        'Fundamentals of Geography: Review',
+        'Geomorphology: Endogenous and Exogenous Agents: Review',
+        'Geomorphology: Relief Structure and Rock Types: Review',
+        'Global Geopolitics',
+        'Globalization and Neoliberalism',
+        'Globalized World: Review',
+        'Industrial Revolution: Review',
+        'Industry Classification: Review',
+        'International Conferences on Environmental Impacts',
+        'Latin America: Economic Crisis and Social Problems',
+        'Latin America: Left-Wing Governments: Review',
+        'Modes and Transportation: Review',
+        'NATO and Counter-Terrorism: Review',
+        'Nationalism and Geopolitics: Review',
+        'New World Order: Review',
+        'Nuclear Energy: Review',
+        'Revolution 4.0: Review',
+        'Soil: Review',
+        'Taylorism and Fordism: Review',
+        'Urban Geography',
+        'Weather Elements: Review',
+        'World: Biomes: Review',
+        'World: Climate: Review',
+        'World: Hydrography: Review',
+    ),
+    ('History', 10, 300): (
+        'Concept of Temporality',
+        'Family Life',
+        'Family and Community',
+        'Games and Toys in Different Eras',
+        'Perception of Social Environment Differences',
+        'School and Community',
+    ),
+    ('History', 20, 300): (
+        'Experience Recording',
+        'Objects and Memory',
+        'Time Measurement',
+        'Work and Nature',
+    ),
+    ('History', 30, 300): (
+        'Change in Life in the Countryside and the City',
+        'City: Work, Culture, and Leisure',
+        'Official Documents',
+        'Space: Public and Domestic',
+    ),
+    ('History', 40, 300): (
+        'Emergence of the Human Species',
+        'Human Actions: Time and Space',
+        'Media and Communication',
+        'Movement of People and Goods',
+        'Nomadism and the First Communities',
+        'Routes: Land, River and Maritime',
+        'Social and Cultural Transformations',
+    ),
+    ('History', 50, 300): (
+        'Ancient Cities and Contemporary Cities',
+        'Birth of Cities',
+        'From Nomadism to Sedentism: Birth of the First Cities and Agriculture',
+        'Heritage: Material and Intangible',
+        'History and Memory',
+        'History of Indigenous Peoples',
+        'Language and Technology in the Study of History',
+        'Milestones of Memory',
+        'Notion of State',
+        'Religion of Ancient Peoples',
+        'Time and History',
+        'Time and Orality',
+    ),
+    ('History', 60, 300): (
+        'Ancient Egypt: Introduction',
+        'Ancient Greece: Introduction',
+        'Ancient Rome: Introduction',
+        'Arabs: Expansion of Islam',
+        'Historical Time',
+        'Mesoamerica: Introduction',
+        'Mesopotamia: Introduction',
+        'Middle Ages: Introduction',
+        'What is history?',
+    ),
+    ('History', 70, 300): (
+        'Absolute Monarchies',
+        'Great Navigations',
+        'Protestantism',
+        'Renaissance',
+        'Spanish Colonization in America: Economy, Society, Administration, and Slavery',
+    ),
+    ('History', 80, 300): (
+        'English Revolution: From the Puritan Revolution to the Glorious Revolution',
+        'European Imperialism in Asia and Africa',
+        'French Revolution: Constitutional Monarchy, National Convention, and Directory',
+        'Latin American Independences: Formation of the First Republics',
+        'USA and Latin America: International Relations',
+    ),
+    ('History', 90, 300): (
+        'Cold War: Introduction',
+        'Decolonization: Africa and Asia',
+        'Dictatorships in Latin America',
+        'Globalized World',
+        'Politics and Economy: Latin America in the Post-Military Dictatorship',
+        'Russian Revolution',
+        'Terrorism',
+        'Totalitarian Regimes: Nazism, Fascism, Communism, Francoism, and Salazarism',
+        'World War I',
+        'World War II',
+    ),
+    ('History', 100, 300): (
+        'African Kingdoms: Kush, Axum, and Ghana',
+        'Ancient Egypt',
+        'Ancient Greece: Classical Period, Hellenism',
+        'Ancient Greece: Pre-Hellenism',
+        'Ancient Rome: Monarchy and Republic',
+        'Ancient Rome: Roman Empire',
+        'Late Antiquity: Fall of the Western Roman Empire',
+        'Mesopotamia',
+        'Study of History: Introduction',
+    ),
+    ('History', 100, 500): (
+        'Absolutism',
+        'America: Indigenous Peoples',
+        'European Maritime Expansion: Mercantilism',
+        'Formation of Modern States',
+        'Islam: Birth and Expansion',
+        'Middle Ages: Late Middle Ages, High Middle Ages, and Early Middle Ages',
+        'Protestant Movements',
+        'Renaissance',
+        'Spanish Colonization: Economy, Politics, Society, Colonial Pact, and Slavery',
+        'Thirteen Colonies',
+    ),
+    ('History', 110, 500): (
+        'America in the 19th Century',
+        'American War of Independence',
+        'Chinese Communist Revolution',
+        'Cold War: Formation of Blocs',
+        'Cold War: Peaceful Coexistence, Conflicts and Social Movements',
+        'Cuban Communist Revolution',
+        'Decolonization of Africa and Asia',
+        'English Revolution: from the Puritan Revolution to the Glorious Revolution',
+        'First Industrial Revolution',
+        'French Revolution: Constitutional Monarchy, National Convention, and Directory',
+        'Illustration',
+        'Imperialism: Africa',
+        'Imperialism: Asia',
+        'Latin American Independences: Formation of the First Republics',
+        'Napoleonic Period',
+        'Russian Revolution: From the Fall of the Tsar to the Revolutionary Process',
+        'Russian Revolution: Lenin and Stalin',
+        'Second Industrial Revolution and the Social Doctrines of the 19th Century',
+        'Totalitarian Regimes in Europe: Francoism and Salazarism',
+        'Totalitarian Regimes in Europe: Nazism, Fascism, and Communism',
+        'Unifications in Europe: Italy and Germany',
+        'World War I: Background',
+        'World War I: Conclusion of the War',
+        'World War II',
+    ),
+    ('History', 110, 700): (
+        'Asia: Far East',
+        'Conflicts in the Middle East',
+        'Dictatorial Regimes in Latin America',
+    ),
+    ('History', 120, 700): (
+        'Absolutism: Review',
+        'Africa: Kush, Axum and Ghana: Review',
+        'America in the 19th Century: Review',
+        'America: Native Peoples: Review',
+        'American Independence Review',
+        'Ancient Egypt: Review',
+        'Ancient Greece, Classical Period, Hellenism: Review',
+        'Ancient Greece, Pre-Hellenism: Review',
+        'Ancient Rome, Monarchy and Republic: Review',
+        'Ancient Rome, Roman Empire: Review',
+        'Chinese Communist Revolution: Review',
+        'Cold War: Formation of the Blocs: Review',
+        'Cold War: Peaceful Coexistence, Conflicts and Social Movements: Review',
+        'Conflicts in the Middle East: Review',
+        'Cuban Communist Revolution: Review',
+        'Decolonization of Africa and Asia: Review',
+        'Dictatorial Regimes in Latin America: Review',
+        'English Revolution: Review',
+        'Enlightenment: Review',
+        'European Maritime Expansion: Review',
+        'Fall of the Western Roman Empire, Late Antiquity: Review',
+        'First Industrial Revolution: Review',
+        'Formation of Modern States: Review',
+        'French Revolution: Review',
+        'Imperialism: Africa: Review',
+        'Imperialism: Asia: Review',
+        'Islam: Birth and Expansion: Review',
+        'Italian and German Unification: Review',
+        'Latin American Independences: Review',
+        'Mesopotamia: Review',
+        'Middle Ages: Review',
+        'Napoleonic Period: Review',
+        'Protestant Movement: Review',
+        'Renaissance: Review',
+        'Russian Revolution: From the Fall of Tsarism to the Revolutionary Process: Review',
+        'Russian Revolution: Lenin and Stalin: Review',
+        'Second Industrial Revolution and 19th Century Social Doctrines: Review',
+        'Spanish Colonization: Review',
+        'Thirteen Colonies: Review',
+        'Totalitarian Regimes in Europe: Nazism, Fascism, Communism, Salazarism, and Francoism: Review',
+        'What is History: Review',
+        'World War I: Review',
+        'World War II: Review',
+    ),
+    ('Mathematics', 10, 300): (
+        'Addition and Subtraction of Natural Numbers Less than 100',
+        'Basic Addition Facts',
+        'Comparison of Natural Numbers Less Than 20',
+        'Composition and Decomposition of Natural Numbers Less than 100',
+        'Counting Natural Numbers Less Than 100',
+        'Dates and Time Periods',
+        'Flat Figures: Introduction',
+        'Organization of Objects by Attributes',
+        'Representation and Reading of Research',
+        'Sequence of Events of the Day',
+        'Sequences: Missing Elements',
+        'Size Comparison by Terms',
+    ),
+    ('Mathematics', 20, 300): (
+        'Addition and Subtraction of Naturals Less than 1,000',
+        'Basic Subtraction Facts',
+        'Comparison of Natural Numbers Less Than 100',
+        'Comparison of Research Information',
+        'Composition and Decomposition of Natural Numbers Less than 1000',
+        'Counting Natural Numbers Less Than 1,000',
+        'Double, Half, Triple and Third Part',
+        'Event Classification',
+        'Movement of Objects and People',
+        'Multiplication by 2, 3, 4, and 5',
+        'Sequences and Patterns',
+        'Sequences: Increasing and Decreasing',
+        'Spatial Figures',
+        'Time Intervals',
+    ),
+    ('Mathematics', 30, 300): (
+        'Addition and Subtraction of Natural Numbers',
+        'Basic Multiplication Facts',
+        'Clock Reading',
+        'Comparison of Object Areas',
+        'Composition and Decomposition of Natural Numbers Less than 10,000',
+        'Congruent Figures',
+        'Data Reading and Interpretation',
+        'Division of Naturals',
+        'Equality: Identical Sums and Subtractions',
+        'Flat Figures: Sides and Vertices',
+        'Multiplication by 2, 3, 4, 5, and 10',
+        'Number Line: Natural Numbers',
+        'Paths of People and Objects',
+        'Reading and Comparing Natural Numbers Less Than 10,000',
+        'Sequences: Addition and Subtraction',
+        'Spatial Geometric Figures: Characteristics and Layouts',
+        'Units of Measurement: Capacity and Mass',
+        'Units of Measurement: Length and Time',
+        'Value Equivalence: buying and selling',
+    ),
+    ('Mathematics', 40, 300): (
+        'Addition and Subtraction: Missing Values',
+        'Area of Plane Figures: Unit Squares',
+        'Bar or Pictorial Charts',
+        'Composition and Decomposition of Natural Numbers into Powers of 10',
+        'Counting: Introduction',
+        'Equality: Missing Values',
+        'Equality: Same Operation on Both Sides',
+        'Inverse Relationships of Operations',
+        'Movements and Location: Grid Meshes',
+        'Multiplication and Division Problems',
+        'Perimeter',
+        'Prisms and Pyramids: Layouts and Characteristics',
+        'Probable and Improbable',
+        'Reading and Comparing Natural Numbers Less Than 100,000',
+        'Remainders of Division',
+        'Right and Non-Right Angles',
+        'Sequences: Multiples of a Natural Number',
+        'Unit Fractions',
+        'Units of Measure: Time',
+        'Value Equivalence: Discount and Exchange',
+    ),
+    ('Mathematics', 50, 300): (
+        'Equality Between Two Members',
+        'Graphics: bar, table, line, image',
+        'Greater or Lesser',
+        'Rational Numbers: Introduction',
+        'Writing Natural Numbers',
+    ),
+    ('Mathematics', 50, 500): (
+        'Addition and Subtraction of Decimal Numbers',
+        'Angle Congruence and Proportionality',
+        'Area and Perimeter: Comparison',
+        'Cartesian Coordinates',
+        'Classification of Angles by Their Opening',
+        'Classification of Shapes',
+        'Conversion: Area',
+        'Conversion: Length',
+        'Conversion: Mass and Volume',
+        'Counting Principle',
+        'Decimal Numbers',
+        'Equal Parts Distribution',
+        'Fractions: Common Denominators',
+        'Fractions: Comparison',
+        'Fractions: Composing Shapes',
+        'Fractions: Concept of Conversion between Fractions and Decimal Numbers',
+        'Fractions: Equivalent Fractions',
+        'Fractions: Representation',
+        'Graphics: Bars, Tables, Lines, Images',
+        'Multiplication and Division of Decimal Numbers',
+        'Multiplication with Missing Values',
+        'Percentage: Notable Percentages',
+        'Planning: Spatial Figures',
+        'Possible Outcomes',
+        'Properties of Shapes',
+        'Random Events',
+        'Reasons and Proportions',
+        'Symmetry in the Cartesian Plane: Introduction',
+        'Time Conversion',
+        'Triangle Components',
+        'Unequal Partition',
+        'Volume: Relationships with Cubes',
+    ),
+    ('Mathematics', 60, 300): (
+        '3D Geometric Solids',
+        'Algorithms and Problems',
+        'Angle Measurement',
+        'Angle Problems',
+        'Base Change',
+        'Cartesian Plane: 1st Quadrant',
+        'Comparisons between fractions',
+        'Data Interpretation',
+        'Data Representation',
+        'Decimal System',
+        'Divisibility Criteria',
+        'Divisors and Multiples',
+        'Exact Square and Cubic Roots',
+        'Exponentiation: Rational Numbers',
+        'Flowcharts',
+        'Fractions and Decimal Numbers: Conversion',
+        'Fractions: Addition and Subtraction',
+        'Fractions: Multiplication and Division',
+        'Fractions: Parts of Natural Numbers',
+        'Geometric Algorithms',
+        'Ground Floor and Aerial Views',
+        'Introduction to Regular Polygons',
+        'Lines, Line Segments, and Rays',
+        'Numerical Expressions',
+        'Operations: Decimals',
+        'Operations: Mixed Numbers',
+        'Operations: Natural Numbers',
+        'Operations: Order of Operations',
+        'Operations: Properties',
+        'Percentage: Relation to Proportionality',
+        'Prime and Composite Numbers',
+        'Probability: Introduction',
+        'Problems with Measurements',
+        'Quadrilateral Classification',
+        'Roman Numerals',
+        'Rounding',
+        'Triangles and Their Classifications',
+        'Unequal Partition Problems',
+        'Variables',
+    ),
+    ('Mathematics', 60, 500): (
+        'Expansion and Reduction of Figures',
+        'Graphics: Bars and Columns',
+    ),
+    ('Mathematics', 70, 300): (
+        'Absolute Value and Number Order',
+        'Angular Relationships in Parallel Lines',
+        'Area: Circle',
+        'Area: Composite Figures',
+        'Area: Rectangle and Parallelogram',
+        'Area: Square',
+        'Area: Trapezoid',
+        'Area: Triangle',
+        'Census and Sample Research',
+        'Circles: Introduction',
+        'Contextualized Measurement Problems',
+        'First Degree Equations',
+        'GCD',
+        'Graphics: Pie Charts',
+        'Inequalities: Introduction',
+        'LCM',
+        'Metric vs. Imperial System',
+        'Negative Numbers',
+        'Operations: Decimals and Fractions',
+        'Operations: Negative Numbers',
+        'Operations: Problems with Rational Operations',
+        'Operations: Ratios',
+        'Opposite Numbers',
+        'Percentage: Conversion with Fractions and Decimals',
+        'Percentage: Percentage Problems',
+        'Perimeter: Circle',
+        'Polygon Angles',
+        'Polygons: Introduction',
+        'Probability Predictions',
+        'Problems and Flowcharts',
+        'Proportion',
+        'Reflections of Plane Figures',
+        'Rotations of Plane Figures',
+        'Sample Spaces',
+        'Sequences: Classifications',
+        'Sequences: Terms',
+        'Statistics: Arithmetic Mean',
+        'Sum of the Interior Angles of a Triangle',
+        'Symmetry in Relation to Axes',
+        'Theoretical Probability',
+        'Translations of Plane Figures',
+        'Triangle Existence Condition',
+        'Variables and Unknowns',
+    ),
+    ('Mathematics', 70, 500): (
+        'Polygon Transformations',
+        'Rational Number Sorting',
+        'Volume: Rectangular Prism',
+    ),
+    ('Mathematics', 80, 300): (
+        'Angle Classification',
+        'Fundamental Principle of Counting',
+        'Geometric Constructions',
+        'Non-Rational Square and Cubic Roots',
+        'Percentage: Discounts or Percentage Increases',
+        'Rational Exponents: Powering',
+        'Repeating Decimals',
+    ),
+    ('Mathematics', 80, 500): (
+        'Algebraic Expressions',
+        'Area of Shapes',
+        'Basic Second Degree Equation',
+        'Bisector and Perpendicular Bisector',
+        'Combinations',
+        'Equations with Two Variables',
+        'Factorial',
+        'Graphics: Graph Suitability',
+        'Internal Angles of Quadrilaterals',
+        'Linear Equations: Comparison',
+        'Number of Solutions of the System',
+        'Permutations',
+        'Probability of Complementary Events',
+        'Properties of Exponentiation: Rational Exponents',
+        'Reflections in the Cartesian Plane',
+        'Regular Polygons: Angles and Diagonals',
+        'Relationships and equations of magnitudes',
+        'Research: Sampling',
+        'Rotations in the Cartesian Plane',
+        'Rule of 3: Direct',
+        'Rule of 3: Indirect',
+        'Scientific Notation',
+        'Sequence Terms',
+        'Sets: Introduction',
+        'Side, Radius and Apothem of Inscribed and Circumscribed Polygons',
+        'Statistics: Arithmetic and Geometric Means',
+        'Statistics: Frequencies',
+        'Statistics: Median',
+        'Statistics: Mode',
+        'System of Equations',
+        'Translations in the Cartesian Plane',
+        'Volume: Rectangular Blocks',
+    ),
+    ('Mathematics', 90, 500): (
+        'Base Change Problems',
+        'Circle: Angles in a Circle',
+        'Distance Between Points in the Cartesian Plane',
+        'Exponentiation: Negative Exponents',
+        'Factorization: Difference of Squares',
+        'Factorization: Grouping and Evidencing',
+        'Factorization: Second Degree Expressions',
+        'Function: Inputs and Outputs',
+        'Function: Linear Functions',
+        'Function: Representations and Applications',
+        'Inscribed Angles',
+        'Irrational Numbers',
+        'Irrational Numbers: Number Line',
+        'Metric Relationships in the Right Triangle',
+        'Notable Cube Products',
+        'Notable Products of Squares',
+        'Operations with Real Numbers',
+        'Orthogonal View',
+        'Parallel Lines Cut by a Transversal',
+        'Percentage: Successive Percentages',
+        'Perfect Squares',
+        'Probability: Dependent Events',
+        'Probability: Independent Events',
+        'Problems with Scientific Notation',
+        'Proportionality Relationships',
+        'Proportions in the Cartesian Plane',
+        'Pythagorean Theorem',
+        'Regular Polygon: Construction',
+        'Second Degree Equations',
+        'Triangle Similarity',
+        'Trigonometric Ratios',
+        'Volume and Area: Cylinder',
+    ),
+    ('Mathematics', 90, 700): (
+        'Graphics: graph evaluation',
+        'Volume: Contextualized Rectangular Prism',
+    ),
+    ('Mathematics', 100, 300): (
+        'Circle: Eccentric Angles',
+        'Circle: Inscribed and Central Angles',
+        'First Degree Function: Graph and Table',
+        'Localization',
+        'Second Degree Function: Graph and Table',
+    ),
+    ('Mathematics', 100, 500): (
+        'Algorithms and Problems: Medium',
+        'Angles: Classification',
+        'Angles: Clocks',
+        'Angles: Degrees and Radians',
+        'Angles: Vertically Opposite Angles',
+        'Divisibility Criteria: Review',
+        'Dubious Figures',
+        'Equations: Irrational',
+        'Exponentiation: Introduction',
+        'Factorization',
+        'First Degree Equation Problems',
+        'Function: Codomain and Range',
+        'Function: Domain',
+        'Function: Even or Odd',
+        'Function: Graphs',
+        'Function: Introduction',
+        'GCD Problems',
+        'LCM Problems',
+        'Lines: Parallel and Transversal',
+        'Mathematical Expressions',
+        'Notable Products',
+        'Numeric Sets',
+        'Operations: Addition and Subtraction',
+        'Operations: Multiplication and Division',
+        'Point, Line, and Plane',
+        'Prime and Composite Numbers: Review',
+        'Radication',
+        'Scientific Notation: Review',
+        'Sets',
+        'Triangles: Angular Classification',
+        'Triangles: Cevians and Notable Points',
+        'Triangles: Classification by Sides',
+        'Triangles: Sum of Angles',
+        'Unit Systems',
+    ),
+    ('Mathematics', 100, 700): (
+        'Absolute Value and Modulus',
+        'Arithmetic Progression: Sum',
+        'Arithmetic Progression: Terms',
+        'Basic Trigonometric Lines: 30º, 45º, 60º',
+        'Circle Area',
+        'Circle: Circumference Problems',
+        'Circle: Power of a Point',
+        'Circumscribed Polygons',
+        'Elements of a Sequence',
+        'Exponential Equation',
+        'Exponential Function: Graph',
+        'Exponential Function: Inputs and Outputs',
+        'Exponential Inequality',
+        'Exponentiation: Properties',
+        'Financial Mathematics: Compound Interest',
+        'Financial Mathematics: Interest and Time Value of Money',
+        'Financial Mathematics: Simple Interest',
+        'Financial Mathematics: Spreadsheets',
+        'First Degree Equation',
+        'First Degree Function: Inputs and Outputs',
+        'First Degree Function: Introduction',
+        'First Degree Inequality',
+        'Function: Bijective',
+        'Function: Injective and Surjective',
+        'Geometric Progression: Sum',
+        'Geometric Progression: Terms',
+        'Hexagon Area',
+        'Inscribed Polygons',
+        'Logarithm: Introduction',
+        'Logarithm: Properties',
+        'Logarithm: Values',
+        'Logarithmic Equation',
+        'Logarithmic Function: Graph',
+        'Logarithmic Function: Inputs and Outputs',
+        'Logarithmic Inequality',
+        'Modular Equation',
+        'Modular Function: Graph',
+        'Modular Function: Inputs and Outputs',
+        'Modular Inequality',
+        'Perimeter and Area Relationship',
+        'Polygons: Classification',
+        'Polygons: Diagonal',
+        'Polygons: Sum of Angles',
+        'Quadratic Equation: Bhaskara',
+        'Quadrilateral: Parallelogram',
+        'Quadrilateral: Rectangle',
+        'Quadrilateral: Rhombus',
+        'Quadrilaterals: Introduction',
+        'Quadrilaterals: Trapezoid',
+        'Radication: Properties',
+        'Rationalization of Denominators',
+        'Rectangle Area',
+        'Regular Polygons: Introduction',
+        'Right Triangle: Metric Relationships',
+        'Second Degree Equation: Coefficients',
+        'Second Degree Function: Inputs and Outputs',
+        'Second Degree Function: Introduction',
+        'Second Degree Function: Maximums and Minimums',
+        'Second Degree Inequality',
+        'Square Area',
+        "Thales' Theorem",
+        'Trapezoid Area',
+        'Triangle Area',
+        'Triangles: Congruence',
+        'Triangles: Law of Cosines',
+        'Triangles: Law of Sines',
+        "Triangles: Menelaus' Theorem",
+        'Triangles: Pythagoras',
+        'Triangles: Similarity',
+        'Trigonometry in the Right Triangle',
+    ),
+    ('Mathematics', 110, 500): (
+        'Statistics: Mode and Median',
+    ),
+    ('Mathematics', 110, 700): (
+        'Basic Probability',
+        'Binomial Probability',
+        'Combinatorial Analysis: Additive Principle',
+        'Combinatorial Analysis: Circular Permutation',
+        'Combinatorial Analysis: Combination',
+        'Combinatorial Analysis: Factorial',
+        'Combinatorial Analysis: Multiplicative Principle',
+        'Combinatorial Analysis: Number of Non-Negative Integer Solutions',
+        'Combinatorial Analysis: Number of Positive Integer Solutions',
+        "Combinatorial Analysis: Pascal's Triangle",
+        'Combinatorial Analysis: Permutation with Repetition',
+        'Combinatorial Analysis: Simple Permutation',
+        'Compound Rule of Three Problems',
+        'Conditional Probability',
+        'Direct Proportion Rule Problems',
+        'Indirect Rule of 3 Problems',
+        "Newton's Binomial: Independent Term of x",
+        "Newton's Binomial: Introduction",
+        "Newton's Binomial: Sum of the Coefficients (Binomials)",
+        'Probability: Properties',
+        'Probability: Sample Space',
+        'Probability: Successive Events',
+        'Ratio',
+        "Spatial Geometry: Cavalieri's Principle",
+        'Spatial Geometry: Deformations in Projections',
+        'Spatial Geometry: Dihedrals and Trihedrals',
+        'Spatial Geometry: Frontal Views',
+        'Spatial Geometry: Fundamentals',
+        'Spatial Geometry: Metric Relations of Cones',
+        'Spatial Geometry: Metric Relations of Prisms',
+        'Spatial Geometry: Metric Relations of Pyramids',
+        'Spatial Geometry: Metric Relations of Spheres',
+        'Spatial Geometry: Metric Relations of the Cylinder',
+        'Spatial Geometry: Polyhedra',
+        'Spatial Geometry: Prism Volume',
+        'Spatial Geometry: Revolution Figures',
+        'Spatial Geometry: Surface Area of the Cone',
+        'Spatial Geometry: Surface Area of the Cylinder',
+        'Spatial Geometry: Surface Area of the Prism',
+        'Spatial Geometry: Surface Area of the Pyramid',
+        'Spatial Geometry: Surface Area of the Sphere',
+        'Spatial Geometry: Volume of Cones',
+        'Spatial Geometry: Volume of Spheres',
+        'Spatial Geometry: Volume of the Cylinder',
+        'Spatial Geometry: Volume of the Pyramid',
+        'Statistics: Averages',
+        'Statistics: Interpretation of Graphs and Tables',
+        'Statistics: Sample Surveys',
+        'Statistics: Types of Graphs and Tables',
+    ),
+    ('Mathematics', 120, 700): (
+        'Analytic Geometry: Centroid',
+        'Analytic Geometry: Distance Between Points',
+        'Analytic Geometry: Equation of Conics',
+        'Analytic Geometry: Equation of a Line',
+        'Analytic Geometry: Equation of the Circle',
+        'Analytic Geometry: Midpoint',
+        'Cartesian Plane: Points',
+        'Complex Numbers: Basic Equality',
+        'Complex Numbers: Basic Operations',
+        'Complex Numbers: Conjugate',
+        'Complex Numbers: Exponentiation',
+        'Complex Numbers: Gauss Plane',
+        'Complex Numbers: Introduction',
+        'Complex Numbers: Magnitude',
+        'Complex Numbers: Multiplication and Division',
+        'Complex Numbers: Powers of i',
+        'Complex Numbers: Trigonometric Form',
+        'Determinant: 1x1',
+        'Determinant: 2x2',
+        'Determinant: 3x3',
+        'Determinant: Inverse Matrix and Cofactors',
+        'Determinant: Laplace',
+        "Determinants: Binet's Theorem",
+        'Determinants: Properties',
+        'Linear Systems: Resolution',
+        'Linear Systems: System Discussion',
+        'Linear Systems: Written by Matrices',
+        'Matrix: Classifications',
+        'Matrix: Equality',
+        'Matrix: Inverse Calculation',
+        'Matrix: Operations',
+        'Polynomials: Factorization',
+        "Polynomials: Girard's Relations",
+        'Polynomials: Numerical Values',
+        'Polynomials: Operations',
+        'Polynomials: Properties',
+        'Polynomials: Remainder',
+        'Polynomials: Roots',
+        'Reflections: Advanced',
+        'Rotations: Advanced',
+        'Similar Matrix',
+        'Translations: Advanced',
+        'Trigonometric Equation',
+        'Trigonometric Function: Graphs',
+        'Trigonometric Function: Inputs and Outputs',
+        'Trigonometric Function: Periodicity',
+        'Trigonometric Inequality',
+        'Trigonometric Lines of 75º, 15º, 22.5º',
+        'Trigonometry: Basic Trigonometric Lines (30º,45º,60º): Review',
+        'Trigonometry: Double/Triple Angle',
+        'Trigonometry: Fundamental Relationship',
+        'Trigonometry: Product-to-Sum Transformation',
+        'Trigonometry: Sine, Cosine, and Tangent: Review',
+        'Trigonometry: Sum and Difference of Angles',
+    ),
+    ('Philosophy', 100, 300): (
+        'Concept of Modernity',
+        'Democracy and Citizenship',
+        'Ethics and Democratic Values',
+        'Ethics in the Globalized World',
+        'Human Rights and Totalitarian Regimes',
+        'Morality of Modern Man',
+        'Origin of Philosophy',
+        'Reflection on Ethics',
+        'Science and its Contexts: Ethics, Freedom, Culture, and Religion',
+        'Scientific Thinking vs. Common Sense',
+        'Subjectivity in Contemporary Society',
+    ),
+    ('Philosophy', 110, 300): (
+        'Art and Culture',
+        'Construction of Morality',
+        'Kant, Hegel and Freud',
+        'Marx and Nietzsche',
+        'Modern and Contemporary Philosophy',
+        'Science and Bioethics',
+        'Subjectivity of Contemporary Culture',
+        'Understanding and Reflection on Philosophy',
+    ),
+    ('Philosophy', 120, 300): (
+        'Cultural Diversity',
+        'Ethics and Will',
+        'Freedom and Subjectivity',
+        'Identity',
+        'Philosophical Schools: Ancient, Medieval, Modern, and Contemporary',
+        'Politics and Power',
+    ),
+    ('Physical Education', 10, 300): (
+        'Basic Elements of Gymnastics: Balances, Jumps, and Turns',
+        'Dances: Community and Regional Context',
+        "Games and Fun: Blind Man's Bluff",
+        'Games and Fun: Hopscotch',
+    ),
+    ('Physical Education', 20, 300): (
+        'Constitutive Elements of Dances',
+        'Games and Fun: Dodgeball',
+        'Games and Fun: Hide and Seek and Tag',
+        'Precision Sports',
+    ),
+    ('Physical Education', 30, 300): (
+        'Body Self-Awareness',
+        'Field and Pole Sports',
+        'Games and Fun: Circle and Rope',
+        'Games and Fun: Popular Worldwide',
+        'General Gymnastics Elements: Rotations, Acrobatics, with and without Equipment',
+    ),
+    ('Physical Education', 40, 300): (
+        'Dances: Injustice and Prejudice',
+        'Games and Fun: Capture the Flag',
+        'Games and Fun: Hot Potato and Pass the Ring',
+        'Games and Fun: Marbles and Spinning Top',
+    ),
+    ('Physical Education', 50, 300): (
+        'Dance as Historical Heritage',
+        'Field Sports',
+        'Fights and Practice',
+        'Gymnastics',
+        'Movement and Dance',
+        'Net and Wall Sports',
+        'Traditional Games and Toys',
+    ),
+    ('Physical Education', 60, 300): (
+        'Electronic Games',
+        'Jiu-Jitsu',
+        'Measure Sports: Introduction',
+        'Skate',
+        'Technical-Combinatory Sports',
+        'Track and Field: Introduction',
+        'Urban Dances',
+    ),
+    ('Physical Education', 70, 300): (
+        'Darts',
+        'Handball: Introduction',
+        'Invasion Sports: Introduction',
+        'Physical Exercise and Physical Activity',
+        'Physical Exercise and the Body',
+        'Precision Sports',
+        'Urban Adventure',
+    ),
+    ('Physical Education', 80, 300): (
+        'Ballroom Dancing',
+        'Hockey',
+        'Nature Adventures',
+        'Net Sports: Introduction',
+        'Physical Exercise Demands',
+        'Pole Sports',
+        'Transformations in Sports',
+        'Volleyball: Introduction',
+    ),
+    ('Physical Education', 90, 300): (
+        'Body Awareness Gymnastics',
+        'Combat Sports: Introduction',
+        'Doping, Corruption and Medication',
+        'Fitness Gymnastics',
+        'Football: Introduction',
+        'Futsal',
+        'Judo: Introduction',
+        'World Fights',
+    ),
+    ('Physical Education', 100, 300): (
+        'Doping in Sports',
+        'Electronic Games',
+        'Health and Sports',
+        'History of Sports',
+        'Track and Field',
+    ),
+    ('Physical Education', 110, 300): (
+        'American Football',
+        'Chess',
+        'Handball',
+        'Measure Sports',
+        'Net Sports',
+        'Steroids and Anabolics',
+        'Swimming',
+        'Volleyball',
+    ),
+    ('Physical Education', 120, 300): (
+        'Combat Sports',
+        'Ethics and Sports',
+        'Football',
+        'High Performance Sports and the Body',
+        'Invasion Sports',
+        'Judo',
+        'Olympic Sports and Olympics',
+    ),
+    ('Physics', 100, 300): (
+        'Dimensional Analysis',
+        'Dynamics: Centripetal Force',
+        'Dynamics: Elastic Force',
+        'Dynamics: Forces in Curvilinear Motion',
+        'Dynamics: Main Forces',
+        "Dynamics: Mechanics Problems: Newton's Laws",
+        "Dynamics: Newton's 1st Law",
+        "Dynamics: Newton's 2nd Law",
+        "Dynamics: Newton's 3rd Law",
+        'Dynamics: Representation of Forces',
+        'Dynamics: Traction Force',
+        'Dynamics: friction force',
+        'Hydrostatics: Pressure',
+        'Hydrostatics: Specific Mass',
+        "Hydrostatics: Stevin's Theorem",
+        'International System',
+        'Kinematics: Acceleration of Uniformly Varied Circular Motion',
+        'Kinematics: Angular Displacement',
+        'Kinematics: Average Angular Velocity',
+        'Kinematics: Average Scalar Acceleration',
+        'Kinematics: Average Scalar Speed',
+        'Kinematics: Average Speed of Uniformly Accelerated Motion',
+        'Kinematics: Average Vector Acceleration',
+        'Kinematics: Average Vector Velocity',
+        'Kinematics: Centripetal Acceleration',
+        'Kinematics: Instantaneous Acceleration',
+        'Kinematics: Instantaneous Speed',
+        'Kinematics: Motion Transmission',
+        'Kinematics: Oblique Motion',
+        'Kinematics: Oblique Motion Equation',
+        'Kinematics: Path of a Body',
+        'Kinematics: Period in Circular Movements',
+        'Kinematics: Position Change',
+        'Kinematics: Reference Frame and Position',
+        'Kinematics: Relationship between Speeds in Circular Motions',
+        'Kinematics: Relative Velocity',
+        'Kinematics: Uniform Circular Motion',
+        'Kinematics: Uniform Circular Motion Acceleration',
+        'Kinematics: Uniform Motion',
+        'Kinematics: Uniform Motion Graphs',
+        'Kinematics: Uniformly Accelerated Motion',
+        'Kinematics: Uniformly Accelerated Motion Graphs',
+        'Kinematics: Uniformly Varied Circular Motion',
+        'Kinematics: Vertical Motion',
+        'Momentum and Impulse: Coefficient of Restitution',
+        'Momentum and Impulse: Collisions in One Dimension',
+        'Momentum and Impulse: Conservation of Momentum',
+        'Momentum and Impulse: Impulse Theorem',
+        'Momentum and Impulse: Impulse of a Force',
+        'Momentum and Impulse: Momentum',
+        'Momentum and Impulse: Two-Dimensional Collisions',
+        'Order of Magnitude',
+        'Statics: Levers',
+        'Statics: Rigid Body',
+        'Statics: Torque or Moment',
+        'System Prefixes',
+        'Vectors: Addition',
+        'Vectors: Decomposition',
+        'Vectors: Difference',
+        'Vectors: Introduction',
+        'Work: Constant Force',
+        'Work: Elastic Force',
+        'Work: Graphics',
+        'Work: Kinetic Energy',
+        'Work: Kinetic Energy and Work',
+        'Work: Power',
+        'Work: Power and Speed',
+        'Work: Resultant Force',
+        'Work: Weight',
+    ),
+    ('Physics', 100, 500): (
+        'Astronomy: Black Holes',
+        'Astronomy: Celestial Objects',
+        'Astronomy: Galaxies',
+        'Astronomy: Stellar Evolution',
+        'Astronomy: Types of Stars',
+        "Bernoulli's Principle",
+        'Gravitation: Bodies in Orbit',
+        'Gravitation: Escape Velocity',
+        'Gravitation: Gravitation Problems',
+        'Gravitation: Gravitational Acceleration',
+        'Gravitation: Gravitational Force',
+        "Gravitation: Kepler's Laws",
+        "Hydrodynamics: Bernoulli's Principle",
+        'Hydrodynamics: Flow Rate',
+        'Hydrostatics: Buoyancy',
+        'Hydrostatics: Hydrostatic Problems',
+        "Hydrostatics: Pascal's Theorem",
+        'Hydrostatics: Work and Energy Problems',
+        'Momentum and Impulse: Collision and Momentum Problems',
+        'Solar System: Characteristics',
+        'Work: Elastic Potential Energy',
+        'Work: Gravitational Potential Energy',
+        'Work: Mechanical Energy',
+        'Work: Non-Conservative Systems',
+    ),
+    ('Physics', 110, 500): (
+        "Calorimetry: Fourier's Law",
+        'Calorimetry: Heat Exchange Problems',
+        'Calorimetry: Heat Flow',
+        'Calorimetry: Introduction',
+        'Calorimetry: Latent Heat',
+        'Calorimetry: Sensible Heat',
+        'Calorimetry: Thermal Power',
+        'Calorimetry: Thermometer Scale Changes',
+        'Electricity: Capacitance',
+        'Electricity: Capacitors in Parallel',
+        'Electricity: Capacitors in Series',
+        'Electricity: Charge Conservation',
+        'Electricity: Conductors and Insulators',
+        "Electricity: Coulomb's Law",
+        'Electricity: Electric Charge',
+        'Electricity: Electric Current',
+        'Electricity: Electric Field',
+        "Electricity: Electric Field and Gauss's Law",
+        'Electricity: Electric Potential',
+        'Electricity: Electric Potential Energy',
+        'Electricity: Electric Power',
+        'Electricity: Electrical Circuits',
+        'Electricity: Generators and Receivers',
+        'Electricity: Lines of Force',
+        "Electricity: Ohm's First Law",
+        'Electricity: Parallel Plate Capacitor',
+        'Electricity: Parallel Resistors',
+        'Electricity: Potential Difference',
+        'Electricity: Problems of Electric Forces and Fields',
+        "Electricity: Resistivity and Ohm's 2nd Law",
+        'Electricity: Resistor Association',
+        'Electricity: Series Resistors',
+        'Electricity: Spherical Capacitor',
+        'Electricity: Types of Electrification',
+        'Electricity: Voltmeters and Ammeters',
+        'Electricity: Work of Electric Force in Uniform Fields',
+        'Electricity: Work of the Electric Force',
+        'Expansion: Liquids in Containers',
+        'Linear Expansion',
+        'Magnetic Field: Coil',
+        'Magnetic Field: Loop',
+        'Magnetic Field: Solenoid',
+        'Magnetic Field: Wire',
+        'Magnetism: Field Lines',
+        'Magnetism: Force on Current-Carrying Wire',
+        'Magnetism: Magnetic Field',
+        'Magnetism: Magnetic Force on Charges',
+        'Magnetism: Magnets',
+        'Main Forms of Energy Generation',
+        'Renewable and Non-Renewable Energies',
+        'Surface Expansion',
+        'Thermodynamics: 1st Law of Thermodynamics',
+        'Thermodynamics: 2nd Law of Thermodynamics',
+        'Thermodynamics: Average Speed of Gas Molecules',
+        'Thermodynamics: Carnot Cycle',
+        'Thermodynamics: Entropy',
+        'Thermodynamics: Gas Pressure',
+        'Thermodynamics: Gaseous Transformations',
+        'Thermodynamics: General Gas Equation',
+        'Thermodynamics: Internal Energy of a Gas',
+        'Thermodynamics: Thermal Machines',
+        'Thermodynamics: Thermal Transformations',
+        'Thermodynamics: Thermodynamic Cycle',
+        'Thermodynamics: Work of a Gas',
+        'Volumetric Expansion',
+    ),
+    ('Physics', 110, 700): (
+        "Magnetism: Faraday's Law",
+        'Magnetism: Magnetic Flux',
+    ),
+    ('Physics', 120, 700): (
+        "Convex and Concave Mirrors: Gauss's Equation",
+        'Convex and Concave Mirrors: Image Formation',
+        'Flat Mirror: Image Formation',
+        'Flat Mirror: Movement and Image Formation',
+        'Flat Mirror: Rotation',
+        'Geometric Optics: Apparent Position',
+        'Geometric Optics: Camera Obscura',
+        'Geometric Optics: Critical Angle Problems',
+        'Geometric Optics: Human Eye',
+        'Geometric Optics: Introduction',
+        'Geometric Optics: Optical Instruments',
+        'Geometric Optics: Parallel Plates',
+        'Geometric Optics: Penumbra and Shadow',
+        'Geometric Optics: Prisms',
+        'Geometric Optics: Reflection',
+        'Geometric Optics: Refractive Index',
+        "Geometric Optics: Snell's Law",
+        "Lens: Lens Maker's Equation",
+        'Lenses: Gaussian Equation',
+        'Lenses: Types',
+        'Lenses: Vergence',
+        'Modern Physics: Bohr Model',
+        'Modern Physics: Heisenberg Uncertainty Principle',
+        'Modern Physics: Hydrogen Atom',
+        'Modern Physics: Photoelectric Effect',
+        'Modern Physics: Photons',
+        'Simple Harmonic Motion: Definition',
+        'Simple Harmonic Motion: Equation of Motion',
+        'Simple Harmonic Motion: Mass-Spring System',
+        'Simple Harmonic Motion: Mechanical Energy',
+        'Simple Harmonic Motion: Relationship between SHM and UCM',
+        'Simple Harmonic Motion: Simple Pendulum',
+        'Sound Waves: Pitch and Timbre',
+        'Theory of Relativity: Introduction',
+        'Theory of Relativity: Relativistic Energy',
+        'Theory of Relativity: Space Contraction',
+        'Theory of Relativity: Time Dilation',
+        'Waves: Beats',
+        'Waves: Doppler Effect',
+        'Waves: Electromagnetic and Mechanical',
+        'Waves: Elements of a Wave',
+        'Waves: Equation',
+        "Waves: Newton's Rings",
+        'Waves: Polarization',
+        'Waves: Radiations and Their Risks',
+        'Waves: Reflection',
+        'Waves: Refraction',
+        'Waves: Sound Intensity',
+        'Waves: Speed on Strings',
+        'Waves: Superposition',
+        'Waves: Vibration in Sound Tubes',
+        'Waves: Vibration in Strings',
+        'Waves: Wave Speed',
+        "Waves: Young's Experiment",
+    ),
+    ('Portuguese', 60, 300): (
+        'Alfabetização',
+        'Artigo de Opinião',
+        'Classe de Palavras',
+        'Classes Gramaticais',
+        'Crase',
+        'Interpretação Textual',
+        'Interpretação de Texto',
+        'Parnasianismo',
+        'Pontuação',
+        'Preposição',
+        'Substantivo',
+        'Substantivos',
+    ),
+    ('Portuguese', 60, 500): (
+        'Alfabetização',
+        'Artigo de Opinião',
+        'Classe de Palavras',
+        'Classes Gramaticais',
+        'Crase',
+        'Interpretação Textual',
+        'Interpretação de Texto',
+        'Parnasianismo',
+        'Pontuação',
+        'Preposição',
+        'Substantivo',
+        'Substantivos',
+    ),
+    ('Portuguese', 60, 700): (
+        'Alfabetização',
+        'Artigo de Opinião',
+        'Classe de Palavras',
+        'Classes Gramaticais',
+        'Crase',
+        'Interpretação Textual',
+        'Interpretação de Texto',
+        'Parnasianismo',
+        'Pontuação',
+        'Preposição',
+        'Substantivo',
+        'Substantivos',
+    ),
+    ('Portuguese', 70, 300): (
+        'Alfabetização',
+        'Artigo de Opinião',
+        'Classe de Palavras',
+        'Classes Gramaticais',
+        'Crase',
+        'Interpretação Textual',
+        'Interpretação de Texto',
+        'Parnasianismo',
+        'Pontuação',
+        'Preposição',
+        'Substantivo',
+        'Substantivos',
+    ),
+    ('Portuguese', 70, 500): (
+        'Alfabetização',
+        'Artigo de Opinião',
+        'Classe de Palavras',
+        'Classes Gramaticais',
+        'Crase',
+        'Interpretação Textual',
+        'Interpretação de Texto',
+        'Parnasianismo',
+        'Pontuação',
+        'Preposição',
+        'Substantivo',
+        'Substantivos',
+    ),
+    ('Portuguese', 70, 700): (
+        'Alfabetização',
+        'Artigo de Opinião',
+        'Classe de Palavras',
+        'Classes Gramaticais',
+        'Crase',
+        'Interpretação Textual',
+        'Interpretação de Texto',
+        'Parnasianismo',
+        'Pontuação',
+        'Preposição',
+        'Substantivo',
+        'Substantivos',
+    ),
+    ('Portuguese', 80, 300): (
+        'Alfabetização',
+        'Artigo de Opinião',
+        'Classe de Palavras',
+        'Classes Gramaticais',
+        'Crase',
+        'Interpretação Textual',
+        'Interpretação de Texto',
+        'Parnasianismo',
+        'Pontuação',
+        'Preposição',
+        'Substantivo',
+        'Substantivos',
+    ),
+    ('Portuguese', 80, 500): (
+        'Alfabetização',
+        'Artigo de Opinião',
+        'Classe de Palavras',
+        'Classes Gramaticais',
+        'Crase',
+        'Interpretação Textual',
+        'Interpretação de Texto',
+        'Parnasianismo',
+        'Pontuação',
+        'Preposição',
+        'Substantivo',
+        'Substantivos',
+    ),
+    ('Portuguese', 80, 700): (
+        'Alfabetização',
+        'Artigo de Opinião',
+        'Classe de Palavras',
+        'Classes Gramaticais',
+        'Crase',
+        'Interpretação Textual',
+        'Interpretação de Texto',
+        'Parnasianismo',
+        'Pontuação',
+        'Preposição',
+        'Substantivo',
+        'Substantivos',
+    ),
+    ('Portuguese', 90, 300): (
+        'Alfabetização',
+        'Artigo de Opinião',
+        'Classe de Palavras',
+        'Classes Gramaticais',
+        'Crase',
+        'Interpretação Textual',
+        'Interpretação de Texto',
+        'Parnasianismo',
+        'Pontuação',
+        'Preposição',
+        'Substantivo',
+        'Substantivos',
+    ),
+    ('Portuguese', 90, 500): (
+        'Alfabetização',
+        'Artigo de Opinião',
+        'Classe de Palavras',
+        'Classes Gramaticais',
+        'Crase',
+        'Interpretação Textual',
+        'Interpretação de Texto',
+        'Parnasianismo',
+        'Pontuação',
+        'Preposição',
+        'Substantivo',
+        'Substantivos',
+    ),
+    ('Portuguese', 90, 700): (
+        'Alfabetização',
+        'Artigo de Opinião',
+        'Classe de Palavras',
+        'Classes Gramaticais',
+        'Crase',
+        'Interpretação Textual',
+        'Interpretação de Texto',
+        'Parnasianismo',
+        'Pontuação',
+        'Preposição',
+        'Substantivo',
+        'Substantivos',
+    ),
+    ('Portuguese', 100, 300): (
+        'Alfabetização',
+        'Artigo de Opinião',
+        'Classe de Palavras',
+        'Classes Gramaticais',
+        'Crase',
+        'Interpretação Textual',
+        'Interpretação de Texto',
+        'Parnasianismo',
+        'Pontuação',
+        'Preposição',
+        'Substantivo',
+        'Substantivos',
+    ),
+    ('Portuguese', 100, 500): (
+        'Alfabetização',
+        'Artigo de Opinião',
+        'Classe de Palavras',
+        'Classes Gramaticais',
+        'Crase',
+        'Interpretação Textual',
+        'Interpretação de Texto',
+        'Parnasianismo',
+        'Pontuação',
+        'Preposição',
+        'Substantivo',
+        'Substantivos',
+    ),
+    ('Portuguese', 100, 700): (
+        'Alfabetização',
+        'Artigo de Opinião',
+        'Classe de Palavras',
+        'Classes Gramaticais',
+        'Crase',
+        'Interpretação Textual',
+        'Interpretação de Texto',
+        'Parnasianismo',
+        'Pontuação',
+        'Preposição',
+        'Substantivo',
+        'Substantivos',
+    ),
+    ('Portuguese', 110, 300): (
+        'Alfabetização',
+        'Artigo de Opinião',
+        'Classe de Palavras',
+        'Classes Gramaticais',
+        'Crase',
+        'Interpretação Textual',
+        'Interpretação de Texto',
+        'Parnasianismo',
+        'Pontuação',
+        'Preposição',
+        'Substantivo',
+        'Substantivos',
+    ),
+    ('Portuguese', 110, 500): (
+        'Alfabetização',
+        'Artigo de Opinião',
+        'Classe de Palavras',
+        'Classes Gramaticais',
+        'Crase',
+        'Interpretação Textual',
+        'Interpretação de Texto',
+        'Parnasianismo',
+        'Pontuação',
+        'Preposição',
+        'Substantivo',
+        'Substantivos',
+    ),
+    ('Portuguese', 110, 700): (
+        'Alfabetização',
+        'Artigo de Opinião',
+        'Classe de Palavras',
+        'Classes Gramaticais',
+        'Crase',
+        'Interpretação Textual',
+        'Interpretação de Texto',
+        'Parnasianismo',
+        'Pontuação',
+        'Preposição',
+        'Substantivo',
+        'Substantivos',
+    ),
+    ('Portuguese', 120, 300): (
+        'Alfabetização',
+        'Artigo de Opinião',
+        'Classe de Palavras',
+        'Classes Gramaticais',
+        'Crase',
+        'Interpretação Textual',
+        'Interpretação de Texto',
+        'Parnasianismo',
+        'Pontuação',
+        'Preposição',
+        'Substantivo',
+        'Substantivos',
+    ),
+    ('Portuguese', 120, 500): (
+        'Alfabetização',
+        'Artigo de Opinião',
+        'Classe de Palavras',
+        'Classes Gramaticais',
+        'Crase',
+        'Interpretação Textual',
+        'Interpretação de Texto',
+        'Parnasianismo',
+        'Pontuação',
+        'Preposição',
+        'Substantivo',
+        'Substantivos',
+    ),
+    ('Portuguese', 120, 700): (
+        'Alfabetização',
+        'Artigo de Opinião',
+        'Classe de Palavras',
+        'Classes Gramaticais',
+        'Crase',
+        'Interpretação Textual',
+        'Interpretação de Texto',
+        'Parnasianismo',
+        'Pontuação',
+        'Preposição',
+        'Substantivo',
+        'Substantivos',
+    ),
+    ('Science', 10, 300): (
+        'Daily Activities Time Scales',
+        'Human Body Parts: Introduction',
+        'Human Physical Characteristics',
+        'Hygiene Habits',
+        'Materials: Characteristics and Composition',
+    ),
+    ('Science', 20, 300): (
+        'Characteristics of Plants and Animals',
+        'Domestic Accident Prevention',
+        'Effect of Solar Radiation',
+        'Materials of Main Everyday Objects',
+        'Plants: Main Parts',
+        'Plants: Water and Light',
+        'Positions of the Sun and Shadow',
+    ),
+    ('Science', 30, 300): (
+        'Animals: Group Organization',
+        'Animals: Life Cycle',
+        'Animals: Way of Life',
+        'Daily Periods',
+        'Earth Features',
+        'Land Use',
+        'Maintenance of Auditory and Visual Health',
+        'Passage of Light through Objects',
+        'Sound Production',
+        'Types of Soil',
+    ),
+    ('Science', 40, 300): (
+        'Cardinal Points',
+        'Cyclic Movements of the Moon and Earth',
+        'Disease Prevention',
+        'Everyday Materials Transformations',
+        'Food Chains: Introduction',
+        'Food Production by Microorganisms',
+        'Fungi and Bacteria: Decomposition',
+        'Matter Cycle and Energy Flow',
+        'Mixtures: Introduction',
+        'Reversible and Irreversible Transformations',
+    ),
+    ('Science', 50, 300): (
+        'Circulatory System',
+        'Conscious Consumption',
+        'Digestive System',
+        'Food and Eating Disorders',
+        'Main Phases of the Moon',
+        'Nature Conservation',
+        'Observation Devices',
+        'Physical Properties of Materials',
+        'Respiratory System',
+        'Stars and Constellations',
+        'Subject: Introduction',
+        'Water Cycle',
+        'Water Usage',
+    ),
+    ('Science', 60, 300): (
+        'Chemical Transformations',
+        'Earth Study',
+        'Human Body: Cell Organization',
+        'Human Body: Circulatory System',
+        'Human Body: Digestive System',
+        'Human Body: Movement',
+        'Human Body: Nervous System',
+        'Human Body: Respiratory System',
+        'Human Body: System Organization',
+        'Human Body: Urinary System',
+        'Human Body: Vision',
+        'Impacts of Science',
+        'Layers of the Earth',
+        'Mixtures Separation',
+        'Types of Mixtures',
+        'Types of Rocks',
+    ),
+    ('Science', 70, 300): (
+        'Air Composition',
+        'Continental Drift',
+        'Disasters and Natural Changes',
+        'Greenhouse Effect and Human Action',
+        'Heat Propagation',
+        'Heat and Temperature',
+        'History of Technology',
+        'Natural Phenomena',
+        'New Materials and Technologies',
+        'Ozone Layer',
+        'Simple and Thermal Machines',
+        'Types of Fuels',
+        'Water and Community',
+    ),
+    ('Science', 80, 300): (
+        'Basic Electrical Circuits',
+        'Electrical Power',
+        'Energy Generation',
+        'Energy Transformation',
+        'Environmental Balance',
+        'Human Body: Human Reproduction',
+        'Human Body: Puberty',
+        'Moon',
+        'Renewable and Non-Renewable Energies',
+        'Reproduction: Plants and Animals',
+        'Weather Forecasting',
+    ),
+    ('Science', 90, 300): (
+        'Astronomical Unit',
+        'Atom: Atomic Evolution',
+        'Atom: Introduction',
+        'Basic Genetics',
+        'Chemical Bonds: Ionic and Covalent',
+        'Colligative Properties: Boiling Point Elevation',
+        'Conscious Consumption and Environmental Issues',
+        'Electromagnetic Waves: Introduction',
+        'Evolution: Introduction',
+        'Galaxies and Milky Way',
+        'Human Body: Gametes and Transmission of Traits',
+        'Main Inorganic Compounds',
+        'Periodic Table: Introduction',
+        'Phases of Mixing',
+        'Ponderal Laws: Introduction',
+        'Primary Colors',
+        'Reactions: Introduction',
+        'Solar System: Evolution',
+        'Solar System: Introduction',
+        'Stars: Evolution',
+        'State Changes',
+        'Types of Substances and Mixtures',
+        'Waves: Introduction',
+    ),
+    ('Science', 90, 500): (
+        'Basic Stoichiometry',
+        'Number of Moles: Introduction',
+        'Phases of the Moon',
+    ),
+    ('Sociology', 100, 300): (
+        'Concept of Ideology',
+        'Globalized World and Migration Flows',
+        'Modernity: Ethnocentrism and Racism',
+        'Rights and Duties',
+        'Technology and Work',
+        'Violence and its Manifestations',
+    ),
+    ('Sociology', 110, 300): (
+        'Changes in the World of Work',
+        'Human Coexistence: Social Interaction and Isolation',
+        'Mass Culture',
+        'Social Inequality',
+    ),
+    ('Sociology', 120, 300): (
+        'Classics of Sociology',
+        'Society, Ideology and Culture',
+        'State Building',
+    ),
+    ('Spanish', 100, 300): (
+        'Accentuation',
+        'Articles, Contractions and Neutral Article',
+        'Formal and Informal Treatment',
+        'Numbers in Spanish',
+        'Object Pronoun',
+        'Personal Pronoun',
+        'Possessive and Demonstrative Pronouns',
+        'Text Interpretation',
+        'The Alphabet, Sounds and Syllabic Separation',
+        'Verbs: Imperative',
+        'Verbs: Like',
+        'Verbs: Present Tense',
+        'Verbs: Ser, Estar, Tener',
+        'Verbs: Simple Conditional',
+        'Vocabulary: Days of the Week, Dates and Time',
+        'Vocabulary: Places and Family',
+        'Vocabulary: Travel and Transportation',
+    ),
+    ('Spanish', 110, 300): (
+        'Adjectives',
+        'Adverbs',
+        'False Cognates',
+        'Indefinite Pronouns and Determiners',
+        'Muy vs. Mucho',
+        'Past Perfect and Simple Past',
+        'Prepositions and Prepositional Phrases',
+        'Reflexive Pronouns and Relative Pronouns',
+        'Spelling',
+        'Verbs: Future Simple and Future Perfect',
+        'Verbs: Imperfect Preterite and Past Perfect',
+        'Verbs: Participle',
+        'Verbs: Periphrastic Future',
+    ),
+    ('Spanish', 120, 300): (
+        'Conjunctions',
+        'Homographs and Homophones',
+        'Interrogative Pronouns',
+        'Scientific Technical Vocabulary',
+        'Textual Genres',
+        'Use of the Whys',
+        'Verbs: Imperfect Preterite and Perfect Subjunctive',
+        'Verbs: Past Conditional',
+        'Verbs: Past Participle',
+        'Verbs: Past Perfect',
+        'Verbs: Present Subjunctive',
+        'Verbs: Tense Problems',
+        'Vocabulary: Animals, Plants, and Human Body Parts',
+        'Vocabulary: Parts of the House, Objects and Materials',
+        'Word Formation',
+    ),
+})
+
+# Cells with at least one category
+AVAILABLE_CELLS = frozenset(CELLS)
+
+# Every (discipline, category) pair
+DISCIPLINE_CATEGORY_PAIRS = frozenset(
+    (discipline, category)
+    for discipline, names in CATEGORIES.items()
+    for category in names
+)
+
+# English -> Portuguese
+DISCIPLINE_TRANSLATIONS = MappingProxyType({
+    'Mathematics': 'Matemática',
+    'Science': 'Ciências',
+    'Physics': 'Física',
+    'History': 'História',
+    'Geography': 'Geografia',
+    'Biology': 'Biologia',
+    'English': 'Inglês',
+    'Philosophy': 'Filosofia',
+    'Physical Education': 'Educação Física',
+    'Arts': 'Artes',
+    'Spanish': 'Espanhol',
+    'Portuguese': 'Português',
+})
+
+# English -> Portuguese (topic-level names)
+CATEGORY_TRANSLATIONS = MappingProxyType({
+    'Algebra': 'Álgebra',
+    'Arithmetic and Numbers': 'Aritmética e Números',
+    'Combinatorial Analysis and Probability': 'Análise Combinatória e Probabilidade',
+    'Geometry': 'Geometria',
+    'Magnitudes and Measurements': 'Grandezas e Medidas',
+    'Magnitudes and Measures': 'Grandezas e Medidas',
+    'Statistics': 'Estatística',
+    'Trigonometry': 'Trigonometria',
+    'Earth and Universe': 'Terra e Universo',
+    'Life and Evolution': 'Vida e Evolução',
+    'Matter and Energy': 'Matéria e Energia',
+    'Astronomy': 'Astronomia',
+    'Electromagnetism': 'Eletromagnetismo',
+    'Introduction to Physics': 'Introdução à Física',
+    'Kinematics': 'Cinemática',
+    'Modern Physics and Relativity': 'Física Moderna e Relatividade',
+    'Modern physics and relativity': 'Física Moderna e Relatividade',
+    'Statics and Dynamics': 'Estática e Dinâmica',
+    'Thermology': 'Termologia',
+    'Waves and Optics': 'Ondas e Óptica',
+    'Ancient History': 'História Antiga',
+    'Contemporary History': 'História Contemporânea',
+    'Medieval History': 'História Medieval',
+    'Modern History': 'História Moderna',
+    'Theory of History': 'Teoria da História',
+    'Ecosystem and Biome': 'Ecossistema e Bioma',
+    'Geographic Space': 'Espaço Geográfico',
+    'Geographical Space': 'Espaço Geográfico',
+    'Geography Theory': 'Teoria da Geografia',
+    'Geopolitics': 'Geopolítica',
+    'Human Development': 'Desenvolvimento Humano',
+    'Region': 'Região',
+    'Territory': 'Território',
+    'Theory of Geography': 'Teoria da Geografia',
+    'Biochemistry and Metabolism': 'Bioquímica e Metabolismo',
+    'Ecology and Environment': 'Ecologia e Meio Ambiente',
+    'Genetics and Heredity': 'Genética e Hereditariedade',
+    'Genetics and Inheritance': 'Genética e Herança',
+    'Human Anatomy and Physiology': 'Anatomia e Fisiologia Humana',
+    'Introduction to Biology and Evolution': 'Introdução à Biologia e Evolução',
+    'Structure and Function of Organisms': 'Estrutura e Função dos Organismos',
+    'Concept': 'Conceito',
+    'Culture': 'Cultura',
+    'Ethics': 'Ética',
+    'Origin': 'Origem',
+    'Politics': 'Política',
+    'Dance': 'Dança',
+    'Ethics in Sports': 'Ética no Esporte',
+    'Health': 'Saúde',
+    'Recreation': 'Recreação',
+    'Research in Sports': 'Pesquisa em Esportes',
+    'Sport': 'Esporte',
+    'Wrestling': 'Luta',
+    'Art Knowledge': 'Conhecimento em Arte',
+    'Art and Movement': 'Arte e Movimento',
+    'Artistic Production': 'Produção Artística',
+    'Music': 'Música',
+    'Performing Arts': 'Artes Cênicas',
+    'Scenic Art': 'Arte Cênica',
+    'Visual Art': 'Arte Visual',
+    'Verbs': 'Verbos',
+    'Vocabulary': 'Vocabulário',
+    'Reading, Writing, and Comprehension': 'Leitura, Escrita e Compreensão',
+    'Reading, Writing and Comprehension': 'Leitura, Escrita e Compreensão',
+    'Grammar': 'Gramática',
+})
+
+DISCIPLINE_TRANSLATIONS_REVERSE = MappingProxyType(
+    {v: k for k, v in DISCIPLINE_TRANSLATIONS.items()}
+)
@@ -0,0 +1,449 @@
+"""
+Inverted-Index Search over Catalog Categories (prompt -> category)
+
+REQUIREMENTS:
+- Tokenize category, topic, description and `description gepeto` text
+  (accent-folded, light stemming for English and Portuguese)
+- Index the Spanish catalog names too, so Portuguese prompts find cognates
+- Inverted index with BM25 scoring over one document per (discipline, category)
+- Top-k queries filtered by discipline and grade in milliseconds
+- Serialized index (pickle) for fast load
+- Incremental updates driven by CatalogStore change sets
+
+USAGE:
+    python3 catalog_search.py "frações equivalentes" --discipline Matemática --grade 50
+    python3 catalog_search.py "photosynthesis in plants" -k 5
+"""
+
+import math
+import os
+import pickle
+import re
+import sys
+import time
+import unicodedata
+from functools import lru_cache
+
+from catalog_store import CatalogStore, DEFAULT_CSV_PATH, DEFAULT_DB_PATH
+import generate_bilingual_requests as bilingual
+
+# -------------------------------------------------------------------------
+# CONFIGURATION
+# -------------------------------------------------------------------------
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_INDEX_PATH = os.path.join(SCRIPT_DIR, "catalog_search.idx")
+INDEX_VERSION = 1
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Term-frequency boost per field (category names matter most)
+FIELD_WEIGHTS = {
+    "category": 3.0,
+    "topic": 2.0,
+    "name_es": 2.0,
+    "description": 1.0,
+    "description_gepeto": 1.0,
+}
+
+# Language used to stem each field (Spanish names go through the
+# Portuguese stemmer, which handles the shared suffixes well enough)
+FIELD_LANGUAGES = {
+    "category": "en",
+    "topic": "en",
+    "description": "en",
+    "description_gepeto": "en",
+    "name_es": "pt",
+}
+
+STOPWORDS = {
+    "en": frozenset("""
+        a an and are as at be by for from has have in into is it its of on or
+        that the their them these this those to was were which with what how
+        why when where who about between both each other over under its than
+        then they we you your our can will using use used
+        """.split()),
+    "pt": frozenset("""
+        a o as os um uma uns umas e de do da dos das em no na nos nas por pelo
+        pela pelos pelas para com sem sobre entre que qual quais como se sua seu
+        suas seus ao aos ou mais menos muito ser estar ter este esta estes estas
+        esse essa isso isto el la los las del y en con por para su sus
+        """.split()),
+}
+
+# Portuguese -> English word endings for cognates ("revolucao" -> "revolution")
+COGNATE_ENDINGS = (("coes", "tions"), ("cao", "tion"), ("dades", "ties"), ("dade", "ty"),
+                   ("ismos", "isms"), ("ismo", "ism"), ("mente", "ly"))
+
+TOKEN = re.compile(r"[a-z0-9]+")
+
+# -------------------------------------------------------------------------
+# TEXT PROCESSING
+# -------------------------------------------------------------------------
+
+def fold(text):
+    """Lower-case and strip accents: 'Frações' -> 'fracoes'."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+@lru_cache(maxsize=200000)
+def stem_en(word):
+    """Light English stemmer (plurals, -ing/-ed, common derivations)."""
+    if len(word) <= 3 or word.isdigit():
+        return word
+    if word.endswith("ies") and len(word) > 4:
+        word = word[:-3] + "y"
+    elif word.endswith("sses"):
+        word = word[:-2]
+    elif word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        word = word[:-1]
+
+    for suffix in ("ing", "ed"):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            stem = word[:-len(suffix)]
+            if any(vowel in stem for vowel in "aeiouy"):
+                if len(stem) > 3 and stem[-1] == stem[-2] and stem[-1] not in "lsz":
+                    stem = stem[:-1]
+                word = stem
+            break
+
+    for suffix, replacement, min_stem in (
+        ("ational", "ate", 2), ("ization", "ize", 2), ("ation", "ate", 2),
+        ("iveness", "ive", 2), ("fulness", "ful", 2), ("ousness", "ous", 2),
+        ("ness", "", 3), ("ment", "", 4), ("ity", "", 4), ("ical", "ic", 3),
+        ("ful", "", 3), ("ly", "", 4), ("al", "", 5),
+    ):
+        if word.endswith(suffix) and len(word) - len(suffix) >= min_stem:
+            return word[:-len(suffix)] + replacement
+    return word
+
+
+@lru_cache(maxsize=200000)
+def stem_pt(word):
+    """Light Portuguese stemmer after RSLP (plural, feminine, noun and verb suffixes)."""
+    if len(word) <= 3 or word.isdigit():
+        return word
+
+    # Plural
+    for suffix, replacement in (("oes", "ao"), ("aes", "ao"), ("ais", "al"), ("eis", "el"),
+                                ("ois", "ol"), ("ns", "m"), ("res", "r"), ("zes", "z"),
+                                ("ses", "s")):
+        if word.endswith(suffix) and len(word) > len(suffix) + 1:
+            word = word[:-len(suffix)] + replacement
+            break
+    else:
+        if word.endswith("s") and len(word) > 3:
+            word = word[:-1]
+
+    # Feminine
+    if word.endswith("a") and len(word) > 3:
+        word = word[:-1] + "o"
+
+    # Noun / adjective suffixes, longest first
+    for suffix in ("amento", "imento", "amente", "mente", "idade", "izacao", "acao", "icao",
+                   "ismo", "ista", "avel", "ivel", "ico", "oso", "ao", "ario"):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            return word[:-len(suffix)]
+
+    # Verb endings
+    for suffix in ("ando", "endo", "indo", "ado", "ido", "ar", "er", "ir"):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            return word[:-len(suffix)]
+
+    return word
+
+
+STEMMERS = {"en": stem_en, "pt": stem_pt}
+
+
+def analyze(text, language="en"):
+    """Fold, tokenize, drop stopwords and stem."""
+    stem = STEMMERS[language]
+    stopwords = STOPWORDS[language]
+    return [stem(token) for token in TOKEN.findall(fold(text or "")) if token not in stopwords]
+
+
+def cognate(token):
+    """English spelling of a Portuguese word with a regular cognate ending, else None."""
+    for ending, english in COGNATE_ENDINGS:
+        if token.endswith(ending) and len(token) > len(ending) + 2:
+            return token[:-len(ending)] + english
+    return None
+
+
+def analyze_query(text):
+    """
+    Query terms under both stemmers (prompts come in either language), plus
+    the English stem of Portuguese cognates.
+    """
+    terms = []
+    for token in TOKEN.findall(fold(text or "")):
+        if token in STOPWORDS["en"] or token in STOPWORDS["pt"]:
+            continue
+        english = cognate(token)
+        variants = (stem_en(token), stem_pt(token), stem_en(english) if english else None)
+        for stem in variants:
+            if stem and stem not in terms:
+                terms.append(stem)
+    return terms
+
+
+# -------------------------------------------------------------------------
+# SEARCH INDEX
+# -------------------------------------------------------------------------
+
+class CatalogSearchIndex:
+    """
+    BM25 index with one document per (discipline, category).
+
+    Besides the postings (term -> {doc: weighted tf}) it keeps a forward
+    index (doc -> {term: tf}) and the mainIds behind each document, so a
+    change to a few catalog rows only re-indexes the documents they touch.
+    """
+
+    def __init__(self):
+        self.postings = {}        # term -> {doc_key: tf}
+        self.forward = {}         # doc_key -> {term: tf}
+        self.doc_length = {}      # doc_key -> weighted length
+        self.doc_info = {}        # doc_key -> {"topic", "grades", "difficulties"}
+        self.doc_rows = {}        # doc_key -> set(main_id)
+        self.row_doc = {}         # main_id -> doc_key
+        self.row_hashes = {}      # main_id -> row_hash the index has seen
+        self.total_length = 0.0
+
+    # ---------------------------------------------------------------------
+    # Building
+    # ---------------------------------------------------------------------
+
+    @classmethod
+    def build(cls, store):
+        index = cls()
+        index.apply_rows(store, list(store.rows))
+        return index
+
+    def _remove_doc(self, key):
+        for term in self.forward.pop(key, {}):
+            docs = self.postings.get(term)
+            if docs is not None:
+                docs.pop(key, None)
+                if not docs:
+                    del self.postings[term]
+        self.total_length -= self.doc_length.pop(key, 0.0)
+        self.doc_info.pop(key, None)
+
+    def _index_doc(self, key, store):
+        self._remove_doc(key)
+        main_ids = self.doc_rows.get(key)
+        if not main_ids:
+            self.doc_rows.pop(key, None)
+            return
+
+        tf = {}
+        texts_seen = set()
+        grades = set()
+        difficulties = set()
+        topic = ""
+        for main_id in sorted(main_ids):
+            parsed = store.rows[main_id][1]
+            topic = topic or parsed["topic"]
+            if parsed["grade"]:
+                grades.add(parsed["grade"])
+            if parsed["difficulty"]:
+                difficulties.add(parsed["difficulty"])
+            for field, weight in FIELD_WEIGHTS.items():
+                text = parsed.get(field)
+                # Same text on several rows (e.g. the category name) counts once
+                if not text or (field, text) in texts_seen:
+                    continue
+                texts_seen.add((field, text))
+                for term in analyze(text, FIELD_LANGUAGES[field]):
+                    tf[term] = tf.get(term, 0.0) + weight
+
+        self.forward[key] = tf
+        length = sum(tf.values())
+        self.doc_length[key] = length
+        self.total_length += length
+        self.doc_info[key] = {"topic": topic, "grades": grades, "difficulties": difficulties}
+        for term, weight in tf.items():
+            self.postings.setdefault(term, {})[key] = weight
+
+    def apply_rows(self, store, main_ids):
+        """Re-index the documents that the given mainIds belong (or belonged) to."""
+        dirty = set()
+        for main_id in main_ids:
+            old_key = self.row_doc.pop(main_id, None)
+            if old_key is not None:
+                self.doc_rows.get(old_key, set()).discard(main_id)
+                dirty.add(old_key)
+            self.row_hashes.pop(main_id, None)
+
+            current = store.rows.get(main_id)
+            if current is None:
+                continue
+            row_hash, parsed = current
+            if not parsed["discipline"] or not parsed["category"]:
+                continue
+            key = (parsed["discipline"], parsed["category"])
+            self.row_doc[main_id] = key
+            self.row_hashes[main_id] = row_hash
+            self.doc_rows.setdefault(key, set()).add(main_id)
+            dirty.add(key)
+
+        for key in dirty:
+            self._index_doc(key, store)
+        return dirty
+
+    def on_catalog_change(self, store):
+        """Subscriber for CatalogStore.subscribe."""
+        def callback(changes):
+            self.apply_rows(store, changes["inserted"] + changes["updated"] + changes["deleted"])
+        return callback
+
+    def sync(self, store):
+        """Bring a loaded index up to date with a store it may have drifted from."""
+        stale = [main_id for main_id, (row_hash, _) in store.rows.items()
+                 if self.row_hashes.get(main_id) != row_hash]
+        stale.extend(main_id for main_id in self.row_hashes if main_id not in store.rows)
+        return self.apply_rows(store, stale) if stale else set()
+
+    # ---------------------------------------------------------------------
+    # Persistence
+    # ---------------------------------------------------------------------
+
+    def save(self, path=DEFAULT_INDEX_PATH):
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump((INDEX_VERSION, self.__dict__), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path=DEFAULT_INDEX_PATH):
+        """Return the saved index, or None if missing or from another version."""
+        try:
+            with open(path, "rb") as f:
+                version, state = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return None
+        if version != INDEX_VERSION:
+            return None
+        index = cls()
+        index.__dict__.update(state)
+        return index
+
+    # ---------------------------------------------------------------------
+    # Querying
+    # ---------------------------------------------------------------------
+
+    def search(self, query, k=10, discipline=None, grade=None, difficulty=None):
+        """
+        Top-k categories for a free-text query, BM25-scored.
+        discipline may be the English or Portuguese name.
+        """
+        if discipline is not None:
+            discipline = bilingual_discipline(discipline)
+
+        doc_count = len(self.forward)
+        if not doc_count:
+            return []
+        average_length = self.total_length / doc_count
+
+        scores = {}
+        for term in analyze_query(query):
+            docs = self.postings.get(term)
+            if not docs:
+                continue
+            idf = math.log(1 + (doc_count - len(docs) + 0.5) / (len(docs) + 0.5))
+            for key, tf in docs.items():
+                if discipline is not None and key[0] != discipline:
+                    continue
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self.doc_length[key] / average_length)
+                scores[key] = scores.get(key, 0.0) + idf * tf * (BM25_K1 + 1) / (tf + norm)
+
+        results = []
+        for key, score in sorted(scores.items(), key=lambda kv: (-kv[1], kv[0])):
+            info = self.doc_info[key]
+            if grade is not None and grade not in info["grades"]:
+                continue
+            if difficulty is not None and difficulty not in info["difficulties"]:
+                continue
+            results.append({
+                "discipline": key[0],
+                "category": key[1],
+                "topic": info["topic"],
+                "score": round(score, 4),
+                "grades": sorted(info["grades"]),
+                "difficulties": sorted(info["difficulties"]),
+            })
+            if len(results) == k:
+                break
+        return results
+
+
+DISCIPLINE_TRANSLATIONS_REVERSE = {pt: en for en, pt in bilingual.DISCIPLINE_TRANSLATIONS.items()}
+
+
+def bilingual_discipline(name):
+    """Accept Portuguese discipline names ("Matemática" -> "Mathematics")."""
+    return DISCIPLINE_TRANSLATIONS_REVERSE.get(name, name)
+
+
+def load_or_build(csv_path=DEFAULT_CSV_PATH, db_path=DEFAULT_DB_PATH,
+                  index_path=DEFAULT_INDEX_PATH):
+    """
+    Open the catalog store, ingest csv_path if its mtime / size changed since
+    the last ingest, and return (store, index) with the index loaded from
+    disk and patched incrementally (or built fresh). The index stays
+    subscribed to the store for later ingests.
+    """
+    store = CatalogStore(db_path)
+    index = CatalogSearchIndex.load(index_path)
+    if index is None:
+        index = CatalogSearchIndex.build(store)
+    else:
+        index.sync(store)
+    store.subscribe(index.on_catalog_change(store))
+
+    changes = store.ingest_if_changed(csv_path)
+    if changes["inserted"] or changes["updated"] or changes["deleted"] or \
+            not os.path.exists(index_path):
+        index.save(index_path)
+    return store, index
+
+
+# -------------------------------------------------------------------------
+# MAIN EXECUTION
+# -------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    options = {"--discipline": None, "--grade": None, "--difficulty": None, "-k": "10"}
+    for flag in list(options):
+        if flag in args:
+            pos = args.index(flag)
+            options[flag] = args[pos + 1]
+            del args[pos:pos + 2]
+
+    if not args:
+        print(__doc__)
+        sys.exit(2)
+
+    start = time.perf_counter()
+    store, index = load_or_build()
+    loaded = time.perf_counter()
+    results = index.search(
+        " ".join(args),
+        k=int(options["-k"]),
+        discipline=options["--discipline"],
+        grade=int(options["--grade"]) if options["--grade"] else None,
+        difficulty=int(options["--difficulty"]) if options["--difficulty"] else None,
+    )
+    searched = time.perf_counter()
+
+    for rank, result in enumerate(results, 1):
+        print(f"{rank:2d}. [{result['score']:6.2f}] {result['discipline']} / {result['category']}"
+              f"  (topic: {result['topic']}; grades {result['grades']})")
+    print(f"\n# {len(index.forward)} categories indexed; load {(loaded - start) * 1000:.1f} ms, "
+          f"query {(searched - loaded) * 1000:.2f} ms")
+    store.close()
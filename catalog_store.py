@@ -0,0 +1,403 @@
+"""
+Incremental Catalog Store Keyed by mainId
+
+REQUIREMENTS:
+- Ingest a new CSV version and diff it against the stored one by `mainId`
+  using per-row hashes
+- Apply only inserted / updated / deleted rows to the in-memory indexes and
+  to the on-disk index (SQLite, one row per catalog row plus the derived
+  cell table)
+- Invalidate dependent data precisely: category sets, availability cells,
+  topic sets and translation maps, and tell subscribers exactly which keys
+  changed
+- Update cost proportional to the size of the change (the CSV still has to
+  be read once to hash it); ingest_if_changed() skips even that when the
+  CSV's mtime and size match the last ingest, as WarmCatalog does
+
+USAGE:
+    python3 catalog_store.py "Biblioteca de Alexandria - en.csv"
+    python3 catalog_store.py new_export.csv --db catalog_store.sqlite
+
+From code:
+    store = CatalogStore("catalog_store.sqlite")
+    changes = store.ingest(csv_path)
+    all_categories = store.categories_index()   # load_categories_from_csv shape
+"""
+
+import csv
+import hashlib
+import os
+import re
+import sqlite3
+import sys
+import time
+
+import generate_bilingual_requests as bilingual
+
+# -------------------------------------------------------------------------
+# CONFIGURATION
+# -------------------------------------------------------------------------
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CSV_PATH = os.path.join(SCRIPT_DIR, "Biblioteca de Alexandria - en.csv")
+DEFAULT_DB_PATH = os.path.join(SCRIPT_DIR, "catalog_store.sqlite")
+
+# The `query` column holds the Spanish catalog entry; its name is the
+# category translation the CSV carries
+SPANISH_NAME = re.compile(r"\bname:\s*'((?:[^'\\]|\\.)*)'")
+
+# Columns kept per row (besides mainId and the row hash)
+STORED_FIELDS = ("discipline", "topic", "category", "grade", "difficulty", "level",
+                 "description", "description_gepeto", "name_es")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS rows (
+    main_id TEXT PRIMARY KEY,
+    row_hash TEXT NOT NULL,
+    discipline TEXT,
+    topic TEXT,
+    category TEXT,
+    grade INTEGER,
+    difficulty INTEGER,
+    level INTEGER,
+    description TEXT,
+    description_gepeto TEXT,
+    name_es TEXT
+);
+CREATE TABLE IF NOT EXISTS cells (
+    discipline TEXT NOT NULL,
+    grade INTEGER NOT NULL,
+    difficulty INTEGER NOT NULL,
+    category TEXT NOT NULL,
+    refs INTEGER NOT NULL,
+    PRIMARY KEY (discipline, grade, difficulty, category)
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# -------------------------------------------------------------------------
+# HELPER FUNCTIONS
+# -------------------------------------------------------------------------
+
+def row_hash(row, fieldnames):
+    """Stable hash of every column of a CSV row."""
+    joined = "\x1f".join(row.get(name) or "" for name in fieldnames)
+    return hashlib.blake2b(joined.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def parse_row(row):
+    """Reduce a CSV row to the fields the store indexes."""
+    parsed = bilingual.parse_catalog_row(row)
+    grade, difficulty = (parsed[2], parsed[3]) if parsed else (None, None)
+    try:
+        level = int(row.get("level", "").strip())
+    except ValueError:
+        level = None
+    match = SPANISH_NAME.search(row.get("query") or "")
+    return {
+        "discipline": row.get("discipline", "").strip(),
+        "topic": row.get("topic", "").strip(),
+        "category": row.get("category", "").strip(),
+        "grade": grade,
+        "difficulty": difficulty,
+        "level": level,
+        "description": (row.get("description") or "").strip(),
+        "description_gepeto": (row.get("description gepeto") or "").strip(),
+        "name_es": match.group(1).replace("\\'", "'") if match else None,
+    }
+
+
+def _bump(counter, key, delta):
+    """Reference-count helper; returns True if key appeared or disappeared."""
+    before = counter.get(key, 0)
+    after = before + delta
+    if after:
+        counter[key] = after
+    else:
+        counter.pop(key, None)
+    return (before == 0) != (after == 0)
+
+
+def empty_changes():
+    return {
+        "inserted": [],
+        "updated": [],
+        "deleted": [],
+        "cells": set(),          # (discipline, grade, difficulty) whose category set changed
+        "disciplines": set(),    # disciplines whose category or topic set changed
+        "categories": set(),     # (discipline, category) added, removed or edited
+        "topics": set(),         # (discipline, topic) added or removed
+        "translations": set(),   # categories whose translation changed
+        "ref_cells": set(),      # cells whose reference counts changed (persistence)
+    }
+
+
+# -------------------------------------------------------------------------
+# CATALOG STORE
+# -------------------------------------------------------------------------
+
+class CatalogStore:
+    """
+    In-memory catalog indexes backed by a SQLite file.
+
+    Derived indexes are reference counts over rows, so removing a row only
+    drops a category from a cell when no other row still provides it.
+    """
+
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        self.db_path = db_path
+        self.db = sqlite3.connect(db_path or ":memory:")
+        self.db.executescript(SCHEMA)
+
+        self.rows = {}              # main_id -> (row_hash, parsed)
+        self.cell_refs = {}         # (disc, grade, diff) -> {category: refs}
+        self.category_refs = {}     # disc -> {category: refs}
+        self.topic_refs = {}        # disc -> {topic: refs}
+        self.translation_refs = {}  # category -> {Spanish name: refs}
+        self.translations = {}      # category -> Spanish name
+        self._subscribers = []
+        self._index_cache = None
+
+        for main_id, stored_hash, *values in self.db.execute(
+                f"SELECT main_id, row_hash, {', '.join(STORED_FIELDS)} FROM rows"):
+            parsed = dict(zip(STORED_FIELDS, values))
+            self.rows[main_id] = (stored_hash, parsed)
+            self._index_row(parsed, +1, empty_changes())
+
+    # ---------------------------------------------------------------------
+    # Subscriptions
+    # ---------------------------------------------------------------------
+
+    def subscribe(self, callback):
+        """Call callback(changes) after every ingest that changed something."""
+        self._subscribers.append(callback)
+
+    # ---------------------------------------------------------------------
+    # Index maintenance
+    # ---------------------------------------------------------------------
+
+    def _index_row(self, parsed, delta, changes):
+        disc = parsed["discipline"]
+        category = parsed["category"]
+        topic = parsed["topic"]
+        if not disc:
+            return
+
+        if category:
+            if _bump(self.category_refs.setdefault(disc, {}), category, delta):
+                changes["disciplines"].add(disc)
+            changes["categories"].add((disc, category))
+            if parsed["grade"] and parsed["difficulty"]:
+                cell = (disc, parsed["grade"], parsed["difficulty"])
+                changes["ref_cells"].add(cell)
+                if _bump(self.cell_refs.setdefault(cell, {}), category, delta):
+                    changes["cells"].add(cell)
+            if parsed["name_es"]:
+                self._index_translation(category, parsed["name_es"], delta, changes)
+
+        if topic and _bump(self.topic_refs.setdefault(disc, {}), topic, delta):
+            changes["disciplines"].add(disc)
+            changes["topics"].add((disc, topic))
+
+    def _index_translation(self, category, name_es, delta, changes):
+        """
+        The newest row's name wins; when the rows supplying the current name
+        are all removed, fall back to the name most rows still supply.
+        """
+        names = self.translation_refs.setdefault(category, {})
+        _bump(names, name_es, delta)
+        if not names:
+            del self.translation_refs[category]
+        current = self.translations.get(category)
+        if delta > 0:
+            name = name_es
+        elif current in names:
+            name = current
+        else:
+            name = max(names, key=names.get) if names else None
+        if name == current:
+            return
+        if name is None:
+            del self.translations[category]
+        else:
+            self.translations[category] = name
+        changes["translations"].add(category)
+
+    def _update_index_cache(self, changes):
+        """Patch the cached categories_index() for the changed cells only."""
+        if self._index_cache is None:
+            return
+        for disc, grade, difficulty in changes["cells"]:
+            names = self.cell_refs.get((disc, grade, difficulty))
+            grades = self._index_cache.setdefault(disc, {})
+            if names:
+                grades.setdefault(grade, {})[difficulty] = list(names)
+            else:
+                grades.get(grade, {}).pop(difficulty, None)
+                if not grades.get(grade):
+                    grades.pop(grade, None)
+
+    # ---------------------------------------------------------------------
+    # Ingest
+    # ---------------------------------------------------------------------
+
+    def ingest(self, csv_path):
+        """
+        Diff csv_path against the stored catalog by mainId and apply the
+        difference. Returns the change set (see empty_changes).
+        """
+        changes = empty_changes()
+        seen = set()
+        upserts = []
+
+        with open(csv_path, "r", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            fieldnames = reader.fieldnames
+            for row in reader:
+                main_id = (row.get("mainId") or "").strip()
+                if not main_id:
+                    continue
+                seen.add(main_id)
+                new_hash = row_hash(row, fieldnames)
+                current = self.rows.get(main_id)
+                if current is not None and current[0] == new_hash:
+                    continue
+
+                parsed = parse_row(row)
+                # Add the new version before removing the old one so refs to
+                # an unchanged category / cell never drop to zero in between
+                self._index_row(parsed, +1, changes)
+                if current is None:
+                    changes["inserted"].append(main_id)
+                else:
+                    changes["updated"].append(main_id)
+                    self._index_row(current[1], -1, changes)
+                self.rows[main_id] = (new_hash, parsed)
+                upserts.append((main_id, new_hash, *(parsed[name] for name in STORED_FIELDS)))
+
+        for main_id in [main_id for main_id in self.rows if main_id not in seen]:
+            changes["deleted"].append(main_id)
+            self._index_row(self.rows.pop(main_id)[1], -1, changes)
+
+        self._persist(upserts, changes)
+        self._update_index_cache(changes)
+
+        if changes["inserted"] or changes["updated"] or changes["deleted"]:
+            for callback in self._subscribers:
+                callback(changes)
+        return changes
+
+    def ingest_if_changed(self, csv_path):
+        """
+        ingest(csv_path) unless the file's (path, mtime, size) signature is
+        the one recorded by the last ingest; then return an empty change set
+        without reading it.
+        """
+        stat = os.stat(csv_path)
+        signature = f"{os.path.abspath(csv_path)}:{stat.st_mtime_ns}:{stat.st_size}"
+        row = self.db.execute("SELECT value FROM meta WHERE key = 'csv_signature'").fetchone()
+        if row is not None and row[0] == signature:
+            return empty_changes()
+        changes = self.ingest(csv_path)
+        with self.db:
+            self.db.execute("INSERT OR REPLACE INTO meta VALUES ('csv_signature', ?)", (signature,))
+        return changes
+
+    def _persist(self, upserts, changes):
+        with self.db:
+            if upserts:
+                self.db.executemany(
+                    f"INSERT OR REPLACE INTO rows (main_id, row_hash, {', '.join(STORED_FIELDS)}) "
+                    f"VALUES ({', '.join('?' * (len(STORED_FIELDS) + 2))})",
+                    upserts,
+                )
+            if changes["deleted"]:
+                self.db.executemany("DELETE FROM rows WHERE main_id = ?",
+                                    [(main_id,) for main_id in changes["deleted"]])
+
+            # Rewrite only the cells whose reference counts changed
+            for cell in changes["ref_cells"]:
+                self.db.execute("DELETE FROM cells WHERE discipline = ? AND grade = ? "
+                                "AND difficulty = ?", cell)
+                self.db.executemany(
+                    "INSERT INTO cells VALUES (?, ?, ?, ?, ?)",
+                    [(*cell, category, refs)
+                     for category, refs in self.cell_refs.get(cell, {}).items()],
+                )
+            self.db.execute("INSERT OR REPLACE INTO meta VALUES ('updated_at', ?)",
+                            (time.strftime("%Y-%m-%d %H:%M:%S"),))
+
+    # ---------------------------------------------------------------------
+    # Views
+    # ---------------------------------------------------------------------
+
+    def categories_index(self):
+        """
+        Dict of discipline -> grade -> difficulty -> [categories], the shape
+        load_categories_from_csv returns (including the Portuguese block).
+        Built once, then patched per ingest; every call returns a fresh
+        copy, so callers may modify it.
+        """
+        if self._index_cache is None:
+            index = {}
+            for (disc, grade, difficulty), names in self.cell_refs.items():
+                if names:
+                    index.setdefault(disc, {}).setdefault(grade, {})[difficulty] = list(names)
+            self._index_cache = index
+        index = {disc: {grade: {difficulty: list(names) for difficulty, names in cells.items()}
+                        for grade, cells in grades.items()}
+                 for disc, grades in self._index_cache.items()}
+        index["Portuguese"] = {
+            grade: {diff: bilingual.PORTUGUESE_CATEGORIES.copy()
+                    for diff in bilingual.DIFFICULTY_LEVELS}
+            for grade in bilingual.AVAILABLE_GRADES
+        }
+        return index
+
+    def cell(self, discipline, grade, difficulty):
+        return list(self.cell_refs.get((discipline, grade, difficulty), ()))
+
+    def categories(self, discipline):
+        return list(self.category_refs.get(discipline, ()))
+
+    def topics(self, discipline):
+        return list(self.topic_refs.get(discipline, ()))
+
+    def translate(self, category):
+        """Spanish name of a category, if the catalog has one."""
+        return self.translations.get(category)
+
+    def close(self):
+        self.db.close()
+
+
+# -------------------------------------------------------------------------
+# MAIN EXECUTION
+# -------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    db_path = DEFAULT_DB_PATH
+    if "--db" in args:
+        pos = args.index("--db")
+        db_path = args[pos + 1]
+        del args[pos:pos + 2]
+    csv_path = args[0] if args else DEFAULT_CSV_PATH
+
+    start = time.perf_counter()
+    store = CatalogStore(db_path)
+    opened = time.perf_counter()
+    changes = store.ingest(csv_path)
+    done = time.perf_counter()
+
+    print(f"# Catalog store: {db_path}")
+    print(f"# Rows stored: {len(store.rows)}")
+    print(f"# Inserted: {len(changes['inserted'])}, updated: {len(changes['updated'])}, "
+          f"deleted: {len(changes['deleted'])}")
+    print(f"# Cells changed: {len(changes['cells'])}, disciplines changed: "
+          f"{len(changes['disciplines'])}, translations changed: {len(changes['translations'])}")
+    print(f"# Open: {(opened - start) * 1000:.1f} ms, ingest: {(done - opened) * 1000:.1f} ms")
+    store.close()
@@ -0,0 +1,297 @@
+"""
+Category Clustering for Diversity-Aware Sampling
+
+REQUIREMENTS:
+- Offline stage: vectorize category names and descriptions (sparse TF-IDF)
+  and cluster each discipline's categories (spherical k-means)
+- Cluster ids cached next to the catalog, keyed by the CSV SHA-256, and
+  rebuilt only when the catalog changes
+- The request generator spreads draws across clusters, so one batch does
+  not get three "Genetics: ..." categories
+- Seconds for 100k categories
+
+NumPy is not a dependency of this repo, so vectors are plain dicts
+(term -> weight) and centroids are kept sparse: each holds only its
+"centroid_terms" heaviest terms, and documents are scored against all
+centroids at once through a term -> centroid inverted index.
+
+USAGE:
+    python3 category_clustering.py            # build (or reuse) and report
+    python3 category_clustering.py --force    # rebuild the cache
+"""
+
+import csv
+import json
+import math
+import os
+import random
+import sys
+from collections import Counter
+
+from build_catalog_constants import csv_sha256
+from catalog_search import analyze, bilingual_discipline
+import generate_bilingual_requests as bilingual
+
+# -------------------------------------------------------------------------
+# CONFIGURATION
+# -------------------------------------------------------------------------
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CSV_PATH = os.path.join(SCRIPT_DIR, "Biblioteca de Alexandria - en.csv")
+DEFAULT_CACHE_PATH = os.path.join(SCRIPT_DIR, "category_clusters.json")
+
+CLUSTER_PARAMS = {
+    "name_weight": 2.0,           # category name terms count double
+    "categories_per_cluster": 8,  # k = categories / this
+    "max_clusters": 64,           # per discipline
+    "centroid_terms": 40,
+    "max_iterations": 15,
+    "update_sample": 5000,        # centroids are re-estimated from at most this many docs
+    "seed": 42,
+}
+
+# -------------------------------------------------------------------------
+# VECTORIZATION
+# -------------------------------------------------------------------------
+
+def read_category_texts(csv_path):
+    """Return discipline -> category -> Counter of terms (name weighted up)."""
+    name_weight = CLUSTER_PARAMS["name_weight"]
+    texts = {}
+    seen = set()
+    with open(csv_path, "r", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            disc = row.get("discipline", "").strip()
+            category = row.get("category", "").strip()
+            if not disc or not category:
+                continue
+            terms = texts.setdefault(disc, {}).get(category)
+            if terms is None:
+                terms = texts[disc][category] = Counter()
+                for term in analyze(category):
+                    terms[term] += name_weight
+            for field in ("description", "description gepeto"):
+                text = (row.get(field) or "").strip()
+                if text and (disc, category, text) not in seen:
+                    seen.add((disc, category, text))
+                    terms.update(analyze(text))
+    return texts
+
+
+def tfidf_vectors(term_counts):
+    """Sparse, L2-normalized TF-IDF vectors for one discipline's categories."""
+    doc_count = len(term_counts)
+    df = Counter()
+    for terms in term_counts.values():
+        df.update(terms.keys())
+    idf = {term: math.log((1 + doc_count) / (1 + n)) + 1 for term, n in df.items()}
+
+    vectors = {}
+    for name, terms in term_counts.items():
+        vector = {term: (1 + math.log(tf)) * idf[term] for term, tf in terms.items() if tf > 0}
+        vectors[name] = _normalized(vector)
+    return vectors
+
+
+def _normalized(vector):
+    norm = math.sqrt(sum(w * w for w in vector.values()))
+    return {t: w / norm for t, w in vector.items()} if norm else vector
+
+
+def _dot(a, b):
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(w * b.get(t, 0.0) for t, w in a.items())
+
+
+# -------------------------------------------------------------------------
+# SPHERICAL K-MEANS
+# -------------------------------------------------------------------------
+
+def _seed_centroids(vectors, k, rng):
+    """k-means++ seeding (cosine distance) on a sample of the documents."""
+    sample = vectors if len(vectors) <= 20 * k else rng.sample(vectors, 20 * k)
+    centroids = [rng.choice(sample)]
+    best = [_dot(vector, centroids[0]) for vector in sample]
+    while len(centroids) < k:
+        distances = [max(0.0, 1.0 - sim) for sim in best]
+        total = sum(distances)
+        if total <= 0:
+            break
+        pick = rng.random() * total
+        for pos, distance in enumerate(distances):
+            pick -= distance
+            if pick <= 0:
+                break
+        centroids.append(sample[pos])
+        best = [max(sim, _dot(vector, sample[pos])) for sim, vector in zip(best, sample)]
+    return centroids
+
+
+def _assign(vectors, centroids, previous=None):
+    """Nearest centroid per vector via a term -> [(centroid, weight)] index."""
+    index = {}
+    for cid, centroid in enumerate(centroids):
+        for term, weight in centroid.items():
+            index.setdefault(term, []).append((cid, weight))
+
+    zeros = [0.0] * len(centroids)
+    labels = []
+    for pos, vector in enumerate(vectors):
+        scores = zeros[:]
+        for term, weight in vector.items():
+            postings = index.get(term)
+            if postings:
+                for cid, centroid_weight in postings:
+                    scores[cid] += weight * centroid_weight
+        best = max(scores)
+        if best > 0:
+            labels.append(scores.index(best))
+        else:
+            labels.append(previous[pos] if previous else 0)
+    return labels
+
+
+def _centroid(members, max_terms):
+    total = {}
+    for vector in members:
+        for term, weight in vector.items():
+            total[term] = total.get(term, 0.0) + weight
+    if len(total) > max_terms:
+        total = dict(sorted(total.items(), key=lambda item: -item[1])[:max_terms])
+    return _normalized(total)
+
+
+def spherical_kmeans(vectors, k, rng):
+    """
+    Cluster unit vectors by cosine similarity. Centroids are re-estimated
+    from a random sample of at most update_sample documents per iteration
+    (every document for catalogs of normal size), and the final assignment
+    covers all documents.
+    """
+    if len(vectors) <= k:
+        return list(range(len(vectors)))
+
+    max_terms = CLUSTER_PARAMS["centroid_terms"]
+    update_sample = CLUSTER_PARAMS["update_sample"]
+    centroids = [_centroid([c], max_terms) for c in _seed_centroids(vectors, k, rng)]
+
+    positions = list(range(len(vectors)))
+    labels = None
+    for _ in range(CLUSTER_PARAMS["max_iterations"]):
+        if len(vectors) > update_sample:
+            sample = rng.sample(positions, update_sample)
+            sample_labels = _assign([vectors[pos] for pos in sample], centroids)
+        else:
+            sample = positions
+            sample_labels = _assign(vectors, centroids, labels)
+            if sample_labels == labels:
+                break
+            labels = sample_labels
+
+        members = [[] for _ in centroids]
+        for pos, label in zip(sample, sample_labels):
+            members[label].append(vectors[pos])
+        centroids = [_centroid(group, max_terms) if group
+                     else _centroid([vectors[rng.choice(sample)]], max_terms)
+                     for group in members]
+
+    return _assign(vectors, centroids, labels)
+
+
+def cluster_discipline(term_counts, rng):
+    """Return category -> cluster id for one discipline."""
+    names = sorted(term_counts)
+    vectors = tfidf_vectors(term_counts)
+    k = max(1, min(CLUSTER_PARAMS["max_clusters"],
+                   round(len(names) / CLUSTER_PARAMS["categories_per_cluster"])))
+    labels = spherical_kmeans([vectors[name] for name in names], k, rng)
+    return dict(zip(names, labels))
+
+
+# -------------------------------------------------------------------------
+# CACHE
+# -------------------------------------------------------------------------
+
+def build_clusters(csv_path=DEFAULT_CSV_PATH):
+    """Return discipline -> category -> cluster id for the whole catalog."""
+    rng = random.Random(CLUSTER_PARAMS["seed"])
+    return {disc: cluster_discipline(term_counts, rng)
+            for disc, term_counts in sorted(read_category_texts(csv_path).items())}
+
+
+def load_clusters(csv_path=DEFAULT_CSV_PATH, cache_path=DEFAULT_CACHE_PATH, force=False):
+    """
+    Cluster ids for the catalog, from the cache while the CSV hash and
+    parameters match; otherwise rebuilt and written back.
+    """
+    digest = csv_sha256(csv_path)
+    if not force:
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached.get("csv_sha256") == digest and cached.get("params") == CLUSTER_PARAMS:
+                return cached["clusters"]
+        except (FileNotFoundError, ValueError):
+            pass
+
+    clusters = build_clusters(csv_path)
+    tmp_path = cache_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"csv_sha256": digest, "params": CLUSTER_PARAMS, "clusters": clusters},
+                  f, ensure_ascii=False)
+    os.replace(tmp_path, cache_path)
+    return clusters
+
+
+def cluster_members(clusters):
+    """Invert category -> id into id -> sorted [categories]."""
+    members = {}
+    for name, cid in clusters.items():
+        members.setdefault(cid, []).append(name)
+    return {cid: sorted(names) for cid, names in sorted(members.items())}
+
+
+def repeated_cluster_draws(requests, clusters):
+    """Count requests whose category shares a cluster with an earlier one of the same discipline."""
+    seen = set()
+    repeats = 0
+    for req in requests:
+        disc = bilingual_discipline(req["discipline"])
+        key = (disc, clusters.get(disc, {}).get(req["category"]))
+        if key in seen:
+            repeats += 1
+        seen.add(key)
+    return repeats
+
+
+# -------------------------------------------------------------------------
+# MAIN EXECUTION
+# -------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    import time
+
+    start = time.perf_counter()
+    clusters = load_clusters(force="--force" in sys.argv)
+    elapsed = time.perf_counter() - start
+
+    for disc, mapping in clusters.items():
+        print(f"# {disc}: {len(mapping)} categories in {len(set(mapping.values()))} clusters")
+    print(f"# Clusters ready in {elapsed * 1000:.0f} ms (cache: {DEFAULT_CACHE_PATH})")
+    print()
+
+    for cid, names in list(cluster_members(clusters["Biology"]).items())[:5]:
+        print(f"# Biology cluster {cid}: {', '.join(names[:6])}{' ...' if len(names) > 6 else ''}")
+    print()
+
+    all_categories = bilingual.load_categories_from_csv(DEFAULT_CSV_PATH)
+    for label, cluster_arg in (("uniform", None), ("cluster-spread", clusters)):
+        repeats = 0
+        for seed in range(50):
+            random.seed(seed)
+            requests = bilingual.generate_all_requests(
+                DEFAULT_CSV_PATH, questions_per_discipline=10,
+                all_categories=all_categories, clusters=cluster_arg)
+            repeats += repeated_cluster_draws(requests, clusters)
+        print(f"# {label}: {repeats / 50:.1f} repeated-cluster draws per campaign")
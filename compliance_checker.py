@@ -0,0 +1,311 @@
+"""
+Automated List-Compliance Checker (language, count, question type)
+
+REQUIREMENTS:
+- Stream list_of_questions files (corpus_stream.py)
+- Detect each question's language offline with a character-trigram model
+  (language_model.json, trained from the individual-question corpora and
+  the catalog, never from the list corpora it checks)
+- Count questions and types against request_context
+- Write the three compliance flags list-evaluator.js asks reviewers for:
+  compliance_correct_language, compliance_correct_count, compliance_correct_type
+- Spread the work over all cores
+
+Rules follow the rubric in list-evaluator.js:
+- language: every question is in the locale's language
+- count: total questions == num_mcq_requested + num_discursive_requested
+- type: MCQ only -> all MCQ; open-ended only -> all open-ended;
+  both -> at least one of each
+
+USAGE:
+    python3 compliance_checker.py list_of_questions_to_test_v3.json -o checked.json
+    python3 compliance_checker.py lists.jsonl -o passing.json --only-passing --workers 8
+    python3 compliance_checker.py --train        # rebuild language_model.json
+"""
+
+import json
+import math
+import os
+import re
+import sys
+import time
+from collections import Counter
+from itertools import repeat
+from multiprocessing import Pool
+from operator import add
+
+from corpus_stream import iter_question_lists, iter_questions, question_type, write_corpus
+
+# -------------------------------------------------------------------------
+# CONFIGURATION
+# -------------------------------------------------------------------------
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+MODEL_PATH = os.path.join(SCRIPT_DIR, "language_model.json")
+CSV_PATH = os.path.join(SCRIPT_DIR, "Biblioteca de Alexandria - en.csv")
+
+# Labeled by their request_context.locale. The list_of_questions corpora are
+# what this script checks, so they are kept out of training (their own
+# locale would be the label being verified); these share no question with them
+TRAINING_CORPORA = [
+    "individual_questions_to_test_Jan26.json",
+    "individual_questions_to_test_v3.json",
+]
+
+LOCALE_LANGUAGES = {"en_US": "en", "pt_BR": "pt"}
+
+COMPLIANCE_FLAGS = ("compliance_correct_language", "compliance_correct_count",
+                    "compliance_correct_type")
+
+# Language-teaching lists quote the target language, so they are not used for training
+LANGUAGE_SUBJECTS = {"English", "Inglês", "Spanish", "Espanhol"}
+
+NGRAM = 3                  # ngrams() builds trigrams
+MODEL_NGRAMS = 2500        # most frequent trigrams kept per language
+MAX_CHARS = 400            # characters of each question scored
+MIN_NGRAMS = 12            # shorter texts are not judged
+UNCERTAIN_MARGIN = 0.15    # mean log-prob gap below which the call is "uncertain"
+
+MATH_SPAN = re.compile(r"\{\{MATH\}\}.*?\{\{/MATH\}\}", re.DOTALL)
+NON_LETTERS = re.compile(r"[^a-zà-öø-ÿ]+")
+
+# -------------------------------------------------------------------------
+# LANGUAGE MODEL
+# -------------------------------------------------------------------------
+
+def clean_text(text):
+    """Drop math spans, lower-case and keep letters only (accents included)."""
+    text = MATH_SPAN.sub(" ", text or "")
+    return " " + NON_LETTERS.sub(" ", text.lower()).strip() + " "
+
+
+def ngrams(text):
+    """Character trigrams of text, built with C-level maps (no Python loop)."""
+    return list(map(add, map(add, text, text[1:]), text[2:]))
+
+
+def question_text(question):
+    return f"{question.get('question_statement') or ''} {question.get('question_solution') or ''}"
+
+
+def training_texts():
+    """Yield (language, text) from TRAINING_CORPORA and the catalog CSV and translations."""
+    for name in TRAINING_CORPORA:
+        path = os.path.join(SCRIPT_DIR, name)
+        if not os.path.exists(path):
+            continue
+        for question in iter_questions(path):
+            context = question.get("request_context") or {}
+            language = LOCALE_LANGUAGES.get(context.get("locale"))
+            if language and context.get("discipline") not in LANGUAGE_SUBJECTS:
+                yield language, question_text(question)
+
+    import csv
+    from catalog_store import SPANISH_NAME
+    with open(CSV_PATH, "r", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            yield "en", f"{row.get('category', '')} {row.get('description', '')}"
+            match = SPANISH_NAME.search(row.get("query") or "")
+            if match:
+                yield "es", match.group(1)
+
+    from generate_bilingual_requests import CATEGORY_TRANSLATIONS, DISCIPLINE_TRANSLATIONS
+    for translations in (CATEGORY_TRANSLATIONS, DISCIPLINE_TRANSLATIONS):
+        for english, portuguese in translations.items():
+            yield "en", english
+            yield "pt", portuguese
+
+
+def train_model(path=MODEL_PATH):
+    """Count trigrams per language and write the top MODEL_NGRAMS as log-probabilities."""
+    counts = {}
+    for language, text in training_texts():
+        counts.setdefault(language, Counter()).update(ngrams(clean_text(text)))
+
+    model = {"ngram": NGRAM, "languages": {}}
+    for language, counter in sorted(counts.items()):
+        total = sum(counter.values())
+        vocabulary = len(counter)
+        top = counter.most_common(MODEL_NGRAMS)
+        # Add-one smoothing; anything outside the top list gets the unseen mass
+        denominator = total + vocabulary
+        model["languages"][language] = {
+            "unseen": round(math.log(1 / denominator), 3),
+            "logprobs": {gram: round(math.log((n + 1) / denominator), 3) for gram, n in top},
+        }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(model, f, ensure_ascii=False, separators=(",", ":"))
+    return model
+
+
+def load_model(path=MODEL_PATH):
+    with open(path, "r", encoding="utf-8") as f:
+        model = json.load(f)
+    return {language: (entry["logprobs"], entry["unseen"])
+            for language, entry in model["languages"].items()}
+
+
+def detect_language(text, model):
+    """
+    Return (language, margin, trigrams scored). margin is the mean per-trigram
+    log-probability gap between the best and second-best language.
+    """
+    grams = ngrams(clean_text(text[:MAX_CHARS]))
+    total = len(grams)
+    if not total:
+        return None, 0.0, 0
+    scores = []
+    for language, (logprobs, unseen) in model.items():
+        scores.append((sum(map(logprobs.get, grams, repeat(unseen))) / total, language))
+    scores.sort(reverse=True)
+    margin = scores[0][0] - scores[1][0] if len(scores) > 1 else math.inf
+    return scores[0][1], margin, total
+
+
+# -------------------------------------------------------------------------
+# COMPLIANCE
+# -------------------------------------------------------------------------
+
+_model = None
+
+
+def _init_worker(model_path):
+    global _model
+    _model = load_model(model_path)
+
+
+def check_list(question_list, model=None):
+    """Return the compliance record for one list."""
+    model = model or _model
+    context = question_list.get("request_context") or {}
+    questions = question_list.get("questions") or []
+    expected = LOCALE_LANGUAGES.get(context.get("locale"))
+    num_mcq_requested = context.get("num_mcq_requested") or 0
+    num_discursive_requested = context.get("num_discursive_requested") or 0
+
+    wrong_language = []
+    for position, question in enumerate(questions):
+        language, margin, scored = detect_language(question_text(question), model)
+        if scored < MIN_NGRAMS or margin < UNCERTAIN_MARGIN:
+            continue
+        if language != expected:
+            wrong_language.append({"position": position, "detected": language,
+                                   "margin": round(margin, 3)})
+
+    types = Counter(question_type(question) for question in questions)
+    if num_mcq_requested and num_discursive_requested:
+        type_ok = types["MCQ"] > 0 and types["discursive"] > 0
+    elif num_mcq_requested:
+        type_ok = bool(questions) and types["discursive"] == 0
+    else:
+        type_ok = bool(questions) and types["MCQ"] == 0
+
+    return {
+        "list_id": question_list.get("list_id"),
+        "compliance_correct_language": int(bool(questions) and expected is not None
+                                           and not wrong_language),
+        "compliance_correct_count": int(len(questions) == num_mcq_requested + num_discursive_requested),
+        "compliance_correct_type": int(type_ok),
+        "num_mcq": types["MCQ"],
+        "num_discursive": types["discursive"],
+        "wrong_language": wrong_language,
+    }
+
+
+def _check_with_list(question_list):
+    return question_list, check_list(question_list)
+
+
+def check_corpus(path, workers=None, header=None, chunksize=64):
+    """
+    Yield (question_list, compliance) for every list of a corpus, in order.
+    Corpus header fields are stored in header (if given) as they are read.
+    """
+    lists = iter_question_lists(path, header)
+    if workers == 1:
+        _init_worker(MODEL_PATH)
+        for question_list in lists:
+            yield _check_with_list(question_list)
+        return
+    with Pool(workers, initializer=_init_worker, initargs=(MODEL_PATH,)) as pool:
+        yield from pool.imap(_check_with_list, lists, chunksize)
+
+
+def all_passed(compliance):
+    return all(compliance[flag] for flag in COMPLIANCE_FLAGS)
+
+
+def print_failure(question_list, compliance):
+    context = question_list.get("request_context") or {}
+    failed = [flag.replace("compliance_correct_", "") for flag in COMPLIANCE_FLAGS
+              if not compliance[flag]]
+    line = (f"list {compliance['list_id']}: {context.get('discipline')} {context.get('locale')} "
+            f"failed {', '.join(failed)} "
+            f"(MCQ {compliance['num_mcq']}/{context.get('num_mcq_requested')}, "
+            f"discursive {compliance['num_discursive']}/{context.get('num_discursive_requested')})")
+    if compliance["wrong_language"]:
+        line += f" wrong language at {[w['position'] for w in compliance['wrong_language']]}"
+    print(line)
+
+
+# -------------------------------------------------------------------------
+# MAIN EXECUTION
+# -------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    if "--train" in args:
+        model = train_model()
+        sizes = {lang: len(entry["logprobs"]) for lang, entry in model["languages"].items()}
+        print(f"# Wrote {MODEL_PATH} ({os.path.getsize(MODEL_PATH) // 1024} KB, trigrams {sizes})")
+        sys.exit(0)
+
+    options = {"-o": None, "--workers": None}
+    for flag in list(options):
+        if flag in args:
+            pos = args.index(flag)
+            options[flag] = args[pos + 1]
+            del args[pos:pos + 2]
+    only_passing = "--only-passing" in args
+    if only_passing:
+        args.remove("--only-passing")
+    if len(args) != 1:
+        print(__doc__)
+        sys.exit(2)
+
+    workers = int(options["--workers"]) if options["--workers"] else None
+    start = time.perf_counter()
+    totals = Counter()
+    header = {}
+
+    def checked_lists():
+        for question_list, compliance in check_corpus(args[0], workers, header):
+            totals["lists"] += 1
+            for flag in COMPLIANCE_FLAGS:
+                totals[flag] += compliance[flag]
+            passed = all_passed(compliance)
+            totals["passed"] += passed
+            if not passed and totals["lists"] - totals["passed"] <= 20:
+                print_failure(question_list, compliance)
+            if passed or not only_passing:
+                yield dict(question_list, compliance=compliance)
+
+    if options["-o"]:
+        write_corpus(options["-o"], header, checked_lists(), trailer=lambda: {
+            "compliance": {"checked_lists": totals["lists"], "passing_lists": totals["passed"]}})
+    else:
+        for _ in checked_lists():
+            pass
+
+    elapsed = time.perf_counter() - start
+
+    print(f"\n# =========================================================================")
+    print(f"# COMPLIANCE SUMMARY")
+    print(f"# =========================================================================")
+    print(f"# Lists checked: {totals['lists']}")
+    for flag in COMPLIANCE_FLAGS:
+        print(f"# {flag}: {totals[flag]}")
+    print(f"# Passing all three: {totals['passed']}")
+    print(f"# {totals['lists'] / elapsed * 60:,.0f} lists per minute")
+    if options["-o"]:
+        print(f"# Written to {options['-o']}")
@@ -0,0 +1,331 @@
+"""
+Adaptive Concurrency Controller for the Generation Backend
+
+REQUIREMENTS:
+- Raise and lower the number of in-flight generation calls from observed
+  latency and error rates (latency gradient with a sqrt(limit) probing
+  step, multiplicative decrease on errors / throttling)
+- Never exceed a hard ceiling
+- Expose the current window and the latency percentiles it observes
+- Deterministically testable: virtual clock + simulated backend with
+  injected slowdowns and throttling
+
+USAGE:
+    python3 concurrency_controller.py                 # adaptive vs fixed, simulated
+    python3 concurrency_controller.py --fixed 16      # compare against another fixed window
+
+In real runs wrap each backend call in `with controller.slot():` (or use
+run_concurrently); the simulation drives on_complete directly.
+"""
+
+import heapq
+import math
+import random
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+# -------------------------------------------------------------------------
+# CONFIGURATION
+# -------------------------------------------------------------------------
+
+CONTROLLER_DEFAULTS = {
+    "initial_limit": 4,
+    "min_limit": 1,
+    "max_limit": 32,           # hard ceiling
+    "tolerance": 1.5,          # latency up to tolerance * baseline counts as healthy
+    "smoothing": 0.5,          # fraction of the gradient step taken per window
+    "backoff": 0.7,            # multiplicative decrease on error / throttle
+    "baseline_samples": 100,   # span of the long-term latency average
+    "percentile_samples": 1024,
+}
+
+# -------------------------------------------------------------------------
+# CONTROLLER
+# -------------------------------------------------------------------------
+
+class AdaptiveConcurrencyController:
+    """
+    Concurrency limit driven by completions (gradient style, after
+    Netflix's concurrency-limits Gradient2, with AIMD-style backoff).
+
+    - Every success moves the limit toward
+      limit * gradient + sqrt(limit), where
+      gradient = clamp(tolerance * baseline / latency, 0.5, 1): healthy
+      calls grow the window by about sqrt(limit) and queueing shrinks it.
+    - Error or throttle: limit *= backoff, at most once per baseline latency
+      so one burst of failures counts as one congestion signal.
+
+    baseline is a long exponential average of latency (span
+    baseline_samples), so a backend that gets slower for everyone is
+    absorbed after a while instead of collapsing the window.
+    """
+
+    def __init__(self, clock=time.monotonic, **options):
+        unknown = set(options) - set(CONTROLLER_DEFAULTS)
+        if unknown:
+            raise ValueError(f"Unknown controller option(s): {', '.join(sorted(unknown))}")
+        self.options = dict(CONTROLLER_DEFAULTS, **options)
+        if self.options["min_limit"] > self.options["max_limit"]:
+            raise ValueError("min_limit must not exceed max_limit")
+
+        self.clock = clock
+        self.limit = float(min(max(self.options["initial_limit"], self.options["min_limit"]),
+                               self.options["max_limit"]))
+        self.in_flight = 0
+        self.long_latency = None
+        self._long_alpha = 2.0 / (self.options["baseline_samples"] + 1)
+        self._latencies = deque(maxlen=self.options["percentile_samples"])
+        self._last_decrease = -math.inf
+        self._condition = threading.Condition()
+        self.stats = {"completed": 0, "errors": 0, "decreases": 0, "peak_window": self.window}
+
+    # ---------------------------------------------------------------------
+    # Observed state
+    # ---------------------------------------------------------------------
+
+    @property
+    def window(self):
+        """Current number of calls allowed in flight."""
+        return max(self.options["min_limit"], int(self.limit))
+
+    def percentiles(self, points=(50, 95, 99)):
+        """Latency percentiles (nearest rank) over the recent completions."""
+        ordered = sorted(self._latencies)
+        if not ordered:
+            return {f"p{p}": None for p in points}
+        return {f"p{p}": ordered[min(len(ordered) - 1, max(0, math.ceil(p / 100 * len(ordered)) - 1))]
+                for p in points}
+
+    def snapshot(self):
+        return {"window": self.window, "limit": round(self.limit, 3), "in_flight": self.in_flight,
+                "baseline": self.long_latency, **self.percentiles(), **self.stats}
+
+    # ---------------------------------------------------------------------
+    # Admission
+    # ---------------------------------------------------------------------
+
+    def try_acquire(self):
+        with self._condition:
+            if self.in_flight >= self.window:
+                return False
+            self.in_flight += 1
+            return True
+
+    def acquire(self, timeout=None):
+        """Block until a slot is free; returns False on timeout."""
+        with self._condition:
+            if not self._condition.wait_for(lambda: self.in_flight < self.window, timeout):
+                return False
+            self.in_flight += 1
+            return True
+
+    def on_complete(self, latency, error=False):
+        """Release a slot and feed one observation to the limit."""
+        with self._condition:
+            self.in_flight -= 1
+            self._update(latency, error)
+            self._condition.notify_all()
+
+    @contextmanager
+    def slot(self):
+        """Acquire a slot, time the body, and report errors raised inside it."""
+        self.acquire()
+        start = self.clock()
+        try:
+            yield
+        except Exception:
+            self.on_complete(self.clock() - start, error=True)
+            raise
+        self.on_complete(self.clock() - start)
+
+    # ---------------------------------------------------------------------
+    # Limit update
+    # ---------------------------------------------------------------------
+
+    def _update(self, latency, error):
+        options = self.options
+        self.stats["completed"] += 1
+
+        if error:
+            self.stats["errors"] += 1
+            now = self.clock()
+            if now - self._last_decrease >= (self.long_latency or 0.0):
+                self._last_decrease = now
+                self.limit *= options["backoff"]
+                self.stats["decreases"] += 1
+        else:
+            self._latencies.append(latency)
+            if self.long_latency is None:
+                self.long_latency = latency
+            else:
+                self.long_latency += self._long_alpha * (latency - self.long_latency)
+                # Let the baseline recover quickly once the backend is fast again
+                if self.long_latency > 2 * latency:
+                    self.long_latency *= 0.95
+
+            gradient = min(1.0, max(0.5, options["tolerance"] * self.long_latency / latency))
+            target = self.limit * gradient + math.sqrt(self.limit)
+            # One completion is 1 / limit of a window's worth of evidence
+            self.limit += options["smoothing"] * (target - self.limit) / self.limit
+
+        self.limit = min(max(self.limit, options["min_limit"]), options["max_limit"])
+        self.stats["peak_window"] = max(self.stats["peak_window"], self.window)
+
+
+def run_concurrently(items, call, controller):
+    """
+    Run call(item) for every item with in-flight calls bounded by the
+    controller's window. Returns [(item, result or exception)] in item order.
+    """
+    def guarded(item):
+        try:
+            with controller.slot():
+                return call(item)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=controller.options["max_limit"]) as pool:
+        return list(zip(items, pool.map(guarded, items)))
+
+
+# -------------------------------------------------------------------------
+# SIMULATION
+# -------------------------------------------------------------------------
+
+class VirtualClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class SimulatedBackend:
+    """
+    Generation backend model with a fixed capacity.
+
+    Latency grows with in-flight calls beyond capacity (queueing); past
+    throttle_at in-flight calls each new call fails fast with
+    throttle_probability. slowdowns is a list of (start, end, factor)
+    windows of virtual time during which every call is factor times slower.
+    """
+
+    def __init__(self, capacity=12, base_latency=2.0, throttle_at=20, throttle_probability=0.5,
+                 jitter=0.1, slowdowns=(), seed=0):
+        self.capacity = capacity
+        self.base_latency = base_latency
+        self.throttle_at = throttle_at
+        self.throttle_probability = throttle_probability
+        self.jitter = jitter
+        self.slowdowns = list(slowdowns)
+        self.rng = random.Random(seed)
+
+    def call(self, now, in_flight):
+        """Return (latency, error) for a call started at now with in_flight calls (itself included)."""
+        if in_flight > self.throttle_at and self.rng.random() < self.throttle_probability:
+            return 0.1 * self.base_latency, True
+        factor = 1.0
+        for start, end, slowdown in self.slowdowns:
+            if start <= now < end:
+                factor *= slowdown
+        queueing = 1.0 + max(0, in_flight - self.capacity) / self.capacity
+        noise = self.rng.lognormvariate(0.0, self.jitter)
+        return self.base_latency * factor * queueing * noise, False
+
+
+def simulate(backend, total_calls, controller=None, fixed_window=None, max_attempts=5):
+    """
+    Discrete-event run of total_calls generation calls; failed calls are
+    retried up to max_attempts. Exactly one of controller / fixed_window.
+
+    Returns a dict with makespan, failures, lost calls and the window trace.
+    """
+    if (controller is None) == (fixed_window is None):
+        raise ValueError("Pass exactly one of controller or fixed_window")
+
+    clock = controller.clock if controller else VirtualClock()
+    pending = deque((call_id, 1) for call_id in range(total_calls))
+    events = []  # (finish_time, seq, call_id, attempt, latency, error)
+    seq = 0
+    in_flight = 0
+    failures = 0
+    lost = 0
+    trace = []
+
+    while pending or events:
+        while pending:
+            if controller:
+                if not controller.try_acquire():
+                    break
+                in_flight = controller.in_flight
+            elif in_flight < fixed_window:
+                in_flight += 1
+            else:
+                break
+            call_id, attempt = pending.popleft()
+            latency, error = backend.call(clock.now, in_flight)
+            seq += 1
+            heapq.heappush(events, (clock.now + latency, seq, call_id, attempt, latency, error))
+
+        finish, _, call_id, attempt, latency, error = heapq.heappop(events)
+        clock.now = finish
+        if controller:
+            controller.on_complete(latency, error)
+            in_flight = controller.in_flight
+        else:
+            in_flight -= 1
+        if error:
+            failures += 1
+            if attempt < max_attempts:
+                pending.append((call_id, attempt + 1))
+            else:
+                lost += 1
+        trace.append((round(clock.now, 3), controller.window if controller else fixed_window))
+
+    return {"makespan": clock.now, "failures": failures, "lost": lost, "trace": trace}
+
+
+def default_scenario(seed=0):
+    """Backend with a 4x slowdown between t=100 and t=160."""
+    return SimulatedBackend(seed=seed, slowdowns=[(100.0, 160.0, 4.0)])
+
+
+# -------------------------------------------------------------------------
+# MAIN EXECUTION
+# -------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    TOTAL_CALLS = 1000
+    fixed_windows = [4, 32]
+    if "--fixed" in sys.argv:
+        fixed_windows = [int(sys.argv[sys.argv.index("--fixed") + 1])]
+
+    print(f"# Simulated backend: capacity 12, throttling above 20 in flight, "
+          f"4x slowdown for t in [100, 160)")
+    print(f"# {TOTAL_CALLS} generation calls, failed calls retried up to 5 times")
+    print()
+
+    for window in fixed_windows:
+        result = simulate(default_scenario(), TOTAL_CALLS, fixed_window=window)
+        print(f"# fixed window {window:2d}: makespan {result['makespan']:7.1f}s, "
+              f"failures {result['failures']:4d}, lost {result['lost']}")
+
+    controller = AdaptiveConcurrencyController(clock=VirtualClock(), max_limit=32)
+    result = simulate(default_scenario(), TOTAL_CALLS, controller=controller)
+    snapshot = controller.snapshot()
+    print(f"# adaptive       : makespan {result['makespan']:7.1f}s, "
+          f"failures {result['failures']:4d}, lost {result['lost']}")
+    print(f"#   final window {snapshot['window']}, peak {snapshot['peak_window']}, "
+          f"decreases {snapshot['decreases']}")
+    print(f"#   latency p50 {snapshot['p50']:.2f}s, p95 {snapshot['p95']:.2f}s, "
+          f"p99 {snapshot['p99']:.2f}s (baseline {snapshot['baseline']:.2f}s)")
+
+    print()
+    print("# Window over time (adaptive)")
+    step = max(1, len(result["trace"]) // 12)
+    for now, window in result["trace"][::step]:
+        print(f"#   t={now:7.1f}s  window={window:2d}  {'#' * window}")
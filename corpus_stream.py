@@ -0,0 +1,241 @@
+"""
+Streaming Reader for Question Corpora
+
+REQUIREMENTS:
+- Read list_of_questions_*.json / individual_questions_*.json one list or
+  question at a time, without loading the whole file
+- Also accept JSONL (one list or question per line)
+- Keep the header fields (generated_at, total_lists, ...) available
+- normalize_question mirrors normalizeQuestion in list-evaluator.js, so
+  Python checkers see questions exactly as reviewers do
+
+USAGE:
+    from corpus_stream import iter_question_lists, iter_questions
+    header = {}
+    for question_list in iter_question_lists("list_of_questions_to_test_v3.json", header):
+        ...
+"""
+
+import json
+import os
+import re
+
+# -------------------------------------------------------------------------
+# CONFIGURATION
+# -------------------------------------------------------------------------
+
+CHUNK_SIZE = 1 << 16
+
+MCQ_TYPES = ("multiple_choice", "MCQ")
+
+# Same table as DISCIPLINE_TRANSLATIONS_REVERSE in list-evaluator.js
+DISCIPLINE_TRANSLATIONS_REVERSE = {
+    "Matemática": "Mathematics",
+    "Ciências": "Science",
+    "Física": "Physics",
+    "História": "History",
+    "Geografia": "Geography",
+    "Biologia": "Biology",
+    "Inglês": "English Language Arts",
+    "Filosofia": "Philosophy",
+    "Educação Física": "Physical Education",
+    "Artes": "Arts",
+    "Português": "Portuguese",
+    "Espanhol": "Spanish",
+}
+
+WHITESPACE = re.compile(r"\s*")
+
+# -------------------------------------------------------------------------
+# INCREMENTAL JSON
+# -------------------------------------------------------------------------
+
+class _JsonStream:
+    """Buffered reader that decodes one JSON value at a time."""
+
+    def __init__(self, f):
+        self.f = f
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decode = json.JSONDecoder().raw_decode
+
+    def _fill(self, size=CHUNK_SIZE):
+        chunk = self.f.read(size)
+        if not chunk:
+            self.eof = True
+            return
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+
+    def peek(self):
+        while True:
+            self.pos = WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if self.eof:
+                return ""
+            self._fill()
+
+    def expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in JSON stream, found {found or 'end of file'!r}")
+        self.pos += 1
+
+    def value(self):
+        self.peek()
+        size = CHUNK_SIZE
+        while True:
+            try:
+                value, end = self.decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+                self._fill(size)
+                size *= 2
+                continue
+            # A number ending exactly at the buffer edge may continue in the next chunk
+            if end == len(self.buffer) and not self.eof:
+                self._fill(size)
+                continue
+            self.pos = end
+            return value
+
+
+def iter_array(path, keys, header=None):
+    """
+    Yield the items of the top-level array(s) named in keys (a name or a
+    tuple of names) of a JSON object file. Every other top-level field is
+    stored in header (if given) as it is read.
+    """
+    if isinstance(keys, str):
+        keys = (keys,)
+    with open(path, "r", encoding="utf-8") as f:
+        stream = _JsonStream(f)
+        stream.expect("{")
+        if stream.peek() == "}":
+            return
+        while True:
+            name = stream.value()
+            stream.expect(":")
+            if name in keys:
+                stream.expect("[")
+                if stream.peek() == "]":
+                    stream.pos += 1
+                else:
+                    while True:
+                        yield stream.value()
+                        if stream.peek() == ",":
+                            stream.pos += 1
+                            continue
+                        stream.expect("]")
+                        break
+            elif header is not None:
+                header[name] = stream.value()
+            else:
+                stream.value()
+            if stream.peek() == ",":
+                stream.pos += 1
+                continue
+            stream.expect("}")
+            return
+
+
+def iter_jsonl(path):
+    decode = json.JSONDecoder().decode
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield decode(line)
+
+
+def _is_jsonl(path):
+    return os.path.splitext(path)[1].lower() in (".jsonl", ".ndjson")
+
+
+def iter_question_lists(path, header=None):
+    """Yield each {list_id, request_context, questions, ...} of a list corpus."""
+    if _is_jsonl(path):
+        return iter_jsonl(path)
+    return iter_array(path, "question_lists", header)
+
+
+def iter_questions(path, header=None):
+    """
+    Yield every question of a corpus: the "questions" array of an
+    individual-questions file, or the questions of each list in a list file.
+    """
+    items = (iter_jsonl(path) if _is_jsonl(path)
+             else iter_array(path, ("question_lists", "questions"), header))
+    for item in items:
+        if isinstance(item.get("questions"), list):
+            yield from item["questions"]
+        else:
+            yield item
+
+
+def write_corpus(path, header, items, key="question_lists", trailer=None):
+    """
+    Stream items into a corpus JSON file as {**header, key: [...], **trailer()}.
+
+    header is read after the first item is pulled, so a dict being filled
+    by iter_question_lists(..., header) can be passed straight through;
+    trailer is an optional callable for fields known only at the end
+    (e.g. counts). Returns the number of items written.
+    """
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        iterator = iter(items)
+        first = next(iterator, None)
+        f.write("{\n")
+        for name, value in header.items():
+            if name != key:
+                f.write(f"  {json.dumps(name)}: {json.dumps(value, ensure_ascii=False)},\n")
+        f.write(f"  {json.dumps(key)}: [")
+        if first is not None:
+            f.write("\n    " + json.dumps(first, ensure_ascii=False))
+            count = 1
+            for item in iterator:
+                f.write(",\n    " + json.dumps(item, ensure_ascii=False))
+                count += 1
+        f.write("\n  ]")
+        for name, value in (trailer() if trailer else {}).items():
+            f.write(f",\n  {json.dumps(name)}: {json.dumps(value, ensure_ascii=False)}")
+        f.write("\n}\n")
+    return count
+
+
+# -------------------------------------------------------------------------
+# NORMALIZATION (list-evaluator.js parity)
+# -------------------------------------------------------------------------
+
+def question_type(question):
+    return "MCQ" if question.get("type") in MCQ_TYPES else "discursive"
+
+
+def normalize_question(question):
+    """Python port of normalizeQuestion() in list-evaluator.js."""
+    alternatives = question.get("incorrect_alternatives") or []
+    difficulty = question.get("difficulty_level")
+    if difficulty is None:
+        difficulty = question.get("difficulty")
+    normalized = {
+        "question_statement": question.get("question_statement") or "",
+        "question_solution": question.get("question_solution") or "",
+        "type": question_type(question),
+        "correct_answer": question.get("answer") or question.get("correct_answer") or "",
+    }
+    for i in range(4):
+        normalized[f"incorrect_alternative_{i + 1}"] = (
+            alternatives[i] if i < len(alternatives) and alternatives[i] else "")
+    normalized["difficulty"] = difficulty
+    return normalized
+
+
+def normalize_discipline(discipline):
+    """Python port of normalizeDiscipline() in list-evaluator.js."""
+    if not discipline or not discipline.strip():
+        return "Unknown"
+    trimmed = discipline.strip()
+    return DISCIPLINE_TRANSLATIONS_REVERSE.get(trimmed, trimmed)
@@ -0,0 +1,175 @@
+"""
+Difficulty-Progression Scorer and Reordering Stage for Question Lists
+
+REQUIREMENTS:
+- Score every list's easy-to-hard monotonicity from each question's
+  difficulty (difficulty_level, else difficulty, as list-evaluator.js reads it)
+- Inversions counted with a Fenwick tree in O(n log n); Kendall tau-b
+  derived from them (ties in difficulty handled)
+- Optionally reorder into a stable easy-to-hard order that keeps the list's
+  MCQ / discursive pattern: every position keeps its type, and each type's
+  questions fill their positions from easiest to hardest
+- Whole corpus files in one streaming pass; the score and the permutation
+  applied are recorded on each list
+
+Suggested rubric score (Difficulty Progression, 0-2):
+    2 - no inversions; 1 - more pairs in order than out of order (tau > 0); 0 - otherwise
+
+USAGE:
+    python3 difficulty_progression.py list_of_questions_to_test_v3.json
+    python3 difficulty_progression.py list_of_questions_to_test_v3.json --reorder -o reordered.json
+"""
+
+import math
+import sys
+from collections import Counter
+
+from corpus_stream import iter_question_lists, normalize_question, write_corpus
+
+# -------------------------------------------------------------------------
+# INVERSIONS AND KENDALL TAU
+# -------------------------------------------------------------------------
+
+def count_inversions(values):
+    """
+    Pairs i < j with values[i] > values[j] (equal values are not
+    inversions). Fenwick tree over the ranks of the values.
+    """
+    ranks = {value: rank for rank, value in enumerate(sorted(set(values)), 1)}
+    size = len(ranks)
+    tree = [0] * (size + 1)
+    inversions = 0
+    for seen, value in enumerate(values):
+        rank = ranks[value]
+        # Number of earlier values <= value
+        not_greater = 0
+        i = rank
+        while i:
+            not_greater += tree[i]
+            i -= i & -i
+        inversions += seen - not_greater
+        i = rank
+        while i <= size:
+            tree[i] += 1
+            i += i & -i
+    return inversions
+
+
+def progression_stats(values):
+    """Inversions, Kendall tau-b against position order, and the suggested 0-2 score."""
+    n = len(values)
+    pairs = n * (n - 1) // 2
+    tied = sum(t * (t - 1) // 2 for t in Counter(values).values())
+    inversions = count_inversions(values)
+    concordant = pairs - tied - inversions
+    denominator = math.sqrt((pairs - tied) * pairs) if pairs - tied > 0 else 0.0
+    tau = (concordant - inversions) / denominator if denominator else 1.0
+    if inversions == 0:
+        score = 2
+    elif tau > 0:
+        score = 1
+    else:
+        score = 0
+    return {"inversions": inversions, "kendall_tau": round(tau, 4), "score": score}
+
+
+# -------------------------------------------------------------------------
+# REORDERING
+# -------------------------------------------------------------------------
+
+def progression_permutation(difficulties, types):
+    """
+    Permutation perm (new position -> old position) that sorts each type's
+    questions by difficulty (stable) into that type's original positions.
+    Questions without a difficulty keep their relative place at the end of
+    their type.
+    """
+    positions_by_type = {}
+    for position, qtype in enumerate(types):
+        positions_by_type.setdefault(qtype, []).append(position)
+
+    perm = [0] * len(types)
+    for positions in positions_by_type.values():
+        ordered = sorted(positions, key=lambda p: (difficulties[p] is None, difficulties[p] or 0))
+        for slot, source in zip(positions, ordered):
+            perm[slot] = source
+    return perm
+
+
+def process_list(question_list, reorder=False):
+    """
+    Return the list annotated with "difficulty_progression"; with reorder,
+    questions are permuted and the record adds the permutation and the
+    stats "after" it.
+    """
+    questions = question_list.get("questions") or []
+    normalized = [normalize_question(question) for question in questions]
+    difficulties = [question["difficulty"] for question in normalized]
+    scored = [d for d in difficulties if d is not None]
+
+    record = progression_stats(scored)
+    record["difficulties"] = difficulties
+    if reorder:
+        perm = progression_permutation(difficulties, [q["type"] for q in normalized])
+        reordered = [difficulties[p] for p in perm]
+        record["permutation"] = perm
+        record["after"] = dict(progression_stats([d for d in reordered if d is not None]),
+                               difficulties=reordered)
+        question_list = dict(question_list, questions=[questions[p] for p in perm])
+    return dict(question_list, difficulty_progression=record)
+
+
+# -------------------------------------------------------------------------
+# MAIN EXECUTION
+# -------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    output_path = None
+    if "-o" in args:
+        pos = args.index("-o")
+        output_path = args[pos + 1]
+        del args[pos:pos + 2]
+    reorder = "--reorder" in args
+    if reorder:
+        args.remove("--reorder")
+    if len(args) != 1:
+        print(__doc__)
+        sys.exit(2)
+
+    totals = Counter()
+    header = {}
+
+    def processed_lists():
+        for question_list in iter_question_lists(args[0], header):
+            result = process_list(question_list, reorder)
+            record = result["difficulty_progression"]
+            before = record
+            after = record.get("after", record)
+            totals["lists"] += 1
+            totals[f"score_{before['score']}"] += 1
+            totals[f"after_score_{after['score']}"] += 1
+            totals["inversions"] += before["inversions"]
+            totals["inversions_after"] += after["inversions"]
+            totals["reordered"] += record.get("permutation", []) != sorted(record.get("permutation", []))
+            yield result
+
+    if output_path:
+        write_corpus(output_path, header, processed_lists())
+    else:
+        for _ in processed_lists():
+            pass
+
+    print(f"# =========================================================================")
+    print(f"# DIFFICULTY PROGRESSION")
+    print(f"# =========================================================================")
+    print(f"# Lists: {totals['lists']}")
+    print(f"# Suggested scores: 2 -> {totals['score_2']}, 1 -> {totals['score_1']}, "
+          f"0 -> {totals['score_0']}")
+    print(f"# Inversions: {totals['inversions']}")
+    if reorder:
+        print(f"# Reordered lists: {totals['reordered']}")
+        print(f"# After reordering: 2 -> {totals['after_score_2']}, 1 -> {totals['after_score_1']}, "
+              f"0 -> {totals['after_score_0']} ({totals['inversions_after']} inversions)")
+    if output_path:
+        print(f"# Written to {output_path}")
@@ -0,0 +1,264 @@
+"""
+Distractor-Quality Screener for MCQ Alternatives
+
+REQUIREMENTS:
+- Normalize answer and incorrect alternatives: strip {{MATH}} tags, drop
+  whitespace inside math, collapse whitespace elsewhere, canonicalize
+  decimal commas ("9,109" -> "9.109") and single-character braces
+  ("10^{8}" -> "10^8"). Case is kept: 'YY' and 'yy' are different genotypes.
+- Flag distractors that duplicate the answer or each other:
+    exact   - identical after normalization
+    format  - identical once braces and \\text / \\mathrm wrappers are ignored
+    near    - Myers bit-parallel edit distance within NEAR_RATIO of the
+              length (early cutoff), and every word that differs is a
+              typo-level change (one edit in a word of NEAR_MIN_WORD+ chars)
+  Legitimate distractors often differ by one character that matters
+  ("x-axis" / "y-axis", "Wall A" / "Wall B", "10^{-26}" / "10^{26}",
+  "increase" / "decrease"), so short words, numbers and signs never count
+  as near duplicates. Language-subject lists skip the near check: their
+  distractors differ by one word on purpose.
+- Whole corpora in one streaming batch job, one result per list
+
+USAGE:
+    python3 distractor_screener.py list_of_questions_to_test_v3.json
+    python3 distractor_screener.py corpus.json --results screened.jsonl
+"""
+
+import json
+import re
+import sys
+import time
+from collections import Counter
+from functools import lru_cache
+
+from corpus_stream import iter_question_lists, question_type
+
+# -------------------------------------------------------------------------
+# CONFIGURATION
+# -------------------------------------------------------------------------
+
+NEAR_MIN_LENGTH = 12   # shorter texts are only compared exactly / by format
+NEAR_RATIO = 0.05      # max edit distance as a fraction of the longer text
+NEAR_MIN_WORD = 6      # shorter differing words are never typos
+
+# Grammar distractors are near duplicates by design
+LANGUAGE_SUBJECTS = {"English", "Inglês", "Spanish", "Espanhol", "Portuguese", "Português",
+                     "English Language Arts"}
+
+MATH_SPAN = re.compile(r"\{\{MATH\}\}(.*?)\{\{/MATH\}\}", re.DOTALL)
+SINGLE_BRACE = re.compile(r"([\^_])\{(\\?[^{}\s])\}")
+SIZING = re.compile(r"\\(?:left|right|displaystyle|,|;|!|quad)(?![a-zA-Z])")
+DECIMAL_COMMA = re.compile(r"(?<=\d),(?=\d)")
+WHITESPACE = re.compile(r"\s+")
+MARKUP = re.compile(r"\\(?:text|mathrm|mathbf|textbf|operatorname)(?![a-zA-Z])|[{}\s]")
+WORD = re.compile(r"[^\W_]+|[^\w\s]")
+
+# -------------------------------------------------------------------------
+# NORMALIZATION
+# -------------------------------------------------------------------------
+
+def _math(match):
+    inner = SIZING.sub("", match.group(1))
+    inner = SINGLE_BRACE.sub(r"\1\2", inner)
+    inner = inner.replace("\\dfrac", "\\frac").replace("\\tfrac", "\\frac")
+    return WHITESPACE.sub("", inner)
+
+
+@lru_cache(maxsize=1 << 16)
+def normalize_alternative(text):
+    """Canonical form used for exact comparison."""
+    text = MATH_SPAN.sub(_math, str(text or ""))
+    text = DECIMAL_COMMA.sub(".", text)
+    return WHITESPACE.sub(" ", text).strip().rstrip(".")
+
+
+@lru_cache(maxsize=1 << 16)
+def skeleton(normalized):
+    """Normalized text without markup: equal skeletons differ only in formatting."""
+    return MARKUP.sub("", normalized)
+
+
+@lru_cache(maxsize=1 << 16)
+def words(normalized):
+    return WORD.findall(normalized)
+
+
+# -------------------------------------------------------------------------
+# MYERS BIT-PARALLEL EDIT DISTANCE
+# -------------------------------------------------------------------------
+
+def myers_distance(a, b, cutoff=None):
+    """
+    Levenshtein distance between a and b (Myers 1999, with Hyyro's
+    formulation for global distance), using Python ints as bit vectors so
+    patterns of any length work. Returns cutoff + 1 as soon as the
+    distance is known to exceed cutoff.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    m = len(b)
+    if cutoff is not None and len(a) - m > cutoff:
+        return cutoff + 1
+    if m == 0:
+        return len(a)
+
+    # Pattern bitmasks: bit i set where b[i] == char
+    peq = {}
+    for i, char in enumerate(b):
+        peq[char] = peq.get(char, 0) | (1 << i)
+
+    mask = (1 << m) - 1
+    high = 1 << (m - 1)
+    pv = mask
+    mv = 0
+    score = m
+    remaining = len(a)
+    for char in a:
+        eq = peq.get(char, 0)
+        xv = eq | mv
+        xh = ((((eq & pv) + pv) & mask) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+        remaining -= 1
+        # The final distance is at least score - remaining
+        if cutoff is not None and score - remaining > cutoff:
+            return cutoff + 1
+    return score
+
+
+# -------------------------------------------------------------------------
+# SCREENING
+# -------------------------------------------------------------------------
+
+def compare(a, b, near=True):
+    """Return (kind, distance) if a and b (normalized) are duplicates, else None."""
+    if a == b:
+        return "exact", 0
+    if skeleton(a) == skeleton(b):
+        return "format", None
+    if not near:
+        return None
+    longest = max(len(a), len(b))
+    if longest < NEAR_MIN_LENGTH:
+        return None
+    cutoff = int(longest * NEAR_RATIO)
+    distance = myers_distance(a, b, cutoff)
+    if distance > cutoff or not typo_words(words(a), words(b)):
+        return None
+    return "near", distance
+
+
+def typo_words(words_a, words_b):
+    """True if the words that differ pair up as single-edit changes of long words."""
+    remaining = Counter(words_a)
+    remaining.subtract(words_b)
+    only_a = sorted(remaining.elements())
+    only_b = sorted((-remaining).elements())
+    if not only_a or len(only_a) != len(only_b):
+        return False
+    for word_a, word_b in zip(only_a, only_b):
+        if (min(len(word_a), len(word_b)) < NEAR_MIN_WORD or not word_a.isalpha()
+                or myers_distance(word_a, word_b, 1) > 1):
+            return False
+    return True
+
+
+def screen_question(question, near=True):
+    """Issues for one MCQ: duplicates of the answer, of each other, and empty distractors."""
+    answer = question.get("answer") or question.get("correct_answer") or ""
+    alternatives = question.get("incorrect_alternatives") or []
+    normalized_answer = normalize_alternative(answer)
+    normalized = [normalize_alternative(alt) for alt in alternatives]
+
+    issues = []
+    for i, alt in enumerate(normalized):
+        if not alt:
+            issues.append({"kind": "empty", "alternative": i})
+            continue
+        match = compare(normalized_answer, alt, near)
+        if match:
+            issues.append({"kind": f"{match[0]}_answer", "alternative": i, "distance": match[1],
+                           "text": alternatives[i]})
+        for j in range(i + 1, len(normalized)):
+            if not normalized[j]:
+                continue
+            match = compare(alt, normalized[j], near)
+            if match:
+                issues.append({"kind": f"{match[0]}_alternatives", "alternative": i, "other": j,
+                               "distance": match[1], "text": alternatives[j]})
+    return issues
+
+
+def screen_list(question_list):
+    """Per-list result: issues keyed by question position."""
+    context = question_list.get("request_context") or {}
+    near = context.get("discipline") not in LANGUAGE_SUBJECTS
+    flagged = []
+    for position, question in enumerate(question_list.get("questions") or []):
+        if question_type(question) != "MCQ":
+            continue
+        issues = screen_question(question, near)
+        if issues:
+            flagged.append({"position": position, "issues": issues})
+    return {"list_id": question_list.get("list_id"), "flagged_questions": flagged}
+
+
+# -------------------------------------------------------------------------
+# MAIN EXECUTION
+# -------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    results_path = None
+    if "--results" in args:
+        pos = args.index("--results")
+        results_path = args[pos + 1]
+        del args[pos:pos + 2]
+    if not args:
+        print(__doc__)
+        sys.exit(2)
+
+    start = time.perf_counter()
+    kinds = Counter()
+    lists = 0
+    flagged_lists = 0
+    out = open(results_path, "w", encoding="utf-8") if results_path else None
+    try:
+        for path in args:
+            for question_list in iter_question_lists(path):
+                result = screen_list(question_list)
+                lists += 1
+                if out:
+                    out.write(json.dumps(dict(result, file=path), ensure_ascii=False) + "\n")
+                if not result["flagged_questions"]:
+                    continue
+                flagged_lists += 1
+                for flagged in result["flagged_questions"]:
+                    for issue in flagged["issues"]:
+                        kinds[issue["kind"]] += 1
+                        if sum(kinds.values()) <= 30:
+                            print(f"{path}: list {result['list_id']} question {flagged['position']}: "
+                                  f"{issue['kind']} (alternative {issue['alternative']}) "
+                                  f"{issue.get('text', '')!r}")
+    finally:
+        if out:
+            out.close()
+    elapsed = time.perf_counter() - start
+
+    print(f"\n# =========================================================================")
+    print(f"# DISTRACTOR SCREENING")
+    print(f"# =========================================================================")
+    print(f"# Lists: {lists} ({flagged_lists} with flagged distractors)")
+    for kind, count in kinds.most_common():
+        print(f"#   {kind}: {count}")
+    print(f"# {lists / elapsed:,.0f} lists per second")
+    if results_path:
+        print(f"# Results written to {results_path}")
@@ -11,6 +11,9 @@ REQUIREMENTS:
 
 import random
 import csv
+from collections import Counter
+
+import instrumentation
 
 # -------------------------------------------------------------------------
 # CONFIGURATION
@@ -135,10 +138,72 @@ CATEGORY_TRANSLATIONS = {
     "Grammar": "Gramática",
 }
 
+# Portuguese language categories (not in the CSV), available for every
+# grade/difficulty combination
+PORTUGUESE_CATEGORIES = [
+    'Classes Gramaticais',
+    'Substantivo',
+    'Substantivos',
+    'Interpretação de Texto',
+    'Crase',
+    'Interpretação Textual',
+    'Alfabetização',
+    'Artigo de Opinião',
+    'Preposição',
+    'Parnasianismo',
+    'Pontuação',
+    'Classe de Palavras'
+]
+
 # -------------------------------------------------------------------------
 # HELPER FUNCTIONS
 # -------------------------------------------------------------------------
 
+def parse_catalog_row(row):
+    """
+    Parse one CSV row into (discipline, category, grade, difficulty).
+    Returns None for rows that cannot be placed in the index.
+    """
+    disc = row.get('discipline', '').strip()
+    category = row.get('category', '').strip()
+    grade_str = row.get('grade', '').strip()
+    level_str = row.get('level', '').strip()
+
+    # Convert grade string to numeric (e.g., "6th grade" -> 60)
+    grade_num = None
+    if 'grade' in grade_str.lower():
+        try:
+            # Extract number from strings like "6th grade", "12th grade"
+            grade_val = int(''.join(filter(str.isdigit, grade_str.split('th')[0])))
+            if 1 <= grade_val <= 12:
+                grade_num = grade_val * 10  # Convert to 60-120 format
+        except:
+            return None
+
+    # Get difficulty level and map to our difficulty buckets (300/500/700)
+    csv_level = None
+    if level_str:
+        try:
+            csv_level = int(level_str)
+        except:
+            return None
+
+    # Map CSV level to our difficulty (300/500/700)
+    difficulty = None
+    if csv_level is not None:
+        if 0 <= csv_level <= 300:
+            difficulty = 300
+        elif 301 <= csv_level <= 600:
+            difficulty = 500
+        else:  # 601+
+            difficulty = 700
+
+    if disc and category and grade_num and difficulty:
+        return disc, category, grade_num, difficulty
+    return None
+
+
+@instrumentation.instrumented()
 def load_categories_from_csv(csv_path):
     """
     Load available categories for each discipline from the CSV.
@@ -147,44 +212,16 @@ def load_categories_from_csv(csv_path):
     # Structure: discipline -> grade -> difficulty -> [categories]
     disciplines_categories = {}
 
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            disc = row.get('discipline', '').strip()
-            category = row.get('category', '').strip()
-            grade_str = row.get('grade', '').strip()
-            level_str = row.get('level', '').strip()
-
-            # Convert grade string to numeric (e.g., "6th grade" -> 60)
-            grade_num = None
-            if 'grade' in grade_str.lower():
-                try:
-                    # Extract number from strings like "6th grade", "12th grade"
-                    grade_val = int(''.join(filter(str.isdigit, grade_str.split('th')[0])))
-                    if 1 <= grade_val <= 12:
-                        grade_num = grade_val * 10  # Convert to 60-120 format
-                except:
+    with instrumentation.stage("csv_parse"):
+        with open(csv_path, 'r', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                parsed = parse_catalog_row(row)
+                if parsed is None:
+                    instrumentation.count("csv_rows_skipped")
                     continue
+                disc, category, grade_num, difficulty = parsed
 
-            # Get difficulty level and map to our difficulty buckets (300/500/700)
-            csv_level = None
-            if level_str:
-                try:
-                    csv_level = int(level_str)
-                except:
-                    continue
-
-            # Map CSV level to our difficulty (300/500/700)
-            difficulty = None
-            if csv_level is not None:
-                if 0 <= csv_level <= 300:
-                    difficulty = 300
-                elif 301 <= csv_level <= 600:
-                    difficulty = 500
-                else:  # 601+
-                    difficulty = 700
-
-            if disc and category and grade_num and difficulty:
                 if disc not in disciplines_categories:
                     disciplines_categories[disc] = {}
                 if grade_num not in disciplines_categories[disc]:
@@ -195,39 +232,27 @@ def load_categories_from_csv(csv_path):
                 disciplines_categories[disc][grade_num][difficulty].add(category)
 
     # Convert sets to lists
-    result = {}
-    for disc in disciplines_categories:
-        result[disc] = {}
-        for grade in disciplines_categories[disc]:
-            result[disc][grade] = {}
-            for diff in disciplines_categories[disc][grade]:
-                result[disc][grade][diff] = list(disciplines_categories[disc][grade][diff])
+    with instrumentation.stage("index_build"):
+        result = {}
+        for disc in disciplines_categories:
+            result[disc] = {}
+            for grade in disciplines_categories[disc]:
+                result[disc][grade] = {}
+                for diff in disciplines_categories[disc][grade]:
+                    result[disc][grade][diff] = list(disciplines_categories[disc][grade][diff])
 
     # Add Portuguese language categories for all grades/difficulties
     # Since we don't have CSV data, we'll make them available for all combinations
     result['Portuguese'] = {}
-    portuguese_categories = [
-        'Classes Gramaticais',
-        'Substantivo',
-        'Substantivos',
-        'Interpretação de Texto',
-        'Crase',
-        'Interpretação Textual',
-        'Alfabetização',
-        'Artigo de Opinião',
-        'Preposição',
-        'Parnasianismo',
-        'Pontuação',
-        'Classe de Palavras'
-    ]
     for grade in AVAILABLE_GRADES:
         result['Portuguese'][grade] = {}
         for diff in DIFFICULTY_LEVELS:
-            result['Portuguese'][grade][diff] = portuguese_categories.copy()
+            result['Portuguese'][grade][diff] = PORTUGUESE_CATEGORIES.copy()
 
     return result
 
 
+@instrumentation.instrumented()
 def translate_discipline(discipline, locale):
     """Translate discipline name based on locale."""
     if locale == PORTUGUESE_LOCALE and discipline in DISCIPLINE_TRANSLATIONS:
@@ -252,7 +277,74 @@ def generate_question_distribution():
     return 1, 1
 
 
-def generate_requests_for_discipline(discipline, grade_diff_categories, target_questions=10):
+def default_locale_policy(discipline):
+    """Default locale policy: "en_US", "pt_BR" or "bilingual"."""
+    # Define English-only subjects
+    english_only_subjects = ["Biology", "Mathematics", "Physics", "Science", "English"]
+
+    if discipline in english_only_subjects:
+        return ENGLISH_LOCALE
+    if discipline == "Portuguese":
+        return PORTUGUESE_LOCALE
+    return "bilingual"
+
+
+def build_locale_pool(discipline, num_requests, locale_policy=None):
+    """
+    Build the locale pool for a discipline.
+
+    Args:
+        discipline: Name of the discipline
+        num_requests: Number of requests to generate
+        locale_policy: Optional override - either a single policy for every
+            discipline or a dict of discipline -> policy. A policy is
+            "en_US", "pt_BR" or "bilingual". Disciplines without a policy
+            follow the default rules below.
+    """
+    policy = locale_policy
+    if isinstance(locale_policy, dict):
+        policy = locale_policy.get(discipline)
+
+    if policy is None:
+        policy = default_locale_policy(discipline)
+
+    # Special handling for language disciplines and STEM subjects
+    if policy == ENGLISH_LOCALE:
+        # Biology, Mathematics, Physics, Science, and English: ALL questions in en_US
+        return [ENGLISH_LOCALE] * num_requests
+    if policy == PORTUGUESE_LOCALE:
+        # Portuguese discipline: ALL questions in pt_BR
+        return [PORTUGUESE_LOCALE] * num_requests
+    if policy != "bilingual":
+        raise ValueError(f"Unknown locale policy for {discipline}: {policy}")
+
+    # Other disciplines: 5 en_US + 5 pt_BR
+    locale_pool = [ENGLISH_LOCALE] * 5 + [PORTUGUESE_LOCALE] * 5
+    # Shuffle to randomize order
+    random.shuffle(locale_pool)
+    return locale_pool
+
+
+def choose_category(available_categories, clusters, cluster_usage):
+    """
+    Pick a category from the least-used cluster so far in this batch.
+
+    Args:
+        available_categories: Categories of the drawn grade/difficulty cell
+        clusters: Dict of category -> cluster id (see category_clustering.py)
+        cluster_usage: Counter of cluster id -> draws, updated in place
+    """
+    least_used = min(cluster_usage[clusters.get(name)] for name in available_categories)
+    candidates = [name for name in available_categories
+                  if cluster_usage[clusters.get(name)] == least_used]
+    category = random.choice(candidates)
+    cluster_usage[clusters.get(category)] += 1
+    return category
+
+
+@instrumentation.instrumented()
+def generate_requests_for_discipline(discipline, grade_diff_categories, target_questions=10,
+                                     locale_policy=None, clusters=None):
     """
     Generate requests for a single discipline.
 
@@ -263,24 +355,14 @@ def generate_requests_for_discipline(discipline, grade_diff_categories, target_q
         discipline: Name of the discipline
         grade_diff_categories: Dict of grade -> difficulty -> [categories]
         target_questions: Number of questions to generate
+        locale_policy: Optional locale policy (see build_locale_pool)
+        clusters: Optional dict of category -> cluster id; draws are then
+            spread across clusters instead of uniform within the cell
     """
     num_requests = target_questions // 2
 
-    # Define English-only subjects
-    english_only_subjects = ["Biology", "Mathematics", "Physics", "Science", "English"]
-
-    # Special handling for language disciplines and STEM subjects
-    if discipline in english_only_subjects:
-        # Biology, Mathematics, Physics, Science, and English: ALL questions in en_US
-        locale_pool = [ENGLISH_LOCALE] * num_requests
-    elif discipline == "Portuguese":
-        # Portuguese discipline: ALL questions in pt_BR
-        locale_pool = [PORTUGUESE_LOCALE] * num_requests
-    else:
-        # Other disciplines: 5 en_US + 5 pt_BR
-        locale_pool = [ENGLISH_LOCALE] * 5 + [PORTUGUESE_LOCALE] * 5
-        # Shuffle to randomize order
-        random.shuffle(locale_pool)
+    locale_pool = build_locale_pool(discipline, num_requests, locale_policy)
+    cluster_usage = Counter()
 
     requests = []
     attempts_without_success = 0
@@ -303,7 +385,10 @@ def generate_requests_for_discipline(discipline, grade_diff_categories, target_q
         if grade in grade_diff_categories and difficulty in grade_diff_categories[grade]:
             available_categories = grade_diff_categories[grade][difficulty]
             if available_categories:
-                category = random.choice(available_categories)
+                if clusters is None:
+                    category = random.choice(available_categories)
+                else:
+                    category = choose_category(available_categories, clusters, cluster_usage)
 
         # If we found a valid combination, add it
         if category is not None:
@@ -328,16 +413,27 @@ def generate_requests_for_discipline(discipline, grade_diff_categories, target_q
             requests.append(request)
         else:
             attempts_without_success += 1
+            instrumentation.count("rejection_attempts")
 
     if len(requests) < num_requests:
+        instrumentation.count("disciplines_short_of_target")
         print(f"Warning: Only generated {len(requests)} out of {num_requests} requests for {discipline}")
 
     return requests
 
 
-def generate_all_requests(csv_path, selected_disciplines=None, questions_per_discipline=10):
-    """Generate requests for multiple disciplines."""
-    all_categories = load_categories_from_csv(csv_path)
+@instrumentation.instrumented()
+def generate_all_requests(csv_path, selected_disciplines=None, questions_per_discipline=10,
+                          locale_policy=None, all_categories=None, clusters=None):
+    """
+    Generate requests for multiple disciplines.
+
+    Pass all_categories (the result of load_categories_from_csv) to reuse an
+    already loaded catalog instead of re-reading csv_path, and clusters
+    (discipline -> category -> cluster id) for diversity-aware draws.
+    """
+    if all_categories is None:
+        all_categories = load_categories_from_csv(csv_path)
 
     if selected_disciplines:
         disciplines = [d for d in selected_disciplines if d in all_categories]
@@ -356,7 +452,9 @@ def generate_all_requests(csv_path, selected_disciplines=None, questions_per_dis
         discipline_requests = generate_requests_for_discipline(
             discipline,
             grade_diff_categories,
-            target_questions=questions_per_discipline
+            target_questions=questions_per_discipline,
+            locale_policy=locale_policy,
+            clusters=clusters.get(discipline) if clusters else None
         )
 
         all_requests.extend(discipline_requests)
@@ -364,6 +462,7 @@ def generate_all_requests(csv_path, selected_disciplines=None, questions_per_dis
     return all_requests
 
 
+@instrumentation.instrumented()
 def print_requests(requests):
     """Print requests in Python list format."""
     print("REQUESTS = [")
@@ -387,11 +486,44 @@ def print_requests(requests):
     print("]")
 
 
+@instrumentation.instrumented()
+def print_summary(requests):
+    """Print the summary footer (totals, per-discipline and locale counts)."""
+    print(f"\n# =========================================================================")
+    print(f"# SUMMARY")
+    print(f"# =========================================================================")
+    print(f"# Total requests: {len(requests)}")
+    print(f"# Total questions: {len(requests) * 2}")
+
+    locale_counts = Counter(req["locale"] for req in requests)
+
+    # Count by original discipline name
+    disc_counts = {}
+    for req in requests:
+        # Get original English name for counting
+        orig_disc = req["discipline"]
+        for eng, port in DISCIPLINE_TRANSLATIONS.items():
+            if port == orig_disc:
+                orig_disc = eng
+                break
+        disc_counts[orig_disc] = disc_counts.get(orig_disc, 0) + 1
+
+    print(f"\n# Requests per discipline:")
+    for disc, count in sorted(disc_counts.items()):
+        print(f"#   {disc}: {count} requests ({count * 2} questions)")
+
+    print(f"\n# Locale distribution:")
+    for locale, count in sorted(locale_counts.items()):
+        print(f"#   {locale}: {count} requests")
+
+
 # -------------------------------------------------------------------------
 # MAIN EXECUTION
 # -------------------------------------------------------------------------
 
 if __name__ == "__main__":
+    instrumentation.configure_from_environment()
+
     CSV_PATH = "/Users/camila/Turbo_SAFE/teachy/teachy-test/Biblioteca de Alexandria - en.csv"
 
     # Selected disciplines as requested
@@ -430,30 +562,6 @@ if __name__ == "__main__":
     print_requests(requests)
 
     # Summary
-    print(f"\n# =========================================================================")
-    print(f"# SUMMARY")
-    print(f"# =========================================================================")
-    print(f"# Total requests: {len(requests)}")
-    print(f"# Total questions: {len(requests) * 2}")
-
-    from collections import Counter
-    locale_counts = Counter(req["locale"] for req in requests)
-
-    # Count by original discipline name
-    disc_counts = {}
-    for req in requests:
-        # Get original English name for counting
-        orig_disc = req["discipline"]
-        for eng, port in DISCIPLINE_TRANSLATIONS.items():
-            if port == orig_disc:
-                orig_disc = eng
-                break
-        disc_counts[orig_disc] = disc_counts.get(orig_disc, 0) + 1
-
-    print(f"\n# Requests per discipline:")
-    for disc, count in sorted(disc_counts.items()):
-        print(f"#   {disc}: {count} requests ({count * 2} questions)")
+    print_summary(requests)
 
-    print(f"\n# Locale distribution:")
-    for locale, count in sorted(locale_counts.items()):
-        print(f"#   {locale}: {count} requests")
+    instrumentation.finish()
@@ -12,6 +12,8 @@ REQUIREMENTS:
 import random
 import csv
 
+import instrumentation
+
 # -------------------------------------------------------------------------
 # CONFIGURATION
 # -------------------------------------------------------------------------
@@ -45,11 +47,12 @@ DISCIPLINE_TRANSLATIONS = {
 DISCIPLINE_TRANSLATIONS_REVERSE = {v: k for k, v in DISCIPLINE_TRANSLATIONS.items()}
 
 # Load categories from CSV
+@instrumentation.instrumented()
 def load_categories_from_csv(csv_path):
     """Load available categories for each discipline from the CSV."""
     disciplines_categories = {}
 
-    with open(csv_path, 'r', encoding='utf-8') as f:
+    with instrumentation.stage("csv_parse"), open(csv_path, 'r', encoding='utf-8') as f:
         reader = csv.DictReader(f)
         for row in reader:
             disc = row.get('discipline', '').strip()
@@ -61,7 +64,8 @@ def load_categories_from_csv(csv_path):
                 disciplines_categories[disc].add(topic)
 
     # Convert sets to lists for easier random selection
-    return {k: list(v) for k, v in disciplines_categories.items()}
+    with instrumentation.stage("index_build"):
+        return {k: list(v) for k, v in disciplines_categories.items()}
 
 
 # -------------------------------------------------------------------------
@@ -80,6 +84,7 @@ def generate_question_distribution():
     return num_mcq, num_discursive
 
 
+@instrumentation.instrumented()
 def generate_requests_for_discipline(discipline, categories, target_questions=10):
     """
     Generate requests for a single discipline to reach target number of questions.
@@ -119,6 +124,7 @@ def generate_requests_for_discipline(discipline, categories, target_questions=10
             available_categories.remove(category)
         else:
             # If all categories used, reset the pool but avoid immediate repetition
+            instrumentation.count("category_pool_resets")
             available_categories = [c for c in categories if c not in used_categories[-2:]]
             if not available_categories:
                 available_categories = categories.copy()
@@ -154,6 +160,7 @@ def generate_requests_for_discipline(discipline, categories, target_questions=10
     return requests
 
 
+@instrumentation.instrumented()
 def generate_all_requests(csv_path, selected_disciplines=None, questions_per_discipline=10):
     """
     Generate requests for multiple disciplines.
@@ -193,6 +200,7 @@ def generate_all_requests(csv_path, selected_disciplines=None, questions_per_dis
     return all_requests
 
 
+@instrumentation.instrumented()
 def print_requests(requests):
     """Print requests in Python list format."""
     print("REQUESTS = [")
@@ -221,6 +229,8 @@ def print_requests(requests):
 # -------------------------------------------------------------------------
 
 if __name__ == "__main__":
+    instrumentation.configure_from_environment()
+
     # Configuration
     CSV_PATH = "/Users/camila/Turbo_SAFE/teachy/teachy-test/Biblioteca de Alexandria - en.csv"
 
@@ -280,3 +290,5 @@ if __name__ == "__main__":
     print(f"\n# Locale distribution:")
     for locale, count in sorted(locale_counts.items()):
         print(f"#   {locale}: {count} requests")
+
+    instrumentation.finish()
@@ -0,0 +1,428 @@
+"""
+Long-lived Generation Daemon for Bilingual Expert Rating Requests
+
+REQUIREMENTS:
+- Load the catalog CSV and the derived discipline -> grade -> difficulty index once
+- Serve generate_all_requests-style calls over loopback HTTP
+  (disciplines, questions per discipline, seed, locale policy)
+- Reload the catalog automatically when the CSV changes on disk
+- Handle concurrent clients
+- Thin client CLI that prints the same output as generate_bilingual_requests.py
+- Benchmark cold-start versus warm-call latency
+
+USAGE:
+    python3 generation_daemon.py serve
+    python3 generation_daemon.py client --disciplines Mathematics History
+    python3 generation_daemon.py benchmark
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import generate_bilingual_requests as bilingual
+import instrumentation
+
+# -------------------------------------------------------------------------
+# CONFIGURATION
+# -------------------------------------------------------------------------
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CSV_PATH = os.path.join(SCRIPT_DIR, "Biblioteca de Alexandria - en.csv")
+
+# Loopback only - the daemon is not meant to be reachable from other hosts
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 3031  # server.js already uses 3030
+
+DEFAULT_DISCIPLINES = [
+    "Mathematics",
+    "Portuguese",
+    "Science",
+    "History",
+    "Geography",
+    "Biology",
+    "English",
+    "Philosophy",
+    "Physical Education",
+    "Physics",
+]
+
+DEFAULT_QUESTIONS_PER_DISCIPLINE = 10
+DEFAULT_SEED = 42
+
+# -------------------------------------------------------------------------
+# WARM CATALOG
+# -------------------------------------------------------------------------
+
+class CatalogUnavailable(RuntimeError):
+    """No catalog has been loaded yet (the CSV is missing or unreadable)."""
+
+
+class WarmCatalog:
+    """
+    Keeps the parsed catalog in memory and reloads it when the CSV changes.
+
+    The file is stat()ed on every call (cheap); it is only re-parsed when its
+    mtime or size differ from the loaded version. While the CSV is missing
+    or being replaced the last loaded catalog keeps being served.
+    """
+
+    def __init__(self, csv_path):
+        self.csv_path = csv_path
+        self._lock = threading.Lock()
+        self._signature = None
+        self.categories = None
+        self.loaded_at = None
+        self.reload_count = 0
+        self.last_error = None
+        try:
+            self.get()
+        except CatalogUnavailable as e:
+            print(f"# Warning: {e}", file=sys.stderr)
+
+    def _current_signature(self):
+        """(mtime, size) of the CSV, or None while it cannot be stat()ed."""
+        try:
+            stat = os.stat(self.csv_path)
+        except OSError as e:
+            self.last_error = f"Cannot stat {self.csv_path}: {e.strerror}"
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def get(self):
+        """
+        Return the catalog index, reloading it first if the CSV changed.
+        Raises CatalogUnavailable if no catalog could ever be loaded.
+        """
+        signature = self._current_signature()
+        if signature is not None and signature != self._signature:
+            with self._lock:
+                # Another thread may have reloaded while we waited for the lock
+                if signature != self._signature:
+                    try:
+                        self.categories = bilingual.load_categories_from_csv(self.csv_path)
+                    except OSError as e:
+                        self.last_error = f"Cannot read {self.csv_path}: {e.strerror}"
+                    else:
+                        self._signature = signature
+                        self.loaded_at = time.strftime("%Y-%m-%d %H:%M:%S")
+                        self.reload_count += 1
+                        self.last_error = None
+        if self.categories is None:
+            raise CatalogUnavailable(self.last_error or "Catalog not loaded")
+        return self.categories
+
+
+# The generators draw from the module-level `random` state, so a seeded call
+# has to run without another request reseeding it halfway through.
+_generation_lock = threading.Lock()
+
+
+def generate_from_catalog(catalog, disciplines=None, questions_per_discipline=10,
+                          seed=None, locale_policy=None):
+    """Run generate_all_requests against the warm catalog."""
+    all_categories = catalog.get()
+    with _generation_lock:
+        if seed is not None:
+            random.seed(seed)
+        return bilingual.generate_all_requests(
+            catalog.csv_path,
+            selected_disciplines=disciplines,
+            questions_per_discipline=questions_per_discipline,
+            locale_policy=locale_policy,
+            all_categories=all_categories,
+        )
+
+
+# -------------------------------------------------------------------------
+# HTTP SERVER
+# -------------------------------------------------------------------------
+
+def _is_int(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def validate_params(params):
+    """Error message for a malformed /generate body, or None when it is well-formed."""
+    if not isinstance(params, dict):
+        return "Body must be a JSON object"
+    disciplines = params.get("disciplines")
+    if disciplines is not None and not (isinstance(disciplines, list)
+                                        and all(isinstance(d, str) for d in disciplines)):
+        return "'disciplines' must be a list of strings"
+    if "questions_per_discipline" in params and not _is_int(params["questions_per_discipline"]):
+        return "'questions_per_discipline' must be an integer"
+    if params.get("seed") is not None and not _is_int(params["seed"]):
+        return "'seed' must be an integer"
+    policy = params.get("locale_policy")
+    if policy is not None and not isinstance(policy, (str, dict)):
+        return "'locale_policy' must be a string or an object"
+    return None
+
+
+class GenerationHandler(BaseHTTPRequestHandler):
+    """
+    Routes:
+        GET  /health    -> catalog status
+        POST /generate  -> {"requests": [...]}
+    Both answer 503 while no catalog has ever been loaded.
+
+    /generate body (all fields optional):
+        {"disciplines": [...], "questions_per_discipline": 10,
+         "seed": 42, "locale_policy": {"History": "bilingual"}}
+    Bodies of the wrong shape or types get a 400 (see validate_params).
+    """
+
+    catalog = None
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path != "/health":
+            self._send_json(404, {"error": f"Unknown route: {self.path}"})
+            return
+        try:
+            self.catalog.get()
+        except CatalogUnavailable as e:
+            self._send_json(503, {"status": "unavailable", "error": str(e)})
+            return
+        self._send_json(200, {
+            "status": "ok",
+            "csv_path": self.catalog.csv_path,
+            "loaded_at": self.catalog.loaded_at,
+            "reload_count": self.catalog.reload_count,
+            "disciplines": sorted(self.catalog.categories),
+            "last_error": self.catalog.last_error,
+        })
+
+    def do_POST(self):
+        if self.path != "/generate":
+            self._send_json(404, {"error": f"Unknown route: {self.path}"})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            params = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError as e:
+            self._send_json(400, {"error": f"Invalid JSON body: {e}"})
+            return
+        error = validate_params(params)
+        if error:
+            self._send_json(400, {"error": error})
+            return
+
+        start = time.perf_counter()
+        try:
+            requests = generate_from_catalog(
+                self.catalog,
+                disciplines=params.get("disciplines"),
+                questions_per_discipline=params.get("questions_per_discipline",
+                                                    DEFAULT_QUESTIONS_PER_DISCIPLINE),
+                seed=params.get("seed"),
+                locale_policy=params.get("locale_policy"),
+            )
+        except CatalogUnavailable as e:
+            self._send_json(503, {"error": str(e)})
+            return
+        except (ValueError, TypeError, AttributeError) as e:
+            self._send_json(400, {"error": str(e)})
+            return
+
+        self._send_json(200, {
+            "requests": requests,
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 3),
+            "catalog_loaded_at": self.catalog.loaded_at,
+        })
+
+    def log_message(self, format, *args):
+        # One log line per request would drown the daemon output
+        pass
+
+
+def make_server(csv_path=DEFAULT_CSV_PATH, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    """Create (but do not start) a threaded daemon bound to host:port."""
+    handler = type("BoundGenerationHandler", (GenerationHandler,),
+                   {"catalog": WarmCatalog(csv_path)})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+# -------------------------------------------------------------------------
+# CLIENT
+# -------------------------------------------------------------------------
+
+def request_generation(params, host=DEFAULT_HOST, port=DEFAULT_PORT, timeout=30):
+    """POST params to a running daemon and return the list of requests."""
+    req = urllib.request.Request(
+        f"http://{host}:{port}/generate",
+        data=json.dumps(params).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        return json.loads(resp.read())["requests"]
+
+
+def run_client(args):
+    params = {
+        "disciplines": args.disciplines,
+        "questions_per_discipline": args.questions_per_discipline,
+        "seed": args.seed,
+        "locale_policy": json.loads(args.locale_policy) if args.locale_policy else None,
+    }
+
+    try:
+        requests = request_generation(params, args.host, args.port)
+    except (urllib.error.URLError, ConnectionError):
+        if not args.fallback:
+            raise
+        # Daemon not running: behave exactly like the standalone script
+        print(f"# Daemon unreachable at {args.host}:{args.port}, generating in-process",
+              file=sys.stderr)
+        if args.seed is not None:
+            random.seed(args.seed)
+        requests = bilingual.generate_all_requests(
+            args.csv,
+            selected_disciplines=params["disciplines"],
+            questions_per_discipline=params["questions_per_discipline"],
+            locale_policy=params["locale_policy"],
+        )
+
+    print(f"# Generating bilingual requests for {len(args.disciplines)} disciplines")
+    print(f"# Target: {args.questions_per_discipline} questions per discipline")
+    print(f"# Each request: 2 questions (1 MCQ + 1 discursive)")
+    print(f"# Portuguese requests use Portuguese names")
+    print()
+
+    bilingual.print_requests(requests)
+    bilingual.print_summary(requests)
+
+
+# -------------------------------------------------------------------------
+# BENCHMARK
+# -------------------------------------------------------------------------
+
+def _describe(samples_ms):
+    ordered = sorted(samples_ms)
+    p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+    return (f"min {ordered[0]:8.2f} ms | median {statistics.median(ordered):8.2f} ms | "
+            f"p95 {p95:8.2f} ms")
+
+
+def run_benchmark(args):
+    """
+    Cold start: a fresh Python process imports the generator, parses the CSV
+    and generates (what every orchestration call pays today).
+    Warm call: one HTTP round-trip to an already running daemon.
+    """
+    params = {
+        "disciplines": args.disciplines,
+        "questions_per_discipline": args.questions_per_discipline,
+        "seed": args.seed,
+    }
+
+    cold_code = (
+        "import random, generate_bilingual_requests as g; "
+        f"random.seed({args.seed!r}); "
+        f"g.generate_all_requests({args.csv!r}, {args.disciplines!r}, "
+        f"{args.questions_per_discipline!r})"
+    )
+    cold = []
+    for _ in range(args.cold_runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", cold_code], cwd=SCRIPT_DIR,
+                       check=True, stdout=subprocess.DEVNULL)
+        cold.append((time.perf_counter() - start) * 1000)
+
+    server = make_server(args.csv, args.host, 0)
+    port = server.server_address[1]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        request_generation(params, args.host, port)  # first call after load
+        warm = []
+        for _ in range(args.warm_runs):
+            start = time.perf_counter()
+            request_generation(params, args.host, port)
+            warm.append((time.perf_counter() - start) * 1000)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print(f"# =========================================================================")
+    print(f"# BENCHMARK: {len(args.disciplines)} disciplines, "
+          f"{args.questions_per_discipline} questions each")
+    print(f"# =========================================================================")
+    print(f"# Cold start ({args.cold_runs} runs): {_describe(cold)}")
+    print(f"# Warm call  ({args.warm_runs} runs): {_describe(warm)}")
+    print(f"# Speedup (median): {statistics.median(cold) / statistics.median(warm):.1f}x")
+
+
+# -------------------------------------------------------------------------
+# MAIN EXECUTION
+# -------------------------------------------------------------------------
+
+def build_parser():
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--csv", default=DEFAULT_CSV_PATH, help="Catalog CSV path")
+    common.add_argument("--host", default=DEFAULT_HOST)
+    common.add_argument("--port", type=int, default=DEFAULT_PORT)
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("serve", parents=[common], help="Run the daemon in the foreground")
+
+    for name in ("client", "benchmark"):
+        p = sub.add_parser(name, parents=[common])
+        p.add_argument("--disciplines", nargs="+", default=DEFAULT_DISCIPLINES)
+        p.add_argument("--questions-per-discipline", type=int,
+                       default=DEFAULT_QUESTIONS_PER_DISCIPLINE)
+        p.add_argument("--seed", type=int, default=DEFAULT_SEED)
+
+    client = sub.choices["client"]
+    client.add_argument("--locale-policy",
+                        help='JSON policy, e.g. \'"bilingual"\' or \'{"History": "pt_BR"}\'')
+    client.add_argument("--no-fallback", dest="fallback", action="store_false",
+                        help="Fail instead of generating in-process when the daemon is down")
+
+    bench = sub.choices["benchmark"]
+    bench.add_argument("--cold-runs", type=int, default=5)
+    bench.add_argument("--warm-runs", type=int, default=50)
+    return parser
+
+
+if __name__ == "__main__":
+    instrumentation.configure_from_environment()
+    args = build_parser().parse_args()
+
+    if args.command == "serve":
+        server = make_server(args.csv, args.host, args.port)
+        print(f"Generation daemon running at http://{args.host}:{server.server_address[1]}/")
+        print(f"Catalog: {args.csv}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+    elif args.command == "client":
+        run_client(args)
+    else:
+        run_benchmark(args)
+
+    instrumentation.finish()
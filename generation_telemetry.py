@@ -0,0 +1,398 @@
+"""
+Latency and Throughput Telemetry for Generation Runs
+
+REQUIREMENTS:
+- One compact JSONL event per generated list (timing and outcome)
+- HDR-style log-linear latency histograms per
+  (discipline, locale, difficulty, num_questions) with p50 / p95 / p99
+- Summary written into the run header next to successful_lists / failed_lists
+- Recording cheap enough (< 1 microsecond per event) to stay on in production
+
+record() only appends its argument tuple; every FLUSH_EVERY events the
+batch is handed to a background thread that folds it into the histograms
+and writes its JSONL lines, stamped with the fold time (so "t" resolves to
+a batch, not an event). flush(), histograms() and summary() wait for the
+handed-off batches. `python3 generation_telemetry.py --bench` measures the
+caller-side cost per event and the folding cost on the background thread.
+
+USAGE:
+    python3 generation_telemetry.py                       # simulated run + summary
+    python3 generation_telemetry.py --summarize run.telemetry.jsonl
+    python3 generation_telemetry.py --bench                # record() / folding cost per event
+"""
+
+import json
+import os
+import random
+import queue
+import sys
+import threading
+import time
+from array import array
+from collections import Counter
+from itertools import repeat
+from operator import itemgetter, mul, rshift, sub
+
+# -------------------------------------------------------------------------
+# CONFIGURATION
+# -------------------------------------------------------------------------
+
+# 2^8 sub-buckets per power of two: relative error below 0.8%
+SUB_BUCKET_BITS = 8
+FLUSH_EVERY = 4096
+MAX_QUEUED_BATCHES = 16     # record() blocks beyond this (folding fell behind)
+PERCENTILES = (50, 95, 99)
+BENCH_EVENTS = 1_000_000
+
+_wall_clock = time.time
+
+# -------------------------------------------------------------------------
+# HISTOGRAM
+# -------------------------------------------------------------------------
+
+_SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+_HALF_BUCKETS = _SUB_BUCKETS >> 1
+
+# A float64 >= _HALF_BUCKETS read as an integer and shifted down to its exponent
+# and top SUB_BUCKET_BITS - 1 mantissa bits is its log-linear bucket plus a constant
+_MANTISSA_SHIFT = 52 - (SUB_BUCKET_BITS - 1)
+_EXPONENT_OFFSET = (1023 + SUB_BUCKET_BITS - 2) * _HALF_BUCKETS
+
+_group_of = itemgetter(1, 2, 3, 4)
+_seconds_of = itemgetter(5)
+
+
+def bucket_index(value):
+    """Log-linear bucket of a non-negative integer (exact below 2^SUB_BUCKET_BITS)."""
+    if value < _SUB_BUCKETS:
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    return shift * _HALF_BUCKETS + (value >> shift)
+
+
+def bucket_indices(seconds):
+    """
+    [bucket_index(int(s * 1e6)) for s in seconds], computed in bulk from the
+    floats' bit patterns so the per-event work stays in C.
+    """
+    micros = array("d", map(mul, seconds, repeat(1_000_000.0)))
+    indices = map(sub, map(rshift, memoryview(micros).cast("B").cast("Q").tolist(),
+                           repeat(_MANTISSA_SHIFT)), repeat(_EXPONENT_OFFSET))
+    if micros and min(micros) < _HALF_BUCKETS:
+        return [int(m) if m < _HALF_BUCKETS else index for m, index in zip(micros, indices)]
+    return list(indices)
+
+
+def bucket_bounds(index):
+    """Inclusive (low, high) values of a bucket."""
+    if index < _SUB_BUCKETS:
+        return index, index
+    shift = index // _HALF_BUCKETS - 1
+    top = index - shift * _HALF_BUCKETS
+    return top << shift, ((top + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """
+    Sparse HDR-style histogram of integer microseconds. Percentiles report
+    the highest value equivalent to their bucket, as HdrHistogram does.
+    """
+
+    __slots__ = ("counts", "total")
+
+    def __init__(self):
+        self.counts = {}
+        self.total = 0
+
+    def add(self, value, count=1):
+        index = bucket_index(value)
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.total += count
+
+    def add_bucket(self, index, count):
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.total += count
+
+    def merge(self, other):
+        for index, count in other.counts.items():
+            self.add_bucket(index, count)
+
+    def percentile(self, p):
+        if not self.total:
+            return None
+        rank = max(1, -(-self.total * p // 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return bucket_bounds(index)[1]
+
+    def summary(self):
+        result = {"count": self.total}
+        for p in PERCENTILES + (100,):
+            value = self.percentile(p)
+            label = "max_ms" if p == 100 else f"p{p}_ms"
+            result[label] = None if value is None else round(value / 1000, 1)
+        return result
+
+
+# -------------------------------------------------------------------------
+# RECORDER
+# -------------------------------------------------------------------------
+
+class TelemetryRecorder:
+    """
+    Collects per-list events for one generation run.
+
+    Args:
+        events_path: JSONL file for the raw events (None keeps histograms only)
+        flush_every: events per batch handed to the folding thread
+    """
+
+    def __init__(self, events_path=None, flush_every=FLUSH_EVERY):
+        self.events_path = events_path
+        self.flush_every = flush_every
+        self._file = open(events_path, "w", encoding="utf-8") if events_path else None
+        self._pending = []
+        self._batches = queue.Queue(MAX_QUEUED_BATCHES)
+        self._worker = None
+        self._error = None
+        self._buckets = {}         # (discipline, locale, difficulty, num_questions) -> {bucket: count}
+        self.outcomes = Counter()  # outcome -> count
+        self.failures = Counter()  # key -> failed count
+        self.started = time.time()
+        self.events = 0
+
+    def record(self, *event):
+        """
+        record(list_id, discipline, locale, difficulty, num_questions, seconds,
+               outcome="success")
+
+        Hot path: appends the argument tuple as is (no clock read, no tuple
+        built here); a full batch is handed to the folding thread.
+        """
+        pending = self._pending
+        pending.append(event)
+        if len(pending) >= self.flush_every:
+            self._hand_off()
+
+    def _hand_off(self):
+        pending, self._pending = self._pending, []
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._fold_batches, name="telemetry-fold",
+                                            daemon=True)
+            self._worker.start()
+        self._batches.put(pending)
+
+    def _fold_batches(self):
+        while True:
+            batch = self._batches.get()
+            try:
+                if self._error is None:
+                    self._fold(batch)
+            except Exception as e:
+                self._error = e
+            finally:
+                self._batches.task_done()
+
+    def flush(self):
+        """Fold every event recorded so far, waiting for the folding thread."""
+        pending, self._pending = self._pending, []
+        self._batches.join()
+        if self._error is not None:
+            raise RuntimeError(f"telemetry folding failed: {self._error}") from self._error
+        if pending:
+            self._fold(pending)
+
+    def _fold(self, pending):
+        """Fold a batch into bucket counts and write its JSONL lines."""
+        buckets = self._buckets
+        for key, index in zip(map(_group_of, pending), bucket_indices(map(_seconds_of, pending))):
+            counts = buckets.get(key)
+            if counts is None:
+                counts = buckets[key] = {}
+            counts[index] = counts.get(index, 0) + 1
+        outcomes = [event[6] if len(event) > 6 else "success" for event in pending]
+        self.outcomes.update(outcomes)
+        self.failures.update([event[1:5] for event, outcome in zip(pending, outcomes)
+                              if outcome != "success"])
+        self.events += len(pending)
+        if self._file:
+            at = round(_wall_clock(), 3)
+            lines = []
+            for event, outcome in zip(pending, outcomes):
+                list_id, discipline, locale, difficulty, num_questions, seconds = event[:6]
+                lines.append(json.dumps(
+                    {"t": at, "list_id": list_id, "discipline": discipline,
+                     "locale": locale, "difficulty": difficulty, "n": num_questions,
+                     "ms": round(int(seconds * 1_000_000) / 1000, 1), "outcome": outcome},
+                    ensure_ascii=False, separators=(",", ":")))
+            self._file.write("\n".join(lines) + "\n")
+
+    def histograms(self):
+        """(discipline, locale, difficulty, num_questions) -> LatencyHistogram."""
+        self.flush()
+        histograms = {}
+        for key, counts in self._buckets.items():
+            histogram = histograms[key] = LatencyHistogram()
+            for index, count in counts.items():
+                histogram.add_bucket(index, count)
+        return histograms
+
+    def close(self):
+        self.flush()
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def summary(self):
+        """Run-level telemetry for the corpus header."""
+        histograms = self.histograms()
+        overall = LatencyHistogram()
+        groups = []
+        for key in sorted(histograms, key=lambda k: tuple(str(part) for part in k)):
+            histogram = histograms[key]
+            overall.merge(histogram)
+            discipline, locale, difficulty, num_questions = key
+            groups.append({"discipline": discipline, "locale": locale, "difficulty": difficulty,
+                           "num_questions": num_questions, "failures": self.failures.get(key, 0),
+                           **histogram.summary()})
+        elapsed = time.time() - self.started
+        return {
+            "events": self.events,
+            "outcomes": dict(sorted(self.outcomes.items())),
+            "wall_seconds": round(elapsed, 3),
+            "latency": overall.summary(),
+            "by_group": groups,
+            "events_file": os.path.basename(self.events_path) if self.events_path else None,
+        }
+
+
+def annotate_header(corpus, recorder):
+    """Return corpus with a "telemetry" entry right after failed_lists."""
+    summary = recorder.summary()
+    annotated = {}
+    for key, value in corpus.items():
+        annotated[key] = value
+        if key == "failed_lists":
+            annotated["telemetry"] = summary
+    annotated.setdefault("telemetry", summary)
+    return annotated
+
+
+def load_events(path, recorder=None):
+    """Rebuild a recorder (without an events file) from a telemetry JSONL."""
+    recorder = recorder or TelemetryRecorder()
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                event = json.loads(line)
+                recorder.record(event["list_id"], event["discipline"], event["locale"],
+                                event["difficulty"], event["n"], event["ms"] / 1000,
+                                event["outcome"])
+    recorder.flush()
+    return recorder
+
+
+def benchmark(n=BENCH_EVENTS, repeats=5, seed=1):
+    """
+    Best-of-repeats nanoseconds per event on n synthetic events (no events
+    file), the bare loop over the events subtracted:
+        record_ns - the caller's record() loop, batches handed off as in a run
+                    and the folding thread idle until the loop ends (the
+                    generator waits on the backend most of the time)
+        fold_ns   - folding those batches on the background thread
+    A caller recording back to back while the thread folds shares the GIL
+    with it and pays roughly the sum.
+    """
+    rng = random.Random(seed)
+    disciplines = ("Mathematics", "History", "Physics", "Portuguese")
+    events = [(i, disciplines[i % 4], ("en_US", "pt_BR")[i % 2], 100 * (1 + i % 10), 2 + i % 9,
+               rng.lognormvariate(1, 0.5), "failed" if i % 50 == 0 else "success")
+              for i in range(n)]
+    best = {"loop": float("inf"), "record": float("inf"), "fold": float("inf")}
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for event in events:
+            pass
+        best["loop"] = min(best["loop"], time.perf_counter() - start)
+
+        recorder = TelemetryRecorder(flush_every=FLUSH_EVERY)
+        recorder._batches = queue.Queue()       # unbounded, so the caller never waits
+        hold = threading.Lock()
+        hold.acquire()
+        recorder._worker = threading.Thread(target=lambda: (hold.acquire(),
+                                                            recorder._fold_batches()),
+                                            daemon=True)
+        recorder._worker.start()
+        record = recorder.record
+        start = time.perf_counter()
+        for event in events:
+            record(*event)
+        recorded = time.perf_counter()
+        hold.release()
+        recorder.flush()
+        best["record"] = min(best["record"], recorded - start)
+        best["fold"] = min(best["fold"], time.perf_counter() - recorded)
+    record_ns = (best["record"] - best["loop"]) / n * 1e9
+    fold_ns = best["fold"] / n * 1e9
+    return {"events": n, "record_ns": round(record_ns), "fold_ns": round(fold_ns)}
+
+
+def print_summary(summary, limit=15):
+    print(f"# =========================================================================")
+    print(f"# TELEMETRY")
+    print(f"# =========================================================================")
+    print(f"# Events: {summary['events']}  outcomes: {summary['outcomes']}")
+    latency = summary["latency"]
+    print(f"# Latency p50 {latency['p50_ms']} ms, p95 {latency['p95_ms']} ms, "
+          f"p99 {latency['p99_ms']} ms, max {latency['max_ms']} ms")
+    print(f"# Slowest groups by p95:")
+    slowest = sorted(summary["by_group"], key=lambda g: -(g["p95_ms"] or 0))[:limit]
+    for group in slowest:
+        print(f"#   {group['discipline']:<22} {group['locale']:<6} {group['difficulty']:>4} "
+              f"n={group['num_questions']:<3} count={group['count']:<5} "
+              f"p50={group['p50_ms']:>8} p95={group['p95_ms']:>8} p99={group['p99_ms']:>8} "
+              f"failed={group['failures']}")
+
+
+# -------------------------------------------------------------------------
+# MAIN EXECUTION
+# -------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    if "--summarize" in sys.argv:
+        path = sys.argv[sys.argv.index("--summarize") + 1]
+        print_summary(load_events(path).summary())
+        sys.exit(0)
+    if "--bench" in sys.argv:
+        result = benchmark()
+        print(f"# {result['events']:,} events, best of 5: record() {result['record_ns']} ns per event "
+              f"on the caller; folding {result['fold_ns']} ns per event on the telemetry thread")
+        sys.exit(0)
+
+    import generate_bilingual_requests as bilingual
+    from concurrency_controller import SimulatedBackend, VirtualClock
+    from request_coalescing import DEFAULT_CSV_PATH, build_corpus, dispatch, simulated_backend
+
+    random.seed(42)
+    requests = bilingual.generate_all_requests(DEFAULT_CSV_PATH, questions_per_discipline=40)
+
+    # Each simulated backend call advances a virtual clock by its modelled latency
+    clock = VirtualClock()
+    latency_model = SimulatedBackend(throttle_at=0, throttle_probability=0.03, seed=1)
+
+    def timed_backend(batch):
+        seconds, error = latency_model.call(clock.now, 1)
+        clock.now += seconds * (1 + 0.25 * (batch["num_mcq"] + batch["num_discursive"]))
+        if error:
+            raise RuntimeError("throttled")
+        return simulated_backend(batch)
+
+    events_path = "simulated_run.telemetry.jsonl"
+    recorder = TelemetryRecorder(events_path)
+    question_lists, stats = dispatch(requests, timed_backend, telemetry=recorder, clock=clock)
+    corpus = annotate_header(build_corpus(question_lists, model_used="simulated"), recorder)
+    recorder.close()
+    print_summary(corpus["telemetry"])
+    print(f"# Events written to {events_path}")
@@ -13,6 +13,8 @@ REQUIREMENTS:
 
 import random
 
+from build_catalog_constants import load_catalog_constants
+
 # -------------------------------------------------------------------------
 # CONFIGURATION
 # -------------------------------------------------------------------------
@@ -29,115 +31,9 @@ AVAILABLE_GRADES = [60, 70, 80, 90, 100, 110, 120]
 # Difficulty levels
 DIFFICULTY_LEVELS = [300, 500, 700]
 
-# Discipline categories mapping (from CSV analysis)
-DISCIPLINE_CATEGORIES = {
-    "Mathematics": [
-        "Trigonometry",
-        "Magnitudes and Measurements",
-        "Arithmetic and Numbers",
-        "Geometry",
-        "Algebra",
-        "Statistics",
-        "Combinatorial Analysis and Probability"
-    ],
-    "Science": [
-        "Matter and Energy",
-        "Life and Evolution",
-        "Earth and Universe"
-    ],
-    "Physics": [
-        "Thermology",
-        "Modern Physics and Relativity",
-        "Electromagnetism",
-        "Waves and Optics",
-        "Introduction to Physics",
-        "Statics and Dynamics",
-        "Kinematics",
-        "Astronomy"
-    ],
-    "Biology": [
-        "Human Anatomy and Physiology",
-        "Genetics and Heredity",
-        "Biochemistry and Metabolism",
-        "Introduction to Biology and Evolution",
-        "Ecology and Environment",
-        "Structure and Function of Organisms"
-    ],
-    "Chemistry": [
-        "Inorganic Compounds and Stoichiometry",
-        "Organic Chemistry: Isomerism and Reactions",
-        "Atoms and Periodic Table",
-        "Chemical Equilibrium and Electrochemistry",
-        "Solutions and Colligative Properties",
-        "Introduction to Chemistry",
-        "Thermochemistry, Kinetics and Nuclear",
-        "Organic Chemistry: Organic Compounds"
-    ],
-    "History": [
-        "Ancient History",
-        "Modern History",
-        "Medieval History",
-        "Contemporary History",
-        "Theory of History"
-    ],
-    "Geography": [
-        "Territory",
-        "Geographic Space",
-        "Theory of Geography",
-        "Geopolitics",
-        "Region",
-        "Ecosystem and Biome",
-        "Human Development"
-    ],
-    "English Language Arts": [
-        "Verbs",
-        "Vocabulary",
-        "Reading, Writing, and Comprehension",
-        "Grammar"
-    ],
-    "Philosophy": [
-        "Culture",
-        "Ethics",
-        "Politics",
-        "Origin",
-        "Concept"
-    ],
-    "Arts": [
-        "Performing Arts",
-        "Music",
-        "Visual Art",
-        "Scenic Art",
-        "Art Knowledge",
-        "Art and Movement",
-        "Artistic Production"
-    ],
-    "Physical Education": [
-        "Dance",
-        "Wrestling",
-        "Recreation",
-        "Research in Sports",
-        "Sport",
-        "Ethics in Sports",
-        "Health"
-    ],
-    "Sociology": [
-        "Individual and Social Class",
-        "Sociology Theory",
-        "Social Structure"
-    ],
-    "Economics": [
-        "Current Economy",
-        "Basic Economic Concepts",
-        "Finance and Investment",
-        "Economic Indicators and Policies",
-        "Market Structures and Competition"
-    ],
-    "Environmental Sciences": [
-        "Human Action",
-        "Biomes and Ecosystems",
-        "Action of Nature"
-    ]
-}
+# Discipline categories mapping, generated from the CSV by
+# build_catalog_constants.py (discipline -> tuple of topics)
+DISCIPLINE_CATEGORIES = load_catalog_constants().TOPICS
 
 
 # -------------------------------------------------------------------------
@@ -171,7 +67,7 @@ def generate_requests_for_discipline(discipline, num_requests=10):
         raise ValueError(f"Unknown discipline: {discipline}")
 
     # Get available categories for this discipline
-    available_categories = DISCIPLINE_CATEGORIES[discipline].copy()
+    available_categories = list(DISCIPLINE_CATEGORIES[discipline])
 
     # Select 5 random English and 5 random Portuguese locales
     selected_en_locales = random.sample(ENGLISH_LOCALES, min(5, len(ENGLISH_LOCALES)))
@@ -188,7 +84,7 @@ def generate_requests_for_discipline(discipline, num_requests=10):
             # available_categories.remove(category)
         else:
             # If we run out, reset the pool
-            available_categories = DISCIPLINE_CATEGORIES[discipline].copy()
+            available_categories = list(DISCIPLINE_CATEGORIES[discipline])
             category = random.choice(available_categories)
 
         # Random locale from the selected 10
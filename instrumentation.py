@@ -0,0 +1,282 @@
+"""
+Stage-level Instrumentation and Profiling Hooks for the Generators
+
+REQUIREMENTS:
+- Per-stage wall time and call counts (CSV parsing, index building, sampling,
+  translation, output)
+- Named counters for retries (e.g. rejection-loop attempts)
+- Peak memory per stage and for the whole run
+- Enabled by the --profile flag or the TEACHY_PROFILE environment variable,
+  near-zero overhead when off
+- Optional cProfile and tracemalloc dumps plus a JSON report next to the output
+- Safe to use from several threads (generation_daemon.py request threads):
+  the stage stack is per thread and the shared totals are updated under a
+  lock. Traced-memory peaks are process-wide, so with concurrent stages a
+  stage's peak includes the other threads' allocations
+
+USAGE:
+    TEACHY_PROFILE=1 python3 generate_bilingual_requests.py > out.py   # "", 0, false, no = off
+    python3 generate_bilingual_requests.py --profile > out.py
+
+    TEACHY_PROFILE=<path>      report base path (default: <script name>)
+    TEACHY_PROFILE_CPROFILE=1  also dump <base>.prof (open with pstats/snakeviz)
+    TEACHY_PROFILE_TRACEMALLOC=1  trace allocations, dump <base>.tracemalloc
+
+Writes <base>.profile.json with one entry per stage.
+"""
+
+import cProfile
+import functools
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import nullcontext
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# -------------------------------------------------------------------------
+# CONFIGURATION
+# -------------------------------------------------------------------------
+
+ENV_VAR = "TEACHY_PROFILE"
+CPROFILE_ENV_VAR = "TEACHY_PROFILE_CPROFILE"
+TRACEMALLOC_ENV_VAR = "TEACHY_PROFILE_TRACEMALLOC"
+CLI_FLAG = "--profile"
+OFF_VALUES = ("", "0", "false", "no", "off")
+
+# Module-level switch checked by every hook; a single global lookup when off
+enabled = False
+
+_stages = {}
+_counters = {}
+_local = threading.local()      # .stack: the calling thread's open stages
+_lock = threading.Lock()        # guards _stages and _counters
+_profiler = None
+_started_at = None
+_NULL_STAGE = nullcontext()
+
+# -------------------------------------------------------------------------
+# ENABLE / DISABLE
+# -------------------------------------------------------------------------
+
+def enable(profile=False, trace_memory=False):
+    """Start collecting stage timings (and optionally cProfile / tracemalloc)."""
+    global enabled, _profiler, _started_at
+    reset()
+    enabled = True
+    _started_at = time.perf_counter()
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    if profile:
+        _profiler = cProfile.Profile()
+        _profiler.enable()
+
+
+def disable():
+    """Stop collecting. Collected data stays available to report()."""
+    global enabled
+    enabled = False
+    if _profiler is not None:
+        _profiler.disable()
+
+
+def reset():
+    """Drop everything collected so far."""
+    global _local, _profiler, _started_at
+    _stages.clear()
+    _counters.clear()
+    _local = threading.local()
+    _profiler = None
+    _started_at = None
+
+
+def configure_from_environment(argv=None):
+    """
+    Enable instrumentation if TEACHY_PROFILE is set or --profile is on the
+    command line. Removes --profile from argv so scripts never see it.
+    """
+    argv = sys.argv if argv is None else argv
+    requested = env_flag(ENV_VAR)
+    if CLI_FLAG in argv:
+        argv.remove(CLI_FLAG)
+        requested = True
+    if requested:
+        enable(profile=env_flag(CPROFILE_ENV_VAR), trace_memory=env_flag(TRACEMALLOC_ENV_VAR))
+    return requested
+
+
+def env_flag(name):
+    """True unless the variable is unset or one of OFF_VALUES (case-insensitive)."""
+    return os.environ.get(name, "").strip().lower() not in OFF_VALUES
+
+
+def _stack():
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+# -------------------------------------------------------------------------
+# HOOKS
+# -------------------------------------------------------------------------
+
+class _Stage:
+    __slots__ = ("name", "start", "peak")
+
+    def __init__(self, name):
+        self.name = name
+        self.start = 0.0
+        self.peak = 0
+
+    def __enter__(self):
+        stack = _stack()
+        if tracemalloc.is_tracing():
+            # Fold the peak reached so far into the enclosing stage before
+            # resetting it for this one
+            peak = tracemalloc.get_traced_memory()[1]
+            if stack:
+                stack[-1].peak = max(stack[-1].peak, peak)
+            tracemalloc.reset_peak()
+        stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self.start
+        stack = _stack()
+        stack.pop()
+        if tracemalloc.is_tracing():
+            self.peak = max(self.peak, tracemalloc.get_traced_memory()[1])
+            if stack:
+                stack[-1].peak = max(stack[-1].peak, self.peak)
+
+        with _lock:
+            stats = _stages.get(self.name)
+            if stats is None:
+                stats = _stages[self.name] = {"calls": 0, "wall_s": 0.0, "max_s": 0.0,
+                                              "peak_bytes": 0}
+            stats["calls"] += 1
+            stats["wall_s"] += elapsed
+            stats["max_s"] = max(stats["max_s"], elapsed)
+            stats["peak_bytes"] = max(stats["peak_bytes"], self.peak)
+        return False
+
+
+def stage(name):
+    """Context manager timing a block as `name`. A shared no-op when disabled."""
+    if not enabled:
+        return _NULL_STAGE
+    return _Stage(name)
+
+
+def instrumented(name=None):
+    """Decorator timing every call of the function as a stage."""
+    def decorator(func):
+        stage_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not enabled:
+                return func(*args, **kwargs)
+            with _Stage(stage_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def count(name, n=1):
+    """Increment a named counter (retries, rows skipped, ...)."""
+    if enabled:
+        with _lock:
+            _counters[name] = _counters.get(name, 0) + n
+
+
+# -------------------------------------------------------------------------
+# REPORTING
+# -------------------------------------------------------------------------
+
+def _process_peak_rss_bytes():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def report():
+    """Return the collected data as a JSON-serializable dict."""
+    stages = {}
+    with _lock:
+        collected = sorted(((name, dict(stats)) for name, stats in _stages.items()),
+                           key=lambda kv: -kv[1]["wall_s"])
+        counters = dict(sorted(_counters.items()))
+    for stage_name, stats in collected:
+        stages[stage_name] = {
+            "calls": stats["calls"],
+            "wall_ms": round(stats["wall_s"] * 1000, 3),
+            "mean_ms": round(stats["wall_s"] * 1000 / stats["calls"], 3),
+            "max_ms": round(stats["max_s"] * 1000, 3),
+            "peak_traced_bytes": stats["peak_bytes"] if tracemalloc.is_tracing() else None,
+        }
+
+    total = time.perf_counter() - _started_at if _started_at is not None else None
+    return {
+        "generated_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "total_wall_ms": round(total * 1000, 3) if total is not None else None,
+        "peak_rss_bytes": _process_peak_rss_bytes(),
+        "peak_traced_bytes": (tracemalloc.get_traced_memory()[1]
+                              if tracemalloc.is_tracing() else None),
+        "stages": stages,
+        "counters": counters,
+    }
+
+
+def write_report(base_path=None):
+    """
+    Write <base>.profile.json (plus .prof / .tracemalloc dumps when those
+    collectors are running). Returns the list of files written.
+
+    base_path defaults to the TEACHY_PROFILE value when it is a path, else
+    to the running script's name in the current directory.
+    """
+    if base_path is None:
+        env_value = os.environ.get(ENV_VAR, "")
+        if env_value.strip().lower() not in OFF_VALUES + ("1", "true", "yes", "on"):
+            base_path = env_value
+        else:
+            base_path = os.path.splitext(os.path.basename(sys.argv[0] or "run"))[0]
+
+    written = []
+    data = report()
+
+    if _profiler is not None:
+        _profiler.disable()
+        _profiler.dump_stats(base_path + ".prof")
+        written.append(base_path + ".prof")
+
+    if tracemalloc.is_tracing():
+        tracemalloc.take_snapshot().dump(base_path + ".tracemalloc")
+        written.append(base_path + ".tracemalloc")
+
+    with open(base_path + ".profile.json", "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    written.insert(0, base_path + ".profile.json")
+    return written
+
+
+def finish(base_path=None):
+    """Write the report if instrumentation is on; announce files on stderr."""
+    if not enabled:
+        return []
+    disable()
+    written = write_report(base_path)
+    for path in written:
+        print(f"# Profile written: {path}", file=sys.stderr)
+    return written
@@ -0,0 +1,399 @@
+"""
+{{MATH}} / LaTeX Integrity Validator for Generated Corpora
+
+REQUIREMENTS:
+- Validate every text field of every question (statement, solution, answer,
+  incorrect alternatives) in list_of_questions / individual_questions files
+- Hand-written single-pass scanner per field, mirroring what
+  convertMathTags() + KaTeX auto-render in the evaluators will do:
+    errors   - malformed / unclosed / unopened / mismatched / nested {{MATH}} and
+               {{MATHBLOCK}} tags, unbalanced braces, unbalanced
+               \\left / \\right, unsafe commands (macro definitions, links,
+               raw HTML), double-escaped commands ("\\\\times" renders as a
+               line break followed by the word "times")
+    warnings - unknown commands, LaTeX commands or "\\\\" outside math,
+               escaped newlines ("\\n" as two characters), empty math spans
+- Questions spread over a process pool
+- Results cached per question content hash (latex_validator.cache), so
+  re-validating a mostly unchanged corpus only scans the new questions
+
+USAGE:
+    python3 latex_validator.py list_of_questions_to_test_v3.json
+    python3 latex_validator.py individual_questions_to_test_Jan26.json --results latex.jsonl
+    python3 latex_validator.py corpus.json --workers 4 --no-cache
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import sys
+import time
+from collections import Counter
+from multiprocessing import Pool
+
+from corpus_stream import iter_array
+
+# -------------------------------------------------------------------------
+# CONFIGURATION
+# -------------------------------------------------------------------------
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CACHE_PATH = os.path.join(SCRIPT_DIR, "latex_validator.cache")
+
+# Bump when the rules change: cached results from older rules are discarded
+VALIDATOR_VERSION = 1
+
+BATCH_SIZE = 2048         # questions per pool round (bounds memory)
+EXCERPT_CHARS = 40
+
+TEXT_FIELDS = ("question_statement", "question_solution", "answer", "correct_answer")
+
+# Tag -> (kind, opening)
+TAGS = {
+    "{{MATH}}": ("MATH", True),
+    "{{/MATH}}": ("MATH", False),
+    "{{MATHBLOCK}}": ("MATHBLOCK", True),
+    "{{/MATHBLOCK}}": ("MATHBLOCK", False),
+}
+
+# "{{MATH}0" and the like: a tag KaTeX will never see
+MALFORMED_TAG_PREFIXES = ("{{MATH", "{{/MATH")
+
+ERRORS = frozenset({
+    "malformed_tag", "unclosed_tag", "unopened_closing_tag", "mismatched_tag", "nested_math_tag",
+    "unbalanced_braces", "unbalanced_left_right", "unsafe_command", "double_escaped_command",
+})
+
+# Need KaTeX's trust option, define macros, or touch files / HTML
+UNSAFE_COMMANDS = frozenset("""
+    href url includegraphics htmlClass htmlId htmlStyle htmlData
+    def gdef edef xdef let futurelet newcommand renewcommand providecommand
+    input include write openout immediate catcode
+    """.split())
+
+# Commands the generator is expected to use (KaTeX supports all of them)
+KNOWN_COMMANDS = frozenset("""
+    alpha beta gamma delta epsilon varepsilon zeta eta theta vartheta iota kappa lambda
+    mu nu xi pi varpi rho varrho sigma varsigma tau upsilon phi varphi chi psi omega
+    Gamma Delta Theta Lambda Xi Pi Sigma Upsilon Phi Psi Omega
+    frac dfrac tfrac cfrac sqrt root binom dbinom tbinom over
+    times cdot div pm mp ast star circ bullet oplus ominus otimes odot cap cup
+    setminus wedge vee neg lnot land lor
+    le leq ge geq lt gt ne neq approx sim simeq cong equiv propto ll gg prec succ
+    in notin ni subset subseteq supset supseteq emptyset varnothing forall exists nexists
+    mid parallel perp angle measuredangle triangle square degree prime infty partial nabla
+    to gets rightarrow leftarrow leftrightarrow Rightarrow Leftarrow Leftrightarrow
+    longrightarrow longleftarrow implies iff mapsto uparrow downarrow rightleftharpoons
+    leftrightharpoons xrightarrow xleftarrow
+    sin cos tan cot sec csc arcsin arccos arctan sinh cosh tanh log ln lg exp lim
+    limsup liminf max min sup inf det gcd deg dim ker arg sum prod int iint iiint oint
+    left right big Big bigg Bigg bigl bigr Bigl Bigr middle
+    text textbf textit textrm mathrm mathbf mathit mathcal mathbb mathsf mathtt
+    operatorname boldsymbol bm displaystyle textstyle scriptstyle
+    vec hat bar overline underline widehat widetilde tilde dot ddot overrightarrow
+    overleftarrow overbrace underbrace cancel bcancel xcancel boxed
+    quad qquad space hspace vspace enspace thinspace medspace thickspace
+    begin end hline cline
+    ldots cdots vdots ddots dots dotsc dotsb
+    lbrace rbrace langle rangle lceil rceil lfloor rfloor vert Vert lvert rvert
+    therefore because checkmark dagger ddagger ell hbar aleph Re Im wp
+    color textcolor colorbox
+    ce pu
+    """.split())
+
+# -------------------------------------------------------------------------
+# SCANNER
+# -------------------------------------------------------------------------
+
+def _issue(issues, code, text, offset):
+    issues.append({
+        "code": code,
+        "severity": "error" if code in ERRORS else "warning",
+        "offset": offset,
+        "excerpt": text[max(0, offset - 10):offset + EXCERPT_CHARS - 10],
+    })
+
+
+def _command(text, pos):
+    """Name of the command whose backslash is at pos, and where it ends."""
+    end = pos + 1
+    n = len(text)
+    while end < n and text[end].isascii() and text[end].isalpha():
+        end += 1
+    return text[pos + 1:end], end
+
+
+def scan(text):
+    """
+    Single left-to-right pass over one text field. Returns a list of issues
+    ({code, severity, offset, excerpt}).
+    """
+    issues = []
+    n = len(text)
+    i = 0
+    math = None          # kind of the open math span, or None
+    math_start = 0
+    content_seen = False
+    depth = 0            # brace depth inside math
+    brace_opened = []    # offsets of open braces
+    lefts = 0
+
+    while i < n:
+        char = text[i]
+
+        if char == "{" and text.startswith("{{", i):
+            end = text.find("}}", i + 2)
+            tag = TAGS.get(text[i:end + 2]) if end != -1 else None
+            if tag is None and text.startswith(MALFORMED_TAG_PREFIXES, i):
+                _issue(issues, "malformed_tag", text, i)
+            if tag is not None:
+                kind, opening = tag
+                if opening:
+                    if math is not None:
+                        _issue(issues, "nested_math_tag", text, i)
+                    math, math_start, content_seen = kind, i, False
+                    depth, brace_opened, lefts = 0, [], 0
+                else:
+                    if math is None:
+                        _issue(issues, "unopened_closing_tag", text, i)
+                    else:
+                        if kind != math:
+                            _issue(issues, "mismatched_tag", text, i)
+                        if depth > 0:
+                            _issue(issues, "unbalanced_braces", text, brace_opened[-1])
+                        if lefts:
+                            _issue(issues, "unbalanced_left_right", text, math_start)
+                        if not content_seen:
+                            _issue(issues, "empty_math", text, math_start)
+                    math = None
+                i = end + 2
+                continue
+
+        if math is None:
+            # Outside math: only backslashes matter
+            if char == "\\":
+                following = text[i + 1:i + 2]
+                if following == "\\":
+                    _issue(issues, "backslashes_outside_math", text, i)
+                    i += 2
+                    continue
+                name, end = _command(text, i)
+                if name in UNSAFE_COMMANDS:
+                    _issue(issues, "unsafe_command", text, i)
+                elif name.startswith("n") and name not in KNOWN_COMMANDS:
+                    # "\nHeat" is an escaped newline before "Heat", not a command
+                    _issue(issues, "escaped_newline", text, i)
+                    end = i + 2
+                elif name:
+                    _issue(issues, "command_outside_math", text, i)
+                i = max(end, i + 1)
+                continue
+            i += 1
+            continue
+
+        # Inside math
+        if not char.isspace():
+            content_seen = True
+        if char == "{":
+            depth += 1
+            brace_opened.append(i)
+        elif char == "}":
+            if depth == 0:
+                _issue(issues, "unbalanced_braces", text, i)
+            else:
+                depth -= 1
+                brace_opened.pop()
+        elif char == "\\":
+            following = text[i + 1:i + 2]
+            if following == "\\":
+                name, end = _command(text, i + 1)
+                if name in KNOWN_COMMANDS or name in UNSAFE_COMMANDS:
+                    _issue(issues, "double_escaped_command", text, i)
+                    i = end
+                else:
+                    i += 2          # "\\" line break
+                continue
+            name, end = _command(text, i)
+            if not name:
+                i += 2              # \, \% \{ \  ... (escaped braces are not braces)
+                continue
+            if name in UNSAFE_COMMANDS:
+                _issue(issues, "unsafe_command", text, i)
+            elif name == "left":
+                lefts += 1
+            elif name == "right":
+                if lefts == 0:
+                    _issue(issues, "unbalanced_left_right", text, i)
+                else:
+                    lefts -= 1
+            elif name not in KNOWN_COMMANDS:
+                _issue(issues, "unknown_command", text, i)
+            i = end
+            continue
+        i += 1
+
+    if math is not None:
+        _issue(issues, "unclosed_tag", text, math_start)
+    return issues
+
+
+# -------------------------------------------------------------------------
+# QUESTIONS AND CACHE
+# -------------------------------------------------------------------------
+
+def question_fields(question):
+    """(field name, text) of every text a reviewer sees rendered."""
+    fields = [(name, question[name]) for name in TEXT_FIELDS if isinstance(question.get(name), str)]
+    for i, alternative in enumerate(question.get("incorrect_alternatives") or []):
+        if isinstance(alternative, str):
+            fields.append((f"incorrect_alternatives[{i}]", alternative))
+    return fields
+
+
+def content_hash(fields):
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(VALIDATOR_VERSION).encode())
+    for name, text in fields:
+        digest.update(b"\0" + name.encode() + b"\0" + text.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def validate_fields(fields):
+    """Issues of one question, each tagged with its field."""
+    issues = []
+    for name, text in fields:
+        for issue in scan(text):
+            issue["field"] = name
+            issues.append(issue)
+    return issues
+
+
+def load_cache(path):
+    try:
+        with open(path, "rb") as f:
+            version, cache = pickle.load(f)
+    except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+        return {}
+    return cache if version == VALIDATOR_VERSION else {}
+
+
+def save_cache(cache, path):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump((VALIDATOR_VERSION, cache), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def iter_items(path):
+    """Yield (list_id, position, question) for list and individual-question corpora."""
+    for number, item in enumerate(iter_array(path, ("question_lists", "questions"))):
+        if isinstance(item.get("questions"), list):
+            for position, question in enumerate(item["questions"]):
+                yield item.get("list_id"), position, question
+        else:
+            yield None, number, item
+
+
+def validate_corpus(path, cache, workers=None, stats=None):
+    """
+    Yield (list_id, position, issues) for every question of a corpus, in
+    order. Questions whose content hash is in cache are not rescanned;
+    new results are added to cache.
+    """
+    stats = stats if stats is not None else Counter()
+    pool = Pool(workers) if workers != 1 else None
+    try:
+        batch = []
+        for list_id, position, question in iter_items(path):
+            fields = question_fields(question)
+            batch.append((list_id, position, content_hash(fields), fields))
+            if len(batch) >= BATCH_SIZE:
+                yield from _validate_batch(batch, cache, pool, stats)
+                batch = []
+        yield from _validate_batch(batch, cache, pool, stats)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+
+def _validate_batch(batch, cache, pool, stats):
+    misses = {}
+    for _, _, digest, fields in batch:
+        if digest not in cache and digest not in misses:
+            misses[digest] = fields
+    stats["questions"] += len(batch)
+    stats["scanned"] += len(misses)
+    if misses:
+        if pool is None:
+            results = map(validate_fields, misses.values())
+        else:
+            results = pool.imap(validate_fields, misses.values(), 64)
+        cache.update(zip(misses, results))
+    for list_id, position, digest, _ in batch:
+        yield list_id, position, cache[digest]
+
+
+# -------------------------------------------------------------------------
+# MAIN EXECUTION
+# -------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    options = {"--results": None, "--workers": None, "--cache": DEFAULT_CACHE_PATH}
+    for flag in list(options):
+        if flag in args:
+            pos = args.index(flag)
+            options[flag] = args[pos + 1]
+            del args[pos:pos + 2]
+    use_cache = "--no-cache" not in args
+    if not use_cache:
+        args.remove("--no-cache")
+    if len(args) != 1:
+        print(__doc__)
+        sys.exit(2)
+
+    cache = load_cache(options["--cache"]) if use_cache else {}
+    workers = int(options["--workers"]) if options["--workers"] else None
+    start = time.perf_counter()
+    stats = Counter()
+    codes = Counter()
+    shown = 0
+    out = open(options["--results"], "w", encoding="utf-8") if options["--results"] else None
+    try:
+        for list_id, position, issues in validate_corpus(args[0], cache, workers, stats):
+            if not issues:
+                continue
+            stats["with_issues"] += 1
+            stats["with_errors"] += any(issue["severity"] == "error" for issue in issues)
+            codes.update(issue["code"] for issue in issues)
+            if out:
+                out.write(json.dumps({"list_id": list_id, "position": position, "issues": issues},
+                                     ensure_ascii=False) + "\n")
+            for issue in issues:
+                if issue["severity"] == "error" and shown < 20:
+                    shown += 1
+                    where = f"list {list_id} question {position}" if list_id is not None \
+                        else f"question {position}"
+                    print(f"{where} {issue['field']}: {issue['code']} at {issue['offset']}: "
+                          f"{issue['excerpt']!r}")
+    finally:
+        if out:
+            out.close()
+    elapsed = time.perf_counter() - start
+    if use_cache:
+        save_cache(cache, options["--cache"])
+
+    print(f"\n# =========================================================================")
+    print(f"# LATEX VALIDATION")
+    print(f"# =========================================================================")
+    print(f"# Questions: {stats['questions']} ({stats['scanned']} scanned, "
+          f"{stats['questions'] - stats['scanned']} from cache)")
+    print(f"# With issues: {stats['with_issues']} ({stats['with_errors']} with errors)")
+    for code, count in codes.most_common():
+        severity = "error" if code in ERRORS else "warning"
+        print(f"#   {code} ({severity}): {count}")
+    print(f"# {elapsed:.2f} s")
+    if options["--results"]:
+        print(f"# Results written to {options['--results']}")
@@ -0,0 +1,483 @@
+"""
+Cached Arithmetic Answer Checker for Math MCQs
+
+REQUIREMENTS:
+- Sandboxed evaluator for the simple LaTeX arithmetic inside {{MATH}} spans
+  (no eval): + - \\times \\cdot \\div /, ^ and 10^{-31}, \\frac / \\dfrac,
+  \\sqrt, parentheses and \\left( \\right), \\%, currency signs ($, \\$,
+  R$, R\\$), decimal commas ("9,109" or "9{,}109" in pt_BR) and thousands
+  separators ("2,500" or "2{,}500" in en_US; "2.500", "300.000.000" and
+  "1.234,5" in pt_BR, where a dot between groups of three digits is never
+  a decimal point)
+- Anything with variables, units inside the expression or unknown commands
+  is "not arithmetic" and skipped, never guessed
+- \text{...} units (with their exponent, \text{ m}^2) are stripped from
+  the value and kept aside: sides / answers are only compared when their
+  units agree, so "50 \text{ mm} = 0.050 \text{ m}" is not an error
+- Memoized per (expression, locale convention)
+- Checks per question:
+    arithmetic_error     - two sides of an "=" chain in the solution disagree
+    answer_mismatch      - the solution's concluding equation (its last math
+                           span, with no number after it) is not the answer,
+                           not even in magnitude ("-30" vs "30")
+    answer_is_distractor - ... and it equals an incorrect alternative
+- Corpora scored on a process pool, mismatches flagged before review
+
+USAGE:
+    python3 math_answer_checker.py list_of_questions_to_test_Jan26.json
+    python3 math_answer_checker.py corpus.json --results math.jsonl --workers 4
+    python3 math_answer_checker.py --self-check      # number-format cases
+"""
+
+import json
+import math
+import re
+import sys
+import time
+from collections import Counter
+from functools import lru_cache
+from multiprocessing import Pool
+
+from corpus_stream import iter_question_lists, question_type
+
+# -------------------------------------------------------------------------
+# CONFIGURATION
+# -------------------------------------------------------------------------
+
+RELATIVE_TOLERANCE = 0.01     # rounded intermediate results ("= 0.33")
+APPROX_TOLERANCE = 0.05       # for "\approx" steps
+MAX_EXPRESSION_CHARS = 300
+MAX_EXPONENT = 308
+MAX_DEPTH = 50
+
+DECIMAL_COMMA_LOCALES = {"pt_BR"}
+
+MATH_SPAN = re.compile(r"\{\{MATH(?:BLOCK)?\}\}(.*?)\{\{/MATH(?:BLOCK)?\}\}", re.DOTALL)
+LEADING_NUMBER = re.compile(r"^[^\d\-−]*?([\-−]?\d[\d.,]*(?:\s*\\?%)?)")
+# A unit: \text{ m} and its exponent, as in \text{ m}^2 or \text{ m}^{-1}
+UNIT = re.compile(r"\\(?:text|mathrm|textrm|mbox)\s*\{([^{}]*)\}(\^(?:\{[^{}]*\}|\d))?")
+SPACING = re.compile(r"\\(?:left|right|[,;:! ]|quad|qquad|displaystyle)(?![a-zA-Z])|\$|\s+")
+CURRENCY = re.compile(r"(?:R|US)?\\?\$")
+THOUSANDS = re.compile(r"(?<![\d.,])\d{1,3}(?:,\d{3})+(?![\d,])")
+DOT_THOUSANDS = re.compile(r"(?<![\d.])\d{1,3}(?:\.\d{3})+(?![\d.])")
+CHAIN_SPLIT = re.compile(r"(=|\\approx)")
+
+TOKEN = re.compile(r"\d+(?:\.\d+)?|\\[a-zA-Z]+|\\%|[-+*/^(){}\[\]%]|.")
+
+OPERATORS = {"\\times": "*", "\\cdot": "*", "\\div": "/", "−": "-", "\\%": "%"}
+
+
+# --self-check cases: (expression, decimal_comma, expected value)
+NUMBER_FORMAT_CASES = [
+    ("2,500 + 500", False, 3000),
+    ("2{,}500", False, 2500),
+    ("9,109", True, 9.109),
+    ("9{,}109", True, 9.109),
+    ("2.500 + 500", True, 3000),
+    ("3.000", True, 3000),
+    ("1.234,5", True, 1234.5),
+    ("300.000.000", True, 300000000),
+    ("R\\$ 1.500,00", True, 1500),
+    ("0.5 + 1.25", True, 1.75),
+]
+
+
+class NotArithmetic(ValueError):
+    """The expression is not plain arithmetic (variables, units, unknown commands)."""
+
+
+# -------------------------------------------------------------------------
+# SANDBOXED EVALUATOR
+# -------------------------------------------------------------------------
+
+def tokenize(expression, decimal_comma):
+    text = SPACING.sub("", CURRENCY.sub("", UNIT.sub("", expression)))
+    # LaTeX braces a comma to keep math-mode spacing off it: 1{,}5, 2{,}500
+    text = text.replace("{,}", ",")
+    if decimal_comma:
+        text = DOT_THOUSANDS.sub(lambda m: m.group(0).replace(".", ""), text)
+        text = re.sub(r"(?<=\d),(?=\d)", ".", text)
+    else:
+        text = THOUSANDS.sub(lambda m: m.group(0).replace(",", ""), text)
+    tokens = []
+    for token in TOKEN.findall(text):
+        token = OPERATORS.get(token, token)
+        tokens.append(token)
+    return tokens
+
+
+class _Parser:
+    """Recursive descent over the token list; every construct is whitelisted."""
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+        self.depth = 0
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def take(self, expected=None):
+        token = self.peek()
+        if token is None or (expected is not None and token != expected):
+            raise NotArithmetic(f"expected {expected or 'a token'}, found {token}")
+        self.pos += 1
+        return token
+
+    def parse(self):
+        value = self.expression()
+        if self.peek() is not None:
+            raise NotArithmetic(f"unexpected {self.peek()}")
+        return value
+
+    def expression(self):
+        self.depth += 1
+        if self.depth > MAX_DEPTH:
+            raise NotArithmetic("too deeply nested")
+        value = self.term()
+        while self.peek() in ("+", "-"):
+            if self.take() == "+":
+                value += self.term()
+            else:
+                value -= self.term()
+        self.depth -= 1
+        return value
+
+    def term(self):
+        value = self.unary()
+        while True:
+            token = self.peek()
+            if token == "*":
+                self.take()
+                value *= self.unary()
+            elif token == "/":
+                self.take()
+                divisor = self.unary()
+                if divisor == 0:
+                    raise NotArithmetic("division by zero")
+                value /= divisor
+            elif token in ("(", "\\frac", "\\dfrac", "\\tfrac", "\\sqrt", "\\pi"):
+                value *= self.unary()      # implicit product: 2(3 + 4), 2\pi
+            else:
+                return value
+
+    def unary(self):
+        token = self.peek()
+        if token == "-":
+            self.take()
+            return -self.unary()
+        if token == "+":
+            self.take()
+            return self.unary()
+        return self.power()
+
+    def power(self):
+        base = self.postfix()
+        if self.peek() != "^":
+            return base
+        self.take()
+        exponent = self.group() if self.peek() == "{" else self.unary()
+        if abs(exponent) > MAX_EXPONENT:
+            raise NotArithmetic("exponent too large")
+        try:
+            value = base ** exponent
+        except (OverflowError, ZeroDivisionError):
+            raise NotArithmetic("power out of range")
+        if isinstance(value, complex):
+            raise NotArithmetic("complex power")
+        return value
+
+    def postfix(self):
+        value = self.primary()
+        while self.peek() == "%":
+            self.take()
+            value /= 100
+        return value
+
+    def group(self):
+        self.take("{")
+        value = self.expression()
+        self.take("}")
+        return value
+
+    def primary(self):
+        token = self.peek()
+        if token is None:
+            raise NotArithmetic("unexpected end")
+        if token[0].isdigit():
+            self.take()
+            return float(token)
+        if token == "(":
+            self.take()
+            value = self.expression()
+            self.take(")")
+            return value
+        if token == "{":
+            return self.group()
+        if token in ("\\frac", "\\dfrac", "\\tfrac"):
+            self.take()
+            numerator = self.group()
+            denominator = self.group()
+            if denominator == 0:
+                raise NotArithmetic("division by zero")
+            return numerator / denominator
+        if token == "\\sqrt":
+            self.take()
+            index = 2.0
+            if self.peek() == "[":
+                self.take()
+                index = self.expression()
+                self.take("]")
+            radicand = self.group() if self.peek() == "{" else self.primary()
+            if radicand < 0 or index == 0:
+                raise NotArithmetic("root out of range")
+            return radicand ** (1 / index)
+        if token == "\\pi":
+            self.take()
+            return math.pi
+        raise NotArithmetic(f"not arithmetic: {token}")
+
+
+@lru_cache(maxsize=1 << 16)
+def evaluate(expression, decimal_comma=False):
+    """Value of a LaTeX arithmetic expression, or None if it is not plain arithmetic."""
+    if not expression or len(expression) > MAX_EXPRESSION_CHARS:
+        return None
+    tokens = tokenize(expression, decimal_comma)
+    if not tokens or not any(token[0].isdigit() for token in tokens):
+        return None
+    try:
+        value = _Parser(tokens).parse()
+    except (NotArithmetic, OverflowError):
+        return None
+    return value if math.isfinite(value) else None
+
+
+def close(a, b, tolerance=RELATIVE_TOLERANCE):
+    return abs(a - b) <= max(1e-12, tolerance * max(abs(a), abs(b)))
+
+
+# -------------------------------------------------------------------------
+# QUESTION CHECKS
+# -------------------------------------------------------------------------
+
+def units(expression):
+    """Normalized units of an expression ("m^2", "g/mol"), "" when it has none."""
+    found = []
+    for name, exponent in UNIT.findall(expression):
+        found.append(normalize_unit(name) + (exponent or "").replace("{", "").replace("}", ""))
+    return " ".join(sorted(unit for unit in found if unit))
+
+
+def normalize_unit(unit):
+    unit = "".join(unit.lower().split())
+    # "mols" / "grams" -> "mol" / "gram"; "m/s" and "s" are left alone
+    if len(unit) > 3 and unit.endswith("s") and unit[-2].isalpha() and "/" not in unit:
+        unit = unit[:-1]
+    return unit
+
+
+def same_units(a, b):
+    """Values are only compared when their units agree (or one side has none)."""
+    return not a or not b or a == b
+
+
+def text_value(text, decimal_comma):
+    """
+    (value, units) of an answer / alternative: its last math span's
+    right-hand side, or its leading number; trailing words are the units.
+    """
+    text = text or ""
+    spans = list(MATH_SPAN.finditer(text))
+    if spans:
+        side = CHAIN_SPLIT.split(spans[-1].group(1))[-1].strip()
+        # "1,6{{MATH}}\\pi \\times 10^{-7}{{/MATH}} V": the coefficient is outside
+        prefix = text[:spans[-1].start()].strip()
+        if LEADING_NUMBER.fullmatch(prefix):
+            side = prefix + side
+        trailing = normalize_unit(text[spans[-1].end():].strip(" .,;"))
+        return evaluate(side, decimal_comma), units(side) or trailing
+    match = LEADING_NUMBER.match(text)
+    if not match:
+        return None, ""
+    return evaluate(match.group(1), decimal_comma), normalize_unit(text[match.end():].strip(" .,;"))
+
+
+def solution_chains(solution, decimal_comma):
+    """
+    For every math span with "=" / "\\approx": list of (value or None, side,
+    approximate, units) for its sides, left to right.
+    """
+    chains = []
+    for span in MATH_SPAN.findall(solution or ""):
+        parts = CHAIN_SPLIT.split(span)
+        if len(parts) < 3:
+            continue
+        first = parts[0].strip()
+        chain = [(evaluate(first, decimal_comma), first, False, units(first))]
+        for i in range(1, len(parts) - 1, 2):
+            side = parts[i + 1].strip()
+            chain.append((evaluate(side, decimal_comma), side, parts[i] != "=", units(side)))
+        chains.append(chain)
+    return chains
+
+
+def final_result(solution, decimal_comma):
+    """
+    (value, side, units) of the solution's concluding equation: its last
+    math span, when that is a chain and no other number follows it in the
+    prose ("... = 4 mols. So 2 mols are produced" concludes outside math).
+    """
+    spans = list(MATH_SPAN.finditer(solution or ""))
+    if not spans or any(char.isdigit() for char in solution[spans[-1].end():]):
+        return None
+    chains = solution_chains(spans[-1].group(0), decimal_comma)
+    if not chains or chains[0][-1][0] is None:
+        return None
+    value, side, _, side_units = chains[0][-1]
+    return value, side, side_units
+
+
+def same_magnitude(a, b):
+    """"The magnitude is 30" answers a final "M = -30"."""
+    return close(abs(a), abs(b))
+
+
+def check_question(question, decimal_comma):
+    """Issues of one question (empty when nothing is checkable or all agree)."""
+    issues = []
+    chains = solution_chains(question.get("question_solution"), decimal_comma)
+    for chain in chains:
+        for (left, left_text, _, left_units), (right, right_text, approximate, right_units) \
+                in zip(chain, chain[1:]):
+            # "50 \\text{ mm} = 0.050 \\text{ m}" is a conversion, not arithmetic
+            if left is None or right is None or not same_units(left_units, right_units):
+                continue
+            if not close(left, right, APPROX_TOLERANCE if approximate else RELATIVE_TOLERANCE):
+                issues.append({"code": "arithmetic_error", "expected": left, "found": right,
+                               "excerpt": f"{left_text} = {right_text}"[:120]})
+
+    if question_type(question) != "MCQ":
+        return issues
+    answer, answer_units = text_value(question.get("answer") or question.get("correct_answer"),
+                                      decimal_comma)
+    if answer is None:
+        return issues
+    result = final_result(question.get("question_solution"), decimal_comma)
+    if result is None or not same_units(result[2], answer_units):
+        return issues
+    final, final_text, _ = result
+    if same_magnitude(final, answer):
+        return issues
+    # The answer may be stated earlier (e.g. before a unit conversion check)
+    if any(same_magnitude(value, answer) for chain in chains for value, _, _, _ in chain if value is not None):
+        return issues
+    issue = {"code": "answer_mismatch", "expected": final, "found": answer, "excerpt": final_text[:120]}
+    for i, alternative in enumerate(question.get("incorrect_alternatives") or []):
+        value, value_units = text_value(alternative, decimal_comma)
+        if value is not None and same_units(value_units, answer_units) \
+                and same_magnitude(value, final):
+            issue["code"] = "answer_is_distractor"
+            issue["alternative"] = i
+            break
+    issues.append(issue)
+    return issues
+
+
+def check_list(question_list):
+    context = question_list.get("request_context") or {}
+    decimal_comma = context.get("locale") in DECIMAL_COMMA_LOCALES
+    flagged = []
+    for position, question in enumerate(question_list.get("questions") or []):
+        issues = check_question(question, decimal_comma)
+        if issues:
+            flagged.append({"position": position, "issues": issues})
+    return {"list_id": question_list.get("list_id"), "discipline": context.get("discipline"),
+            "flagged_questions": flagged}
+
+
+def _check_with_list(question_list):
+    return question_list, check_list(question_list)
+
+
+def check_corpus(path, workers=None, chunksize=32):
+    """Yield (question_list, result) for every list of a corpus, in order."""
+    lists = iter_question_lists(path)
+    if workers == 1:
+        for question_list in lists:
+            yield _check_with_list(question_list)
+        return
+    with Pool(workers) as pool:
+        yield from pool.imap(_check_with_list, lists, chunksize)
+
+
+def self_check():
+    """Run NUMBER_FORMAT_CASES and a pt_BR solution chain; return the failures as messages."""
+    failures = []
+    for expression, decimal_comma, expected in NUMBER_FORMAT_CASES:
+        value = evaluate(expression, decimal_comma)
+        if value is None or not close(value, expected):
+            failures.append(f"{expression!r} (decimal_comma={decimal_comma}): {value}, "
+                            f"expected {expected}")
+    issues = check_question({"question_solution": "{{MATH}}2.500 + 500 = 3.000{{/MATH}}"}, True)
+    if issues:
+        failures.append(f"pt_BR '2.500 + 500 = 3.000': {issues}")
+    return failures
+
+
+# -------------------------------------------------------------------------
+# MAIN EXECUTION
+# -------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    if "--self-check" in args:
+        failures = self_check()
+        for failure in failures:
+            print(failure)
+        print(f"# Number-format cases: {len(NUMBER_FORMAT_CASES) + 1 - len(failures)}/"
+              f"{len(NUMBER_FORMAT_CASES) + 1} passed")
+        sys.exit(1 if failures else 0)
+    options = {"--results": None, "--workers": None}
+    for flag in list(options):
+        if flag in args:
+            pos = args.index(flag)
+            options[flag] = args[pos + 1]
+            del args[pos:pos + 2]
+    if len(args) != 1:
+        print(__doc__)
+        sys.exit(2)
+
+    workers = int(options["--workers"]) if options["--workers"] else None
+    start = time.perf_counter()
+    totals = Counter()
+    out = open(options["--results"], "w", encoding="utf-8") if options["--results"] else None
+    try:
+        for question_list, result in check_corpus(args[0], workers):
+            totals["lists"] += 1
+            if out:
+                out.write(json.dumps(result, ensure_ascii=False) + "\n")
+            for flagged in result["flagged_questions"]:
+                for issue in flagged["issues"]:
+                    totals[issue["code"]] += 1
+                    if sum(totals[c] for c in ("arithmetic_error", "answer_mismatch",
+                                               "answer_is_distractor")) <= 25:
+                        print(f"list {result['list_id']} question {flagged['position']}: "
+                              f"{issue['code']} expected {issue['expected']:.6g}, "
+                              f"found {issue['found']:.6g}: {issue['excerpt']!r}")
+    finally:
+        if out:
+            out.close()
+    elapsed = time.perf_counter() - start
+
+    print(f"\n# =========================================================================")
+    print(f"# MATH ANSWER CHECK")
+    print(f"# =========================================================================")
+    print(f"# Lists: {totals['lists']}")
+    for code in ("arithmetic_error", "answer_mismatch", "answer_is_distractor"):
+        print(f"# {code}: {totals[code]}")
+    info = evaluate.cache_info()
+    print(f"# Expression cache: {info.hits} hits, {info.misses} misses (this process)")
+    print(f"# {elapsed:.2f} s")
+    if options["--results"]:
+        print(f"# Results written to {options['--results']}")
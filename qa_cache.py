@@ -0,0 +1,208 @@
+"""
+Content-Addressed Ids and a Persistent QA Result Store
+
+REQUIREMENTS:
+- Stable content ids for questions and lists, from the normalized
+  (normalizeQuestion, corpus_stream.py) statement, solution, answer and
+  alternatives plus the raw topic and keywords (read by the topic checker);
+  whitespace and Unicode form do not change an id. Every field a checker
+  reads must be part of the id, or its stored results go stale
+- A list's id covers its request_context and its questions' ids in order,
+  since checkers judge questions against the request
+- SQLite result store keyed by (checker, checker version, content id), so
+  a new corpus version (v3 -> Jan26) only runs checkers on new or changed
+  lists and an unchanged corpus is answered from the store
+- Bumping a checker's version invalidates exactly that checker's results;
+  checkers that depend on data files (catalog CSV, language model) derive
+  their version from file_digest() of those files
+
+USAGE:
+    python3 qa_cache.py list_of_questions_to_test_v3.json list_of_questions_to_test_Jan26.json
+    python3 qa_cache.py --stats [--store qa_cache.sqlite]
+    python3 qa_cache.py --prune [--store qa_cache.sqlite]    # drop other checker versions
+
+From code (qa_pipeline.py does this for every checker):
+    store = QAResultStore()
+    cached = store.get_many("latex", 1, [list_content_id(question_list)])
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+import unicodedata
+from collections import Counter
+
+from corpus_stream import iter_question_lists, normalize_question
+
+# -------------------------------------------------------------------------
+# CONFIGURATION
+# -------------------------------------------------------------------------
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_STORE_PATH = os.path.join(SCRIPT_DIR, "qa_cache.sqlite")
+
+# Normalized fields that make up a question's identity (difficulty does not)
+ID_FIELDS = ("type", "question_statement", "question_solution", "correct_answer",
+             "incorrect_alternative_1", "incorrect_alternative_2",
+             "incorrect_alternative_3", "incorrect_alternative_4")
+
+# Raw question fields outside normalizeQuestion that checkers still read
+EXTRA_ID_FIELDS = ("topic", "keywords")
+
+SQL_VARIABLES = 500     # ids per SELECT ... IN (...)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    checker TEXT NOT NULL,
+    version TEXT NOT NULL,
+    content_id TEXT NOT NULL,
+    result TEXT NOT NULL,
+    stored_at TEXT NOT NULL,
+    PRIMARY KEY (checker, version, content_id)
+);
+"""
+
+# -------------------------------------------------------------------------
+# CONTENT IDS
+# -------------------------------------------------------------------------
+
+def _text(value):
+    return " ".join(unicodedata.normalize("NFC", str(value or "")).split())
+
+
+def question_content_id(question):
+    """Hex id of a question's normalized content."""
+    normalized = normalize_question(question)
+    parts = [_text(normalized[name]) for name in ID_FIELDS]
+    parts.extend(json.dumps(question.get(name), sort_keys=True, ensure_ascii=False)
+                 for name in EXTRA_ID_FIELDS)
+    joined = "\x1f".join(parts)
+    return hashlib.blake2b(joined.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def list_content_id(question_list, question_ids=None):
+    """Hex id of a list: its request_context plus its questions' ids, in order."""
+    if question_ids is None:
+        question_ids = [question_content_id(q) for q in question_list.get("questions") or []]
+    context = json.dumps(question_list.get("request_context") or {}, sort_keys=True,
+                         ensure_ascii=False)
+    joined = "\x1e".join([context, *question_ids])
+    return hashlib.blake2b(joined.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def file_digest(path):
+    """Short content hash of a data file a checker depends on ("missing" if absent)."""
+    digest = hashlib.blake2b(digest_size=8)
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+    except FileNotFoundError:
+        return "missing"
+    return digest.hexdigest()
+
+
+# -------------------------------------------------------------------------
+# RESULT STORE
+# -------------------------------------------------------------------------
+
+class QAResultStore:
+    """Checker results as JSON, keyed by (checker, version, content id)."""
+
+    def __init__(self, db_path=DEFAULT_STORE_PATH):
+        self.db_path = db_path
+        self.db = sqlite3.connect(db_path or ":memory:")
+        self.db.execute("PRAGMA journal_mode = WAL")
+        self.db.executescript(SCHEMA)
+
+    def get_many(self, checker, version, content_ids):
+        """{content id: result} for the ids already stored."""
+        content_ids = list(dict.fromkeys(content_ids))
+        found = {}
+        for i in range(0, len(content_ids), SQL_VARIABLES):
+            chunk = content_ids[i:i + SQL_VARIABLES]
+            rows = self.db.execute(
+                f"SELECT content_id, result FROM results WHERE checker = ? AND version = ? "
+                f"AND content_id IN ({', '.join('?' * len(chunk))})",
+                (checker, str(version), *chunk))
+            for content_id, result in rows:
+                found[content_id] = json.loads(result)
+        return found
+
+    def put_many(self, checker, version, results):
+        """Store {content id: result} (JSON-serializable results)."""
+        stored_at = time.strftime("%Y-%m-%d %H:%M:%S")
+        with self.db:
+            self.db.executemany(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)",
+                [(checker, str(version), content_id, json.dumps(result, ensure_ascii=False),
+                  stored_at) for content_id, result in results.items()])
+
+    def stats(self):
+        """[(checker, version, results)]"""
+        return self.db.execute("SELECT checker, version, COUNT(*) FROM results "
+                               "GROUP BY checker, version ORDER BY checker, version").fetchall()
+
+    def prune(self, versions):
+        """Drop results of checker versions other than versions[checker]; return rows deleted."""
+        deleted = 0
+        with self.db:
+            for checker, version in versions.items():
+                deleted += self.db.execute("DELETE FROM results WHERE checker = ? AND version != ?",
+                                           (checker, str(version))).rowcount
+        return deleted
+
+    def close(self):
+        self.db.close()
+
+
+# -------------------------------------------------------------------------
+# MAIN EXECUTION
+# -------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    options = {"--store": DEFAULT_STORE_PATH}
+    for flag in list(options):
+        if flag in args:
+            pos = args.index(flag)
+            options[flag] = args[pos + 1]
+            del args[pos:pos + 2]
+
+    if "--stats" in args or "--prune" in args:
+        store = QAResultStore(options["--store"])
+        if "--prune" in args:
+            from qa_pipeline import CHECKERS, checker_version
+            deleted = store.prune({name: checker_version(name) for name in CHECKERS})
+            print(f"# Pruned {deleted} results of old checker versions")
+        for checker, version, count in store.stats():
+            print(f"# {checker:12s} v{version}: {count} results")
+        store.close()
+        sys.exit(0)
+    if not args:
+        print(__doc__)
+        sys.exit(2)
+
+    # Content overlap between corpus versions: what an incremental run would redo
+    start = time.perf_counter()
+    seen_lists = set()
+    seen_questions = set()
+    for path in args:
+        totals = Counter()
+        for question_list in iter_question_lists(path):
+            question_ids = [question_content_id(q) for q in question_list.get("questions") or []]
+            list_id = list_content_id(question_list, question_ids)
+            totals["lists"] += 1
+            totals["new_lists"] += list_id not in seen_lists
+            seen_lists.add(list_id)
+            for question_id in question_ids:
+                totals["questions"] += 1
+                totals["new_questions"] += question_id not in seen_questions
+                seen_questions.add(question_id)
+        print(f"# {path}: {totals['lists']} lists ({totals['new_lists']} new), "
+              f"{totals['questions']} questions ({totals['new_questions']} new)")
+    print(f"# {len(seen_lists)} distinct lists, {len(seen_questions)} distinct questions "
+          f"({time.perf_counter() - start:.2f} s)")
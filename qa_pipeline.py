@@ -0,0 +1,506 @@
+"""
+Single-Pass Multi-Check QA Pipeline
+
+REQUIREMENTS:
+- Parse each list_of_questions corpus once (corpus_stream.py) into a
+  stream of records: the list as stored, plus its normalized discipline
+  and questions normalized exactly like normalizeQuestion() in
+  list-evaluator.js
+- Fan every record out to the registered checker plugins; adding a checker
+  adds work per record, never another pass over the file
+- CPU-heavy checkers run in a process pool on chunked batches of records;
+  cheap ones run inline in the parent
+- Merge all results into one annotated corpus (-o, a "qa" object on each
+  list), an optional JSONL of per-list results and one report
+- Results are memoized in qa_cache.sqlite by list content id, so a new
+  corpus version only checks new or changed lists (--no-store to disable)
+
+Built-in checkers (existing scripts, reused as plugins):
+    structure    - empty statements / solutions, MCQs without an answer or
+                   with fewer than four options (normalized questions)
+    compliance   - compliance_checker.py (language, count, type)
+    latex        - latex_validator.py ({{MATH}} / LaTeX integrity)
+    distractors  - distractor_screener.py (duplicate / near-duplicate alternatives)
+    topic        - topic_alignment.py (questions against the catalog category)
+    leakage      - answer_leakage.py (answers given away by other statements)
+    bloom        - bloom_tagger.py (cognitive-level diversity)
+    readability  - readability_estimator.py (reading grade vs requested grade)
+    math         - math_answer_checker.py (arithmetic and answer consistency)
+
+A plugin is registered with register_checker(name, check, flagged, ...):
+    check(record, state)  -> JSON-serializable result for one list
+    flagged(result)       -> number of problems found (for the report)
+    setup()               -> per-process state passed to check (models, indexes)
+    prepare()             -> run once in the parent before any worker starts
+                             (e.g. rebuild a cache file workers will load)
+    in_pool               -> False for checkers too cheap to ship to workers
+    version               -> bump it whenever the checker's results change;
+                             stored results are keyed by (name, version,
+                             list content id), see qa_cache.py. A callable
+                             is evaluated once per run, for checkers whose
+                             results depend on data files
+
+USAGE:
+    python3 qa_pipeline.py list_of_questions_to_test_v3.json
+    python3 qa_pipeline.py corpus.json -o checked.json --results qa.jsonl --workers 4
+    python3 qa_pipeline.py corpus.json --checkers latex,math,distractors
+    python3 qa_pipeline.py corpus.json --store /tmp/qa.sqlite   # or --no-store
+    python3 qa_pipeline.py --list
+"""
+
+import json
+import sys
+import time
+from collections import Counter, deque
+from multiprocessing import Pool, cpu_count
+
+import answer_leakage
+import bloom_tagger
+import catalog_search
+import compliance_checker
+import distractor_screener
+import latex_validator
+import math_answer_checker
+import readability_estimator
+import topic_alignment
+from corpus_stream import (iter_question_lists, normalize_discipline, normalize_question,
+                           write_corpus)
+from qa_cache import (DEFAULT_STORE_PATH, QAResultStore, file_digest, list_content_id,
+                      question_content_id)
+
+# -------------------------------------------------------------------------
+# CONFIGURATION
+# -------------------------------------------------------------------------
+
+BATCH_SIZE = 16             # lists per pool task
+MAX_ALTERNATIVES = 4        # incorrect_alternative_1..4 in list-evaluator.js
+MIN_ALTERNATIVES = 3        # four options in total
+
+# -------------------------------------------------------------------------
+# RECORDS
+# -------------------------------------------------------------------------
+
+def make_record(question_list):
+    """
+    The list as stored plus the reviewer's view of it. Existing checkers
+    read the stored fields (answer, incorrect_alternatives, topic, ...);
+    "normalized" and "discipline" match list-evaluator.js; "content_id"
+    keys stored results (qa_cache.py).
+    """
+    context = question_list.get("request_context") or {}
+    questions = question_list.get("questions") or []
+    question_ids = [question_content_id(q) for q in questions]
+    return dict(question_list,
+                discipline=normalize_discipline(context.get("discipline")),
+                normalized=[normalize_question(q) for q in questions],
+                content_id=list_content_id(question_list, question_ids),
+                question_ids=question_ids,
+                qa={})
+
+
+def strip_record(record):
+    """The stored list again (with its content id), without the other fields added by make_record."""
+    return {key: value for key, value in record.items()
+            if key not in ("discipline", "normalized", "question_ids", "qa")}
+
+
+def batches(records, size=BATCH_SIZE):
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+# -------------------------------------------------------------------------
+# CHECKER REGISTRY
+# -------------------------------------------------------------------------
+
+CHECKERS = {}
+
+
+def register_checker(name, check, flagged, setup=None, prepare=None, in_pool=True, version=1):
+    """Add (or replace) a checker plugin; see the module docstring."""
+    CHECKERS[name] = {
+        "name": name,
+        "check": check,
+        "flagged": flagged,
+        "setup": setup,
+        "prepare": prepare,
+        "in_pool": in_pool,
+        "version": version,
+    }
+
+
+_versions = {}
+
+
+def checker_version(name):
+    """The checker's version, with callable versions evaluated once per process."""
+    if name not in _versions:
+        version = CHECKERS[name]["version"]
+        _versions[name] = str(version() if callable(version) else version)
+    return _versions[name]
+
+
+def _count(key):
+    return lambda result: len(result[key])
+
+
+# --- structure ------------------------------------------------------------
+
+def check_structure(record, state):
+    """What a reviewer would see as missing in list-evaluator.js."""
+    flagged = []
+    for position, question in enumerate(record["normalized"]):
+        issues = []
+        if not question["question_statement"].strip():
+            issues.append("empty_statement")
+        if not question["question_solution"].strip():
+            issues.append("empty_solution")
+        if question["type"] == "MCQ":
+            if not question["correct_answer"].strip():
+                issues.append("missing_answer")
+            filled = sum(1 for i in range(MAX_ALTERNATIVES)
+                         if question[f"incorrect_alternative_{i + 1}"].strip())
+            if filled < MIN_ALTERNATIVES:
+                issues.append("missing_alternatives")
+        if issues:
+            flagged.append({"position": position, "issues": issues})
+    return {"discipline": record["discipline"], "flagged_questions": flagged}
+
+
+register_checker("structure", check_structure, _count("flagged_questions"), in_pool=False)
+
+
+# --- compliance -----------------------------------------------------------
+
+def _compliance_setup():
+    return compliance_checker.load_model(compliance_checker.MODEL_PATH)
+
+
+def _compliance_check(record, model):
+    return compliance_checker.check_list(record, model)
+
+
+def _compliance_flagged(result):
+    return sum(1 for flag in compliance_checker.COMPLIANCE_FLAGS if not result[flag])
+
+
+def _compliance_version():
+    return f"1-{file_digest(compliance_checker.MODEL_PATH)}"
+
+
+register_checker("compliance", _compliance_check, _compliance_flagged, setup=_compliance_setup,
+                 version=_compliance_version)
+
+
+# --- latex ----------------------------------------------------------------
+
+def _latex_check(record, state):
+    flagged = []
+    for position, question in enumerate(record.get("questions") or []):
+        issues = latex_validator.validate_fields(latex_validator.question_fields(question))
+        if issues:
+            flagged.append({"position": position, "issues": issues})
+    return {"flagged_questions": flagged}
+
+
+def _latex_flagged(result):
+    return sum(1 for item in result["flagged_questions"]
+               if any(issue["severity"] == "error" for issue in item["issues"]))
+
+
+register_checker("latex", _latex_check, _latex_flagged, version=latex_validator.VALIDATOR_VERSION)
+
+
+# --- distractors ----------------------------------------------------------
+
+def _distractors_check(record, state):
+    return distractor_screener.screen_list(record)
+
+
+register_checker("distractors", _distractors_check, _count("flagged_questions"))
+
+
+# --- topic ----------------------------------------------------------------
+
+def _topic_prepare():
+    # Make sure the saved index reflects the current catalog before workers load it
+    store, _ = catalog_search.load_or_build()
+    store.close()
+
+
+def _topic_setup():
+    index = catalog_search.CatalogSearchIndex.load(catalog_search.DEFAULT_INDEX_PATH)
+    return topic_alignment.AlignmentScorer(index)
+
+
+def _topic_check(record, scorer):
+    return scorer.score_list(record)
+
+
+def _topic_version():
+    # The index is rebuilt from the catalog CSV, so the CSV's content versions the results
+    return f"1-{file_digest(catalog_search.DEFAULT_CSV_PATH)}"
+
+
+register_checker("topic", _topic_check, _count("off_topic"),
+                 setup=_topic_setup, prepare=_topic_prepare, version=_topic_version)
+
+
+# --- leakage --------------------------------------------------------------
+
+def _leakage_check(record, state):
+    return {"leaks": answer_leakage.find_leaks(record)}
+
+
+register_checker("leakage", _leakage_check, _count("leaks"))
+
+
+# --- bloom ----------------------------------------------------------------
+
+def _bloom_setup():
+    return bloom_tagger.load_automaton()
+
+
+def _bloom_check(record, automaton):
+    tagged = bloom_tagger.tag_questions([q["question_statement"] for q in record["normalized"]], automaton)
+    distributions = [distribution for distribution, _ in tagged]
+    return dict(bloom_tagger.list_diversity(distributions),
+                levels=[bloom_tagger.dominant_level(distribution) for distribution in distributions])
+
+
+# Versioned by the lexicon, so editing BLOOM_LEXICON invalidates stored results
+register_checker("bloom", _bloom_check, lambda result: int(result["score"] == 0),
+                 setup=_bloom_setup, prepare=_bloom_setup, version=bloom_tagger.lexicon_hash())
+
+
+# --- readability ----------------------------------------------------------
+
+def _readability_check(record, state):
+    return readability_estimator.estimate_list(record)
+
+
+register_checker("readability", _readability_check, _count("flagged"), version=3)
+
+
+# --- math -----------------------------------------------------------------
+
+def _math_check(record, state):
+    return math_answer_checker.check_list(record)
+
+
+register_checker("math", _math_check, _count("flagged_questions"), version=3)
+
+# -------------------------------------------------------------------------
+# PIPELINE
+# -------------------------------------------------------------------------
+
+_states = {}        # checker -> state from its setup(), per process
+_prepared = set()
+
+
+def _state(name):
+    if name not in _states:
+        setup = CHECKERS[name]["setup"]
+        _states[name] = setup() if setup else None
+    return _states[name]
+
+
+def prepare(names):
+    """Run the prepare() hooks of names not prepared yet in this process."""
+    for name in names:
+        if name not in _prepared and CHECKERS[name]["prepare"]:
+            CHECKERS[name]["prepare"]()
+        _prepared.add(name)
+
+
+def run_checkers(record, names):
+    """({checker: result}, {checker: seconds}) of one record."""
+    results = {}
+    seconds = {}
+    for name in names:
+        start = time.perf_counter()
+        result = CHECKERS[name]["check"](record, _state(name))
+        # Results are shared by every list with the same content, whatever its list_id
+        if isinstance(result, dict):
+            result.pop("list_id", None)
+        results[name] = result
+        seconds[name] = time.perf_counter() - start
+    return results, seconds
+
+
+def _run_tasks(tasks):
+    return [run_checkers(record, names) for record, names in tasks]
+
+
+def _cached(store, batch, names, stats):
+    """Fill each record's "qa" from the store; return its checkers still to run."""
+    missing = [[] for _ in batch]
+    for name in names:
+        version = checker_version(name)
+        found = store.get_many(name, version, [record["content_id"] for record in batch]) \
+            if store is not None else {}
+        for record, todo in zip(batch, missing):
+            if record["content_id"] in found:
+                record["qa"][name] = found[record["content_id"]]
+                stats["cached"] += 1
+            else:
+                todo.append(name)
+    return missing
+
+
+def _store_results(store, batch, outcomes):
+    by_checker = {}
+    for record, (results, _) in zip(batch, outcomes):
+        for name, result in results.items():
+            by_checker.setdefault(name, {})[record["content_id"]] = result
+    for name, results in by_checker.items():
+        store.put_many(name, checker_version(name), results)
+
+
+def _finish(batch, inline, async_result, names, store, stats):
+    """Run a batch's inline checkers, merge the pool's results, store them and yield its lists."""
+    outcomes = async_result.get() if async_result is not None else [({}, {}) for _ in batch]
+    for record, (results, seconds), inline_names in zip(batch, outcomes, inline):
+        inline_results, inline_seconds = run_checkers(record, inline_names)
+        results.update(inline_results)
+        seconds.update(inline_seconds)
+    if store is not None:
+        _store_results(store, batch, outcomes)
+    for record, (results, seconds) in zip(batch, outcomes):
+        record["qa"].update(results)
+        stats["checked"] += len(results)
+        yield strip_record(record), {name: record["qa"][name] for name in names}, seconds
+
+
+def run_pipeline(path, names=None, workers=None, header=None, store=None, stats=None):
+    """
+    Yield (question_list, results, seconds) for every list of a corpus, in
+    order: results maps each checker name to its result for that list.
+
+    With a QAResultStore (qa_cache.py), a checker only runs on lists whose
+    content id has no stored result for the checker's current version, and
+    new results are stored. Setup, prepare hooks and the pool itself are
+    started only once something has to run, so an unchanged corpus is
+    answered from the store. stats counts "cached" and "checked" results.
+    Corpus header fields are stored in header (if given) as they are read.
+    """
+    names = list(names or CHECKERS)
+    for name in names:
+        if name not in CHECKERS:
+            raise ValueError(f"Unknown checker {name!r}; registered: {', '.join(CHECKERS)}")
+    stats = stats if stats is not None else Counter()
+    pooled = {name for name in names if CHECKERS[name]["in_pool"] and workers != 1}
+    window = 2 * (workers or cpu_count())
+    pool = None
+    pending = deque()   # (batch, inline checkers per record, async result), in corpus order
+
+    records = (make_record(question_list) for question_list in iter_question_lists(path, header))
+    try:
+        for batch in batches(records):
+            missing = _cached(store, batch, names, stats)
+            prepare({name for todo in missing for name in todo})
+            tasks = [(record, [name for name in todo if name in pooled])
+                     for record, todo in zip(batch, missing)]
+            inline = [[name for name in todo if name not in pooled] for todo in missing]
+            async_result = None
+            if any(task_names for _, task_names in tasks):
+                pool = pool or Pool(workers)
+                async_result = pool.apply_async(_run_tasks, (tasks,))
+            pending.append((batch, inline, async_result))
+            # Bounded window of batches in flight; yield in order as they complete
+            while pending and (len(pending) > window or pending[0][2] is None
+                               or pending[0][2].ready()):
+                yield from _finish(*pending.popleft(), names, store, stats)
+        while pending:
+            yield from _finish(*pending.popleft(), names, store, stats)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+
+# -------------------------------------------------------------------------
+# MAIN EXECUTION
+# -------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    if "--list" in args:
+        for name, checker in CHECKERS.items():
+            print(f"{name:12s} {'pool' if checker['in_pool'] else 'inline'}  v{checker_version(name)}")
+        sys.exit(0)
+    options = {"-o": None, "--results": None, "--workers": None, "--checkers": None,
+               "--store": DEFAULT_STORE_PATH}
+    for flag in list(options):
+        if flag in args:
+            pos = args.index(flag)
+            options[flag] = args[pos + 1]
+            del args[pos:pos + 2]
+    no_store = "--no-store" in args
+    if no_store:
+        args.remove("--no-store")
+    if len(args) != 1:
+        print(__doc__)
+        sys.exit(2)
+
+    names = options["--checkers"].split(",") if options["--checkers"] else list(CHECKERS)
+    workers = int(options["--workers"]) if options["--workers"] else None
+    start = time.perf_counter()
+    totals = Counter()
+    flagged = Counter()
+    flagged_lists = Counter()
+    seconds = Counter()
+    header = {}
+    stats = Counter()
+    store = None if no_store else QAResultStore(options["--store"])
+    out = open(options["--results"], "w", encoding="utf-8") if options["--results"] else None
+
+    def checked_lists():
+        for question_list, results, timings in run_pipeline(args[0], names, workers, header, store,
+                                                             stats):
+            totals["lists"] += 1
+            totals["questions"] += len(question_list.get("questions") or [])
+            seconds.update(timings)
+            for name, result in results.items():
+                count = CHECKERS[name]["flagged"](result)
+                flagged[name] += count
+                flagged_lists[name] += count > 0
+            if out:
+                out.write(json.dumps(dict(results, list_id=question_list.get("list_id"),
+                                          content_id=question_list["content_id"]),
+                                     ensure_ascii=False) + "\n")
+            yield dict(question_list, qa=results)
+
+    try:
+        if options["-o"]:
+            write_corpus(options["-o"], header, checked_lists())
+        else:
+            for _ in checked_lists():
+                pass
+    finally:
+        if out:
+            out.close()
+        if store is not None:
+            store.close()
+    elapsed = time.perf_counter() - start
+
+    print(f"# =========================================================================")
+    print(f"# QA PIPELINE")
+    print(f"# =========================================================================")
+    print(f"# Lists: {totals['lists']}, questions: {totals['questions']} (one pass)")
+    print(f"# {'checker':12s} {'flagged':>8s} {'lists':>6s} {'cpu s':>8s}")
+    for name in names:
+        print(f"# {name:12s} {flagged[name]:8d} {flagged_lists[name]:6d} {seconds[name]:8.2f}")
+    if store is not None:
+        print(f"# Results from the store: {stats['cached']}, newly checked: {stats['checked']}")
+    print(f"# {elapsed:.2f} s ({totals['lists'] / elapsed:,.0f} lists per second)")
+    if options["-o"]:
+        print(f"# Annotated corpus written to {options['-o']}")
+    if options["--results"]:
+        print(f"# Results written to {options['--results']}")
@@ -0,0 +1,418 @@
+"""
+Exact-Quota Stratified Allocator for Bilingual Expert Rating Requests
+
+REQUIREMENTS:
+- Marginal quotas per discipline: locales, grade spread, difficulty mix and
+  MCQ/discursive split
+- Solve grade x difficulty jointly against the availability index
+  (iterative proportional fitting over the available cells)
+- Largest-remainder rounding so every marginal is hit exactly
+- One pass, no rejection sampling and no retries
+- Output uses the same request dicts as generate_bilingual_requests.py
+
+Unlike generate_bilingual_requests.py, which assigns locales with
+`locale_pool[len(requests) % len(locale_pool)]` and can end up with e.g.
+33 en_US / 17 pt_BR, the counts here are exact.
+"""
+
+import math
+import os
+import random
+from collections import deque
+
+import generate_bilingual_requests as bilingual
+
+# -------------------------------------------------------------------------
+# CONFIGURATION
+# -------------------------------------------------------------------------
+
+ENGLISH_LOCALE = bilingual.ENGLISH_LOCALE
+PORTUGUESE_LOCALE = bilingual.PORTUGUESE_LOCALE
+
+AVAILABLE_GRADES = bilingual.AVAILABLE_GRADES
+DIFFICULTY_LEVELS = bilingual.DIFFICULTY_LEVELS
+
+QUESTIONS_PER_REQUEST = 2
+
+# Relative weights; anything left out of a mapping gets no share
+DEFAULT_QUOTAS = {
+    "locales": None,  # None = follow the generator's locale rules (see default_locale_weights)
+    "grades": {grade: 1 for grade in AVAILABLE_GRADES},
+    "difficulties": {difficulty: 1 for difficulty in DIFFICULTY_LEVELS},
+    "mcq_share": 0.5,
+}
+
+IPF_MAX_ITERATIONS = 200
+IPF_TOLERANCE = 1e-9
+EPSILON = 1e-9
+
+# -------------------------------------------------------------------------
+# HELPER FUNCTIONS
+# -------------------------------------------------------------------------
+
+def default_locale_weights(discipline):
+    """Locale weights matching the generator's default locale policy."""
+    policy = bilingual.default_locale_policy(discipline)
+    if policy == "bilingual":
+        return {ENGLISH_LOCALE: 1, PORTUGUESE_LOCALE: 1}
+    return {policy: 1}
+
+
+def largest_remainder(weights, total, rng=None):
+    """
+    Split `total` into integers proportional to `weights` (Hamilton method).
+    Ties go to the key listed first, or to a random one when rng is given.
+    """
+    keys = [key for key, weight in weights.items() if weight > 0]
+    weight_sum = sum(weights[key] for key in keys)
+    if total and not keys:
+        raise ValueError("Cannot allocate a non-zero total with no positive weights")
+
+    counts = {key: 0 for key in weights}
+    if not total:
+        return counts
+
+    exact = {key: total * weights[key] / weight_sum for key in keys}
+    for key in keys:
+        counts[key] = int(_snap(exact[key]))
+    leftover = total - sum(counts.values())
+
+    tie_break = [rng.random() for _ in keys] if rng is not None else list(range(len(keys)))
+    order = sorted(range(len(keys)),
+                   key=lambda i: (-round(exact[keys[i]] - counts[keys[i]], 9), tie_break[i]))
+    for i in order[:leftover]:
+        counts[keys[i]] += 1
+    return counts
+
+
+def _snap(value):
+    """Absorb floating-point noise around integers (2.9999999999 -> 3)."""
+    nearest = round(value)
+    return nearest if abs(value - nearest) < EPSILON else value
+
+
+def available_cells(grade_diff_categories):
+    """Set of (grade, difficulty) cells that have at least one category."""
+    return {
+        (grade, difficulty)
+        for grade, difficulties in grade_diff_categories.items()
+        for difficulty, categories in difficulties.items()
+        if categories
+    }
+
+
+def fit_table(cells, grade_targets, difficulty_targets,
+              max_iterations=IPF_MAX_ITERATIONS, tolerance=IPF_TOLERANCE):
+    """
+    Iterative proportional fitting of a grade x difficulty table whose
+    support is `cells` (the available cells) to the row and column targets.
+    Returns {(grade, difficulty): float}.
+
+    If the targets cannot both be met on that support, the difficulty
+    margins are matched and the grade margins come as close as IPF gets.
+    """
+    table = {cell: 1.0 for cell in cells
+             if grade_targets.get(cell[0]) and difficulty_targets.get(cell[1])}
+
+    for _ in range(max_iterations):
+        row_sums = {}
+        for (grade, difficulty), value in table.items():
+            row_sums[grade] = row_sums.get(grade, 0.0) + value
+        for cell in table:
+            table[cell] *= grade_targets[cell[0]] / row_sums[cell[0]]
+
+        col_sums = {}
+        for (grade, difficulty), value in table.items():
+            col_sums[difficulty] = col_sums.get(difficulty, 0.0) + value
+        error = 0.0
+        for cell in table:
+            error = max(error, abs(col_sums[cell[1]] - difficulty_targets[cell[1]]))
+            table[cell] *= difficulty_targets[cell[1]] / col_sums[cell[1]]
+
+        if error < tolerance:
+            break
+
+    return table
+
+
+def _max_flow(capacity, adjacency, source, sink):
+    """Edmonds-Karp over a dict-of-dicts residual graph (mutated in place)."""
+    flow = 0
+    while True:
+        parent = {source: None}
+        queue = deque([source])
+        while queue and sink not in parent:
+            node = queue.popleft()
+            for nxt in adjacency[node]:
+                if nxt not in parent and capacity[node][nxt] > 0:
+                    parent[nxt] = node
+                    queue.append(nxt)
+        if sink not in parent:
+            return flow
+
+        path = []
+        node = sink
+        while parent[node] is not None:
+            path.append((parent[node], node))
+            node = parent[node]
+        bottleneck = min(capacity[u][v] for u, v in path)
+        for u, v in path:
+            capacity[u][v] -= bottleneck
+            capacity[v][u] += bottleneck
+        flow += bottleneck
+
+
+def controlled_round(fitted, rng=None):
+    """
+    Round a fitted table to integers so that every cell, every row sum,
+    every column sum and the total land on the floor or ceiling of their
+    fitted value, and the total is exact (zero-restricted controlled
+    rounding; always feasible for two-way tables). Cells outside the
+    support stay zero.
+
+    Solved as a bounded flow: source -> grade -> difficulty -> sink, where
+    each cell may take one extra unit above its floor. Larger fractional
+    parts are tried first (largest remainder); rng breaks ties.
+    """
+    table = {}
+    fractions = {}
+    for cell, value in fitted.items():
+        value = _snap(value)
+        table[cell] = math.floor(value)
+        if value - table[cell] > EPSILON:
+            fractions[cell] = value - table[cell]
+
+    if not fractions:
+        return {cell: count for cell, count in table.items() if count}
+
+    row_fraction = {}
+    col_fraction = {}
+    for (grade, difficulty), fraction in fractions.items():
+        row_fraction[grade] = row_fraction.get(grade, 0.0) + fraction
+        col_fraction[difficulty] = col_fraction.get(difficulty, 0.0) + fraction
+    total = round(sum(fractions.values()))
+
+    def bounds(value):
+        value = _snap(value)
+        return math.floor(value), math.ceil(value)
+
+    edges = []  # (from, to, lower, upper)
+    for grade, fraction in row_fraction.items():
+        edges.append(("source", ("grade", grade), *bounds(fraction)))
+    tie_break = {cell: rng.random() if rng is not None else 0 for cell in fractions}
+    for cell in sorted(fractions, key=lambda c: (-round(fractions[c], 9), tie_break[c], c)):
+        edges.append((("grade", cell[0]), ("difficulty", cell[1]), 0, 1))
+    for difficulty, fraction in col_fraction.items():
+        edges.append((("difficulty", difficulty), "sink", *bounds(fraction)))
+    edges.append(("sink", "source", total, total))
+
+    # Lower bounds -> plain max-flow between a super source and super sink
+    capacity = {}
+    adjacency = {}
+    excess = {}
+
+    def add_edge(u, v, cap):
+        for node in (u, v):
+            capacity.setdefault(node, {})
+            adjacency.setdefault(node, [])
+        if v not in capacity[u]:
+            adjacency[u].append(v)
+            adjacency[v].append(u)
+            capacity[u][v] = 0
+            capacity[v].setdefault(u, 0)
+        capacity[u][v] += cap
+
+    for u, v, lower, upper in edges:
+        add_edge(u, v, upper - lower)
+        excess[v] = excess.get(v, 0) + lower
+        excess[u] = excess.get(u, 0) - lower
+
+    required = 0
+    for node, amount in excess.items():
+        if amount > 0:
+            add_edge("super_source", node, amount)
+            required += amount
+        elif amount < 0:
+            add_edge(node, "super_sink", -amount)
+    add_edge("super_source", "super_sink", 0)
+
+    if _max_flow(capacity, adjacency, "super_source", "super_sink") != required:
+        raise ValueError("Controlled rounding failed; fitted table is inconsistent")
+
+    for cell in fractions:
+        if capacity[("grade", cell[0])][("difficulty", cell[1])] == 0:
+            table[cell] += 1
+
+    return {cell: count for cell, count in table.items() if count}
+
+
+def split_question_types(num_requests, mcq_share, questions_per_request=QUESTIONS_PER_REQUEST,
+                         rng=None):
+    """Exact MCQ/discursive counts per request, as evenly spread as possible."""
+    total_questions = num_requests * questions_per_request
+    counts = largest_remainder({"mcq": mcq_share, "discursive": 1 - mcq_share},
+                               total_questions, rng)
+    base, extra = divmod(counts["mcq"], num_requests) if num_requests else (0, 0)
+    return [
+        (base + (1 if i < extra else 0), questions_per_request - base - (1 if i < extra else 0))
+        for i in range(num_requests)
+    ]
+
+
+# -------------------------------------------------------------------------
+# REQUEST ALLOCATOR
+# -------------------------------------------------------------------------
+
+def allocate_discipline_requests(discipline, grade_diff_categories, target_questions=10,
+                                 quotas=None, rng=random):
+    """
+    Generate requests for a single discipline with exact quotas.
+
+    Args:
+        discipline: Name of the discipline
+        grade_diff_categories: Dict of grade -> difficulty -> [categories]
+        target_questions: Number of questions to generate
+        quotas: Overrides for DEFAULT_QUOTAS (locales, grades, difficulties, mcq_share)
+        rng: Random source (module `random` or a random.Random instance)
+    """
+    quotas = {**DEFAULT_QUOTAS, **(quotas or {})}
+    num_requests = target_questions // QUESTIONS_PER_REQUEST
+    cells = available_cells(grade_diff_categories)
+    if not cells or not num_requests:
+        return []
+
+    # Both marginals over the same support: the cells whose grade AND
+    # difficulty are wanted. A difficulty whose only cells lie in an
+    # unwanted grade would otherwise keep a target no cell can fill, and
+    # the table would come out short of num_requests.
+    usable_cells = {cell for cell in cells
+                    if quotas["grades"].get(cell[0], 0) > 0
+                    and quotas["difficulties"].get(cell[1], 0) > 0}
+    if not usable_cells:
+        print(f"Warning: No categories for the requested grades/difficulties in "
+              f"{discipline}, skipping...")
+        return []
+    grade_weights = {g: w for g, w in quotas["grades"].items()
+                     if any(cell[0] == g for cell in usable_cells)}
+    difficulty_weights = {d: w for d, w in quotas["difficulties"].items()
+                          if any(cell[1] == d for cell in usable_cells)}
+    dropped = {g for g, d in cells if quotas["grades"].get(g, 0) > 0} - set(grade_weights)
+    dropped |= {d for g, d in cells
+                if quotas["difficulties"].get(d, 0) > 0} - set(difficulty_weights)
+    if dropped:
+        print(f"Warning: {discipline} quotas renormalized to the grades/difficulties "
+              f"the catalog can serve together")
+    grade_targets = {g: num_requests * w / sum(grade_weights.values())
+                     for g, w in grade_weights.items()}
+    difficulty_targets = {d: num_requests * w / sum(difficulty_weights.values())
+                          for d, w in difficulty_weights.items()}
+
+    fitted = fit_table(usable_cells, grade_targets, difficulty_targets)
+    table = controlled_round(fitted, rng)
+
+    achieved = {}
+    for (grade, difficulty), count in table.items():
+        achieved[grade] = achieved.get(grade, 0) + count
+    if any(abs(achieved.get(g, 0) - target) >= 1 for g, target in grade_targets.items()):
+        print(f"Warning: grade quota for {discipline} relaxed "
+              f"(catalog has no matching grade/difficulty cells)")
+
+    locale_weights = quotas["locales"] or default_locale_weights(discipline)
+    locale_counts = largest_remainder(locale_weights, num_requests, rng)
+
+    slots = [cell for cell in sorted(table) for _ in range(table[cell])]
+    locales = [locale for locale, count in locale_counts.items() for _ in range(count)]
+    types = split_question_types(num_requests, quotas["mcq_share"], rng=rng)
+    assert len(slots) == len(locales) == len(types) == num_requests, \
+        f"{discipline}: {len(slots)} slots, {len(locales)} locales, {len(types)} types " \
+        f"for {num_requests} requests"
+    rng.shuffle(slots)
+    rng.shuffle(locales)
+    rng.shuffle(types)
+
+    # Categories drawn without replacement per cell while the cell lasts
+    remaining = {}
+    requests = []
+    for (grade, difficulty), locale, (num_mcq, num_discursive) in zip(slots, locales, types):
+        pool = remaining.get((grade, difficulty))
+        if not pool:
+            pool = remaining[(grade, difficulty)] = list(grade_diff_categories[grade][difficulty])
+        category = pool.pop(rng.randrange(len(pool)))
+
+        requests.append({
+            "grade": grade,
+            "locale": locale,
+            "difficulty": difficulty,
+            "category": category,
+            "discipline": bilingual.translate_discipline(discipline, locale),
+            "num_mcq": num_mcq,
+            "num_discursive": num_discursive,
+        })
+
+    # Keep the output grouped by locale so discipline headers stay readable
+    requests.sort(key=lambda r: r["locale"])
+    return requests
+
+
+def allocate_all_requests(csv_path, selected_disciplines=None, questions_per_discipline=10,
+                          quotas=None, quotas_by_discipline=None, all_categories=None,
+                          rng=random):
+    """Allocate requests for multiple disciplines (same arguments as generate_all_requests)."""
+    if all_categories is None:
+        all_categories = bilingual.load_categories_from_csv(csv_path)
+
+    if selected_disciplines:
+        disciplines = [d for d in selected_disciplines if d in all_categories]
+    else:
+        disciplines = list(all_categories.keys())
+
+    all_requests = []
+    for discipline in disciplines:
+        discipline_quotas = {**(quotas or {}), **(quotas_by_discipline or {}).get(discipline, {})}
+        all_requests.extend(allocate_discipline_requests(
+            discipline,
+            all_categories[discipline],
+            target_questions=questions_per_discipline,
+            quotas=discipline_quotas,
+            rng=rng,
+        ))
+    return all_requests
+
+
+# -------------------------------------------------------------------------
+# MAIN EXECUTION
+# -------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    CSV_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            "Biblioteca de Alexandria - en.csv")
+
+    SELECTED_DISCIPLINES = [
+        "Mathematics",
+        "Portuguese",
+        "Science",
+        "History",
+        "Geography",
+        "Biology",
+        "English",
+        "Philosophy",
+        "Physical Education",
+        "Physics",
+    ]
+
+    QUESTIONS_PER_DISCIPLINE = 10
+
+    random.seed(42)
+
+    print(f"# Allocating bilingual requests for {len(SELECTED_DISCIPLINES)} disciplines")
+    print(f"# Target: {QUESTIONS_PER_DISCIPLINE} questions per discipline (exact quotas)")
+    print()
+
+    requests = allocate_all_requests(
+        CSV_PATH,
+        selected_disciplines=SELECTED_DISCIPLINES,
+        questions_per_discipline=QUESTIONS_PER_DISCIPLINE,
+    )
+
+    bilingual.print_requests(requests)
+    bilingual.print_summary(requests)
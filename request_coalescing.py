@@ -0,0 +1,318 @@
+"""
+Batched Request Coalescing before Dispatch
+
+REQUIREMENTS:
+- Sit between generate_all_requests and any generation backend
+- Group compatible specs (same discipline, grade, locale and difficulty)
+  into fewer, larger backend calls, within configurable size limits
+- Split each response back into one question list per original spec,
+  keeping the list_id / request_context mapping of the list corpus
+  (list_of_questions_*.json)
+- Report how many backend round-trips were saved
+
+A backend is any callable taking a batch dict and returning a list of
+questions shaped like the corpus (type, categoryName, ...). Questions are
+routed back by category first, then by type to whichever spec still needs
+one; anything beyond what was requested is counted as surplus.
+
+USAGE:
+    python3 request_coalescing.py                      # generated campaign
+    python3 request_coalescing.py output_requests.py   # specs from files
+    python3 request_coalescing.py specs.jsonl --max-specs 4 --max-questions 12
+"""
+
+import os
+import random
+import sys
+import time
+
+import generate_bilingual_requests as bilingual
+from validate_requests import iter_specs
+
+# -------------------------------------------------------------------------
+# CONFIGURATION
+# -------------------------------------------------------------------------
+
+DEFAULT_CSV_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "Biblioteca de Alexandria - en.csv")
+
+DEFAULT_LIMITS = {
+    "max_specs_per_call": 5,       # specs merged into one backend call
+    "max_questions_per_call": 20,  # MCQ + discursive across the merged specs
+}
+
+MCQ_TYPES = ("multiple_choice", "MCQ")
+
+# Cost model of the simulated backend (seconds)
+SIMULATED_CALL_OVERHEAD = 1.5
+SIMULATED_SECONDS_PER_QUESTION = 0.8
+
+# -------------------------------------------------------------------------
+# COALESCING
+# -------------------------------------------------------------------------
+
+def coalesce_key(spec):
+    return (spec["discipline"], spec["grade"], spec["locale"], spec["difficulty"])
+
+
+def request_context(spec):
+    """The request_context recorded on corpus lists and questions."""
+    return {
+        "grade": spec["grade"],
+        "locale": spec["locale"],
+        "difficulty": spec["difficulty"],
+        "category": spec["category"],
+        "discipline": spec["discipline"],
+        "num_mcq_requested": spec.get("num_mcq", 0),
+        "num_discursive_requested": spec.get("num_discursive", 0),
+    }
+
+
+def _new_batch(batch_id, spec):
+    discipline, grade, locale, difficulty = coalesce_key(spec)
+    return {
+        "batch_id": batch_id,
+        "discipline": discipline,
+        "grade": grade,
+        "locale": locale,
+        "difficulty": difficulty,
+        "categories": [],
+        "num_mcq": 0,
+        "num_discursive": 0,
+        "members": [],
+    }
+
+
+def coalesce_requests(requests, limits=None, first_list_id=1):
+    """
+    Pack specs into backend calls.
+
+    Specs sharing (discipline, grade, locale, difficulty) are merged in
+    input order until adding the next one would exceed a limit; a single
+    spec larger than max_questions_per_call still gets its own call.
+
+    Returns a list of batches; each member keeps the spec's list_id
+    (position in the campaign, from first_list_id) and request_context.
+    """
+    limits = dict(DEFAULT_LIMITS, **(limits or {}))
+    batches = []
+    open_batches = {}
+
+    for list_id, spec in enumerate(requests, first_list_id):
+        key = coalesce_key(spec)
+        num_mcq = spec.get("num_mcq", 0)
+        num_discursive = spec.get("num_discursive", 0)
+
+        batch = open_batches.get(key)
+        if batch is not None and (
+                len(batch["members"]) >= limits["max_specs_per_call"]
+                or batch["num_mcq"] + batch["num_discursive"] + num_mcq + num_discursive
+                > limits["max_questions_per_call"]):
+            batch = None
+        if batch is None:
+            batch = open_batches[key] = _new_batch(len(batches) + 1, spec)
+            batches.append(batch)
+
+        if spec["category"] not in batch["categories"]:
+            batch["categories"].append(spec["category"])
+        batch["num_mcq"] += num_mcq
+        batch["num_discursive"] += num_discursive
+        batch["members"].append({
+            "list_id": list_id,
+            "category": spec["category"],
+            "num_mcq": num_mcq,
+            "num_discursive": num_discursive,
+            "request_context": request_context(spec),
+        })
+
+    return batches
+
+
+# -------------------------------------------------------------------------
+# SPLITTING RESPONSES
+# -------------------------------------------------------------------------
+
+def question_type(question):
+    """Same rule as normalizeQuestion in list-evaluator.js."""
+    return "MCQ" if question.get("type") in MCQ_TYPES else "discursive"
+
+
+def split_response(batch, questions):
+    """
+    Route a batch's questions back to its members.
+
+    Returns (question_lists, surplus) where question_lists has one
+    {"list_id", "request_context", "questions"} per member, in member order,
+    and surplus counts questions nobody asked for.
+    """
+    remaining = [{"MCQ": m["num_mcq"], "discursive": m["num_discursive"]}
+                 for m in batch["members"]]
+    routed = [[] for _ in batch["members"]]
+
+    def take(pos, question, qtype):
+        remaining[pos][qtype] -= 1
+        routed[pos].append(dict(question, request_context=batch["members"][pos]["request_context"]))
+
+    # Pass 1: same category, same type
+    leftovers = []
+    for question in questions:
+        qtype = question_type(question)
+        category = question.get("categoryName") or question.get("category")
+        for pos, member in enumerate(batch["members"]):
+            if member["category"] == category and remaining[pos][qtype] > 0:
+                take(pos, question, qtype)
+                break
+        else:
+            leftovers.append((question, qtype))
+
+    # Pass 2: any member still short of that type (e.g. translated category names)
+    surplus = 0
+    for question, qtype in leftovers:
+        for pos in range(len(batch["members"])):
+            if remaining[pos][qtype] > 0:
+                take(pos, question, qtype)
+                break
+        else:
+            surplus += 1
+
+    question_lists = [
+        {
+            "list_id": member["list_id"],
+            "request_context": member["request_context"],
+            "questions": routed[pos],
+        }
+        for pos, member in enumerate(batch["members"])
+    ]
+    return question_lists, surplus
+
+
+def dispatch(requests, backend, limits=None, telemetry=None, clock=time.perf_counter):
+    """
+    Coalesce, call the backend once per batch, and split the answers.
+
+    Returns (question_lists sorted by list_id, stats). A batch whose
+    backend call raises yields empty lists for all its members. With a
+    telemetry recorder (generation_telemetry.py) every list is recorded
+    with its batch's call latency and a success / partial / failed outcome.
+    """
+    batches = coalesce_requests(requests, limits)
+    question_lists = []
+    stats = {"specs": len(requests), "calls": len(batches), "failed_calls": 0,
+             "questions_requested": 0, "questions_received": 0, "surplus": 0,
+             "short_lists": 0}
+
+    for batch in batches:
+        stats["questions_requested"] += batch["num_mcq"] + batch["num_discursive"]
+        start = clock()
+        try:
+            questions = backend(batch)
+        except Exception as e:
+            print(f"Warning: Batch {batch['batch_id']} failed: {e}")
+            stats["failed_calls"] += 1
+            questions = []
+        seconds = clock() - start
+        stats["questions_received"] += len(questions)
+
+        lists, surplus = split_response(batch, questions)
+        stats["surplus"] += surplus
+        for member, question_list in zip(batch["members"], lists):
+            requested = member["num_mcq"] + member["num_discursive"]
+            received = len(question_list["questions"])
+            if received < requested:
+                stats["short_lists"] += 1
+            if telemetry is not None:
+                outcome = ("success" if received >= requested
+                           else "partial" if received else "failed")
+                telemetry.record(member["list_id"], batch["discipline"], batch["locale"],
+                                 batch["difficulty"], requested, seconds, outcome)
+        question_lists.extend(lists)
+
+    question_lists.sort(key=lambda question_list: question_list["list_id"])
+    return question_lists, stats
+
+
+def build_corpus(question_lists, model_used="default"):
+    """Wrap split lists in the list_of_questions_*.json header."""
+    successful = sum(1 for question_list in question_lists if question_list["questions"])
+    return {
+        "generated_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "model_used": model_used,
+        "total_lists": len(question_lists),
+        "successful_lists": successful,
+        "failed_lists": len(question_lists) - successful,
+        "total_questions": sum(len(ql["questions"]) for ql in question_lists),
+        "question_lists": question_lists,
+    }
+
+
+# -------------------------------------------------------------------------
+# SIMULATED BACKEND
+# -------------------------------------------------------------------------
+
+def simulated_backend(batch):
+    """Return placeholder questions in corpus shape, spread over the batch's categories."""
+    questions = []
+    categories = batch["categories"]
+    counts = {}
+    for member in batch["members"]:
+        counts.setdefault(member["category"], [0, 0])
+        counts[member["category"]][0] += member["num_mcq"]
+        counts[member["category"]][1] += member["num_discursive"]
+    for category in categories:
+        num_mcq, num_discursive = counts[category]
+        for qtype, n in (("multiple_choice", num_mcq), ("discursive", num_discursive)):
+            for i in range(n):
+                questions.append({
+                    "question_statement": f"[{category}] placeholder {qtype} #{i + 1}",
+                    "type": qtype,
+                    "difficulty": batch["difficulty"],
+                    "grade": batch["grade"],
+                    "categoryName": category,
+                    "disciplineName": batch["discipline"],
+                })
+    return questions
+
+
+def simulated_seconds(calls, questions):
+    return calls * SIMULATED_CALL_OVERHEAD + questions * SIMULATED_SECONDS_PER_QUESTION
+
+
+# -------------------------------------------------------------------------
+# MAIN EXECUTION
+# -------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    limits = {}
+    for flag, name in (("--max-specs", "max_specs_per_call"),
+                       ("--max-questions", "max_questions_per_call")):
+        if flag in args:
+            pos = args.index(flag)
+            limits[name] = int(args[pos + 1])
+            del args[pos:pos + 2]
+
+    if args:
+        requests = [spec for path in args for _, spec in iter_specs(path)]
+    else:
+        random.seed(42)
+        requests = bilingual.generate_all_requests(DEFAULT_CSV_PATH, questions_per_discipline=40)
+
+    batches = coalesce_requests(requests, limits)
+    question_lists, stats = dispatch(requests, simulated_backend, limits)
+    corpus = build_corpus(question_lists, model_used="simulated")
+
+    uncoalesced = simulated_seconds(stats["specs"], stats["questions_requested"])
+    coalesced = simulated_seconds(stats["calls"], stats["questions_requested"])
+
+    print(f"# =========================================================================")
+    print(f"# COALESCING SUMMARY")
+    print(f"# =========================================================================")
+    print(f"# Specs: {stats['specs']}")
+    print(f"# Backend calls: {stats['calls']} "
+          f"({stats['specs'] / max(1, stats['calls']):.2f} specs per call)")
+    print(f"# Largest call: {max((len(b['members']) for b in batches), default=0)} specs")
+    print(f"# Questions requested / received: {stats['questions_requested']} / "
+          f"{stats['questions_received']} (surplus {stats['surplus']})")
+    print(f"# Lists: {corpus['total_lists']} ({corpus['successful_lists']} successful, "
+          f"{stats['short_lists']} short)")
+    print(f"# Simulated backend time: {uncoalesced:.1f}s uncoalesced -> {coalesced:.1f}s coalesced")
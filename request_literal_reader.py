@@ -0,0 +1,366 @@
+"""
+Streaming Reader for `REQUESTS = [...]` Python-Literal Files
+
+REQUIREMENTS:
+- Read request archives in the output_requests.py / request.md style
+  without exec, import or a whole-file ast: a line-by-line tokenizer for
+  the restricted literal format (a list of flat dicts with str / int values, # comments,
+  trailing commas, any header or markdown around the assignment)
+- Yield (line number, request) one entry at a time, in constant memory
+- Report malformed entries with their line number and carry on with the
+  next entry (or raise ValueError when no error list is given); brackets
+  inside a malformed entry (list or dict values) are matched while skipping
+  it, so they neither end the literal nor start a spurious entry
+- Convert archives to JSONL or to a columnar JSON file
+  ({"count": N, "columns": {field: [values...]}}, null where a request has
+  no such field), streaming both ways
+
+Supported values: "double" / 'single' quoted strings (with escapes),
+integers, True / False / None. Anything else (floats, nested containers,
+expressions, triple-quoted strings) makes the entry malformed.
+
+USAGE:
+    python3 request_literal_reader.py output_requests.py request.md        # check only
+    python3 request_literal_reader.py output_requests.py -o requests.jsonl
+    python3 request_literal_reader.py archive/*.py --columnar requests.columns.json
+    python3 request_literal_reader.py --self-check                         # malformed-input cases
+
+From code:
+    errors = []
+    for line_no, request in iter_requests("output_requests.py", errors):
+        ...
+"""
+
+import ast
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+
+# -------------------------------------------------------------------------
+# CONFIGURATION
+# -------------------------------------------------------------------------
+
+# `REQUESTS = [` starts a literal; everything outside it is skipped
+ASSIGNMENT = re.compile(r"^\s*REQUESTS\s*=\s*\[")
+
+TOKEN = re.compile(r"""\s*(?:
+    (?P<punct>[\[\]{}:,])
+  | (?P<string>"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*')
+  | (?P<number>-?\d+(?:\.\d*)?(?:[eE][-+]?\d+)?)
+  | (?P<name>[A-Za-z_]\w*)
+  | (?P<comment>\#.*)
+  | (?P<bad>\S)
+)""", re.VERBOSE)
+
+# Fast path: the one-field-per-line layout every generator prints
+FIELD_LINE = re.compile(r'^\s*"([^"\\\n]*)"\s*:\s*(?:"([^"\\\n]*)"|(-?\d+))\s*(,?)\s*(?:#.*)?$')
+
+NAMES = {"True": True, "False": False, "None": None}
+
+MAX_PRINTED = 50
+
+# --self-check cases: (literal, requests expected, malformed entries expected)
+MALFORMED_CASES = [
+    ('REQUESTS = [\n  {"a": 1},\n  {"a": 1.5},\n  {"a": 2},\n]\n', 2, 1),
+    ('REQUESTS = [\n  {"a": 1, "a": 2},\n  {"a": 3},\n]\n', 1, 1),
+    ('REQUESTS = [\n  {"a": "x\n  },\n  {"a": 3},\n]\n', 1, 1),
+    ('REQUESTS = [\n  {"a": 1 "b": 2},\n  {"a": 3},\n]\n', 1, 1),
+    ('REQUESTS = [\n  {"a": 1},\n', 1, 1),
+    ('REQUESTS = [\n  {"a": 1},\n  {"tags": ["a", "b"]},\n  {"a": 2},\n  {"a": 3},\n]\n', 3, 1),
+    ('REQUESTS = [\n  {"a": 1, "tags": [["a"], "b"], "b": 2},\n  {"a": 3},\n]\n', 1, 1),
+    ('REQUESTS = [\n  {\n    "meta": {"x": 1, "y": {"z": 2}},\n    "b": 2,\n  },\n'
+     '  {"a": 3},\n]\n', 1, 1),
+    ('REQUESTS = [\n  {"a": 1},\n  [1, 2],\n  {"a": 2},\n]\n', 2, 1),
+]
+
+# -------------------------------------------------------------------------
+# TOKENIZER AND PARSER
+# -------------------------------------------------------------------------
+
+# Parser states
+SEEK, LIST, KEY, COLON, VALUE, AFTER_VALUE, SKIP = range(7)
+
+
+def _string_value(token):
+    """Quoted token to str; only tokens with escapes go through ast."""
+    body = token[1:-1]
+    if "\\" not in body:
+        return body
+    return ast.literal_eval(token)
+
+
+def _value(kind, token):
+    """(value, error message) of a value token."""
+    if kind == "string":
+        return _string_value(token), None
+    if kind == "number":
+        if not token.lstrip("-").isdigit():
+            return None, f"unsupported number {token} (only integers)"
+        return int(token), None
+    if kind == "name" and token in NAMES:
+        return NAMES[token], None
+    return None, f"unexpected {token!r} where a value was expected"
+
+
+def iter_requests(path, errors=None):
+    """
+    Yield (line_no, request) for every entry of every `REQUESTS = [...]`
+    literal in path; line_no is the line of the entry's "{".
+
+    Malformed entries are skipped and appended to errors as
+    {"line", "message"}; without an errors list the first one raises
+    ValueError("path:line: message").
+    """
+    def fail(line_no, message):
+        if errors is None:
+            raise ValueError(f"{path}:{line_no}: {message}")
+        errors.append({"line": line_no, "message": message})
+
+    state = SEEK
+    depth = 0           # brackets opened inside the entry being skipped
+    entry = None
+    entry_line = 0
+    key = None
+    literal_line = 0
+    line_no = 0
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            pos = 0
+            if state == SEEK:
+                match = ASSIGNMENT.match(line)
+                if not match:
+                    continue
+                state = LIST
+                literal_line = line_no
+                pos = match.end()
+            elif state == KEY:
+                match = FIELD_LINE.match(line)
+                if match and match.group(1) not in entry:
+                    key, text, number, comma = match.groups()
+                    entry[key] = text if number is None else int(number)
+                    state = KEY if comma else AFTER_VALUE
+                    continue
+            stripped = line.strip()
+            if stripped == "{" and state == LIST:
+                state, entry, entry_line = KEY, {}, line_no
+                continue
+            if stripped in ("}", "},") and state in (KEY, AFTER_VALUE):
+                state = LIST
+                yield entry_line, entry
+                continue
+            for match in TOKEN.finditer(line, pos):
+                kind = match.lastgroup
+                if kind == "comment":
+                    break
+                token = match.group(kind)
+                if kind == "bad" and token in "\"'":
+                    # The rest of the line is inside the broken string
+                    fail(line_no, "unterminated string")
+                    state, depth = SKIP, 0
+                    break
+                if state == SKIP:
+                    # Resynchronize after the malformed entry's own closing "}" (or the
+                    # literal's "]"), matching any brackets opened inside it
+                    if token in ("[", "{"):
+                        depth += 1
+                    elif token in ("]", "}") and depth:
+                        depth -= 1
+                        if not depth and entry is None:
+                            state = LIST
+                    elif token == "}":
+                        state = LIST
+                    elif token == "]":
+                        state = SEEK
+                        break
+                    continue
+
+                if state == LIST:
+                    if token == "{":
+                        state, entry, entry_line = KEY, {}, line_no
+                    elif token == "]":
+                        state = SEEK
+                        break
+                    elif token != ",":
+                        fail(line_no, f"unexpected {token!r} between entries")
+                        if token == "[":
+                            # Skip the whole list, then carry on between entries
+                            state, entry = SKIP, None
+                elif state == KEY:
+                    if kind == "string":
+                        key = _string_value(token)
+                        if key in entry:
+                            fail(line_no, f"duplicate key {key!r} in the entry of line "
+                                          f"{entry_line}")
+                            state = SKIP
+                        else:
+                            state = COLON
+                    elif token == "}":
+                        state = LIST
+                        yield entry_line, entry
+                    else:
+                        fail(line_no, f"expected a quoted key, found {token!r}")
+                        state = SKIP
+                elif state == COLON:
+                    if token == ":":
+                        state = VALUE
+                    else:
+                        fail(line_no, f"expected ':' after {key!r}, found {token!r}")
+                        state = SKIP
+                elif state == VALUE:
+                    value, message = _value(kind, token)
+                    if message:
+                        fail(line_no, f"{message} (key {key!r})")
+                        state = SKIP
+                    else:
+                        entry[key] = value
+                        state = AFTER_VALUE
+                elif state == AFTER_VALUE:
+                    if token == ",":
+                        state = KEY
+                    elif token == "}":
+                        state = LIST
+                        yield entry_line, entry
+                    else:
+                        fail(line_no, f"expected ',' or '}}' after the value of {key!r}, "
+                                      f"found {token!r}")
+                        state = SKIP
+                if state == SKIP:
+                    # The offending token may itself open a list or dict value
+                    depth = 1 if token in ("[", "{") else 0
+    if state != SEEK:
+        fail(line_no, f"literal opened on line {literal_line} is never closed")
+
+
+def self_check():
+    """Run MALFORMED_CASES through iter_requests; return the failures as messages."""
+    failures = []
+    directory = tempfile.mkdtemp(prefix="literal-check-")
+    try:
+        for number, (text, expected_requests, expected_errors) in enumerate(MALFORMED_CASES, 1):
+            path = os.path.join(directory, f"case{number}.py")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+            errors = []
+            requests = sum(1 for _ in iter_requests(path, errors))
+            if (requests, len(errors)) != (expected_requests, expected_errors):
+                failures.append(f"case {number}: {requests} requests, {len(errors)} malformed "
+                                f"(expected {expected_requests}, {expected_errors}): "
+                                f"{[error['message'] for error in errors]}")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    return failures
+
+
+# -------------------------------------------------------------------------
+# OUTPUT
+# -------------------------------------------------------------------------
+
+class ColumnarWriter:
+    """
+    Streams records into {"count": N, "columns": {field: [...]}}. Each
+    column is spooled to its own temporary file and the JSON is assembled
+    on close, so memory does not grow with the number of records.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.directory = tempfile.mkdtemp(prefix="columnar-")
+        self.columns = {}       # field -> (spool file, values written)
+        self.count = 0
+
+    def write(self, record):
+        for field, value in record.items():
+            column = self.columns.get(field)
+            if column is None:
+                spool = open(os.path.join(self.directory, f"{len(self.columns)}.col"), "w+",
+                             encoding="utf-8")
+                column = self.columns[field] = [spool, 0]
+            spool, written = column
+            spool.write("null\n" * (self.count - written) + json.dumps(value, ensure_ascii=False)
+                        + "\n")
+            column[1] = self.count + 1
+        self.count += 1
+
+    def close(self):
+        try:
+            with open(self.path, "w", encoding="utf-8") as out:
+                out.write(f'{{"count": {self.count}, "columns": {{')
+                for number, (field, (spool, written)) in enumerate(self.columns.items()):
+                    spool.write("null\n" * (self.count - written))
+                    spool.seek(0)
+                    out.write(("," if number else "") + f"\n  {json.dumps(field)}: [")
+                    first = True
+                    for value in spool:
+                        out.write(("" if first else ", ") + value.rstrip("\n"))
+                        first = False
+                    out.write("]")
+                    spool.close()
+                out.write("\n}}\n")
+        finally:
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+
+# -------------------------------------------------------------------------
+# MAIN EXECUTION
+# -------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    options = {"-o": None, "--columnar": None}
+    for flag in list(options):
+        if flag in args:
+            pos = args.index(flag)
+            options[flag] = args[pos + 1]
+            del args[pos:pos + 2]
+    if "--self-check" in args:
+        failures = self_check()
+        for failure in failures:
+            print(failure)
+        print(f"# Malformed-input cases: {len(MALFORMED_CASES) - len(failures)}/"
+              f"{len(MALFORMED_CASES)} passed")
+        sys.exit(1 if failures else 0)
+    if not args:
+        print(__doc__)
+        sys.exit(2)
+
+    start = time.perf_counter()
+    total = 0
+    total_bytes = 0
+    malformed = 0
+    jsonl_out = open(options["-o"], "w", encoding="utf-8") if options["-o"] else None
+    columnar = ColumnarWriter(options["--columnar"]) if options["--columnar"] else None
+    try:
+        for path in args:
+            errors = []
+            total_bytes += os.path.getsize(path)
+            for _, request in iter_requests(path, errors):
+                total += 1
+                if jsonl_out:
+                    jsonl_out.write(json.dumps(request, ensure_ascii=False) + "\n")
+                if columnar:
+                    columnar.write(request)
+            for error in errors:
+                malformed += 1
+                if malformed <= MAX_PRINTED:
+                    print(f"{path}:{error['line']}: {error['message']}")
+    finally:
+        if jsonl_out:
+            jsonl_out.close()
+        if columnar:
+            columnar.close()
+    elapsed = time.perf_counter() - start
+
+    print(f"# =========================================================================")
+    print(f"# REQUEST LITERALS")
+    print(f"# =========================================================================")
+    print(f"# Files: {len(args)}, requests: {total}, malformed entries: {malformed}")
+    print(f"# {elapsed:.3f} s ({total_bytes / max(elapsed, 1e-9) / 1e6:,.1f} MB/s)")
+    if options["-o"]:
+        print(f"# JSONL written to {options['-o']}")
+    if options["--columnar"]:
+        print(f"# Columnar JSON written to {options['--columnar']}")
+    sys.exit(1 if malformed else 0)
@@ -0,0 +1,252 @@
+"""
+Streaming Reservoir Sampling of Categories from an Unbounded Catalog
+
+REQUIREMENTS:
+- One pass over the CSV, no discipline -> grade -> difficulty -> set index
+- Stratified: an independent reservoir per requested (discipline, grade, difficulty) cell
+- Memory bounded by k per cell (Algorithm L)
+- Weighted variant (level or custom weights, Algorithm A-ExpJ)
+- Output has the same shape as load_categories_from_csv, so it feeds
+  straight into generate_requests_for_discipline / generate_all_requests
+
+A category appearing on several rows of the same cell is one candidate per
+row, like in the CSV; reservoirs drop repeats so each cell holds distinct
+names (a cell may therefore return fewer than k when duplicates were drawn).
+"""
+
+import csv
+import heapq
+import math
+import os
+import random
+import sys
+
+import generate_bilingual_requests as bilingual
+
+# -------------------------------------------------------------------------
+# CONFIGURATION
+# -------------------------------------------------------------------------
+
+DEFAULT_K = 5
+
+# -------------------------------------------------------------------------
+# RESERVOIRS
+# -------------------------------------------------------------------------
+
+class AlgorithmLReservoir:
+    """
+    Uniform reservoir of size k (Li, 1994, "Algorithm L").
+
+    After the reservoir fills, the number of items to skip before the next
+    replacement is drawn directly, so only O(k (1 + log(n/k))) random numbers
+    are needed for n items.
+    """
+
+    __slots__ = ("k", "rng", "items", "seen", "_w", "_next")
+
+    def __init__(self, k, rng=random):
+        self.k = k
+        self.rng = rng
+        self.items = []
+        self.seen = 0
+        self._w = 1.0
+        self._next = k
+
+    def _schedule(self):
+        # 1 - random() is in (0, 1], keeping log() finite
+        self._w *= math.exp(math.log(1.0 - self.rng.random()) / self.k)
+        self._next += int(math.log(1.0 - self.rng.random()) / math.log(1 - self._w)) + 1
+
+    def offer(self, item):
+        self.seen += 1
+        if len(self.items) < self.k:
+            self.items.append(item)
+            if len(self.items) == self.k:
+                self._next = self.k
+                self._schedule()
+            return
+        if self.seen == self._next:
+            self.items[self.rng.randrange(self.k)] = item
+            self._schedule()
+
+    def sample(self):
+        return list(self.items)
+
+
+class WeightedReservoir:
+    """
+    Weighted reservoir of size k (Efraimidis & Spirakis A-ExpJ).
+
+    Each item gets key u ** (1 / weight); the k largest keys are kept in a
+    min-heap and exponential jumps skip items that cannot enter it.
+    """
+
+    __slots__ = ("k", "rng", "heap", "seen", "_jump")
+
+    def __init__(self, k, rng=random):
+        self.k = k
+        self.rng = rng
+        self.heap = []  # (key, tiebreak, item)
+        self.seen = 0
+        self._jump = None
+
+    def offer(self, item, weight):
+        self.seen += 1
+        if weight <= 0:
+            return
+        if len(self.heap) < self.k:
+            key = self.rng.random() ** (1.0 / weight)
+            heapq.heappush(self.heap, (key, self.seen, item))
+            if len(self.heap) == self.k:
+                self._jump = math.log(self.rng.random()) / math.log(self.heap[0][0])
+            return
+
+        self._jump -= weight
+        if self._jump > 0:
+            return
+
+        threshold = self.heap[0][0] ** weight
+        key = self.rng.uniform(threshold, 1.0) ** (1.0 / weight)
+        heapq.heapreplace(self.heap, (key, self.seen, item))
+        self._jump = math.log(self.rng.random()) / math.log(self.heap[0][0])
+
+    def sample(self):
+        return [item for _, _, item in sorted(self.heap, reverse=True)]
+
+
+# -------------------------------------------------------------------------
+# WEIGHTS
+# -------------------------------------------------------------------------
+
+def level_weight(row, difficulty):
+    """
+    Weight a row by how central its CSV level is inside its difficulty
+    bucket (300: 0-300, 500: 301-600, 700: 601-1000), so borderline rows are
+    drawn less often.
+    """
+    low, high = bilingual.map_difficulty_to_level_range(difficulty)
+    try:
+        level = int(row.get("level", "").strip())
+    except ValueError:
+        return 0.0
+    middle = (low + high) / 2
+    half_width = (high - low) / 2
+    return max(0.05, 1.0 - abs(level - middle) / half_width)
+
+
+# -------------------------------------------------------------------------
+# SAMPLER
+# -------------------------------------------------------------------------
+
+def sample_categories_from_csv(csv_path, cells, k=DEFAULT_K, weight=None, rng=random):
+    """
+    Sample up to k distinct categories per requested cell in one pass.
+
+    Args:
+        csv_path: Catalog CSV (may be far larger than memory)
+        cells: Iterable of (discipline, grade, difficulty) to sample for.
+            Use None for grade or difficulty to accept any value.
+        k: Reservoir size per cell
+        weight: None for uniform sampling, "level" for level_weight, or a
+            callable (row, discipline, grade, difficulty) -> weight
+        rng: Random source
+
+    Returns:
+        Dict of discipline -> grade -> difficulty -> [categories], the same
+        structure load_categories_from_csv returns.
+    """
+    if weight == "level":
+        weight_fn = lambda row, disc, grade, difficulty: level_weight(row, difficulty)
+    else:
+        weight_fn = weight
+
+    reservoirs = {}
+    for cell in cells:
+        if cell not in reservoirs:
+            reservoirs[cell] = (AlgorithmLReservoir(k, rng) if weight_fn is None
+                                else WeightedReservoir(k, rng))
+    disciplines = {disc for disc, _, _ in reservoirs}
+
+    with open(csv_path, "r", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            if row.get("discipline", "").strip() not in disciplines:
+                continue
+            parsed = bilingual.parse_catalog_row(row)
+            if parsed is None:
+                continue
+            disc, category, grade, difficulty = parsed
+
+            # Exact cell plus any wildcard cells the row also belongs to
+            for key in ((disc, grade, difficulty), (disc, None, difficulty),
+                        (disc, grade, None), (disc, None, None)):
+                reservoir = reservoirs.get(key)
+                if reservoir is None:
+                    continue
+                if weight_fn is None:
+                    reservoir.offer((grade, difficulty, category))
+                else:
+                    reservoir.offer((grade, difficulty, category),
+                                    weight_fn(row, disc, grade, difficulty))
+
+    result = {}
+    for (disc, _, _), reservoir in reservoirs.items():
+        for grade, difficulty, category in reservoir.sample():
+            names = result.setdefault(disc, {}).setdefault(grade, {}).setdefault(difficulty, [])
+            if category not in names:
+                names.append(category)
+    return result
+
+
+def cells_for_disciplines(disciplines, grades=None, difficulties=None):
+    """Every (discipline, grade, difficulty) cell a campaign may draw from."""
+    grades = grades or bilingual.AVAILABLE_GRADES
+    difficulties = difficulties or bilingual.DIFFICULTY_LEVELS
+    return [(disc, grade, difficulty)
+            for disc in disciplines for grade in grades for difficulty in difficulties]
+
+
+# -------------------------------------------------------------------------
+# MAIN EXECUTION
+# -------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    CSV_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            "Biblioteca de Alexandria - en.csv")
+
+    SELECTED_DISCIPLINES = [
+        "Mathematics",
+        "Science",
+        "History",
+        "Geography",
+        "Biology",
+        "English",
+        "Philosophy",
+        "Physical Education",
+        "Physics",
+    ]
+
+    QUESTIONS_PER_DISCIPLINE = 10
+    WEIGHT = "level" if "--weighted" in sys.argv else None
+
+    random.seed(42)
+
+    sampled = sample_categories_from_csv(
+        CSV_PATH,
+        cells_for_disciplines(SELECTED_DISCIPLINES),
+        k=DEFAULT_K,
+        weight=WEIGHT,
+    )
+
+    print(f"# Reservoir-sampled categories ({'level-weighted' if WEIGHT else 'uniform'}, "
+          f"k={DEFAULT_K} per cell)")
+    print()
+
+    requests = bilingual.generate_all_requests(
+        CSV_PATH,
+        selected_disciplines=SELECTED_DISCIPLINES,
+        questions_per_discipline=QUESTIONS_PER_DISCIPLINE,
+        all_categories=sampled,
+    )
+
+    bilingual.print_requests(requests)
+    bilingual.print_summary(requests)
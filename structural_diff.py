@@ -0,0 +1,292 @@
+"""
+Structural Diff for Request Sets and Question Corpora
+
+REQUIREMENTS:
+- Diff two versions of a request set (output_requests_old.py vs
+  output_requests.py, request.md, JSONL specs) or of a question corpus
+  (list_of_questions_*.json, individual_questions_*.json, JSONL)
+- Match records by key instead of by line:
+    request specs - (discipline, locale, grade, difficulty, category); repeated
+                    specs are paired in file order
+    lists         - list_id
+    questions     - content id (qa_cache.py), so only adds / removes
+  (--key field,field or --key content overrides the default)
+- Compare records by a canonical hash (sorted-key JSON, blake2b) and report
+  added / removed / modified records with their field-level changes
+  ("questions[3].answer", "request_context.grade", ...)
+- O(n) and bounded memory: inputs larger than PARTITION_BYTES are
+  hash-partitioned by key into temporary files first, and one partition of
+  the old side is held in memory at a time. Records sharing a key always
+  land in the same partition, so a hot key (thousands of identical request
+  specs) bounds memory by its own size, whatever --partitions says
+
+USAGE:
+    python3 structural_diff.py output_requests_old.py output_requests.py
+    python3 structural_diff.py list_of_questions_to_test_v3.json list_of_questions_to_test_Jan26.json
+    python3 structural_diff.py old.json new.json --results diff.jsonl --key list_id
+    python3 structural_diff.py old.jsonl new.jsonl --partitions 64
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from collections import Counter, deque
+
+from corpus_stream import iter_array, iter_jsonl
+from qa_cache import question_content_id
+from request_literal_reader import iter_requests
+
+# -------------------------------------------------------------------------
+# CONFIGURATION
+# -------------------------------------------------------------------------
+
+# Input bytes per partition; parsed records take several times their JSON size
+PARTITION_BYTES = 32 << 20
+
+REQUEST_KEY = ("discipline", "locale", "grade", "difficulty", "category")
+LIST_KEY = ("list_id",)
+CONTENT_KEY = "content"
+
+LITERAL_EXTENSIONS = (".py", ".md", ".txt")
+MAX_PRINTED = 20
+MAX_VALUE_CHARS = 80
+
+# -------------------------------------------------------------------------
+# READERS AND KEYS
+# -------------------------------------------------------------------------
+
+def iter_records(path):
+    """Yield every record of a request file or corpus, whatever its format."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension in LITERAL_EXTENSIONS:
+        for _, spec in iter_requests(path):
+            yield spec
+    elif extension in (".jsonl", ".ndjson"):
+        yield from iter_jsonl(path)
+    else:
+        yield from iter_array(path, ("question_lists", "questions", "requests"))
+
+
+def default_key(record):
+    if "questions" in record and "list_id" in record:
+        return LIST_KEY
+    if "question_statement" in record:
+        return CONTENT_KEY
+    return REQUEST_KEY
+
+
+def record_key(record, key=None):
+    """The record's match key as a canonical string."""
+    key = key or default_key(record)
+    if key == CONTENT_KEY:
+        return question_content_id(record)
+    return json.dumps([record.get(name) for name in key], ensure_ascii=False)
+
+
+def canonical_hash(record):
+    canonical = json.dumps(record, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _partition_of(key, partitions):
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % partitions
+
+
+# -------------------------------------------------------------------------
+# FIELD-LEVEL CHANGES
+# -------------------------------------------------------------------------
+
+def field_changes(old, new, path=""):
+    """[{path, old, new}] of the leaves that differ ("old"/"new" absent when added/removed)."""
+    if old == new:
+        return []
+    if isinstance(old, dict) and isinstance(new, dict):
+        changes = []
+        for name in list(old) + [name for name in new if name not in old]:
+            child = f"{path}.{name}" if path else str(name)
+            if name not in new:
+                changes.append({"path": child, "old": old[name]})
+            elif name not in old:
+                changes.append({"path": child, "new": new[name]})
+            else:
+                changes.extend(field_changes(old[name], new[name], child))
+        return changes
+    if isinstance(old, list) and isinstance(new, list):
+        changes = []
+        for i in range(max(len(old), len(new))):
+            child = f"{path}[{i}]"
+            if i >= len(new):
+                changes.append({"path": child, "old": old[i]})
+            elif i >= len(old):
+                changes.append({"path": child, "new": new[i]})
+            else:
+                changes.extend(field_changes(old[i], new[i], child))
+        return changes
+    return [{"path": path, "old": old, "new": new}]
+
+
+def field_name(path):
+    """Change path without positions: "questions[3].answer" -> "questions.answer"."""
+    parts = []
+    for part in path.split("."):
+        parts.append(part.split("[", 1)[0])
+    return ".".join(part for part in parts if part)
+
+
+# -------------------------------------------------------------------------
+# DIFF
+# -------------------------------------------------------------------------
+
+def _key_value(item_key):
+    """Back from the canonical string: field values as a list, content ids as is."""
+    return json.loads(item_key) if item_key.startswith("[") else item_key
+
+
+def _keyed(records, key):
+    for record in records:
+        yield record_key(record, key), record
+
+
+def _diff_partition(old_items, new_items, stats):
+    """Diff one partition: old side in memory, new side streamed."""
+    old = {}
+    for item_key, record in old_items:
+        # deque: repeated keys are paired in file order in O(1) each
+        old.setdefault(item_key, deque()).append((canonical_hash(record), record))
+    for item_key, record in new_items:
+        matches = old.get(item_key)
+        if not matches:
+            stats["added"] += 1
+            yield {"change": "added", "key": _key_value(item_key), "record": record}
+            continue
+        old_hash, old_record = matches.popleft()
+        if not matches:
+            del old[item_key]
+        if old_hash == canonical_hash(record):
+            stats["unchanged"] += 1
+            continue
+        stats["modified"] += 1
+        yield {"change": "modified", "key": _key_value(item_key),
+               "fields": field_changes(old_record, record)}
+    for item_key, matches in old.items():
+        for _, record in matches:
+            stats["removed"] += 1
+            yield {"change": "removed", "key": _key_value(item_key), "record": record}
+
+
+def _spill(records, key, partitions, directory, side):
+    """Write (key, record) lines into one file per partition; return the paths."""
+    paths = [os.path.join(directory, f"{side}-{i}.jsonl") for i in range(partitions)]
+    files = [open(path, "w", encoding="utf-8") for path in paths]
+    try:
+        for item_key, record in _keyed(records, key):
+            files[_partition_of(item_key, partitions)].write(
+                json.dumps([item_key, record], ensure_ascii=False) + "\n")
+    finally:
+        for f in files:
+            f.close()
+    return paths
+
+
+def _read_spill(path):
+    for item_key, record in iter_jsonl(path):
+        yield item_key, record
+
+
+def diff(old_path, new_path, key=None, partitions=None, stats=None):
+    """
+    Yield {change, key, record | fields} for every added, removed or
+    modified record of new_path against old_path. stats (a Counter) gets
+    the added / removed / modified / unchanged counts.
+    """
+    stats = stats if stats is not None else Counter()
+    if partitions is None:
+        size = max(os.path.getsize(old_path), os.path.getsize(new_path))
+        partitions = max(1, -(-size // PARTITION_BYTES))
+    stats["partitions"] = partitions
+    if partitions == 1:
+        yield from _diff_partition(_keyed(iter_records(old_path), key),
+                                   _keyed(iter_records(new_path), key), stats)
+        return
+    directory = tempfile.mkdtemp(prefix="structural_diff-")
+    try:
+        old_paths = _spill(iter_records(old_path), key, partitions, directory, "old")
+        new_paths = _spill(iter_records(new_path), key, partitions, directory, "new")
+        for old_part, new_part in zip(old_paths, new_paths):
+            yield from _diff_partition(_read_spill(old_part), _read_spill(new_part), stats)
+            os.remove(old_part)
+            os.remove(new_part)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def _short(value):
+    text = json.dumps(value, ensure_ascii=False)
+    return text if len(text) <= MAX_VALUE_CHARS else text[:MAX_VALUE_CHARS - 3] + "..."
+
+
+# -------------------------------------------------------------------------
+# MAIN EXECUTION
+# -------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    options = {"--results": None, "--key": None, "--partitions": None}
+    for flag in list(options):
+        if flag in args:
+            pos = args.index(flag)
+            options[flag] = args[pos + 1]
+            del args[pos:pos + 2]
+    if len(args) != 2:
+        print(__doc__)
+        sys.exit(2)
+
+    key = None
+    if options["--key"]:
+        key = CONTENT_KEY if options["--key"] == CONTENT_KEY else tuple(options["--key"].split(","))
+    partitions = int(options["--partitions"]) if options["--partitions"] else None
+
+    start = time.perf_counter()
+    stats = Counter()
+    fields = Counter()
+    printed = 0
+    out = open(options["--results"], "w", encoding="utf-8") if options["--results"] else None
+    try:
+        for change in diff(args[0], args[1], key, partitions, stats):
+            if out:
+                out.write(json.dumps(change, ensure_ascii=False) + "\n")
+            if change["change"] == "modified":
+                fields.update({field_name(c["path"]) for c in change["fields"]})
+            if printed >= MAX_PRINTED:
+                continue
+            printed += 1
+            if change["change"] != "modified":
+                print(f"{change['change']:8s} {_short(change['key'])}")
+                continue
+            print(f"modified {_short(change['key'])}: {len(change['fields'])} field changes")
+            for c in change["fields"][:5]:
+                old_value = _short(c["old"]) if "old" in c else "(added)"
+                new_value = _short(c["new"]) if "new" in c else "(removed)"
+                print(f"    {c['path']}: {old_value} -> {new_value}")
+    finally:
+        if out:
+            out.close()
+    elapsed = time.perf_counter() - start
+
+    print(f"\n# =========================================================================")
+    print(f"# STRUCTURAL DIFF {args[0]} -> {args[1]}")
+    print(f"# =========================================================================")
+    print(f"# Added: {stats['added']}, removed: {stats['removed']}, "
+          f"modified: {stats['modified']}, unchanged: {stats['unchanged']}")
+    if fields:
+        print(f"# Most changed fields:")
+        for name, count in fields.most_common(10):
+            print(f"#   {name}: {count} records")
+    print(f"# {elapsed:.2f} s ({stats['partitions']} partition(s))")
+    if options["--results"]:
+        print(f"# Changes written to {options['--results']}")
@@ -0,0 +1,225 @@
+"""
+Topic-Alignment Prechecker (request_context.category vs generated questions)
+
+REQUIREMENTS:
+- Compare each question's topic, keywords and statement with the list's
+  requested category and the matching catalog entry (description, topic,
+  description gepeto, Spanish name)
+- Reuse the precomputed catalog token index (catalog_search.idx): its
+  accent-folded, stemmed terms and document frequencies give the TF-IDF
+  weights; Portuguese categories are matched to the catalog through the
+  index's bilingual search
+- Flag likely off-topic questions in every list, to pre-fill
+  "Teacher Input Alignment" / "Topic & Materials Alignment" review
+- Stream whole corpora (bounded memory) and score lists in parallel
+
+A question is flagged when its cosine with the category profile is below
+OFF_TOPIC_SCORE, or below RELATIVE_SCORE times the median of its list
+(one question drifting away from otherwise well-aligned siblings).
+
+USAGE:
+    python3 topic_alignment.py list_of_questions_to_test_v3.json
+    python3 topic_alignment.py corpus.json --results alignment.jsonl --workers 4
+"""
+
+import json
+import math
+import re
+import sys
+import time
+from collections import Counter
+from multiprocessing import Pool
+
+from catalog_search import DEFAULT_INDEX_PATH, CatalogSearchIndex, analyze_query, load_or_build
+from corpus_stream import iter_question_lists
+
+# -------------------------------------------------------------------------
+# CONFIGURATION
+# -------------------------------------------------------------------------
+
+OFF_TOPIC_SCORE = 0.05
+RELATIVE_SCORE = 0.25
+STATEMENT_CHARS = 600       # statement prefix scored (the setup carries the topic)
+
+# Term-frequency weight of each question field
+QUESTION_FIELDS = {"topic": 2.0, "keywords": 2.0, "question_statement": 1.0}
+CATEGORY_WEIGHT = 3.0       # requested category name, on top of the catalog entry
+
+MATH_SPAN = re.compile(r"\{\{MATH\}\}.*?\{\{/MATH\}\}", re.DOTALL)
+
+# -------------------------------------------------------------------------
+# VECTORS
+# -------------------------------------------------------------------------
+
+def add_terms(vector, text, weight):
+    for term in analyze_query(text):
+        vector[term] = vector.get(term, 0.0) + weight
+
+
+def question_vector(question):
+    vector = {}
+    for field, weight in QUESTION_FIELDS.items():
+        value = question.get(field)
+        if isinstance(value, list):
+            value = " ".join(str(v) for v in value)
+        if field == "question_statement":
+            value = MATH_SPAN.sub(" ", (value or "")[:STATEMENT_CHARS])
+        if value:
+            add_terms(vector, value, weight)
+    return vector
+
+
+class AlignmentScorer:
+    """
+    TF-IDF cosine between questions and category profiles, with document
+    frequencies taken from a CatalogSearchIndex.
+    """
+
+    def __init__(self, index):
+        self.index = index
+        doc_count = len(index.forward)
+        self.default_idf = math.log(doc_count + 1) + 1
+        self.idf = {term: math.log((doc_count + 1) / (len(docs) + 1)) + 1
+                    for term, docs in index.postings.items()}
+        self._profiles = {}
+
+    def catalog_match(self, category, discipline, grade):
+        """Best catalog document for a requested category (grade-filtered first)."""
+        for grade_filter in (grade, None):
+            results = self.index.search(category, k=1, discipline=discipline, grade=grade_filter)
+            if results:
+                return results[0]
+        return None
+
+    def profile(self, context):
+        """(weighted unit vector, catalog match) for a request_context, cached."""
+        key = (context.get("category"), context.get("discipline"), context.get("grade"))
+        cached = self._profiles.get(key)
+        if cached is None:
+            category, discipline, grade = key
+            vector = {}
+            add_terms(vector, category or "", CATEGORY_WEIGHT)
+            match = self.catalog_match(category or "", discipline, grade) if category else None
+            if match:
+                doc = (match["discipline"], match["category"])
+                for term, tf in self.index.forward.get(doc, {}).items():
+                    vector[term] = vector.get(term, 0.0) + tf
+            cached = self._profiles[key] = (self.weigh(vector), match)
+        return cached
+
+    def weigh(self, vector):
+        """Apply idf and normalize to unit length."""
+        idf = self.idf
+        default = self.default_idf
+        weighted = {term: tf * idf.get(term, default) for term, tf in vector.items()}
+        norm = math.sqrt(sum(w * w for w in weighted.values()))
+        return {term: w / norm for term, w in weighted.items()} if norm else {}
+
+    def score(self, question, profile):
+        vector = self.weigh(question_vector(question))
+        if len(vector) > len(profile):
+            vector, profile = profile, vector
+        return sum(w * profile.get(term, 0.0) for term, w in vector.items())
+
+    def score_list(self, question_list):
+        """Per-list result: catalog match, per-question scores and flagged positions."""
+        context = question_list.get("request_context") or {}
+        profile, match = self.profile(context)
+        scores = [round(self.score(q, profile), 4) for q in question_list.get("questions") or []]
+        median = sorted(scores)[len(scores) // 2] if scores else 0.0
+        off_topic = [position for position, score in enumerate(scores)
+                     if score < OFF_TOPIC_SCORE or score < RELATIVE_SCORE * median]
+        return {
+            "list_id": question_list.get("list_id"),
+            "category": context.get("category"),
+            "catalog_category": match["category"] if match else None,
+            "scores": scores,
+            "median_score": median,
+            "off_topic": off_topic,
+        }
+
+
+# -------------------------------------------------------------------------
+# BATCH SCORING
+# -------------------------------------------------------------------------
+
+_scorer = None
+
+
+def _init_worker(index_path):
+    global _scorer
+    _scorer = AlignmentScorer(CatalogSearchIndex.load(index_path))
+
+
+def _score_with_list(question_list):
+    return question_list, _scorer.score_list(question_list)
+
+
+def score_corpus(path, workers=None, header=None, chunksize=32, index_path=DEFAULT_INDEX_PATH):
+    """
+    Yield (question_list, alignment) for every list of a corpus, in order.
+    The catalog index must already be saved at index_path (load_or_build).
+    """
+    lists = iter_question_lists(path, header)
+    if workers == 1:
+        _init_worker(index_path)
+        for question_list in lists:
+            yield _score_with_list(question_list)
+        return
+    with Pool(workers, initializer=_init_worker, initargs=(index_path,)) as pool:
+        yield from pool.imap(_score_with_list, lists, chunksize)
+
+
+# -------------------------------------------------------------------------
+# MAIN EXECUTION
+# -------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    options = {"--results": None, "--workers": None}
+    for flag in list(options):
+        if flag in args:
+            pos = args.index(flag)
+            options[flag] = args[pos + 1]
+            del args[pos:pos + 2]
+    if len(args) != 1:
+        print(__doc__)
+        sys.exit(2)
+
+    # Make sure the saved index reflects the current catalog before workers load it
+    store, _ = load_or_build()
+    store.close()
+
+    workers = int(options["--workers"]) if options["--workers"] else None
+    start = time.perf_counter()
+    totals = Counter()
+    out = open(options["--results"], "w", encoding="utf-8") if options["--results"] else None
+    try:
+        for question_list, alignment in score_corpus(args[0], workers):
+            totals["lists"] += 1
+            totals["questions"] += len(alignment["scores"])
+            if out:
+                out.write(json.dumps(alignment, ensure_ascii=False) + "\n")
+            if not alignment["off_topic"]:
+                continue
+            totals["flagged_lists"] += 1
+            totals["off_topic"] += len(alignment["off_topic"])
+            if totals["flagged_lists"] <= 20:
+                questions = question_list["questions"]
+                for position in alignment["off_topic"]:
+                    print(f"list {alignment['list_id']} [{alignment['category']}] question {position}: "
+                          f"score {alignment['scores'][position]} (median {alignment['median_score']}) "
+                          f"topic {questions[position].get('topic')!r}")
+    finally:
+        if out:
+            out.close()
+    elapsed = time.perf_counter() - start
+
+    print(f"\n# =========================================================================")
+    print(f"# TOPIC ALIGNMENT")
+    print(f"# =========================================================================")
+    print(f"# Lists: {totals['lists']}, questions: {totals['questions']}")
+    print(f"# Likely off-topic: {totals['off_topic']} questions in {totals['flagged_lists']} lists")
+    print(f"# {totals['lists'] / elapsed * 60:,.0f} lists per minute")
+    if options["--results"]:
+        print(f"# Results written to {options['--results']}")
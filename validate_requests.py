@@ -0,0 +1,272 @@
+"""
+Bulk Validator for Request Specs against the Catalog Index
+
+REQUIREMENTS:
+- Stream any number of request specs from Python-literal files
+  (output_requests.py / request.md style, request_literal_reader.py) and
+  JSONL; malformed literal entries are reported with their line numbers
+- Hash-join every spec against the catalog index (catalog_constants.py)
+- Report unknown categories, topic-level names used as categories, empty
+  (discipline, grade, difficulty) cells, categories outside their cell and
+  discipline names that do not match the locale (e.g. "História" for en_US)
+- Suggest the nearest valid alternatives
+- Handle a million specs in seconds (verdicts are memoized per distinct spec)
+
+USAGE:
+    python3 validate_requests.py output_requests.py request.md specs.jsonl
+    python3 validate_requests.py output_requests.py --issues issues.jsonl
+"""
+
+import difflib
+import json
+import os
+import sys
+from collections import Counter
+from functools import lru_cache
+
+from build_catalog_constants import load_catalog_constants
+from request_literal_reader import iter_requests
+
+# -------------------------------------------------------------------------
+# CONFIGURATION
+# -------------------------------------------------------------------------
+
+ENGLISH_LOCALE = "en_US"
+PORTUGUESE_LOCALE = "pt_BR"
+
+REQUIRED_FIELDS = ("grade", "locale", "difficulty", "category", "discipline")
+
+MAX_SUGGESTIONS = 3
+SUGGESTION_CUTOFF = 0.6
+
+# -------------------------------------------------------------------------
+# SPEC READERS
+# -------------------------------------------------------------------------
+
+def iter_literal_specs(path, errors=None):
+    """
+    Yield (line_no, spec) from a `REQUESTS = [...]` file, one dict at a time
+    (request_literal_reader.py). Malformed entries go to errors, if given,
+    as {"line", "message"}; otherwise they raise ValueError.
+    """
+    return iter_requests(path, errors)
+
+
+def iter_jsonl_specs(path):
+    """Yield (line_no, spec) from a JSONL file, skipping blank lines."""
+    decode = json.JSONDecoder().decode
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            if line.strip():
+                yield line_no, decode(line)
+
+
+def iter_specs(path, errors=None):
+    """Pick the reader from the file extension."""
+    if os.path.splitext(path)[1].lower() in (".jsonl", ".ndjson"):
+        return iter_jsonl_specs(path)
+    return iter_literal_specs(path, errors)
+
+
+# -------------------------------------------------------------------------
+# CATALOG INDEX
+# -------------------------------------------------------------------------
+
+class CatalogIndex:
+    """Hash tables the validator joins against, built once from the constants."""
+
+    def __init__(self, catalog=None):
+        catalog = catalog or load_catalog_constants()
+        self.cells = {key: frozenset(names) for key, names in catalog.CELLS.items()}
+        self.categories = {d: frozenset(names) for d, names in catalog.CATEGORIES.items()}
+        self.topics = {d: frozenset(names) for d, names in catalog.TOPICS.items()}
+        self.topic_categories = dict(catalog.TOPIC_CATEGORIES)
+        self.to_english = dict(catalog.DISCIPLINE_TRANSLATIONS_REVERSE)
+        self.to_portuguese = dict(catalog.DISCIPLINE_TRANSLATIONS)
+
+        self.category_disciplines = {}
+        for discipline, names in self.categories.items():
+            for name in names:
+                self.category_disciplines.setdefault(name, set()).add(discipline)
+
+    def canonical_discipline(self, name):
+        return self.to_english.get(name, name)
+
+
+def _issue(code, message, suggestions=()):
+    return {"code": code, "message": message, "suggestions": list(suggestions)}
+
+
+@lru_cache(maxsize=65536)
+def _nearest(name, candidates):
+    return tuple(difflib.get_close_matches(name, candidates, n=MAX_SUGGESTIONS,
+                                           cutoff=SUGGESTION_CUTOFF))
+
+
+def _sorted_tuple(names):
+    return tuple(sorted(names))
+
+
+def make_validator(index):
+    """
+    Return validate(spec) -> tuple of issues. Verdicts are cached per
+    distinct (discipline, locale, grade, difficulty, category), so large
+    campaigns with repeated specs cost one dict lookup per spec.
+    """
+    candidate_cache = {}
+
+    def candidates(key, names):
+        cached = candidate_cache.get(key)
+        if cached is None:
+            cached = candidate_cache[key] = _sorted_tuple(names)
+        return cached
+
+    @lru_cache(maxsize=1 << 20)
+    def check(discipline, locale, grade, difficulty, category):
+        issues = []
+        canonical = index.canonical_discipline(discipline)
+
+        if canonical not in index.categories:
+            issues.append(_issue("unknown_discipline",
+                                 f"Unknown discipline {discipline!r}",
+                                 _nearest(discipline, candidates("disciplines", index.categories))))
+            return tuple(issues)
+
+        # Locale / discipline-name agreement
+        if locale == ENGLISH_LOCALE and canonical != discipline:
+            issues.append(_issue("discipline_locale_mismatch",
+                                 f"Portuguese discipline name {discipline!r} with {locale}",
+                                 [canonical]))
+        elif (locale == PORTUGUESE_LOCALE and canonical == discipline
+              and discipline in index.to_portuguese):
+            issues.append(_issue("discipline_locale_mismatch",
+                                 f"English discipline name {discipline!r} with {locale}",
+                                 [index.to_portuguese[discipline]]))
+        elif locale not in (ENGLISH_LOCALE, PORTUGUESE_LOCALE):
+            issues.append(_issue("unknown_locale", f"Unknown locale {locale!r}"))
+
+        cell = index.cells.get((canonical, grade, difficulty))
+        discipline_categories = index.categories[canonical]
+
+        if not cell:
+            issues.append(_issue("empty_cell",
+                                 f"No categories for {canonical} / grade {grade} / "
+                                 f"difficulty {difficulty}"))
+
+        if category in discipline_categories:
+            if cell and category not in cell:
+                issues.append(_issue("category_not_in_cell",
+                                     f"{category!r} exists for {canonical} but not at "
+                                     f"grade {grade} / difficulty {difficulty}",
+                                     _nearest(category, candidates(("cell", canonical, grade, difficulty), cell))))
+            return tuple(issues)
+
+        if category in index.topics.get(canonical, ()):
+            in_topic = index.topic_categories.get((canonical, category), ())
+            pool = [name for name in in_topic if name in cell] if cell else in_topic
+            issues.append(_issue("topic_not_category",
+                                 f"{category!r} is a {canonical} topic, not a category",
+                                 sorted(pool)[:MAX_SUGGESTIONS]))
+            return tuple(issues)
+
+        elsewhere = index.category_disciplines.get(category)
+        if elsewhere:
+            issues.append(_issue("wrong_discipline",
+                                 f"{category!r} belongs to {', '.join(sorted(elsewhere))}, "
+                                 f"not {canonical}",
+                                 sorted(elsewhere)))
+            return tuple(issues)
+
+        pool = cell or discipline_categories
+        pool_key = ("cell", canonical, grade, difficulty) if cell else ("discipline", canonical)
+        issues.append(_issue("unknown_category",
+                             f"{category!r} is not a {canonical} category",
+                             _nearest(category, candidates(pool_key, pool))))
+        return tuple(issues)
+
+    def validate(spec):
+        try:
+            return check(spec["discipline"], spec["locale"], spec["grade"],
+                         spec["difficulty"], spec["category"])
+        except KeyError:
+            missing = [field for field in REQUIRED_FIELDS if field not in spec]
+            return (_issue("missing_field", f"Missing field(s): {', '.join(missing)}"),)
+        except TypeError:
+            # Unhashable value (e.g. a list where a string was expected)
+            return (_issue("invalid_value", "Spec fields must be strings or integers"),)
+
+    return validate
+
+
+# -------------------------------------------------------------------------
+# MAIN EXECUTION
+# -------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    issues_path = None
+    if "--issues" in args:
+        pos = args.index("--issues")
+        issues_path = args[pos + 1]
+        del args[pos:pos + 2]
+
+    if not args:
+        print(__doc__)
+        sys.exit(2)
+
+    index = CatalogIndex()
+    validate = make_validator(index)
+
+    total_specs = 0
+    bad_specs = 0
+    malformed = 0
+    code_counts = Counter()
+    issues_out = open(issues_path, "w", encoding="utf-8") if issues_path else None
+    # Verdict tuples are shared between identical specs, so their JSON is
+    # encoded once (keyed by id; the tuple is kept alive alongside)
+    encoded_issues = {}
+
+    try:
+        for path in args:
+            errors = []
+            for line_no, spec in iter_specs(path, errors):
+                total_specs += 1
+                issues = validate(spec)
+                if not issues:
+                    continue
+                bad_specs += 1
+                for issue in issues:
+                    code_counts[issue["code"]] += 1
+                if issues_out:
+                    cached = encoded_issues.get(id(issues))
+                    if cached is None or cached[0] is not issues:
+                        key = {field: spec.get(field) for field in REQUIRED_FIELDS}
+                        cached = encoded_issues[id(issues)] = (issues, json.dumps(
+                            {"spec": key, "issues": issues}, ensure_ascii=False)[1:])
+                    issues_out.write(f'{{"file": {json.dumps(path)}, "line": {line_no}, '
+                                     f'{cached[1]}\n')
+                elif bad_specs <= 50:
+                    print(f"{path}:{line_no}: {spec.get('discipline')} / {spec.get('category')!r}")
+                    for issue in issues:
+                        hint = f" -> {', '.join(issue['suggestions'])}" if issue["suggestions"] else ""
+                        print(f"    [{issue['code']}] {issue['message']}{hint}")
+            for error in errors:
+                malformed += 1
+                print(f"{path}:{error['line']}: malformed entry: {error['message']}")
+    finally:
+        if issues_out:
+            issues_out.close()
+
+    print(f"\n# =========================================================================")
+    print(f"# SUMMARY")
+    print(f"# =========================================================================")
+    print(f"# Specs checked: {total_specs}")
+    print(f"# Specs with issues: {bad_specs}")
+    if malformed:
+        print(f"# Malformed entries (not checked): {malformed}")
+    for code, count in code_counts.most_common():
+        print(f"#   {code}: {count}")
+    if issues_path:
+        print(f"# Issues written to {issues_path}")
+
+    sys.exit(1 if bad_specs or malformed else 0)